@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 3600
+    # Cursor-paginated listings reuse a list's total count for this long.
+    PAGINATION_COUNT_CACHE_TTL: int = 60         # seconds
 
     # ── Redis ─────────────────────────────────────────────────────
     REDIS_HOST: str = "localhost"
@@ -28,6 +30,9 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
     USE_REDIS: bool = False
+    # With Redis, periodic jobs run once per cluster: the scheduler leader
+    # holds a lease of this length and workers heartbeat within it.
+    SCHEDULER_LEASE_SECONDS: int = 30
 
     # ── Storage ───────────────────────────────────────────────────
     STORAGE_TYPE: str = "filesystem"  # filesystem | s3 | gcs | azure
@@ -96,6 +101,16 @@ class Settings(BaseSettings):
     X_INTROSPECT_SECRET: str = ""
     OAUTH2_ENV: str = "dev"
 
+    # bcrypt runs in a process pool off the event loop (common_utils.auth.password_hasher).
+    # 0 workers = min(4, CPU count); 0 concurrency = 2 × workers.
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 0
+
+    # Employee bulk import (app.services.employee_import): rows hashed and
+    # inserted per chunk, and the most rows one upload may create.
+    EMPLOYEE_IMPORT_CHUNK_SIZE: int = 1000
+    EMPLOYEE_IMPORT_MAX_ROWS: int = 500
+
     # ── SMTP / Email ──────────────────────────────────────────────
     SMTP_SERVER: str = ""
     SMTP_PORT: int = 587
@@ -129,6 +144,7 @@ class Settings(BaseSettings):
 
     PUSH_NOTIFICATION_BATCH_SIZE: int = 500
     PUSH_NOTIFICATION_DEFAULT_PRIORITY: str = "high"
+    REMINDER_BATCH_SIZE: int = 500   # due bookings claimed and pushed per chunk
     SESSION_CACHE_TTL: int = 3600   # seconds
     SESSION_EXPIRY_DAYS: int = 30
 
@@ -138,12 +154,24 @@ class Settings(BaseSettings):
     # Set TRANSLATION_ENABLED=False to disable translation entirely.
     TRANSLATION_ENABLED: bool = True
     TRANSLATION_CACHE_TTL: int = 86400          # 24 h — Redis TTL for translated strings
+    TRANSLATION_LRU_SIZE: int = 2048             # in-process cache of recent translations
+    TRANSLATION_BATCH_MAX_CHARS: int = 4000      # upstream request size for translate_batch()
     CHAT_MAX_MESSAGE_LENGTH: int = 500           # max chars per chat message
+    # In-house SSE push (/chat/{booking_id}/stream) with Redis pub/sub fan-out.
+    # CHAT_FIREBASE_MIRROR keeps writing to Firebase RTDB for older app builds.
+    CHAT_STREAM_ENABLED: bool = False
+    CHAT_FIREBASE_MIRROR: bool = True
+    CHAT_STREAM_QUEUE_SIZE: int = 100            # per-connection buffer before a resync
     CHAT_WARNING_MESSAGE: str = (
         "Warning: Please do not share personal details or sensitive "
         "information in the chat."
     )
 
+    # ── Alerts / SOS ──────────────────────────────────────────────
+    # Every channel of an alert fan-out is sent concurrently; anything that has
+    # not answered within this budget is marked FAILED so it cannot hold up the rest.
+    ALERT_NOTIFICATION_BUDGET_SECONDS: float = 15.0
+
     # ── Observability ─────────────────────────────────────────────
     # Leave blank in development to allow open access; set both in production.
     METRICS_USER: str = ""
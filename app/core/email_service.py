@@ -278,6 +278,63 @@ class EmailService:
         
         return False
     
+    async def send_individual_emails(
+        self,
+        messages: List[Dict[str, Any]],
+        priority: EmailPriority = EmailPriority.NORMAL
+    ) -> List[bool]:
+        """
+        Send several independent emails over a single SMTP session.
+
+        Each entry of ``messages`` takes ``to_email``, ``subject`` and
+        ``html_content`` / ``text_content``.  Recipients never see each other.
+        A message that fails is retried once through ``send_email`` after the
+        shared session is closed.
+
+        Returns:
+            List[bool]: one result per message, in order
+        """
+        if not messages:
+            return []
+        if not self.is_configured:
+            logger.error("Email service not configured. Cannot send email.")
+            return [False] * len(messages)
+
+        results: List[Optional[bool]] = [None] * len(messages)
+        try:
+            async with self._create_smtp_connection() as smtp_client:
+                for i, m in enumerate(messages):
+                    if not m.get("to_email"):
+                        results[i] = False
+                        continue
+                    try:
+                        msg = self._create_message(
+                            to_emails=[m["to_email"]],
+                            subject=m["subject"],
+                            html_content=m.get("html_content"),
+                            text_content=m.get("text_content"),
+                            reply_to=self.sender_email,
+                            priority=priority
+                        )
+                        await smtp_client.send_message(msg)
+                        self._emails_sent += 1
+                        results[i] = True
+                    except Exception as e:
+                        logger.warning(f"Email to {m['to_email']} failed on shared session: {str(e)}")
+        except Exception as e:
+            logger.warning(f"Shared SMTP session failed after {sum(1 for r in results if r)} email(s): {str(e)}")
+
+        for i, m in enumerate(messages):
+            if results[i] is None:
+                results[i] = await self.send_email(
+                    to_emails=m["to_email"],
+                    subject=m["subject"],
+                    html_content=m.get("html_content"),
+                    text_content=m.get("text_content"),
+                    priority=priority
+                )
+        return results
+
     async def send_driver_assignment_email(self, user_email: str, booking_data: Dict[str, Any]) -> bool:
         """Send driver assignment notification email"""
         html_content = f"""
@@ -2,7 +2,7 @@
 CRUD operations for Alert System
 """
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc, exists, cast, Text
+from sqlalchemy import and_, or_, func, desc, exists
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from app.models.alert import (
@@ -308,10 +308,18 @@ def check_escalation_needed(db: Session, alert: Alert, config: AlertConfiguratio
         return False
     
     # Check time threshold
-    now = get_current_ist_time()
-    elapsed = (now - alert.triggered_at).total_seconds()
+    return seconds_since_triggered(alert) >= config.escalation_threshold_seconds
+
+
+def seconds_since_triggered(alert: Alert) -> float:
+    """Seconds elapsed since the alert was triggered (IST, naive values treated as IST)"""
+    triggered_at = alert.triggered_at
+    if triggered_at.tzinfo is None:
+        from datetime import timezone
+        ist_offset = timedelta(hours=5, minutes=30)
+        triggered_at = triggered_at.replace(tzinfo=timezone(ist_offset))
     
-    return elapsed >= config.escalation_threshold_seconds
+    return (get_current_ist_time() - triggered_at).total_seconds()
 
 
 # ============================================================================
@@ -539,65 +547,28 @@ def get_applicable_configuration(
     alert_type: AlertTypeEnum,
     team_id: Optional[int] = None
 ) -> Optional[AlertConfiguration]:
-    """Get the most applicable configuration for an alert"""
-    import json
-    
-    logger.info(f"[get_applicable_configuration] Searching for tenant_id={tenant_id}, alert_type={alert_type.value}, team_id={team_id}")
-    
-    query = db.query(AlertConfiguration).filter(
-        AlertConfiguration.tenant_id == tenant_id,
-        AlertConfiguration.is_active == True
-    )
-    
-    # For JSON column querying in PostgreSQL, we need to cast to text
-    # and search for the value in the JSON array string representation
-    alert_type_str = f'"{alert_type.value}"'  # JSON string format
-    
-    logger.info(f"[get_applicable_configuration] Searching for alert_type_str: {alert_type_str}")
+    """
+    Get the most applicable configuration for an alert: the highest-priority
+    active team config covering the alert type, else the tenant-wide one.
+    Resolved from the tenant's compiled index (see alert_config_index).
+    """
+    from app.services import alert_config_index
     
-    # Try team-specific first if team_id provided
-    if team_id:
-        logger.info(f"[get_applicable_configuration] Checking team-specific config for team_id={team_id}")
-        team_config = query.filter(
-            AlertConfiguration.team_id == team_id,
-            or_(
-                AlertConfiguration.applicable_alert_types.is_(None),
-                cast(AlertConfiguration.applicable_alert_types, Text).contains(alert_type_str)
-            )
-        ).order_by(desc(AlertConfiguration.priority)).first()
+    for attempt in range(2):
+        config_id = alert_config_index.get_index(db, tenant_id).resolve(alert_type, team_id)
+        if config_id is None:
+            logger.warning(f"[get_applicable_configuration] No config found for tenant_id={tenant_id}, alert_type={alert_type.value}, team_id={team_id}")
+            return None
         
-        if team_config:
-            logger.info(f"[get_applicable_configuration] Found team-specific config: {team_config.config_id}")
-            return team_config
-    
-    # Fall back to tenant-wide
-    logger.info(f"[get_applicable_configuration] Checking tenant-wide config")
-    
-    # First, let's see all configs for this tenant
-    all_tenant_configs = db.query(AlertConfiguration).filter(
-        AlertConfiguration.tenant_id == tenant_id,
-        AlertConfiguration.is_active == True,
-        AlertConfiguration.team_id.is_(None)
-    ).all()
-    
-    logger.info(f"[get_applicable_configuration] Found {len(all_tenant_configs)} active tenant configs with NULL team_id")
-    for cfg in all_tenant_configs:
-        logger.info(f"  - Config ID {cfg.config_id}: applicable_alert_types={cfg.applicable_alert_types}, priority={cfg.priority}")
-    
-    tenant_config = query.filter(
-        AlertConfiguration.team_id.is_(None),
-        or_(
-            AlertConfiguration.applicable_alert_types.is_(None),
-            cast(AlertConfiguration.applicable_alert_types, Text).contains(alert_type_str)
-        )
-    ).order_by(desc(AlertConfiguration.priority)).first()
-    
-    if tenant_config:
-        logger.info(f"[get_applicable_configuration] Found tenant-wide config: {tenant_config.config_id}")
-    else:
-        logger.warning(f"[get_applicable_configuration] No config found for tenant_id={tenant_id}, alert_type={alert_type.value}")
+        config = db.get(AlertConfiguration, config_id)
+        if config is not None and config.is_active and config.tenant_id == tenant_id:
+            logger.info(f"[get_applicable_configuration] tenant_id={tenant_id}, alert_type={alert_type.value}, team_id={team_id} -> config {config_id}")
+            return config
+        
+        # Index predates a write that bypassed invalidation — rebuild once.
+        alert_config_index.invalidate(tenant_id)
     
-    return tenant_config
+    return None
 
 
 def update_alert_configuration(
@@ -40,6 +40,7 @@ from app.models.driver import Driver
 from app.models.employee import Employee
 from app.schemas.announcement import AnnouncementCreate, AnnouncementUpdate
 from app.services.unified_notification_service import UnifiedNotificationService
+from app.utils.pagination import cached_count, keyset_paginate
 
 logger = get_logger(__name__)
 
@@ -544,19 +545,27 @@ def list_recipients(
     announcement_id: int,
     page: int = 1,
     page_size: int = 50,
-) -> Tuple[List[AnnouncementRecipient], int]:
-    """Paginated delivery tracking for one announcement."""
+    cursor: Optional[str] = None,
+) -> Tuple[List[AnnouncementRecipient], int, Optional[str]]:
+    """
+    Paginated delivery tracking for one announcement.
+
+    Returns (items, total, next_cursor); with ``cursor`` the page follows
+    the cursor and ``page`` is ignored.
+    """
     q = db.query(AnnouncementRecipient).filter(
         AnnouncementRecipient.announcement_id == announcement_id,
     )
-    total = q.count()
-    items = (
-        q.order_by(AnnouncementRecipient.recipient_id)
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    total = cached_count(q, refresh=cursor is None)
+    items, next_cursor = keyset_paginate(
+        q,
+        [AnnouncementRecipient.recipient_id],
+        cursor=cursor,
+        offset=(page - 1) * page_size,
+        limit=page_size,
+        descending=False,
     )
-    return items, total
+    return items, total, next_cursor
 
 
 def get_announcements_for_user(
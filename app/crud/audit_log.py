@@ -5,6 +5,7 @@ from datetime import datetime
 from app.models.audit_log import AuditLog
 from app.schemas.audit_log import AuditLogCreate, AuditLogFilter
 from app.core.logging_config import get_logger
+from app.utils.pagination import cached_count, keyset_paginate
 
 logger = get_logger(__name__)
 
@@ -31,10 +32,11 @@ class CRUDAuditLog:
         db: Session,
         *,
         filters: AuditLogFilter
-    ) -> tuple[List[AuditLog], int]:
+    ) -> tuple[List[AuditLog], int, Optional[str]]:
         """
         Get audit logs with filters and pagination
-        Returns tuple of (records, total_count)
+        Returns tuple of (records, total_count, next_cursor); with
+        filters.cursor set, page is ignored and the page follows the cursor.
         """
         query = db.query(AuditLog)
         
@@ -57,20 +59,20 @@ class CRUDAuditLog:
         if conditions:
             query = query.filter(and_(*conditions))
         
-        # Get total count
-        total_count = query.count()
+        # Get total count (cached across the cursor pages of one listing)
+        total_count = cached_count(query, refresh=filters.cursor is None)
         
         # Apply pagination
         skip = (filters.page - 1) * filters.page_size
-        records = (
-            query
-            .order_by(AuditLog.created_at.desc())
-            .offset(skip)
-            .limit(filters.page_size)
-            .all()
+        records, next_cursor = keyset_paginate(
+            query,
+            [AuditLog.created_at, AuditLog.audit_id],
+            cursor=filters.cursor,
+            offset=skip,
+            limit=filters.page_size,
         )
         
-        return records, total_count
+        return records, total_count, next_cursor
 
     def get_by_module(
         self,
@@ -1,7 +1,10 @@
+from datetime import date
 from typing import Optional, List, Union, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import exists
+from sqlalchemy.orm import Query, Session
 from sqlalchemy.exc import SQLAlchemyError
-from app.models.booking import Booking
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.route_management import RouteManagement, RouteManagementBooking
 from app.schemas.booking import BookingCreate, BookingUpdate
 from app.crud.base import CRUDBase
 
@@ -16,6 +19,39 @@ class CRUDBooking(CRUDBase[Booking, BookingCreate, BookingUpdate]):
     def get_by_tenant(self, db: Session, *, tenant_id: str, skip: int = 0, limit: int = 100) -> List[Booking]:
         return db.query(Booking).filter(Booking.tenant_id == tenant_id).offset(skip).limit(limit).all()
 
+    def get_unrouted_query(
+        self,
+        db: Session,
+        *,
+        tenant_id: str,
+        booking_date: date,
+        shift_id: int,
+        status: Optional[BookingStatusEnum] = BookingStatusEnum.REQUEST,
+    ) -> Query:
+        """
+        Bookings of one tenant / date / shift that are on none of the tenant's routes.
+
+        The routed check is a correlated ``NOT EXISTS`` on
+        route_management_bookings(booking_id), so only the shift's own
+        bookings are probed instead of sending every booking id the tenant
+        ever routed back as a ``NOT IN`` list.  ``status=None`` skips the
+        status filter.
+        """
+        routed = exists().where(
+            RouteManagementBooking.booking_id == Booking.booking_id,
+            RouteManagement.route_id == RouteManagementBooking.route_id,
+            RouteManagement.tenant_id == tenant_id,
+        )
+        query = db.query(Booking).filter(
+            Booking.tenant_id == tenant_id,
+            Booking.booking_date == booking_date,
+            Booking.shift_id == shift_id,
+            ~routed,
+        )
+        if status is not None:
+            query = query.filter(Booking.status == status)
+        return query
+
     def create(self, db: Session, *, obj_in: BookingCreate) -> Booking:
         db_obj = Booking(**obj_in.model_dump())
         db.add(db_obj)
@@ -230,6 +230,36 @@ def get_messages(
     )
 
 
+def get_messages_after(
+    db: Session,
+    tenant_id: str,
+    booking_id: int,
+    after_id: int,
+    limit: int = 200,
+) -> List[ChatMessage]:
+    """Messages newer than *after_id*, oldest first — stream resume cursor."""
+    return (
+        db.query(ChatMessage)
+        .filter(
+            ChatMessage.tenant_id == tenant_id,
+            ChatMessage.booking_id == booking_id,
+            ChatMessage.id > after_id,
+        )
+        .order_by(ChatMessage.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def get_last_message_id(db: Session, tenant_id: str, booking_id: int) -> int:
+    result = (
+        db.query(func.max(ChatMessage.id))
+        .filter_by(tenant_id=tenant_id, booking_id=booking_id)
+        .scalar()
+    )
+    return result or 0
+
+
 def get_message_count(db: Session, booking_id: int) -> int:
     result = (
         db.query(func.count(ChatMessage.id))
@@ -25,8 +25,8 @@ class CRUDEmployee(CRUDBase[Employee, EmployeeCreate, EmployeeUpdate]):
             Employee.tenant_id == tenant_id
         ).first()
     
-    def create_with_tenant(self, db: Session, *, obj_in: EmployeeCreate, role_id: Optional[int] = None, tenant_id: str) -> Employee:
-        """Create employee for a specific tenant"""
+    def create_with_tenant(self, db: Session, *, obj_in: EmployeeCreate, role_id: Optional[int] = None, tenant_id: str, password_hash: Optional[str] = None) -> Employee:
+        """Create employee for a specific tenant (``password_hash``: bcrypt hash of obj_in.password, if already computed)"""
         role_id = role_id or self.get_system_role_id(db, role_name="Employee")
         if role_id is None:
             raise ValueError("System role 'Employee' not found in DB")
@@ -36,7 +36,7 @@ class CRUDEmployee(CRUDBase[Employee, EmployeeCreate, EmployeeUpdate]):
             role_id=role_id,
             employee_code=obj_in.employee_code,
             email=obj_in.email,
-            password=hash_password(obj_in.password),
+            password=password_hash or hash_password(obj_in.password),
             team_id=obj_in.team_id,
             phone=obj_in.phone,
             alternate_phone=obj_in.alternate_phone,
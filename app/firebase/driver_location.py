@@ -3,8 +3,8 @@ Firebase service for managing driver location data in hierarchical structure:
 tenant_id -> vendor_id -> driver_id -> {latitude, longitude, metadata}
 
 Enhanced with:
-- Node initialization on duty start
-- Auto-recovery for missing/deleted nodes
+- Node initialization on duty start (the only place a node is read first)
+- Blind update() on every location ping — one RTDB round-trip per ping
 - Complete metadata (driver name, route info, status)
 """
 from firebase_admin import db
@@ -29,13 +29,14 @@ def push_driver_location_to_firebase(
     route_id: int = None,
 ):
     """
-    Update driver location data in Firebase with auto-recovery.
-    
-    Enhanced features:
-    - Automatically recovers missing/deleted nodes
-    - Updates complete metadata (location + speed + driver info)
-    - Safe-checks: ensures firebase_admin is initialized
-    
+    Update driver location data in Firebase with a single blind ``update()``.
+
+    No ``get()`` is issued first: RTDB ``update()`` creates the node when it
+    is missing, so every ping costs exactly one RTDB round-trip.  Full node
+    initialisation (vehicle info, created_at) happens once in ``start_duty``
+    via ``initialize_driver_node_on_duty_start``; the driver name / code /
+    route written here keep a node that was deleted mid-duty usable on the map.
+
     Args:
         tenant_id: Tenant identifier
         vendor_id: Vendor ID
@@ -62,68 +63,17 @@ def push_driver_location_to_firebase(
             )
             return
 
-        ref = db.reference(ref_path)
-        existing = ref.get()
-
-        # Auto-recovery: If node doesn't exist, initialize it
-        if existing is None:
-            logger.warning(
-                "[firebase.push] Node missing at %s — initializing before update",
-                ref_path
+        db.reference(ref_path).update(
+            build_location_payload(
+                driver_id=driver_id,
+                latitude=latitude,
+                longitude=longitude,
+                speed=speed,
+                driver_code=driver_code,
+                driver_name=driver_name,
+                route_id=route_id,
             )
-            if driver_name and driver_code and route_id:
-                initialize_driver_node_on_duty_start(
-                    tenant_id=tenant_id,
-                    vendor_id=vendor_id,
-                    driver_id=driver_id,
-                    driver_name=driver_name,
-                    driver_code=driver_code,
-                    route_id=route_id,
-                    initial_latitude=latitude,
-                    initial_longitude=longitude,
-                )
-                # Add speed if available
-                if speed is not None:
-                    ref.update({"speed": speed})
-                return
-            else:
-                # Missing recovery metadata - create minimal node
-                logger.warning(
-                    "[firebase.push] Missing recovery metadata for %s — creating minimal node",
-                    ref_path
-                )
-        
-        # Prepare location update data
-        # driver_id cast to int: JWT encodes all claims as strings, we always want int in Firebase
-        location_data = {
-            "driver_id": int(driver_id),
-            "latitude": latitude,
-            "longitude": longitude,
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
-        # Add speed if available
-        if speed is not None:
-            location_data["speed"] = speed
-        
-        # Add recovery metadata if available
-        if driver_name:
-            location_data["driver_name"] = driver_name
-        if driver_code:
-            location_data["driver_code"] = driver_code
-        if route_id:
-            location_data["route_id"] = route_id
-        
-        # Ensure is_active flag is set
-        location_data["is_active"] = True
-
-        # Update node (creates if doesn't exist due to above recovery)
-        if existing is None:
-            logger.info("Creating driver node at %s", ref_path)
-            ref.set(location_data)
-        else:
-            # Always update coordinates and timestamp
-            ref.update(location_data)
+        )
 
         logger.debug(
             "Driver location updated at %s — lat=%.6f, lng=%.6f, speed=%s",
@@ -135,6 +85,72 @@ def push_driver_location_to_firebase(
         # Swallow exception - Firebase failure must never block location tracking
 
 
+def queue_driver_location_for_firebase(
+    tenant_id: str,
+    vendor_id: int,
+    driver_id: int,
+    latitude: float = None,
+    longitude: float = None,
+    speed: Optional[float] = None,
+    driver_code: str = None,
+    driver_name: str = None,
+    route_id: int = None,
+):
+    """
+    Hand a location ping to the coalescing writer instead of writing it now.
+
+    Only the latest ping per driver is kept; the writer flushes all pending
+    drivers in one multi-path update every second.  Returns immediately.
+    """
+    from app.firebase.location_writer import location_writer
+
+    location_writer.submit(
+        tenant_id,
+        vendor_id,
+        driver_id,
+        build_location_payload(
+            driver_id=driver_id,
+            latitude=latitude,
+            longitude=longitude,
+            speed=speed,
+            driver_code=driver_code,
+            driver_name=driver_name,
+            route_id=route_id,
+        ),
+    )
+
+
+def build_location_payload(
+    driver_id: int,
+    latitude: float,
+    longitude: float,
+    speed: Optional[float] = None,
+    driver_code: str = None,
+    driver_name: str = None,
+    route_id: int = None,
+) -> dict:
+    """Build the field map written to a driver node on every location ping."""
+    # driver_id cast to int: JWT encodes all claims as strings, we always want int in Firebase
+    location_data = {
+        "driver_id": int(driver_id),
+        "latitude": latitude,
+        "longitude": longitude,
+        "updated_at": datetime.utcnow().isoformat(),
+        "is_active": True,
+    }
+
+    if speed is not None:
+        location_data["speed"] = speed
+    if driver_name:
+        location_data["driver_name"] = driver_name
+    if driver_code:
+        location_data["driver_code"] = driver_code
+    if route_id:
+        location_data["route_id"] = route_id
+
+    return location_data
+
+
 def clear_driver_location_from_firebase(
     tenant_id: str,
     vendor_id: int,
@@ -0,0 +1,214 @@
+"""
+Coalescing Firebase RTDB writer for driver location pings.
+
+Instead of one HTTPS ``update()`` per GPS ping (scheduled as a Starlette
+BackgroundTask and serialised behind the threadpool), pings are handed to a
+single writer that:
+
+- keeps only the latest payload per driver (last-write-wins) in memory,
+- flushes every ``flush_interval`` seconds from one daemon thread,
+- writes all pending drivers in a single multi-path ``update()`` at the
+  root ``drivers/`` node (chunked to ``max_batch`` drivers per call).
+
+Paths are flattened to field level (``{tenant}/{vendor}/{driver}/latitude``)
+so a flush never overwrites fields it does not own (vehicle info,
+created_at, ...), exactly like the per-driver ``ref.update()`` it replaces.
+
+Metrics (Prometheus, exposed on /metrics):
+    firebase_location_writer_queue_depth        drivers waiting for the next flush
+    firebase_location_writer_flush_seconds      latency of each multi-path update
+    firebase_location_writer_pings_total        pings submitted
+    firebase_location_writer_coalesced_total    pings superseded before being flushed
+    firebase_location_writer_flush_errors_total failed flush calls
+
+Testing
+-------
+Pass ``update_fn`` to write into a stub instead of RTDB.  The real SDK also
+honours ``FIREBASE_DATABASE_EMULATOR_HOST`` so the default writer can be
+pointed at a local RTDB emulator without code changes.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DriverKey = Tuple[str, str, str]
+
+_QUEUE_DEPTH = Gauge(
+    "firebase_location_writer_queue_depth",
+    "Driver locations waiting for the next Firebase flush",
+)
+_FLUSH_SECONDS = Histogram(
+    "firebase_location_writer_flush_seconds",
+    "Latency of one multi-path Firebase update",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+_PINGS = Counter(
+    "firebase_location_writer_pings_total",
+    "Location pings submitted to the Firebase writer",
+)
+_COALESCED = Counter(
+    "firebase_location_writer_coalesced_total",
+    "Location pings superseded by a newer ping before being flushed",
+)
+_FLUSH_ERRORS = Counter(
+    "firebase_location_writer_flush_errors_total",
+    "Failed multi-path Firebase updates",
+)
+
+
+def _rtdb_root_update(updates: dict) -> None:
+    """Default sink — one multi-path update at the RTDB ``drivers/`` node."""
+    import firebase_admin
+    from firebase_admin import db
+
+    try:
+        firebase_admin.get_app()
+    except ValueError:
+        logger.error("[firebase.writer] Admin SDK not initialized — dropping %d path(s)", len(updates))
+        return
+    db.reference("drivers").update(updates)
+
+
+class FirebaseLocationWriter:
+    """Coalesces driver location pings and flushes them as batched multi-path updates."""
+
+    def __init__(
+        self,
+        flush_interval: float = 1.0,
+        max_batch: int = 500,
+        update_fn: Optional[Callable[[dict], None]] = None,
+    ):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._update_fn = update_fn or _rtdb_root_update
+        self._pending: Dict[DriverKey, dict] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_flush_seconds: Optional[float] = None
+        self._flushed_drivers = 0
+
+    # ── Producer side ────────────────────────────────────────────────────
+
+    def submit(self, tenant_id, vendor_id, driver_id, payload: dict) -> None:
+        """Queue the latest payload for a driver. Never blocks on network I/O."""
+        key = (str(tenant_id), str(vendor_id), str(driver_id))
+        with self._lock:
+            if key in self._pending:
+                _COALESCED.inc()
+            self._pending[key] = payload
+            depth = len(self._pending)
+        _PINGS.inc()
+        _QUEUE_DEPTH.set(depth)
+        self._ensure_started()
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    # ── Flushing ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _flatten(batch: Dict[DriverKey, dict]) -> dict:
+        updates = {}
+        for (tenant_id, vendor_id, driver_id), payload in batch.items():
+            base = f"{tenant_id}/{vendor_id}/{driver_id}"
+            for field, value in payload.items():
+                updates[f"{base}/{field}"] = value
+        return updates
+
+    def flush(self) -> int:
+        """Write everything pending now. Returns the number of drivers written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            _QUEUE_DEPTH.set(0)
+            if not batch:
+                return 0
+
+            written = 0
+            keys = list(batch.keys())
+            for i in range(0, len(keys), self.max_batch):
+                chunk = {k: batch[k] for k in keys[i:i + self.max_batch]}
+                started = time.perf_counter()
+                try:
+                    self._update_fn(self._flatten(chunk))
+                    written += len(chunk)
+                except Exception as exc:
+                    _FLUSH_ERRORS.inc()
+                    logger.warning(
+                        "[firebase.writer] Flush of %d driver(s) failed — re-queued: %s",
+                        len(chunk), exc,
+                    )
+                    self._requeue(chunk)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    _FLUSH_SECONDS.observe(elapsed)
+                    self._last_flush_seconds = elapsed
+
+            self._flushed_drivers += written
+            return written
+
+    def _requeue(self, chunk: Dict[DriverKey, dict]) -> None:
+        """Put a failed chunk back unless a newer ping already replaced it."""
+        with self._lock:
+            for key, payload in chunk.items():
+                self._pending.setdefault(key, payload)
+            depth = len(self._pending)
+        _QUEUE_DEPTH.set(depth)
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="firebase-location-writer", daemon=True,
+            )
+            self._thread.start()
+
+    def start(self) -> None:
+        self._ensure_started()
+        logger.info("[firebase.writer] Started (interval=%.2fs batch=%d)", self.flush_interval, self.max_batch)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("[firebase.writer] Unexpected flush error")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the flush thread and write whatever is still pending."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+        logger.info("[firebase.writer] Stopped")
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "flush_interval_seconds": self.flush_interval,
+            "max_batch": self.max_batch,
+            "last_flush_seconds": self._last_flush_seconds,
+            "flushed_drivers_total": self._flushed_drivers,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+# Process-wide writer used by the driver location endpoint.
+location_writer = FirebaseLocationWriter()
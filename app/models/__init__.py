@@ -49,5 +49,8 @@ from app.models.chat import ChatSession, ChatMessage, ChatSenderType
 # GPS breadcrumb trail (IMP-1 / IMP-2 / IMP-9)
 from app.models.driver_location_history import DriverLocationHistory
 
+# Driver duty ledger (pre-merged daily duty intervals for rest checks)
+from app.models.driver_duty_day import DriverDutyDay
+
 # DO NOT IMPORT ANY ROUTE-RELATED MODELS HERE
 # The error suggests there's still a conflicting route model being imported
@@ -181,6 +181,9 @@ class AlertNotification(Base):
     sent_at = Column(DateTime, nullable=True)
     delivered_at = Column(DateTime, nullable=True)
     failure_reason = Column(Text, nullable=True)
+    # Milliseconds from the start of the alert's fan-out until the provider
+    # answered.  MIN / MAX per alert give time-to-first / time-to-all-notified.
+    latency_ms = Column(Integer, nullable=True)
     
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
@@ -22,7 +22,7 @@ from enum import Enum as PyEnum
 
 from sqlalchemy import (
     Boolean, Column, DateTime, Enum, ForeignKey,
-    Integer, String, Text, func,
+    Index, Integer, String, Text, func,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -177,5 +177,10 @@ class AnnouncementRecipient(Base):
     read_at       = Column(DateTime, nullable=True)
     created_at    = Column(DateTime, default=func.now(), nullable=False)
 
+    __table_args__ = (
+        # Keyset pagination of delivery tracking: recipient_id > cursor
+        Index("ix_announcement_recipients_ann_recipient", "announcement_id", "recipient_id"),
+    )
+
     # Relationship
     announcement = relationship("Announcement", back_populates="recipients")
@@ -12,6 +12,7 @@ class AuditLog(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False, index=True)
 
     __table_args__ = (
-        Index('idx_tenant_module', 'tenant_id', 'module'),
+        # Keyset pagination of a module's log: (created_at, audit_id) < cursor
+        Index('idx_tenant_module_created', 'tenant_id', 'module', 'created_at', 'audit_id'),
         Index('idx_module_created', 'module', 'created_at'),
     )
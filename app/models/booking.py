@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, String, DateTime, Date, Float,
-    ForeignKey, Enum, func, Text, Boolean
+    ForeignKey, Enum, func, Text, Boolean, Index
 )
 from sqlalchemy.orm import relationship
 from app.database.session import Base
@@ -25,6 +25,7 @@ class BookingTypeEnum(str, PyEnum):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    # Indexes are declared after the columns (the partial one references them).
 
     booking_id = Column(Integer, primary_key=True, index=True)
 
@@ -86,3 +87,25 @@ class Booking(Base):
 
     # Nodal point relationship (populated when shift pickup_type == 'Nodal')
     nodal_point = relationship("NodalPoint", back_populates="bookings")
+
+    __table_args__ = (
+        # (tenant, date, shift, status) — create_routes, route_suggestion,
+        # shift grouping, analytics.  booking_id is carried in the leaf pages
+        # on PostgreSQL so the route joins read the index only.
+        Index(
+            "ix_bookings_tenant_date_shift_status",
+            "tenant_id", "booking_date", "shift_id", "status",
+            postgresql_include=["booking_id"],
+        ),
+        Index("ix_bookings_tenant_status", "tenant_id", "status"),
+        # Keyset pagination of the tenant / employee booking lists by booking_id
+        Index("ix_bookings_tenant_booking", "tenant_id", "booking_id"),
+        Index("ix_bookings_employee_booking", "employee_id", "booking_id"),
+        # Reminder scan: today's scheduled bookings not yet reminded.
+        Index(
+            "ix_bookings_reminder_due",
+            "booking_date",
+            postgresql_where=(status == BookingStatusEnum.SCHEDULED) & reminder_sent_at.is_(None),
+            sqlite_where=(status == BookingStatusEnum.SCHEDULED) & reminder_sent_at.is_(None),
+        ),
+    )
@@ -0,0 +1,58 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index, JSON, event, func
+from sqlalchemy.orm import Session
+from app.database.session import Base
+
+
+class DriverDutyDay(Base):
+    """
+    Duty ledger: one row per driver per calendar day with duty on it.
+
+    Kept in step with route_management by the flush hooks below (see
+    app.services.driver_duty_hours_service.sync_flushed_routes) whenever
+    one of the driver's routes starts, completes or is corrected, so rest
+    checks read a few pre-merged rows instead of the driver's whole route
+    history.
+
+    Columns
+    -------
+    intervals    : merged duty intervals clipped to the day, in order, as
+                   ``[[start_iso, end_iso], ...]``; end is null for a route
+                   still ONGOING
+    duty_minutes : total of the closed intervals (the daily duty total)
+    open_since   : start of the ONGOING route that begins on this day, if any
+    """
+
+    __tablename__ = "driver_duty_days"
+
+    driver_id = Column(
+        Integer,
+        ForeignKey("drivers.driver_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    duty_date = Column(Date, primary_key=True)
+    tenant_id = Column(String(50), nullable=False, index=True)
+
+    intervals = Column(JSON, nullable=False, default=list)
+    duty_minutes = Column(Integer, nullable=False, default=0)
+    open_since = Column(DateTime, nullable=True)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Drivers with an ONGOING route, whatever day it started
+        Index("ix_driver_duty_days_open", "driver_id", postgresql_where=open_since.isnot(None)),
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _note_duty_changes(session, flush_context, instances):
+    from app.services.driver_duty_hours_service import note_route_changes
+
+    note_route_changes(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_duty_ledger(session, flush_context):
+    from app.services.driver_duty_hours_service import sync_flushed_routes
+
+    sync_flushed_routes(session)
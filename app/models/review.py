@@ -12,8 +12,8 @@ One review per booking (enforced by unique constraint on booking_id).
 """
 
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Text,
-    ForeignKey, Enum, func, CheckConstraint, UniqueConstraint, Boolean, JSON,
+    Column, Integer, String, DateTime, Date, Text,
+    ForeignKey, Enum, func, CheckConstraint, UniqueConstraint, Boolean, JSON, Index,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -56,6 +56,9 @@ class RideReview(Base):
         CheckConstraint("overall_rating IS NULL OR (overall_rating >= 1 AND overall_rating <= 5)", name="ck_overall_rating"),
         CheckConstraint("driver_rating  IS NULL OR (driver_rating  >= 1 AND driver_rating  <= 5)", name="ck_driver_rating"),
         CheckConstraint("vehicle_rating IS NULL OR (vehicle_rating >= 1 AND vehicle_rating <= 5)", name="ck_vehicle_rating"),
+
+        # Keyset pagination of the admin review list: (created_at, review_id) < cursor
+        Index("ix_ride_reviews_tenant_created", "tenant_id", "created_at", "review_id"),
     )
 
     # ── Primary key ────────────────────────────────────────────
@@ -157,3 +160,78 @@ class ReviewTag(Base):
     is_active     = Column(Boolean, default=True, nullable=False)
     created_at    = Column(DateTime, default=func.now(), nullable=False)
     updated_at    = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
+# ──────────────────────────────────────────────────────────────
+# Review aggregates — maintained on review submit / deactivate
+# ──────────────────────────────────────────────────────────────
+
+class ReviewSubjectTypeEnum(str, PyEnum):
+    DRIVER  = "driver"
+    VEHICLE = "vehicle"
+
+
+class ReviewAggregate(Base):
+    """
+    Running totals for one driver or vehicle so the summary endpoints never
+    re-scan ride_reviews.
+
+    Only reviews that carry a rating for the subject's dimension are counted
+    (driver_rating for drivers, vehicle_rating for vehicles), matching what
+    the summary endpoints have always reported.
+
+    Rows are created lazily from the raw reviews the first time a subject is
+    touched, then kept up to date incrementally inside the review transaction
+    (see app/services/review_aggregate_service.py).
+    """
+
+    __tablename__ = "review_aggregates"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "subject_type", "subject_id", name="uq_review_aggregate_subject"),
+    )
+
+    aggregate_id   = Column(Integer, primary_key=True, autoincrement=True)
+    tenant_id      = Column(
+        String(50),
+        ForeignKey("tenants.tenant_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    subject_type   = Column(Enum(ReviewSubjectTypeEnum, native_enum=False), nullable=False)
+    subject_id     = Column(Integer, nullable=False)
+
+    rating_sum     = Column(Integer, default=0, nullable=False)   # driver_rating / vehicle_rating
+    rating_count   = Column(Integer, default=0, nullable=False)
+    overall_sum    = Column(Integer, default=0, nullable=False)   # overall_rating of the same reviews
+    overall_count  = Column(Integer, default=0, nullable=False)
+    tag_counts     = Column(_JsonB, nullable=False, default=dict)  # {"Punctual": 12, ...}
+
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class ReviewAggregateDaily(Base):
+    """
+    Per-day buckets behind the rolling 30 / 90-day windows and date-range
+    summaries — a window read touches at most one row per day.
+    """
+
+    __tablename__ = "review_aggregate_daily"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "subject_type", "subject_id", "day", name="uq_review_aggregate_daily"),
+    )
+
+    bucket_id      = Column(Integer, primary_key=True, autoincrement=True)
+    tenant_id      = Column(
+        String(50),
+        ForeignKey("tenants.tenant_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    subject_type   = Column(Enum(ReviewSubjectTypeEnum, native_enum=False), nullable=False)
+    subject_id     = Column(Integer, nullable=False)
+    day            = Column(Date, nullable=False)
+
+    rating_sum     = Column(Integer, default=0, nullable=False)
+    rating_count   = Column(Integer, default=0, nullable=False)
+    tag_counts     = Column(_JsonB, nullable=False, default=dict)
@@ -20,6 +20,9 @@ class RouteManagement(Base):
     __tablename__ = "route_management"
     __table_args__ = (
         Index("ix_route_management_tenant_status", "tenant_id", "status"),
+        Index("ix_rm_tenant_shift", "tenant_id", "shift_id"),
+        Index("ix_rm_tenant_driver", "tenant_id", "assigned_driver_id"),
+        Index("ix_rm_tenant_created", "tenant_id", "created_at"),
     )
 
     route_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -68,6 +71,7 @@ class RouteManagementBooking(Base):
     __tablename__ = "route_management_bookings"
     __table_args__ = (
         UniqueConstraint("route_id", "booking_id", name="uq_route_management_booking_unique"),
+        Index("ix_rmb_booking_id", "booking_id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -12,6 +12,12 @@ class SpeedViolation(Base):
 
     One record = one violation event.  Multiple rows can share the same route_id;
     the total count per ride is derived by querying COUNT(*) WHERE route_id = X.
+
+    Server-detected violations are episodes: one row covers a continuous
+    overspeed stretch.  speed_recorded holds the peak speed, recorded_at the
+    start, and the episode_* columns are filled in when the episode closes
+    (ended_at IS NULL while it is still open).  Rows reported by the driver
+    app are single-ping events and leave the episode columns NULL.
     """
     __tablename__ = "speed_violations"
 
@@ -59,6 +65,14 @@ class SpeedViolation(Base):
     # When the violation occurred (device/GPS timestamp, timezone-aware)
     recorded_at = Column(DateTime(timezone=True), nullable=False)
 
+    # Episode aggregates (server-side detection only)
+    avg_speed        = Column(Float, nullable=True)     # mean over-limit speed (km/h)
+    ping_count       = Column(Integer, nullable=True)   # over-limit pings in the episode
+    ended_at         = Column(DateTime(timezone=True), nullable=True)
+    duration_seconds = Column(Integer, nullable=True)
+    end_latitude     = Column(Float, nullable=True)
+    end_longitude    = Column(Float, nullable=True)
+
     # When the record was inserted into DB
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -70,6 +84,7 @@ class SpeedViolation(Base):
     # Composite index for the most common query patterns
     __table_args__ = (
         Index("ix_speed_violations_tenant_route",  "tenant_id", "route_id"),
-        Index("ix_speed_violations_tenant_driver", "tenant_id", "driver_id"),
-        Index("ix_speed_violations_recorded_at",   "tenant_id", "recorded_at"),
+        # Keyset pagination: (recorded_at, violation_id) < cursor
+        Index("ix_speed_violations_tenant_driver_recorded", "tenant_id", "driver_id", "recorded_at", "violation_id"),
+        Index("ix_speed_violations_tenant_recorded",        "tenant_id", "recorded_at", "violation_id"),
     )
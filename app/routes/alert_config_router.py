@@ -14,6 +14,7 @@ from app.schemas.alert import (
 )
 from app.models.alert import AlertConfiguration
 from app.crud import alert as alert_crud
+from app.services import alert_config_index
 from common_utils.auth.permission_checker import PermissionChecker
 from app.core.logging_config import get_logger
 from app.utils.response_utils import ResponseWrapper
@@ -125,6 +126,7 @@ def create_alert_configuration(
         
         db.commit()
         db.refresh(config)
+        alert_config_index.invalidate(config.tenant_id)
         
         logger.info(f"[alert_config.create] Configuration {config.config_id} created for tenant {tenant_id}")
         
@@ -436,6 +438,7 @@ def update_alert_configuration(
         
         logger.info(f"[alert_config.update] Commit successful, refreshing config")
         db.refresh(config)
+        alert_config_index.invalidate(config.tenant_id)
         
         logger.info(f"[alert_config.update] Configuration {config_id} updated successfully")
         
@@ -516,8 +519,10 @@ def delete_alert_configuration(
             )
         
         # Delete
+        config_tenant_id = config.tenant_id
         db.delete(config)
         db.commit()
+        alert_config_index.invalidate(config_tenant_id)
         
         logger.info(f"[alert_config.delete] Configuration {config_id} deleted")
         
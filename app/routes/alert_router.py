@@ -22,6 +22,7 @@ from app.crud import alert as alert_crud
 from app.crud.booking import booking_crud
 from app.crud import employee as employee_crud
 from app.services.notification_service import NotificationService
+from app.services.alert_escalation_scheduler import escalation_scheduler
 from common_utils.auth.permission_checker import PermissionChecker
 from app.core.logging_config import get_logger
 from app.utils.response_utils import ResponseWrapper
@@ -216,6 +217,9 @@ async def trigger_alert(
                 config_id=config.config_id
             )
             logger.info(f"[alert.trigger] Notification task scheduled for alert {alert.alert_id}")
+            
+            # Register the auto-escalation deadline (cancelled on acknowledge / close)
+            escalation_scheduler.schedule(alert, config)
         
         return ResponseWrapper.success(
             message="Alert triggered successfully. Help is on the way.",
@@ -607,6 +611,7 @@ async def acknowledge_alert(
         db.commit()
         db.refresh(alert)
         logger.info(f"[alert.acknowledge] Changes committed to database")
+        escalation_scheduler.cancel(alert.alert_id)
         
         logger.info(f"[alert.acknowledge] Alert {alert_id} acknowledged by {responder_name}, response_time={alert.response_time_seconds}s")
         
@@ -730,6 +735,7 @@ async def close_alert(
         db.commit()
         db.refresh(alert)
         logger.info(f"[alert.close] Changes committed to database")
+        escalation_scheduler.cancel(alert.alert_id)
         
         logger.info(f"[alert.close] Alert {alert_id} closed by {closed_by_name}, resolution_time={alert.resolution_time_seconds}s")
         
@@ -391,6 +391,7 @@ def list_announcement_recipients_endpoint(
     announcement_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="meta.next_cursor of the previous page (page is then ignored)"),
     user_data=Depends(PermissionChecker(["booking.read"])),
     db: Session = Depends(get_db),
 ):
@@ -401,11 +402,12 @@ def list_announcement_recipients_endpoint(
         from app.models.driver import Driver as DriverModel
 
         ann = _get_or_404(db, announcement_id, user_data.get("tenant_id"))
-        items, total = list_recipients(
+        items, total, next_cursor = list_recipients(
             db=db,
             announcement_id=ann.announcement_id,
             page=page,
             page_size=page_size,
+            cursor=cursor,
         )
 
         # Batch-load names for all recipients in this page
@@ -426,6 +428,7 @@ def list_announcement_recipients_endpoint(
             total=total,
             page=page,
             per_page=page_size,
+            next_cursor=next_cursor,
         )
     except HTTPException as e:
         if e.status_code == 404:
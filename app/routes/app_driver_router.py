@@ -54,6 +54,7 @@ from app.utils.delay_tagging import tag_trip_delay
 # Notification services
 from app.core.email_service import EmailService
 from app.services.sms_service import SMSService
+from app.services.stale_driver_service import forget_heartbeat, record_heartbeat
 from app.services.unified_notification_service import UnifiedNotificationService
 
 
@@ -540,6 +541,9 @@ async def start_duty(
             vehicle_type = vehicle_type,
         )
 
+        # Start the stale-driver heartbeat (a driver who never pings is flagged too)
+        background_tasks.add_task(record_heartbeat, tenant_id=tenant_id, route_id=route.route_id)
+
         # Send notifications to all employees on this route
         background_tasks.add_task(
             send_duty_start_notifications,
@@ -710,7 +714,7 @@ async def get_driver_trips(
         )
         
         if status_filter != "ongoing":
-            route_ids_subquery = route_ids_subquery.filter(func.date(Booking.booking_date) == booking_date)
+            route_ids_subquery = route_ids_subquery.filter(Booking.booking_date == booking_date)
         else:
             logger.info(f"[driver.trips] fetching ongoing routes without date filter to cover edge cases (driver_id={driver_id})")
         
@@ -756,7 +760,7 @@ async def get_driver_trips(
         )
         
         if status_filter != "ongoing":
-            all_bookings_query = all_bookings_query.filter(func.date(Booking.booking_date) == booking_date)
+            all_bookings_query = all_bookings_query.filter(Booking.booking_date == booking_date)
         
         all_bookings_rows = all_bookings_query.order_by(
             RouteManagementBooking.route_id,
@@ -1659,8 +1663,10 @@ async def update_driver_location(
     Actions performed:
       1. Validates the route is ONGOING and belongs to this driver.
       2. Writes the coordinates to driver_location_history (PostgreSQL — full trail).
-      3. Pushes the latest position to Firebase RTDB in a BackgroundTask
-         (non-blocking — a Firebase failure never fails the HTTP response).
+      3. Queues the latest position on the coalescing Firebase RTDB writer
+         (flushed once per second as one multi-path update — a Firebase
+         failure never fails the HTTP response), mirrors it into the
+         Redis live-map GEO sets and stamps the stale-driver heartbeat.
       4. IMP-7: Runs geofence check — if driver is within arrival radius of next
          stop, pushes "Driver arriving" FCM to the waiting employee (BackgroundTask).
       5. IMP-6: Recalculates ETAs for all remaining stops and pushes FCM to
@@ -1709,10 +1715,9 @@ async def update_driver_location(
         db.add(ping)
         db.commit()
 
-        # --- Push latest position to Firebase RTDB (best-effort, non-blocking) ---
+        # --- Queue latest position for the coalescing Firebase writer (never blocks) ---
         driver_obj = db.query(Driver).filter(Driver.driver_id == route.assigned_driver_id).first() if route.assigned_driver_id else None
-        background_tasks.add_task(
-            _push_location_to_firebase_bg,
+        _queue_firebase_location(
             tenant_id  = tenant_id,
             vendor_id  = vendor_id,
             driver_id  = driver_id,
@@ -1724,6 +1729,23 @@ async def update_driver_location(
             route_id   = route.route_id,
         )
 
+        # --- Mirror position into the Redis live-map GEO sets (non-blocking) ---
+        background_tasks.add_task(
+            _record_fleet_location_bg,
+            tenant_id   = tenant_id,
+            vendor_id   = vendor_id,
+            driver_id   = driver_id,
+            latitude    = latitude,
+            longitude   = longitude,
+            speed       = speed,
+            driver_name = driver_obj.name if driver_obj else None,
+            driver_code = driver_obj.code if driver_obj else None,
+            route_id    = route.route_id,
+        )
+
+        # --- Stale-driver heartbeat (non-blocking) ---
+        background_tasks.add_task(record_heartbeat, tenant_id=tenant_id, route_id=route_id)
+
         # --- IMP-7: Geofence arrival check (non-blocking) ---
         background_tasks.add_task(
             _geofence_check_bg,
@@ -1779,7 +1801,7 @@ async def update_driver_location(
         raise handle_db_error(e)
 
 
-def _push_location_to_firebase_bg(
+def _queue_firebase_location(
     tenant_id: str,
     vendor_id: int,
     driver_id: int,
@@ -1791,12 +1813,13 @@ def _push_location_to_firebase_bg(
     route_id: int = None,
 ) -> None:
     """
-    Background task wrapper for Firebase location push.
+    Queue the ping on the coalescing Firebase writer, which flushes all
+    drivers in one multi-path update per interval.
     Swallows all exceptions so a Firebase failure never propagates to the HTTP layer.
     """
     try:
-        from app.firebase.driver_location import push_driver_location_to_firebase
-        push_driver_location_to_firebase(
+        from app.firebase.driver_location import queue_driver_location_for_firebase
+        queue_driver_location_for_firebase(
             tenant_id = tenant_id,
             vendor_id = vendor_id,
             driver_id = driver_id,
@@ -1809,7 +1832,42 @@ def _push_location_to_firebase_bg(
         )
     except Exception as exc:
         logger.exception(
-            "[driver.location] Firebase background push failed for driver %s: %s",
+            "[driver.location] Firebase queueing failed for driver %s: %s",
+            driver_id, exc,
+        )
+
+
+def _record_fleet_location_bg(
+    tenant_id: str,
+    vendor_id: int,
+    driver_id: int,
+    latitude: float,
+    longitude: float,
+    speed: float = None,
+    driver_name: str = None,
+    driver_code: str = None,
+    route_id: int = None,
+) -> None:
+    """
+    Background task wrapper for the Redis live-map mirror.
+    Swallows all exceptions so a Redis failure never propagates to the HTTP layer.
+    """
+    try:
+        from app.services.fleet_location_service import record_driver_location
+        record_driver_location(
+            tenant_id   = tenant_id,
+            vendor_id   = vendor_id,
+            driver_id   = driver_id,
+            latitude    = latitude,
+            longitude   = longitude,
+            speed       = speed,
+            driver_name = driver_name,
+            driver_code = driver_code,
+            route_id    = route_id,
+        )
+    except Exception as exc:
+        logger.exception(
+            "[driver.location] Live-map mirror failed for driver %s: %s",
             driver_id, exc,
         )
 
@@ -1913,7 +1971,8 @@ def _clear_firebase_location_bg(
 ) -> None:
     """
     IMP-11 — Background task wrapper for Firebase location node cleanup.
-    Marks the driver's RTDB node as offline (is_active=False).
+    Marks the driver's RTDB node as offline (is_active=False) and drops the
+    driver from the Redis live map.
     Swallows all exceptions so a Firebase failure never propagates to the HTTP layer.
     """
     try:
@@ -1929,6 +1988,15 @@ def _clear_firebase_location_bg(
             driver_id, exc,
         )
 
+    try:
+        from app.services.fleet_location_service import remove_driver
+        remove_driver(tenant_id=tenant_id, vendor_id=vendor_id, driver_id=driver_id)
+    except Exception as exc:
+        logger.exception(
+            "[driver.end_duty] Live-map cleanup failed for driver %s: %s",
+            driver_id, exc,
+        )
+
 
 def _speed_violation_check_bg(
     tenant_id: str,
@@ -1966,6 +2034,22 @@ def _speed_violation_check_bg(
         )
 
 
+def _close_speed_episode_bg(route_id: int, db: Session) -> None:
+    """
+    IMP-10 — Background task wrapper that finalises an open overspeed episode
+    when duty ends.
+    Swallows all exceptions so a violation failure never propagates to the HTTP layer.
+    """
+    try:
+        from app.services.speed_violation_service import close_speed_episode
+        close_speed_episode(db=db, route_id=route_id)
+    except Exception as exc:
+        logger.exception(
+            "[driver.end_duty] Speed episode close failed for route %s: %s",
+            route_id, exc,
+        )
+
+
 @router.put("/duty/end", status_code=status.HTTP_200_OK)
 async def end_duty(
     route_id: int,
@@ -2070,6 +2154,16 @@ async def end_duty(
             driver_id = driver_id,
         )
 
+        # Stop the stale-driver heartbeat for the closed route
+        background_tasks.add_task(forget_heartbeat, tenant_id=tenant_id, route_id=route_id)
+
+        # IMP-10 — close any overspeed episode still open for this route
+        background_tasks.add_task(
+            _close_speed_episode_bg,
+            route_id = route_id,
+            db       = db,
+        )
+
         return ResponseWrapper.success(
             message="Duty ended and route closed",
             data={
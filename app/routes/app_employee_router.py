@@ -20,8 +20,8 @@ from app.models.booking import Booking, BookingStatusEnum
 from app.models.nodal_point import EmployeeNodalPoint
 from app.models.tenant import Tenant
 from app.models.vehicle import Vehicle
-from app.models.driver import Driver
 from app.models.cutoff import Cutoff
+from app.services.route_views import load_route_refs, serialize_employee_route
 
 
 logger = get_logger(__name__)
@@ -47,72 +47,6 @@ def EmployeeAuth(user_data=Depends(PermissionChecker(["employee_app.read"]))):
     return {"tenant_id": tenant_id, "employee_id": employee_id}
 
 
-def serialize_route(db: Session, route: RouteManagement):
-    """
-    Explicit, non-DRY serializer for response. Feel free to extend.
-    """
-    # Vehicle details
-    vehicle_details = None
-    if route.assigned_vehicle_id:
-        vehicle = db.query(Vehicle).filter(Vehicle.vehicle_id == route.assigned_vehicle_id).first()
-        if vehicle:
-            vehicle_details = {
-                "vehicle_id": vehicle.vehicle_id,
-                "vehicle_number": vehicle.rc_number,
-                "vehicle_type": vehicle.vehicle_type.name if vehicle.vehicle_type else None,
-                "capacity": vehicle.vehicle_type.seats if vehicle.vehicle_type else None,
-            }
-
-    # Driver details
-    driver_details = None
-    if route.assigned_driver_id:
-        driver = db.query(Driver).filter(Driver.driver_id == route.assigned_driver_id).first()
-        if driver:
-            driver_details = {
-                "driver_id": driver.driver_id,
-                "driver_name": driver.name,
-                "driver_phone": driver.phone,
-                "license_number": driver.license_number,
-            }
-
-    # Vendor details
-    vendor_details = None
-    if route.assigned_vendor_id:
-        vendor = db.query(Vendor).filter(Vendor.vendor_id == route.assigned_vendor_id).first()
-        if vendor:
-            vendor_details = {
-                "vendor_id": vendor.vendor_id,
-                "vendor_name": vendor.name,
-                "vendor_code": vendor.vendor_code,
-            }
-
-    # Shift details
-    shift_details = None
-    if route.shift_id:
-        shift = db.query(Shift).filter(Shift.shift_id == route.shift_id).first()
-        if shift:
-            shift_details = {
-                "shift_id": shift.shift_id,
-                "shift_time": shift.shift_time.strftime("%H:%M:%S") if shift.shift_time else None,
-                "log_type": shift.log_type.value if shift.log_type else None,
-            }
-
-    return {
-        "route_id": route.route_id,
-        "route_code": route.route_code,
-        "status": route.status.value,
-        "shift_details": shift_details,
-        "vehicle_details": vehicle_details,
-        "driver_details": driver_details,
-        "vendor_details": vendor_details,
-        "escort_required": route.escort_required,
-        "estimated_total_time": route.estimated_total_time,
-        "estimated_total_distance": route.estimated_total_distance,
-        "actual_total_time": route.actual_total_time,
-        "actual_total_distance": route.actual_total_distance,
-    }
-
-
 @router.get("/bookings", status_code=status.HTTP_200_OK)
 async def get_employee_bookings(
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
@@ -175,6 +109,9 @@ async def get_employee_bookings(
                     .all()
                 )
                 route_map = {r.route_id: r for r in routes}
+
+        # Vehicles / drivers / vendors / shifts for every route and booking on the page
+        refs = load_route_refs(db, route_map.values(), shift_ids={b.shift_id for b in bookings})
         # --- End batch load ---
 
         bookings_list = []
@@ -185,7 +122,7 @@ async def get_employee_bookings(
             if route_booking:
                 route = route_map.get(route_booking.route_id)
                 if route:
-                    route_details = serialize_route(db, route)
+                    route_details = serialize_employee_route(route, refs)
 
             booking_dict = {
                 "tenant_id": booking.tenant_id,
@@ -207,7 +144,7 @@ async def get_employee_bookings(
                 "deboarding_otp": booking.deboarding_otp,
                 "is_active": True,
                 "booking_id": booking.booking_id,
-                "shift_time": booking.shift.shift_time.strftime("%H:%M:%S") if booking.shift and booking.shift.shift_time else None,
+                "shift_time": (refs.shifts.get(booking.shift_id) or {}).get("shift_time"),
                 "route_details": route_details,
                 "created_at": booking.created_at.isoformat() if booking.created_at else None,
                 "updated_at": booking.updated_at.isoformat() if booking.updated_at else None,
@@ -46,7 +46,7 @@ from app.models.vehicle import Vehicle
 from app.models.shift import Shift
 from app.utils.response_utils import ResponseWrapper, handle_db_error
 from common_utils.auth.token_validation import validate_bearer_token
-from common_utils.auth.utils import hash_password, verify_password
+from common_utils.auth.password_hasher import hash_password_async, verify_password_async
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/escort", tags=["Escort App"])
@@ -300,7 +300,7 @@ async def change_escort_password(
         )
 
     # Verify current password
-    if not verify_password(body.current_password, escort.password):
+    if not await verify_password_async(body.current_password, escort.password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ResponseWrapper.error(
@@ -318,7 +318,7 @@ async def change_escort_password(
             ),
         )
 
-    escort.password = hash_password(body.new_password)
+    escort.password = await hash_password_async(body.new_password)
     db.commit()
 
     logger.info(f"Escort {escort_id} changed their password")
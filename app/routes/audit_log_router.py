@@ -20,6 +20,7 @@ def get_audit_by_module(
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
     tenant_id: Optional[str] = Query(None, description="Tenant ID for filtering (required for admins)"),
     employee_id: Optional[int] = Query(None, description="Employee ID filter (only for employee module)"),
+    cursor: Optional[str] = Query(None, description="pagination.next_cursor of the previous page (page is then ignored)"),
     db: Session = Depends(get_db),
     user_data=Depends(PermissionChecker(["audit_log.read"], check_tenant=True)),
 ):
@@ -102,7 +103,8 @@ def get_audit_by_module(
             module=module_name.lower(),
             tenant_id=tenant_filter,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
 
         # Add employee_id filter if module is employee
@@ -111,7 +113,7 @@ def get_audit_by_module(
             logger.info(f"Applying employee_id filter: {employee_id} for module '{module_name}'")
 
         # Get filtered audit logs
-        logs, total_count = audit_log.get_filtered(db=db, filters=filters)
+        logs, total_count, next_cursor = audit_log.get_filtered(db=db, filters=filters)
 
         # Convert to response format
         logs_response = [AuditLogResponse.model_validate(log, from_attributes=True) for log in logs]
@@ -129,7 +131,8 @@ def get_audit_by_module(
                     "page": page,
                     "page_size": page_size,
                     "total_count": total_count,
-                    "total_pages": (total_count + page_size - 1) // page_size
+                    "total_pages": (total_count + page_size - 1) // page_size,
+                    "next_cursor": next_cursor,
                 }
             },
             message=f"Audit logs for {module_name} retrieved successfully",
@@ -36,6 +36,7 @@ from common_utils.auth.utils import (
     create_access_token, create_refresh_token, 
     verify_token, hash_password, verify_password
 )
+from common_utils.auth.password_hasher import upgrade_legacy_hash, verify_password_async
 from common_utils.auth.token_validation import Oauth2AsAccessor, validate_bearer_token
 from app.schemas.employee import EmployeeResponse
 from app.crud.employee import employee_crud
@@ -521,7 +522,7 @@ async def employee_login(
         }
 
         # verify password
-        if not verify_password(form_data.password, employee.password):
+        if not await verify_password_async(form_data.password, employee.password):
             logger.warning(f"🔒 Login failed - Invalid password for employee: {employee.employee_id} ({form_data.username})")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -530,6 +531,7 @@ async def employee_login(
                     error_code=status.HTTP_401_UNAUTHORIZED,
                 ),
             )
+        await upgrade_legacy_hash(db, employee, form_data.password)
 
         # account active checks (using eager-loaded data)
         team_inactive = employee.team and not employee.team.is_active
@@ -1771,7 +1773,7 @@ async def vendor_user_login(
         tenant = vendor.tenant
         logger.debug(f"Tenant validation successful - ID: {tenant.tenant_id}")
 
-        if not verify_password(form_data.password, vendor_user.password):
+        if not await verify_password_async(form_data.password, vendor_user.password):
             logger.warning(
                 f"🔒 Login failed - Invalid password for vendor_user: "
                 f"{vendor_user.vendor_user_id} ({form_data.username})"
@@ -1783,6 +1785,7 @@ async def vendor_user_login(
                     error_code=status.HTTP_401_UNAUTHORIZED
                 )
             )
+        await upgrade_legacy_hash(db, vendor_user, form_data.password)
 
         if not vendor_user.is_active or not vendor.is_active or not tenant.is_active:
             logger.warning(
@@ -1934,7 +1937,7 @@ async def admin_login(
                 )
             )
         
-        if not verify_password(form_data.password, admin.password):   
+        if not await verify_password_async(form_data.password, admin.password):
             logger.warning(f"Admin login failed - Invalid password for admin: {admin.admin_id} ({form_data.username})")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1943,6 +1946,7 @@ async def admin_login(
                     error_code=status.HTTP_401_UNAUTHORIZED
                 )
             )
+        await upgrade_legacy_hash(db, admin, form_data.password)
 
         if not admin.is_active:
             logger.warning(f"Admin login failed - Inactive account for admin: {admin.admin_id} ({form_data.username})")
@@ -3438,7 +3442,7 @@ async def escort_login(
             )
 
         # Verify password against stored hash (bcrypt preferred; legacy SHA-256 supported)
-        if not verify_password(form_data.password, escort.password):
+        if not await verify_password_async(form_data.password, escort.password):
             logger.warning(
                 f"Escort login failed — wrong password for escort_id={escort.escort_id}"
             )
@@ -3449,6 +3453,7 @@ async def escort_login(
                     error_code="INVALID_CREDENTIALS",
                 ),
             )
+        await upgrade_legacy_hash(db, escort, form_data.password)
 
         logger.info(
             f"Escort {escort.escort_id} authenticated — building token"
@@ -17,11 +17,12 @@ from datetime import date, datetime, datetime, timedelta, timezone
 from app.database.session import get_db
 from app.models.booking import Booking
 from app.schemas.booking import BookingCreate, BookingUpdate, BookingResponse, BookingStatusEnum, UpdateBookingRequest, BulkAllEmployeesBookingCreate
-from app.utils.pagination import paginate_query
+from app.utils.pagination import cached_count, keyset_paginate, paginate_query
 from common_utils.auth.permission_checker import PermissionChecker
 from common_utils.auth.token_validation import validate_bearer_token
 from common_utils import get_current_ist_time
 from app.utils.cache_manager import get_tenant_with_cache, get_shift_with_cache, get_weekoff_with_cache, get_cutoff_with_cache
+from app.services.bulk_booking import bulk_book_employees, date_rejection
 from app.schemas.base import BaseResponse, PaginatedResponse
 from app.utils.response_utils import ResponseWrapper, handle_http_error, validate_pagination_params, handle_db_error
 from sqlalchemy.exc import SQLAlchemyError
@@ -504,7 +505,8 @@ def bulk_book_all_employees(
     - If `employee_ids` is provided → books only those employees.
     - Duplicate bookings, weekoff violations, and other per-employee errors are captured
       in `failed` without aborting the entire request.
-    - Returns a summary: `{ booked, skipped, failed_employees }`.
+    - Returns a summary: `{ booked, skipped, failed_employees }` plus `employees`, the
+      per-employee report (booked / skipped / failed dates) from app.services.bulk_booking.
     """
     try:
         user_type = user_data.get("user_type")
@@ -549,21 +551,6 @@ def bulk_book_all_employees(
                 detail=ResponseWrapper.error("Shift not found for this tenant", "SHIFT_NOT_FOUND"),
             )
 
-        # --- Shift time must not have already passed today ---
-        shift_time = get_shift_time(shift)
-        shift_datetime = datetime.combine(payload.booking_date, shift_time).replace(
-            tzinfo=timezone(timedelta(hours=5, minutes=30))
-        )
-        now = get_current_ist_time()
-        if payload.booking_date == date.today() and now >= shift_datetime:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ResponseWrapper.error(
-                    message=f"Cannot create bookings for a shift that has already started or passed (Shift time: {shift_time})",
-                    error_code="PAST_SHIFT_TIME",
-                ),
-            )
-
         # --- Tenant lookup ---
         tenant = get_tenant_with_cache(db, tenant_id)
         if not tenant:
@@ -572,195 +559,47 @@ def bulk_book_all_employees(
         # --- Cutoff config ---
         cutoff = get_cutoff_with_cache(db, tenant_id)
 
-        # --- Fetch target employees ---
-        emp_query = db.query(Employee).filter(
-            Employee.tenant_id == tenant_id,
-            Employee.is_active.is_(True),
+        # --- Shift time, ad-hoc / medical permission and cutoff (shared by all employees) ---
+        shift_time = get_shift_time(shift)
+        shift_log_type = get_shift_log_type(shift)
+        rejection = date_rejection(
+            payload.booking_date, shift_time, shift_log_type, payload.booking_type, cutoff,
+            now=get_current_ist_time(),
         )
-        if payload.employee_ids:
-            emp_query = emp_query.filter(Employee.employee_id.in_(payload.employee_ids))
-        employees = emp_query.all()
-
-        if not employees:
-            return ResponseWrapper.success(
-                data={"booked": 0, "skipped": 0, "failed_employees": []},
-                message="No active employees found to book",
+        if rejection:
+            error_code, message = rejection
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ResponseWrapper.error(message=message, error_code=error_code),
             )
 
-        # --- Pre-fetch existing bookings for this shift+date to avoid N+1 duplicate checks ---
-        all_emp_ids = [e.employee_id for e in employees]
-        existing_bookings_set = set(
-            row[0]
-            for row in db.query(Booking.employee_id).filter(
-                Booking.employee_id.in_(all_emp_ids),
-                Booking.shift_id == payload.shift_id,
-                Booking.booking_date == payload.booking_date,
-                Booking.status != BookingStatusEnum.CANCELLED,
-            ).all()
-        )
-
-        # --- Pre-fetch weekoff configs ---
-        from app.models.weekoff_config import WeekoffConfig
-        weekoff_configs = {
-            wc.employee_id: wc
-            for wc in db.query(WeekoffConfig).filter(
-                WeekoffConfig.employee_id.in_(all_emp_ids)
-            ).all()
-        }
-
-        # --- Pre-fetch nodal assignments if shift is nodal ---
         shift_pickup_type = (
             shift.get("pickup_type") if isinstance(shift, dict)
             else (shift.pickup_type.value if shift.pickup_type else None)
         )
-        is_nodal = shift_pickup_type == PickupTypeEnum.NODAL.value
-        nodal_map: dict = {}
-        if is_nodal:
-            from app.models.nodal_point import EmployeeNodalPoint
-            assignments = (
-                db.query(EmployeeNodalPoint)
-                .filter(EmployeeNodalPoint.employee_id.in_(all_emp_ids))
-                .all()
-            )
-            nodal_map = {a.employee_id: a for a in assignments}
-
-        # --- Cutoff check (shared for all employees for the same shift/date) ---
-        shift_log_type = get_shift_log_type(shift)
-        cutoff_interval = None
-        if payload.booking_type == "adhoc":
-            if not cutoff or not cutoff.allow_adhoc_booking:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ResponseWrapper.error("Ad-hoc booking is not enabled for this tenant", "ADHOC_BOOKING_DISABLED"),
-                )
-            cutoff_interval = cutoff.adhoc_booking_cutoff if cutoff else None
-        elif payload.booking_type == "medical_emergency":
-            if not cutoff or not cutoff.allow_medical_emergency_booking:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ResponseWrapper.error("Medical emergency booking is not enabled for this tenant", "MEDICAL_EMERGENCY_BOOKING_DISABLED"),
-                )
-            cutoff_interval = cutoff.medical_emergency_booking_cutoff if cutoff else None
-        else:
-            if cutoff:
-                cutoff_interval = cutoff.booking_login_cutoff if shift_log_type == "IN" else cutoff.booking_logout_cutoff
 
-        if cutoff and cutoff_interval and cutoff_interval.total_seconds() > 0:
-            time_until_shift = shift_datetime - now
-            if time_until_shift < cutoff_interval:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ResponseWrapper.error(
-                        f"Booking cutoff time has passed for this shift (cutoff: {cutoff_interval})",
-                        "BOOKING_CUTOFF",
-                    ),
-                )
-
-        weekday_map = {0: "monday", 1: "tuesday", 2: "wednesday", 3: "thursday",
-                       4: "friday", 5: "saturday", 6: "sunday"}
-        booking_weekday = weekday_map[payload.booking_date.weekday()]
-
-        # --- Process each employee ---
-        bookings_to_create = []
-        failed_employees = []
-        skipped_count = 0
-
-        for employee in employees:
-            emp_id = employee.employee_id
-
-            # Skip if already booked
-            if emp_id in existing_bookings_set:
-                skipped_count += 1
-                logger.info(f"[bulk-all] Skipping employee {emp_id} — already booked")
-                continue
+        # --- Set-wise eligibility (duplicates, weekoffs, nodal points) + one batched INSERT ---
+        report = bulk_book_employees(
+            db, tenant_id, tenant, cutoff,
+            shift_id=payload.shift_id,
+            shift_time=shift_time,
+            log_type=shift_log_type,
+            nodal=shift_pickup_type == PickupTypeEnum.NODAL.value,
+            booking_dates=[payload.booking_date],
+            booking_type=payload.booking_type,
+            employee_ids=payload.employee_ids,
+        )
 
-            # Weekoff check
-            weekoff_config = weekoff_configs.get(emp_id)
-            if weekoff_config and getattr(weekoff_config, booking_weekday, False):
-                failed_employees.append({
-                    "employee_id": emp_id,
-                    "reason": f"Weekoff day ({booking_weekday})",
-                    "error_code": "WEEKOFF_DAY",
-                })
-                continue
+        if not report.employees:
+            return ResponseWrapper.success(
+                data={"booked": 0, "skipped": 0, "failed_employees": []},
+                message="No active employees found to book",
+            )
 
-            # Compute pickup/drop
-            try:
-                nodal_point_id = None
-                if is_nodal:
-                    assignment = nodal_map.get(emp_id)
-                    if not assignment:
-                        failed_employees.append({
-                            "employee_id": emp_id,
-                            "reason": "No nodal point assigned",
-                            "error_code": "NO_NODAL_ASSIGNMENT",
-                        })
-                        continue
-                    nodal_point = assignment.nodal_point
-                    if not nodal_point or not nodal_point.is_active:
-                        failed_employees.append({
-                            "employee_id": emp_id,
-                            "reason": "Assigned nodal point is inactive",
-                            "error_code": "NODAL_POINT_INACTIVE",
-                        })
-                        continue
-                    nodal_point_id = nodal_point.nodal_point_id
-                    if shift_log_type == "IN":
-                        pickup_lat = float(nodal_point.latitude)
-                        pickup_lng = float(nodal_point.longitude)
-                        pickup_addr = nodal_point.address or nodal_point.name
-                        drop_lat = float(tenant.latitude) if tenant.latitude else None
-                        drop_lng = float(tenant.longitude) if tenant.longitude else None
-                        drop_addr = tenant.address
-                    else:
-                        pickup_lat = float(tenant.latitude) if tenant.latitude else None
-                        pickup_lng = float(tenant.longitude) if tenant.longitude else None
-                        pickup_addr = tenant.address
-                        drop_lat = float(nodal_point.latitude)
-                        drop_lng = float(nodal_point.longitude)
-                        drop_addr = nodal_point.address or nodal_point.name
-                elif shift_log_type == "IN":
-                    pickup_lat, pickup_lng = employee.latitude, employee.longitude
-                    pickup_addr = employee.address
-                    drop_lat, drop_lng = tenant.latitude, tenant.longitude
-                    drop_addr = tenant.address
-                else:
-                    pickup_lat, pickup_lng = tenant.latitude, tenant.longitude
-                    pickup_addr = tenant.address
-                    drop_lat, drop_lng = employee.latitude, employee.longitude
-                    drop_addr = employee.address
-
-                bookings_to_create.append({
-                    "tenant_id": tenant_id,
-                    "employee_id": emp_id,
-                    "employee_code": employee.employee_code,
-                    "team_id": employee.team_id,
-                    "shift_id": payload.shift_id,
-                    "booking_date": payload.booking_date,
-                    "pickup_latitude": pickup_lat,
-                    "pickup_longitude": pickup_lng,
-                    "pickup_location": pickup_addr,
-                    "drop_latitude": drop_lat,
-                    "drop_longitude": drop_lng,
-                    "drop_location": drop_addr,
-                    "status": BookingStatusEnum.REQUEST,
-                    "booking_type": payload.booking_type,
-                    "nodal_point_id": nodal_point_id,
-                })
-            except Exception as emp_err:
-                logger.warning(f"[bulk-all] Error preparing booking for employee {emp_id}: {emp_err}")
-                failed_employees.append({
-                    "employee_id": emp_id,
-                    "reason": str(emp_err),
-                    "error_code": "PREPARATION_ERROR",
-                })
-
-        # --- Bulk insert ---
-        booked_count = 0
-        if bookings_to_create:
-            db.bulk_insert_mappings(Booking, bookings_to_create)
-            db.commit()
-            booked_count = len(bookings_to_create)
+        db.commit()
+        booked_count, skipped_count = report.booked, report.skipped
+        failed_employees = report.failed_employees()
+        if booked_count:
             logger.info(
                 f"[bulk-all] ✅ Created {booked_count} bookings for shift={payload.shift_id} "
                 f"date={payload.booking_date} tenant={tenant_id}"
@@ -772,6 +611,7 @@ def bulk_book_all_employees(
                 "skipped": skipped_count,
                 "failed": len(failed_employees),
                 "failed_employees": failed_employees,
+                "employees": [e.as_dict() for e in report.employees],
             },
             message=f"{booked_count} booking(s) created, {skipped_count} skipped (already booked), {len(failed_employees)} failed",
         )
@@ -804,6 +644,7 @@ def get_bookings(
     status_filter: Optional[BookingStatusEnum] = Query(None, description="Filter by booking status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="meta.next_cursor of the previous page (skip is then ignored)"),
 ):
     try:
         # --- Determine effective tenant ---
@@ -850,7 +691,10 @@ def get_bookings(
         if status_filter:
             query = query.filter(Booking.status == status_filter)
 
-        total, items = paginate_query(query, skip, limit)
+        total = cached_count(query, refresh=cursor is None)
+        items, next_cursor = keyset_paginate(
+            query, [Booking.booking_id], cursor=cursor, offset=skip, limit=limit, descending=False,
+        )
 
         # Fetch route data with eager loading for efficiency (single optimized query)
         booking_ids = [b.booking_id for b in items]
@@ -978,7 +822,8 @@ def get_bookings(
             total=total,
             page=(skip // limit) + 1,
             per_page=limit,
-            message="Bookings fetched successfully"
+            message="Bookings fetched successfully",
+            next_cursor=next_cursor,
         )
 
     except SQLAlchemyError as e:
@@ -1011,6 +856,7 @@ def get_bookings_by_employee(
     user_data=Depends(PermissionChecker(["booking.read"], check_tenant=True)),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="meta.next_cursor of the previous page (skip is then ignored)"),
 ):
     try:
         if not employee_id and not employee_code:
@@ -1063,7 +909,10 @@ def get_bookings_by_employee(
             joinedload(Booking.shift)
         )
 
-        total, items = paginate_query(query, skip, limit)
+        total = cached_count(query, refresh=cursor is None)
+        items, next_cursor = keyset_paginate(
+            query, [Booking.booking_id], cursor=cursor, offset=skip, limit=limit, descending=False,
+        )
         logger.info(f"Found {total} total bookings, returning {len(items)} items")
 
         # Fetch route data with eager loading for efficiency (single optimized query)
@@ -1193,7 +1042,8 @@ def get_bookings_by_employee(
             total=total,
             page=(skip // limit) + 1,
             per_page=limit,
-            message="Employee bookings fetched successfully"
+            message="Employee bookings fetched successfully",
+            next_cursor=next_cursor,
         )
 
     except SQLAlchemyError as e:
@@ -1781,7 +1631,7 @@ async def get_bookings_grouped_by_shift(
             .join(Shift, Shift.shift_id == Booking.shift_id)
             .filter(
                 Booking.tenant_id == effective_tenant_id,
-                func.date(Booking.booking_date) == booking_date,
+                Booking.booking_date == booking_date,
             )
         )
 
@@ -1812,7 +1662,7 @@ async def get_bookings_grouped_by_shift(
             .filter(
                 RouteManagement.tenant_id == effective_tenant_id,
                 Booking.tenant_id == effective_tenant_id,
-                func.date(Booking.booking_date) == booking_date,
+                Booking.booking_date == booking_date,
             )
         )
 
@@ -7,6 +7,9 @@ Employee App  /employee/chat/{booking_id}/...
 Driver App    /driver/chat/{booking_id}/...
 Admin         /chat/sessions/...              (read-only transparency)
 
+Live delivery is Firebase RTDB, or the SSE streams
+(/employee|driver/chat/{booking_id}/stream) when CHAT_STREAM_ENABLED.
+
 Auth
 ────
 • Employee endpoints  → PermissionChecker(["employee_app.read"])
@@ -15,9 +18,12 @@ Auth
 """
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -36,7 +42,7 @@ from app.schemas.chat import (
     SetLanguageRequest,
     SUPPORTED_LANGUAGES,
 )
-from app.services import chat_service
+from app.services import chat_service, chat_stream, translation_service
 from app.utils.response_utils import ResponseWrapper
 from common_utils.auth.permission_checker import PermissionChecker
 
@@ -558,6 +564,153 @@ def driver_set_language(
     )
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# LIVE STREAM ENDPOINTS  (SSE — in-house alternative to the RTDB listener)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _sse_frame(event: Optional[dict], language: str) -> Optional[str]:
+    """Render a chat_stream event for a viewer; None = not for this viewer."""
+    if event is None:
+        return ": keepalive\n\n"
+    if event["type"] == "message":
+        m = event["message"]
+        data = {**m, "translated_text": m["translated_texts"].get(language) or m["original_text"]}
+        return f"id: {m['id']}\nevent: message\ndata: {json.dumps(data, default=str)}\n\n"
+    if event["type"] == "translation" and event["language"] == language:
+        return f"event: translation\ndata: {json.dumps(event)}\n\n"
+    return None
+
+
+def _stream_response(
+    tenant_id: str,
+    booking_id: int,
+    user_type: str,
+    user_id: int,
+    language: str,
+    after: Optional[int],
+) -> StreamingResponse:
+    if not settings.CHAT_STREAM_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat streaming is not enabled.",
+        )
+
+    async def event_generator():
+        try:
+            async for event in chat_stream.hub.events(tenant_id, booking_id, user_type, user_id, after):
+                frame = _sse_frame(event, language)
+                if frame:
+                    yield frame
+        except asyncio.CancelledError:
+            pass
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control":     "no-cache",
+            "X-Accel-Buffering": "no",
+            "Connection":        "keep-alive",
+        },
+    )
+
+
+def _resume_cursor(after: Optional[int], last_event_id: Optional[str]) -> Optional[int]:
+    if after is not None:
+        return after
+    if last_event_id and last_event_id.isdigit():
+        return int(last_event_id)
+    return None
+
+
+@router.get(
+    "/employee/chat/{booking_id}/stream",
+    summary="Employee: Live chat events (SSE)",
+)
+def employee_stream_chat(
+    booking_id: int,
+    after: Optional[int] = Query(None, ge=0, description="Replay messages after this id first"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    db: Session = Depends(get_db),
+    auth: dict = Depends(EmployeeAuth),
+):
+    """
+    Server-Sent Events for one booking chat.
+
+    • ``event: message`` — id is the message id; data as in /messages
+    • ``event: translation`` — a message's translation into your language
+    • ``: keepalive`` every 15 s
+
+    Reconnect with ``Last-Event-ID`` (browsers do this automatically) or
+    ``?after=<message id>`` to receive everything missed in between.
+    While connected, FCM pushes for this chat are skipped.
+    """
+    tenant_id   = auth["tenant_id"]
+    employee_id = auth["employee_id"]
+
+    booking = chat_service.get_booking_or_404(db, tenant_id, booking_id)
+    if booking.employee_id != employee_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This booking does not belong to you.",
+        )
+
+    driver_id = chat_service.get_driver_id_for_booking(db, booking_id)
+    session, _ = chat_service.open_chat_session(
+        db=db,
+        tenant_id=tenant_id,
+        booking_id=booking_id,
+        employee_id=employee_id,
+        driver_id=driver_id,
+    )
+
+    return _stream_response(
+        tenant_id, booking_id, "employee", employee_id,
+        session.employee_language, _resume_cursor(after, last_event_id),
+    )
+
+
+@router.get(
+    "/driver/chat/{booking_id}/stream",
+    summary="Driver: Live chat events (SSE)",
+)
+def driver_stream_chat(
+    booking_id: int,
+    after: Optional[int] = Query(None, ge=0, description="Replay messages after this id first"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    db: Session = Depends(get_db),
+    auth: dict = Depends(DriverAuth),
+):
+    """Server-Sent Events for one booking chat — see the employee stream."""
+    tenant_id = auth["tenant_id"]
+    driver_id = auth["driver_id"]
+
+    booking = chat_service.get_booking_or_404(db, tenant_id, booking_id)
+
+    assigned_driver_id = chat_service.get_driver_id_for_booking(db, booking_id)
+    if assigned_driver_id and assigned_driver_id != driver_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not assigned to this booking.",
+        )
+
+    session, _ = chat_service.open_chat_session(
+        db=db,
+        tenant_id=tenant_id,
+        booking_id=booking_id,
+        employee_id=booking.employee_id,
+        driver_id=driver_id,
+    )
+
+    # Multi-vendor reconciliation: trust auth over route_management
+    session = chat_service.reconcile_session_driver(db, session, driver_id)
+
+    return _stream_response(
+        tenant_id, booking_id, "driver", driver_id,
+        session.driver_language, _resume_cursor(after, last_event_id),
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # ADMIN ENDPOINTS  (read-only — transparency only, no write access)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -633,10 +786,11 @@ def admin_get_session(
     "/chat/sessions/{booking_id}/messages",
     summary="Admin: View full chat transcript (original + all translations)",
 )
-def admin_get_transcript(
+async def admin_get_transcript(
     booking_id: int,
     skip:  int = Query(0,  ge=0),
     limit: int = Query(50, ge=1, le=200),
+    language: Optional[str] = Query(None, description="Translate the page into this ISO 639-1 language"),
     db: Session = Depends(get_db),
     auth: dict = Depends(AdminAuth),
 ):
@@ -646,6 +800,10 @@ def admin_get_transcript(
     - translated_texts — all language variants cached so far
     - firebase_message_id — RTDB key for reference
 
+    With ``language``, messages of the page not yet translated into it are
+    translated in one batch per source language, stored in translated_texts,
+    and returned as translated_text.
+
     Admin has read-only access for transparency — cannot send messages.
     """
     tenant_id = auth["tenant_id"]
@@ -660,11 +818,19 @@ def admin_get_transcript(
     messages = chat_crud.get_messages(db, tenant_id, booking_id, skip, limit)
     total    = chat_crud.get_message_count(db, booking_id)
 
+    if language:
+        if language not in SUPPORTED_LANGUAGES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported language '{language}'",
+            )
+        await _translate_transcript(db, messages, language)
+
     return ResponseWrapper.success(
         data={
             "session":  _serialize_session(session),
             "messages": [
-                _serialize_message(m, viewer_language="en", include_all_translations=True)
+                _serialize_message(m, viewer_language=language or "en", include_all_translations=True)
                 for m in messages
             ],
             "total":    total,
@@ -675,6 +841,25 @@ def admin_get_transcript(
     )
 
 
+async def _translate_transcript(db: Session, messages, language: str) -> None:
+    """Fill translated_texts[language] for every message missing it — one batch per source language."""
+    by_source: dict = {}
+    for m in messages:
+        if m.original_language == language or language in (m.translated_texts or {}):
+            continue
+        by_source.setdefault(m.original_language or "auto", []).append(m)
+
+    for source, group in by_source.items():
+        translated = await translation_service.translate_batch(
+            [m.original_text for m in group], target_language=language, source_language=source,
+        )
+        for m, text in zip(group, translated):
+            if text != m.original_text:
+                m.translated_texts = {**(m.translated_texts or {}), language: text}
+    if by_source:
+        db.commit()
+
+
 # ── Utility endpoints ──────────────────────────────────────────────────────
 
 @router.get(
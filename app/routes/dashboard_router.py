@@ -1,6 +1,9 @@
 """
 Dashboard summary API — tenant-scoped operational snapshot for today.
 
+GET  /api/v1/dashboard/fleet-map          (live driver positions from Redis GEO)
+POST /api/v1/dashboard/fleet-map/polygon  (drivers inside a polygon)
+
 GET /api/v1/dashboard/summary
   - Bookings by status (today)
   - Routes by status (today's shift routes)
@@ -14,8 +17,10 @@ Caching:
                   per-tenant cooldown key so clients cannot spam invalidations.
 """
 
-from datetime import date
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -27,6 +32,7 @@ from app.models.route_management import RouteManagement, RouteManagementStatusEn
 from app.models.shift import Shift, PickupTypeEnum, ShiftLogTypeEnum
 from app.models.vendor import Vendor
 from app.models.vehicle import Vehicle
+from app.services import fleet_location_service
 from app.utils.cache_manager import cache
 from app.utils.response_utils import ResponseWrapper, handle_db_error
 from common_utils.auth.permission_checker import PermissionChecker
@@ -96,7 +102,8 @@ def _build_summary(db: Session, tenant_id: str, today: date) -> dict:
         .filter(
             RouteManagement.tenant_id == tenant_id,
             RouteManagement.is_active == True,
-            func.date(RouteManagement.created_at) == today,
+            RouteManagement.created_at >= datetime.combine(today, time.min),
+            RouteManagement.created_at < datetime.combine(today + timedelta(days=1), time.min),
         )
         .group_by(RouteManagement.status)
         .all()
@@ -317,3 +324,122 @@ async def get_dashboard_summary(
     except Exception as exc:
         logger.exception("[dashboard] unexpected error: %s", exc)
         raise handle_db_error(exc)
+
+
+# ──────────────────────────────────────────────────────────────
+# Live fleet map (Redis GEO)
+# ──────────────────────────────────────────────────────────────
+
+class FleetPolygonRequest(BaseModel):
+    polygon: List[Tuple[float, float]] = Field(
+        ..., min_length=3, description="Polygon vertices as [latitude, longitude] pairs"
+    )
+    vendor_id: Optional[int] = None
+
+
+def _resolve_fleet_scope(
+    user_data: dict,
+    tenant_id: Optional[str],
+    vendor_id: Optional[int],
+) -> Tuple[str, Optional[int]]:
+    """Resolve (tenant_id, vendor_id) for the live map; vendors only see their own fleet."""
+    user_type = user_data.get("user_type")
+
+    if user_type == "admin":
+        if not tenant_id:
+            raise HTTPException(
+                status_code=400,
+                detail=ResponseWrapper.error(
+                    message="tenant_id query param is required for admin users",
+                    error_code="TENANT_ID_REQUIRED",
+                ),
+            )
+    else:
+        tenant_id = user_data.get("tenant_id")
+
+    if user_type == "vendor":
+        vendor_id = user_data.get("vendor_id")
+
+    if not tenant_id:
+        raise HTTPException(
+            status_code=403,
+            detail=ResponseWrapper.error(
+                message="Tenant context required",
+                error_code="TENANT_REQUIRED",
+            ),
+        )
+    return tenant_id, (int(vendor_id) if vendor_id is not None else None)
+
+
+@router.get("/fleet-map")
+async def get_fleet_map(
+    tenant_id: str = Query(None, description="Required for superadmin; inferred from token for other roles"),
+    vendor_id: Optional[int] = Query(None, description="Restrict to one vendor (forced for vendor users)"),
+    latitude: Optional[float] = Query(None, ge=-90, le=90, description="Centre latitude for a radius search"),
+    longitude: Optional[float] = Query(None, ge=-180, le=180, description="Centre longitude for a radius search"),
+    radius_km: Optional[float] = Query(None, gt=0, le=500, description="Search radius in km"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Max drivers for a radius search"),
+    user_data=Depends(PermissionChecker(["dashboard.read"], check_tenant=True)),
+):
+    """
+    Live driver positions for the tenant, served from the Redis GEO sets fed
+    by driver location pings.
+
+    - Without ``latitude``/``longitude``/``radius_km``: every active driver.
+    - With all three: drivers within the radius, nearest first, each with
+      ``distance_km``.
+    """
+    try:
+        tenant_id, vendor_id = _resolve_fleet_scope(user_data, tenant_id, vendor_id)
+
+        radius_params = (latitude, longitude, radius_km)
+        if any(p is not None for p in radius_params) and not all(p is not None for p in radius_params):
+            raise HTTPException(
+                status_code=400,
+                detail=ResponseWrapper.error(
+                    message="latitude, longitude and radius_km must be supplied together",
+                    error_code="INVALID_RADIUS_QUERY",
+                ),
+            )
+
+        if radius_km is not None:
+            drivers = fleet_location_service.get_drivers_within_radius(
+                tenant_id, latitude, longitude, radius_km, vendor_id=vendor_id, limit=limit,
+            )
+        else:
+            drivers = fleet_location_service.get_active_drivers(tenant_id, vendor_id=vendor_id)
+
+        return ResponseWrapper.success(
+            data={"tenant_id": tenant_id, "vendor_id": vendor_id, "count": len(drivers), "drivers": drivers},
+            message="Live fleet positions",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception("[dashboard.fleet_map] unexpected error: %s", exc)
+        raise handle_db_error(exc)
+
+
+@router.post("/fleet-map/polygon")
+async def get_fleet_map_in_polygon(
+    payload: FleetPolygonRequest,
+    tenant_id: str = Query(None, description="Required for superadmin; inferred from token for other roles"),
+    user_data=Depends(PermissionChecker(["dashboard.read"], check_tenant=True)),
+):
+    """Live drivers currently inside the supplied polygon."""
+    try:
+        tenant_id, vendor_id = _resolve_fleet_scope(user_data, tenant_id, payload.vendor_id)
+        drivers = fleet_location_service.get_drivers_in_polygon(
+            tenant_id, payload.polygon, vendor_id=vendor_id,
+        )
+        return ResponseWrapper.success(
+            data={"tenant_id": tenant_id, "vendor_id": vendor_id, "count": len(drivers), "drivers": drivers},
+            message="Live fleet positions inside polygon",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception("[dashboard.fleet_map_polygon] unexpected error: %s", exc)
+        raise handle_db_error(exc)
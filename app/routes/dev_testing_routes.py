@@ -138,7 +138,7 @@ async def get_cache_statistics(
             "shift": len(redis_client.keys("shift:*")),
             "cutoff": len(redis_client.keys("cutoff:*")),
             "weekoff": len(redis_client.keys("weekoff:*")),
-            "driver_locations": len(redis_client.keys("driver_locations:*")),
+            "fleet_geo": len(redis_client.keys("fleet_geo:*")),
             "opaque_tokens": len(redis_client.keys("opaque_token:*")),
             "total": redis_client.dbsize(),
         }
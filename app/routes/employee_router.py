@@ -17,9 +17,10 @@ from app.crud.tenant import tenant_crud
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from app.core.logging_config import get_logger
 from app.utils.audit_helper import log_audit
+from app.services.employee_import import EmployeeImport
+from app.config import settings
 import openpyxl
 from io import BytesIO
-import re
 from datetime import datetime
 
 logger = get_logger(__name__)
@@ -282,7 +283,7 @@ async def download_bulk_upload_template(
             'Required',
             'Required (unique)',
             'Required (unique, 10+ digits)',
-            'Optional (unique)',
+            'Required (unique)',
             'Required (must exist)',
             'Optional',
             'Optional (-90 to 90)',
@@ -355,13 +356,13 @@ async def bulk_create_employees(
     user_data=Depends(PermissionChecker(["employee.create"], check_tenant=True)),
 ):
     """
-    Bulk create employees from Excel file.
+    Bulk create employees from an Excel or CSV file.
     
-    Expected Excel columns:
+    Expected columns (row 1 headers, row 2 instructions, data from row 3):
     - name (required)
     - email (required)
     - phone (required)
-    - employee_code (optional)
+    - employee_code (required)
     - team_id (required)
     - address (optional)
     - latitude (optional)
@@ -370,10 +371,13 @@ async def bulk_create_employees(
     - password (optional, default: 'Welcome@123')
     
     Rules:
-    - File must be .xlsx or .xls format
-    - Maximum 500 rows per upload
+    - File must be .xlsx, .xls or .csv format
+    - At most EMPLOYEE_IMPORT_MAX_ROWS rows per upload (default 500)
     - Validates all data before creating any employee
-    - Returns detailed success/failure report
+    - Returns a per-row error report when any row is rejected
+
+    The file is streamed twice by app.services.employee_import: once to
+    validate, once to hash and insert in chunks.
     """
     try:
         user_type = user_data.get("user_type")
@@ -405,11 +409,11 @@ async def bulk_create_employees(
             pass
 
         # Validate file type
-        if not file.filename.endswith(('.xlsx', '.xls')):
+        if not file.filename.lower().endswith(('.xlsx', '.xls', '.csv')):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ResponseWrapper.error(
-                    message="Invalid file format. Only .xlsx or .xls files are allowed",
+                    message="Invalid file format. Only .xlsx, .xls or .csv files are allowed",
                     error_code="INVALID_FILE_FORMAT",
                 ),
             )
@@ -429,17 +433,16 @@ async def bulk_create_employees(
                 )
             
             # Log file details for debugging
-            logger.info(f"Reading Excel file: {file.filename}, size: {len(content)} bytes")
+            logger.info(f"Reading employee file: {file.filename}, size: {len(content)} bytes")
             
-            # Try to load the workbook
-            workbook = openpyxl.load_workbook(BytesIO(content))
-            sheet = workbook.active
+            # Opens the sheet in streaming mode and reads the header row
+            upload = EmployeeImport(db, content, file.filename, tenant_id=tenant_id, user_type=user_type)
             
         except HTTPException:
             raise
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Failed to read Excel file '{file.filename}': {error_msg}")
+            logger.error(f"Failed to read employee file '{file.filename}': {error_msg}")
             
             # Provide more specific error messages
             if "is not a zip file" in error_msg.lower() or "content_types" in error_msg.lower():
@@ -448,6 +451,8 @@ async def bulk_create_employees(
                 message = "The Excel file is password-protected or encrypted. Please upload an unprotected file."
             elif "corrupted" in error_msg.lower() or "damaged" in error_msg.lower():
                 message = "The Excel file appears to be corrupted. Please try re-downloading the template and filling it again."
+            elif isinstance(e, UnicodeDecodeError):
+                message = "The CSV file is not UTF-8 encoded. Please save it as 'CSV UTF-8' and upload it again."
             else:
                 message = f"Failed to read Excel file: {error_msg}"
             
@@ -459,17 +464,8 @@ async def bulk_create_employees(
                 ),
             )
 
-        # Parse header row
-        headers = []
-        for cell in sheet[1]:
-            if cell.value:
-                headers.append(str(cell.value).strip().lower())
-            else:
-                headers.append(None)
-
         # Validate required columns
-        required_columns = ['name', 'email', 'phone', 'team_id']
-        missing_columns = [col for col in required_columns if col not in headers]
+        missing_columns = upload.missing_columns()
         if missing_columns:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -479,65 +475,25 @@ async def bulk_create_employees(
                 ),
             )
 
-        # Parse data rows
-        employees_data = []
-        errors = []
-        row_number = 2  # Excel row number (1-indexed, header is row 1, instructions row 2)
-        
         # Expire all cached objects to ensure fresh data from database
         # This is critical for duplicate checking across multiple uploads
         db.expire_all()
-        
-        # Start from row 3 to skip header (row 1) and instructions (row 2)
-        for row in sheet.iter_rows(min_row=3, values_only=False):
-            row_number += 1
-            
-            # Skip empty rows
-            if all(cell.value is None or str(cell.value).strip() == '' for cell in row):
-                logger.debug(f"Skipping empty row {row_number}")
-                continue
-            
-            # Build employee data dict
-            employee_dict = {}
-            row_errors = []
-            
-            for idx, header in enumerate(headers):
-                if header and idx < len(row):
-                    cell_value = row[idx].value
-                    if cell_value is not None:
-                        employee_dict[header] = str(cell_value).strip()
-            
-            # Log the parsed row data for debugging
-            logger.debug(f"Row {row_number} parsed data: {employee_dict}")
-            
-            # Validate this row
-            row_validation = validate_employee_row(
-                employee_dict, 
-                row_number, 
-                db, 
-                tenant_id,
-                user_type
+
+        # Pass 1: stream every row, validate it and check it against the
+        # database and the rest of the file (a fixed number of queries)
+        try:
+            report = upload.validate()
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ResponseWrapper.error(
+                    message="The CSV file is not UTF-8 encoded. Please save it as 'CSV UTF-8' and upload it again.",
+                    error_code="FILE_READ_ERROR",
+                ),
             )
-            
-            if row_validation['valid']:
-                logger.debug(f"Row {row_number} validation passed")
-                employees_data.append({
-                    'row': row_number,
-                    'data': row_validation['data']
-                })
-            else:
-                logger.warning(f"Row {row_number} validation failed: {row_validation['errors']}")
-                errors.append({
-                    'row': row_number,
-                    'employee_name': employee_dict.get('name', 'Not provided'),
-                    'email': employee_dict.get('email', 'Not provided'),
-                    'phone': employee_dict.get('phone', 'Not provided'),
-                    'employee_code': employee_dict.get('employee_code', 'Not provided'),
-                    'errors': row_validation['errors']
-                })
-        
+
         # Check if we have any data
-        if not employees_data and not errors:
+        if report.total_rows == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ResponseWrapper.error(
@@ -547,328 +503,119 @@ async def bulk_create_employees(
             )
         
         # Check row limit
-        if len(employees_data) > 500:
+        max_rows = settings.EMPLOYEE_IMPORT_MAX_ROWS
+        if report.valid_rows + len(report.duplicates) > max_rows:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ResponseWrapper.error(
-                    message=f"Too many rows. Maximum 500 employees per upload (found {len(employees_data)})",
+                    message=f"Too many rows. Maximum {max_rows} employees per upload (found {report.valid_rows + len(report.duplicates)})",
                     error_code="TOO_MANY_ROWS",
                 ),
             )
 
         # If there are validation errors, return them without creating anything
-        if errors:
+        if report.failed:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ResponseWrapper.error(
-                    message=f"Validation failed for {len(errors)} row(s). Please fix the errors below and try again.",
+                    message=f"Validation failed for {len(report.failed)} row(s). Please fix the errors below and try again.",
                     error_code="VALIDATION_FAILED",
                     details={
-                        "total_rows": len(employees_data) + len(errors),
-                        "valid_rows": len(employees_data),
-                        "invalid_rows": len(errors),
-                        "failed_employees": errors
+                        "total_rows": report.total_rows,
+                        "valid_rows": report.total_rows - len(report.failed),
+                        "invalid_rows": len(report.failed),
+                        "failed_employees": report.failed
                     }
                 )
             )
 
-        # Check for duplicates within the Excel file itself
-        seen_emails = set()
-        seen_phones = set()
-        seen_codes = set()
-        duplicate_errors = []
-        
-        for item in employees_data:
-            row_num = item['row']
-            emp_data = item['data']
-            name = emp_data.get('name', 'Unknown')
-            email = emp_data.get('email')
-            phone = emp_data.get('phone')
-            code = emp_data.get('employee_code')
-            row_errors = []
-            
-            if email and email in seen_emails:
-                row_errors.append(f"Email '{email}' is duplicated within this Excel file")
-            elif email:
-                seen_emails.add(email)
-            
-            if phone and phone in seen_phones:
-                row_errors.append(f"Phone '{phone}' is duplicated within this Excel file")
-            elif phone:
-                seen_phones.add(phone)
-            
-            if code and code in seen_codes:
-                row_errors.append(f"Employee code '{code}' is duplicated within this Excel file")
-            elif code:
-                seen_codes.add(code)
-            
-            if row_errors:
-                duplicate_errors.append({
-                    'row': row_num,
-                    'employee_name': name,
-                    'email': email,
-                    'phone': phone,
-                    'employee_code': code,
-                    'errors': row_errors
-                })
-        
-        if duplicate_errors:
+        # Duplicates within the file itself
+        if report.duplicates:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ResponseWrapper.error(
                     message=f"Duplicate entries found in Excel file. Please correct the highlighted rows and try again.",
                     error_code="DUPLICATE_IN_FILE",
                     details={
-                        "total_rows": len(employees_data),
-                        "valid_rows": len(employees_data) - len(duplicate_errors),
-                        "duplicate_rows": len(duplicate_errors),
-                        "failed_employees": duplicate_errors
+                        "total_rows": report.total_rows,
+                        "valid_rows": report.valid_rows,
+                        "duplicate_rows": len(report.duplicates),
+                        "failed_employees": report.duplicates
                     }
                 )
             )
 
-        # All validation passed - now create employees
-        logger.info(f"Starting bulk employee creation: {len(employees_data)} employees to process")
-        created_employees = []
-        failed_employees = []
-
-        # Preload existing unique fields per tenant to avoid N+1 duplicate checks in loop
-        tenant_ids_to_check = {
-            (item["data"].get("tenant_id", tenant_id) if user_type == "admin" else tenant_id)
-            for item in employees_data
-        }
-        tenant_ids_to_check = {tid for tid in tenant_ids_to_check if tid}
-        existing_unique = {}
-        if tenant_ids_to_check:
-            existing_rows = (
-                db.query(Employee.tenant_id, Employee.email, Employee.phone, Employee.employee_code)
-                .filter(Employee.tenant_id.in_(tenant_ids_to_check))
-                .all()
+        # Pass 2: all validation passed - stream the file again, hashing
+        # passwords in the worker pool and inserting one chunk at a time
+        logger.info(f"Starting bulk employee creation: {report.total_rows} employees to process")
+        try:
+            created = await upload.create()
+            db.commit()
+        except IntegrityError as ie:
+            db.rollback()
+            logger.error(f"❌ Bulk employee creation rolled back: {ie}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=ResponseWrapper.error(
+                    message="Some employees were created by another request while this file was being processed. No employees were created; please upload the file again.",
+                    error_code="DUPLICATE_ENTRY",
+                ),
+            )
+        except Exception as commit_error:
+            db.rollback()
+            logger.error(f"❌ Bulk employee creation rolled back: {commit_error}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ResponseWrapper.error(
+                    message=f"Failed to save employees to database. No employees were created. Error: {str(commit_error)}",
+                    error_code="BULK_CREATION_COMMIT_FAILED",
+                ),
+            )
+        logger.info(f"✅ Database transaction committed successfully: {len(created)} employees stored in database")
+
+        for emp in created:
+            background_tasks.add_task(
+                send_employee_created_email,
+                employee_data={
+                    "name": emp["name"],
+                    "email": emp["email"],
+                    "phone": emp["phone"],
+                    "employee_id": emp["employee_id"],
+                    "tenant_id": emp["tenant_id"],
+                    "team_id": emp["team_id"],
+                },
             )
-            for t_id, email_val, phone_val, code_val in existing_rows:
-                bucket = existing_unique.setdefault(
-                    t_id,
-                    {"emails": set(), "phones": set(), "codes": set()},
-                )
-                if email_val:
-                    bucket["emails"].add(email_val.lower())
-                if phone_val:
-                    bucket["phones"].add(phone_val)
-                if code_val:
-                    bucket["codes"].add(code_val)
-        
-        for item in employees_data:
-            row_num = item['row']
-            emp_data = item['data']
-            
-            try:
-                # Determine tenant_id for this employee
-                if user_type == "employee":
-                    emp_tenant_id = tenant_id
-                else:  # admin
-                    emp_tenant_id = emp_data.get('tenant_id', tenant_id)
-                
-                # Double-check for duplicates before creating (race condition protection)
-                # MUST filter by tenant_id to match database unique constraints
-                email = emp_data['email']
-                phone = emp_data['phone']
-                employee_code = emp_data.get('employee_code')
-
-                tenant_unique = existing_unique.setdefault(
-                    emp_tenant_id,
-                    {"emails": set(), "phones": set(), "codes": set()},
-                )
-                email_key = email.lower()
-                if email_key in tenant_unique["emails"]:
-                    raise ValueError(f"Email '{email}' already exists in database")
-
-                if phone in tenant_unique["phones"]:
-                    raise ValueError(f"Phone '{phone}' already exists in database")
-
-                if employee_code and employee_code in tenant_unique["codes"]:
-                        raise ValueError(f"Employee code '{employee_code}' already exists in database")
-                
-                # Create employee object
-                employee_create = EmployeeCreate(
-                    name=emp_data['name'],
-                    email=emp_data['email'],
-                    phone=emp_data['phone'],
-                    employee_code=emp_data.get('employee_code'),
-                    team_id=emp_data['team_id'],
-                    address=emp_data.get('address'),
-                    latitude=emp_data.get('latitude'),
-                    longitude=emp_data.get('longitude'),
-                    gender=emp_data.get('gender'),
-                    password=emp_data.get('password', 'Welcome@123'),
-                    tenant_id=emp_tenant_id
-                )
-                
-                # Create in database
-                db_employee = employee_crud.create_with_tenant(
-                    db=db, 
-                    obj_in=employee_create, 
-                    tenant_id=emp_tenant_id
-                )
 
-                # Reserve unique values locally to catch duplicates in same upload batch
-                tenant_unique["emails"].add(email_key)
-                tenant_unique["phones"].add(phone)
-                if employee_code:
-                    tenant_unique["codes"].add(employee_code)
-                
-                db.flush()  # Get the ID without committing yet
-                
-                # Log successful creation
-                logger.info(
-                    f"✓ Row {row_num}: Employee created successfully - "
-                    f"ID: {db_employee.employee_id}, Name: {db_employee.name}, Email: {db_employee.email}"
-                )
-                
-                # Add to background email tasks
-                background_tasks.add_task(
-                    send_employee_created_email,
-                    employee_data={
-                        "name": db_employee.name,
-                        "email": db_employee.email,
-                        "phone": db_employee.phone,
-                        "employee_id": db_employee.employee_id,
-                        "tenant_id": emp_tenant_id,
-                        "team_id": db_employee.team_id,
-                    },
-                )
-                
-                created_employees.append({
-                    'row': row_num,
-                    'employee_id': db_employee.employee_id,
-                    'name': db_employee.name,
-                    'email': db_employee.email
-                })
-                
-            except IntegrityError as ie:
-                db.rollback()
-                error_msg = str(ie.orig) if hasattr(ie, 'orig') else str(ie)
-                if 'unique constraint' in error_msg.lower() or 'duplicate' in error_msg.lower():
-                    if 'email' in error_msg.lower():
-                        error_msg = f"Email '{emp_data['email']}' already exists"
-                    elif 'phone' in error_msg.lower():
-                        error_msg = f"Phone '{emp_data['phone']}' already exists"
-                    elif 'employee_code' in error_msg.lower():
-                        error_msg = f"Employee code '{emp_data.get('employee_code')}' already exists"
-                    else:
-                        error_msg = "Duplicate entry found"
-                
-                failed_employees.append({
-                    'row': row_num,
-                    'name': emp_data.get('name', 'Unknown'),
-                    'email': emp_data.get('email', 'Unknown'),
-                    'error': error_msg
-                })
-                logger.error(
-                    f"✗ Row {row_num}: FAILED - {emp_data.get('name', 'Unknown')} ({emp_data.get('email', 'Unknown')}) - "
-                    f"Error: {error_msg}"
-                )
-                
-            except Exception as e:
-                db.rollback()
-                failed_employees.append({
-                    'row': row_num,
-                    'name': emp_data.get('name', 'Unknown'),
-                    'email': emp_data.get('email', 'Unknown'),
-                    'error': str(e)
-                })
-                logger.error(
-                    f"✗ Row {row_num}: FAILED - {emp_data.get('name', 'Unknown')} ({emp_data.get('email', 'Unknown')}) - "
-                    f"Unexpected error: {str(e)}"
-                )
-        
-        # Commit all successful creations
-        if created_employees:
-            try:
-                db.commit()
-                logger.info(
-                    f"✅ Database transaction committed successfully: "
-                    f"{len(created_employees)} employees stored in database"
-                )
-                
-                # Log each created employee
-                logger.info("=" * 80)
-                logger.info("BULK EMPLOYEE CREATION SUMMARY - SUCCESSFULLY CREATED:")
-                logger.info("=" * 80)
-                for emp in created_employees:
-                    logger.info(
-                        f"  • Row {emp['row']}: {emp['name']} ({emp['email']}) - Employee ID: {emp['employee_id']}"
-                    )
-                logger.info("=" * 80)
-                
-                # Create audit log for bulk creation
-                log_audit(
-                    db=db,
-                    tenant_id=tenant_id or emp_tenant_id,
-                    module="employee",
-                    action="BULK_CREATE",
-                    user_data=user_data,
-                    description=f"Bulk created {len(created_employees)} employees from Excel file",
-                    new_values={
-                        "total_created": len(created_employees),
-                        "total_failed": len(failed_employees),
-                        "file_name": file.filename,
-                        "created_employee_ids": [emp['employee_id'] for emp in created_employees]
-                    },
-                    request=request
-                )
-                
-            except Exception as commit_error:
-                db.rollback()
-                logger.error("=" * 80)
-                logger.error("❌ BULK EMPLOYEE CREATION FAILED - TRANSACTION ROLLED BACK")
-                logger.error("=" * 80)
-                logger.error(f"Commit error: {str(commit_error)}")
-                logger.error(f"NO EMPLOYEES WERE CREATED - All {len(created_employees)} employees rolled back")
-                logger.error("=" * 80)
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=ResponseWrapper.error(
-                        message=f"Failed to save employees to database. No employees were created. Error: {str(commit_error)}",
-                        error_code="BULK_CREATION_COMMIT_FAILED",
-                    ),
-                )
-        else:
-            logger.warning("No employees were created - all rows had errors")
-        
-        # Log failures if any
-        if failed_employees:
-            logger.warning("=" * 80)
-            logger.warning(f"BULK EMPLOYEE CREATION - FAILED ROWS ({len(failed_employees)}):")
-            logger.warning("=" * 80)
-            for emp in failed_employees:
-                logger.warning(
-                    f"  • Row {emp['row']}: {emp['name']} ({emp['email']}) - Error: {emp['error']}"
-                )
-            logger.warning("=" * 80)
-        
-        # Final summary log
-        logger.info(
-            f"BULK EMPLOYEE CREATION COMPLETED: "
-            f"Total: {len(employees_data)}, Success: {len(created_employees)}, Failed: {len(failed_employees)}"
+        # Create audit log for bulk creation
+        log_audit(
+            db=db,
+            tenant_id=tenant_id or created[0]["tenant_id"],
+            module="employee",
+            action="BULK_CREATE",
+            user_data=user_data,
+            description=f"Bulk created {len(created)} employees from {file.filename}",
+            new_values={
+                "total_created": len(created),
+                "total_failed": 0,
+                "file_name": file.filename,
+                "created_employee_ids": [emp['employee_id'] for emp in created]
+            },
+            request=request
         )
-        
-        # Prepare response
+
         response_data = {
-            "total_rows_processed": len(employees_data),
-            "successful": len(created_employees),
-            "failed": len(failed_employees),
-            "created_employees": created_employees,
-            "failed_employees": failed_employees
+            "total_rows_processed": report.total_rows,
+            "successful": len(created),
+            "failed": 0,
+            "created_employees": [
+                {key: emp[key] for key in ("row", "employee_id", "name", "email")} for emp in created
+            ],
+            "failed_employees": []
         }
         
-        if failed_employees:
-            message = f"Partially completed: {len(created_employees)} employees created, {len(failed_employees)} failed"
-        else:
-            message = f"Successfully created {len(created_employees)} employees"
-        
         return ResponseWrapper.success(
             data=response_data,
-            message=message
+            message=f"Successfully created {len(created)} employees"
         )
 
     except HTTPException:
@@ -879,160 +626,6 @@ async def bulk_create_employees(
         raise handle_http_error(e)
 
 
-def validate_employee_row(
-    row_data: Dict[str, Any], 
-    row_number: int, 
-    db: Session,
-    token_tenant_id: Optional[str],
-    user_type: str
-) -> Dict[str, Any]:
-    """
-    Validate a single employee row from Excel.
-    
-    Returns:
-        {
-            'valid': bool,
-            'data': dict (if valid),
-            'errors': list (if invalid)
-        }
-    """
-    errors = []
-    validated_data = {}
-    
-    # 1. Validate required fields
-    if not row_data.get('name') or not row_data['name'].strip():
-        errors.append("Name is required")
-    else:
-        validated_data['name'] = row_data['name'].strip()
-    
-    # 2. Validate email
-    email = row_data.get('email', '').strip().lower()  # normalize to lowercase
-    if not email:
-        errors.append("Email is required")
-    else:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
-            errors.append(f"Invalid email format: {email}")
-        else:
-            # Check if email already exists (must check within tenant)
-            query = db.query(Employee).filter(Employee.email == email)
-            if token_tenant_id:
-                query = query.filter(Employee.tenant_id == token_tenant_id)
-            existing = query.first()
-            if existing:
-                errors.append(f"Email '{email}' already exists in database")
-            else:
-                validated_data['email'] = email
-    
-    # 3. Validate phone
-    phone = row_data.get('phone', '').strip()
-    if not phone:
-        errors.append("Phone is required")
-    else:
-        # Remove common separators
-        phone_clean = re.sub(r'[\s\-\(\)\+]', '', phone)
-        if not phone_clean.isdigit() or len(phone_clean) < 10:
-            errors.append(f"Invalid phone format: {phone}")
-        else:
-            # Check if phone already exists (must check within tenant)
-            query = db.query(Employee).filter(Employee.phone == phone)
-            if token_tenant_id:
-                query = query.filter(Employee.tenant_id == token_tenant_id)
-            existing = query.first()
-            if existing:
-                errors.append(f"Phone '{phone}' already exists in database")
-            else:
-                validated_data['phone'] = phone
-    
-    # 4. Validate team_id
-    team_id_str = row_data.get('team_id', '').strip()
-    if not team_id_str:
-        errors.append("Team ID is required")
-    else:
-        try:
-            team_id = int(team_id_str)
-            # Use cache for team lookup
-            from app.utils import cache_manager
-            team = cache_manager.get_team_with_cache(db, token_tenant_id or validated_data.get('tenant_id'), team_id) if (token_tenant_id or validated_data.get('tenant_id')) else team_crud.get_by_id(db, team_id=team_id)
-            if not team:
-                errors.append(f"Team ID {team_id} does not exist")
-            else:
-                # Validate team belongs to tenant
-                if token_tenant_id and team.tenant_id != token_tenant_id:
-                    errors.append(f"Team ID {team_id} does not belong to your tenant")
-                else:
-                    validated_data['team_id'] = team_id
-                    # Store tenant_id for admin users
-                    if user_type == "admin" and not token_tenant_id:
-                        validated_data['tenant_id'] = team.tenant_id
-        except ValueError:
-            errors.append(f"Team ID must be a number, got: {team_id_str}")
-    
-    # 5. Validate employee_code (optional but must be unique if provided)
-    employee_code = row_data.get('employee_code', '').strip()
-    if employee_code:
-        # Check if employee_code already exists (must check within tenant)
-        query = db.query(Employee).filter(Employee.employee_code == employee_code)
-        if token_tenant_id:
-            query = query.filter(Employee.tenant_id == token_tenant_id)
-        existing = query.first()
-        if existing:
-            errors.append(f"Employee code '{employee_code}' already exists")
-        else:
-            validated_data['employee_code'] = employee_code
-    
-    # 6. Validate optional fields
-    if 'address' in row_data and row_data['address']:
-        validated_data['address'] = row_data['address'].strip()
-    
-    # 7. Validate latitude/longitude
-    if 'latitude' in row_data and row_data['latitude']:
-        try:
-            lat = float(row_data['latitude'])
-            if -90 <= lat <= 90:
-                validated_data['latitude'] = lat
-            else:
-                errors.append(f"Latitude must be between -90 and 90, got: {lat}")
-        except ValueError:
-            errors.append(f"Invalid latitude format: {row_data['latitude']}")
-    
-    if 'longitude' in row_data and row_data['longitude']:
-        try:
-            lon = float(row_data['longitude'])
-            if -180 <= lon <= 180:
-                validated_data['longitude'] = lon
-            else:
-                errors.append(f"Longitude must be between -180 and 180, got: {lon}")
-        except ValueError:
-            errors.append(f"Invalid longitude format: {row_data['longitude']}")
-    
-    # 8. Validate gender (optional)
-    gender = row_data.get('gender', '').strip()
-    if gender:
-        valid_genders = ['Male', 'Female', 'Other', 'male', 'female', 'other']
-        if gender in valid_genders:
-            # Capitalize first letter to match enum
-            validated_data['gender'] = gender.capitalize()
-        else:
-            errors.append(f"Invalid gender. Must be one of: Male, Female, Other. Got: {gender}")
-    
-    # 9. Validate password (optional)
-    password = row_data.get('password', '').strip()
-    if password:
-        if len(password) < 6:
-            errors.append("Password must be at least 6 characters long")
-        else:
-            validated_data['password'] = password
-    else:
-        validated_data['password'] = 'Welcome@123'  # Default password
-    
-    return {
-        'valid': len(errors) == 0,
-        'data': validated_data if len(errors) == 0 else None,
-        'errors': errors
-    }
-
-
 def _build_nodal_point_dict(emp: Employee) -> Optional[dict]:
     """
     Extract nodal point info from the already-loaded ORM relationship.
@@ -6,8 +6,7 @@ from pydantic import BaseModel
 
 import app
 from app.database.session import get_db
-from app.models.booking import Booking
-from app.models.route_management import RouteManagement, RouteManagementBooking
+from app.crud.booking import booking_crud
 from app.models.shift import Shift
 from app.schemas.shift import ShiftResponse
 from app.services.geodesic import group_rides
@@ -113,26 +112,10 @@ async def route_suggestion(
         lat_col = "pickup_latitude" if shift_type == "IN" else "drop_latitude"
         lon_col = "pickup_longitude" if shift_type == "IN" else "drop_longitude"
         
-        # ---- Fetch Already Routed Booking IDs ----
-        routed_booking_ids = (
-            db.query(RouteManagementBooking.booking_id)
-            .join(RouteManagement, RouteManagement.route_id == RouteManagementBooking.route_id)
-            .filter(RouteManagement.tenant_id == tenant_id)
-            .distinct()
-            .all()
-        )
-        routed_booking_ids = [b.booking_id for b in routed_booking_ids]
-
         # ---- Fetch Only Unrouted Bookings ----
-        bookings_query = db.query(Booking).filter(
-            Booking.booking_date == booking_date,
-            Booking.shift_id == shift_id,
-            Booking.tenant_id == tenant_id,
-        )
-        if routed_booking_ids:
-            bookings_query = bookings_query.filter(~Booking.booking_id.in_(routed_booking_ids))
-
-        bookings = bookings_query.all()
+        bookings = booking_crud.get_unrouted_query(
+            db, tenant_id=tenant_id, booking_date=booking_date, shift_id=shift_id, status=None,
+        ).all()
 
         if not bookings:
             logger.info(f"No unrouted bookings found for tenant={tenant_id}, shift={shift_id} on {booking_date}")
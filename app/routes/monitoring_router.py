@@ -45,6 +45,20 @@ async def health_check():
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
+@router.get("/firebase/writer", response_model=BaseResponse)
+async def get_firebase_writer_stats():
+    """Queue depth and flush latency of the coalescing Firebase location writer"""
+    try:
+        from app.firebase.location_writer import location_writer
+        return BaseResponse(
+            success=True,
+            message="Firebase writer stats retrieved",
+            data=location_writer.stats()
+        )
+    except Exception as e:
+        logger.error(f"Failed to get Firebase writer stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve Firebase writer stats")
+
 @router.get("/database/metrics", response_model=BaseResponse)
 async def get_database_metrics():
     """Get database performance metrics"""
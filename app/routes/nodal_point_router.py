@@ -10,6 +10,7 @@ Base path: /api/v1/nodal-points
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from sqlalchemy.orm import Session
 from typing import Optional, List
+import numpy as np
 from geopy.distance import geodesic
 
 from app.database.session import get_db
@@ -24,6 +25,7 @@ from app.schemas.nodal_point import (
     EmployeeNodalAssignRequest,
     EmployeeNodalAssignmentResponse,
 )
+from app.services import nodal_point_index
 from app.utils.response_utils import ResponseWrapper, handle_http_error, handle_db_error
 from common_utils.auth.permission_checker import PermissionChecker
 from app.core.logging_config import get_logger
@@ -58,24 +60,11 @@ def _nearest_active_nodal_point(
     lat: float,
     lng: float,
 ) -> Optional[NodalPoint]:
-    """Return the active nodal point closest to (lat, lng) using geodesic distance."""
-    points = (
-        db.query(NodalPoint)
-        .filter(
-            NodalPoint.tenant_id == tenant_id,
-            NodalPoint.is_active.is_(True),
-        )
-        .all()
-    )
-    if not points:
+    """Return the active nodal point closest to (lat, lng) via the tenant's spatial index."""
+    hits = nodal_point_index.get_index(db, tenant_id).nearest(lat, lng, k=1)
+    if not hits:
         return None
-
-    def _dist(p: NodalPoint) -> float:
-        return geodesic(
-            (lat, lng), (float(p.latitude), float(p.longitude))
-        ).km
-
-    return min(points, key=_dist)
+    return db.get(NodalPoint, hits[0][0])
 
 
 # ──────────────────────────────────────────────────────────────
@@ -106,6 +95,7 @@ def create_nodal_point(
         db.add(nodal_point)
         db.commit()
         db.refresh(nodal_point)
+        nodal_point_index.invalidate(tenant_id)
 
         logger.info(
             f"[nodal_point.create] tenant={tenant_id} "
@@ -167,43 +157,37 @@ def get_nearest_nodal_points(
     latitude: float = Query(..., ge=-90, le=90),
     longitude: float = Query(..., ge=-180, le=180),
     limit: int = Query(3, ge=1, le=20, description="How many nearest points to return"),
+    radius_km: Optional[float] = Query(None, gt=0, description="Only return points within this radius"),
     tenant_id: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     user_data=Depends(PermissionChecker(["nodal_point.read"], check_tenant=True)),
 ):
     """
     Return the N nearest active nodal points to the supplied coordinates,
-    sorted by geodesic distance ascending.
+    sorted by distance ascending, optionally restricted to ``radius_km``.
     """
     try:
         tenant_id = _resolve_tenant(user_data, tenant_id)
 
-        points = (
-            db.query(NodalPoint)
-            .filter(
-                NodalPoint.tenant_id == tenant_id,
-                NodalPoint.is_active.is_(True),
-            )
-            .all()
-        )
-
-        if not points:
+        index = nodal_point_index.get_index(db, tenant_id)
+        if not len(index):
             return ResponseWrapper.success(
                 data=[], message="No active nodal points found for this tenant"
             )
 
-        # Compute distances and sort
-        def _dist(p: NodalPoint) -> float:
-            return geodesic(
-                (latitude, longitude),
-                (float(p.latitude), float(p.longitude)),
-            ).km
-
-        sorted_points = sorted(points, key=_dist)[:limit]
+        hits = index.nearest(latitude, longitude, k=limit, radius_km=radius_km)
+        points = {
+            p.nodal_point_id: p
+            for p in db.query(NodalPoint)
+            .filter(NodalPoint.nodal_point_id.in_([pid for pid, _ in hits]))
+            .all()
+        } if hits else {}
 
         result = []
-        for p in sorted_points:
-            d = _dist(p)
+        for pid, d in hits:
+            p = points.get(pid)
+            if p is None:
+                continue
             base = NodalPointResponse.model_validate(p).model_dump()
             result.append({**base, "distance_km": round(d, 3)})
 
@@ -291,6 +275,7 @@ def update_nodal_point(
 
         db.commit()
         db.refresh(nodal_point)
+        nodal_point_index.invalidate(tid)
 
         logger.info(
             f"[nodal_point.update] id={nodal_point_id} fields={list(update_data.keys())}"
@@ -343,6 +328,7 @@ def deactivate_nodal_point(
 
         nodal_point.is_active = False
         db.commit()
+        nodal_point_index.invalidate(tid)
 
         logger.info(f"[nodal_point.deactivate] id={nodal_point_id} tenant={tid}")
         return ResponseWrapper.deleted(
@@ -627,15 +613,8 @@ def bulk_assign_nearest(
     try:
         tid = _resolve_tenant(user_data, tenant_id)
 
-        active_nodal_points = (
-            db.query(NodalPoint)
-            .filter(
-                NodalPoint.tenant_id == tid,
-                NodalPoint.is_active.is_(True),
-            )
-            .all()
-        )
-        if not active_nodal_points:
+        index = nodal_point_index.get_index(db, tid)
+        if not len(index):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ResponseWrapper.error(
@@ -645,7 +624,7 @@ def bulk_assign_nearest(
             )
 
         employees = (
-            db.query(Employee)
+            db.query(Employee.employee_id, Employee.latitude, Employee.longitude)
             .filter(
                 Employee.tenant_id == tid,
                 Employee.is_active.is_(True),
@@ -653,55 +632,62 @@ def bulk_assign_nearest(
             .all()
         )
 
-        assigned_count = 0
-        skipped = []
+        # One SELECT for every existing assignment in the tenant
+        existing = {
+            row.employee_id: row
+            for row in db.query(
+                EmployeeNodalPoint.id,
+                EmployeeNodalPoint.employee_id,
+                EmployeeNodalPoint.nodal_point_id,
+                EmployeeNodalPoint.is_overridden,
+            )
+            .join(Employee, EmployeeNodalPoint.employee_id == Employee.employee_id)
+            .filter(Employee.tenant_id == tid)
+            .all()
+        }
 
+        skipped = []
+        candidates = []
         for emp in employees:
             # Skip employees already manually overridden
-            existing = (
-                db.query(EmployeeNodalPoint)
-                .filter(
-                    EmployeeNodalPoint.employee_id == emp.employee_id,
-                    EmployeeNodalPoint.is_overridden.is_(True),
-                )
-                .first()
-            )
-            if existing:
+            current = existing.get(emp.employee_id)
+            if current is not None and current.is_overridden:
                 continue
-
             if not emp.latitude or not emp.longitude:
                 skipped.append(
                     {"employee_id": emp.employee_id, "reason": "no coordinates"}
                 )
                 continue
-
-            nearest = min(
-                active_nodal_points,
-                key=lambda p: geodesic(
-                    (float(emp.latitude), float(emp.longitude)),
-                    (float(p.latitude), float(p.longitude)),
-                ).km,
-            )
-
-            # Upsert
-            assignment = (
-                db.query(EmployeeNodalPoint)
-                .filter(EmployeeNodalPoint.employee_id == emp.employee_id)
-                .first()
-            )
-            if assignment:
-                assignment.nodal_point_id = nearest.nodal_point_id
-                assignment.is_overridden = False
-            else:
-                db.add(
-                    EmployeeNodalPoint(
-                        employee_id=emp.employee_id,
-                        nodal_point_id=nearest.nodal_point_id,
-                        tenant_id=tid,
-                        is_overridden=False,
-                    )
-                )
-            assigned_count += 1
+            candidates.append(emp)
+
+        # One vectorised k-NN query for all candidates
+        coords = np.array(
+            [[float(e.latitude), float(e.longitude)] for e in candidates]
+        ).reshape(-1, 2)
+        nearest_ids, _ = index.nearest_bulk(coords)
+
+        inserts, updates = [], []
+        for emp, nodal_point_id in zip(candidates, nearest_ids.tolist()):
+            current = existing.get(emp.employee_id)
+            if current is None:
+                inserts.append({
+                    "employee_id": emp.employee_id,
+                    "nodal_point_id": nodal_point_id,
+                    "tenant_id": tid,
+                    "is_overridden": False,
+                })
+            elif current.nodal_point_id != nodal_point_id:
+                updates.append({
+                    "id": current.id,
+                    "nodal_point_id": nodal_point_id,
+                    "is_overridden": False,
+                })
+
+        if inserts:
+            db.bulk_insert_mappings(EmployeeNodalPoint, inserts)
+        if updates:
+            db.bulk_update_mappings(EmployeeNodalPoint, updates)
+        assigned_count = len(candidates)
 
         db.commit()
 
@@ -1362,7 +1362,7 @@ def get_driver_duty_hours_report(
 
         # Load tenant config for duty limits
         from app.models.tenant_config import TenantConfig
-        from app.services.driver_duty_hours_service import check_rest
+        from app.services.driver_duty_hours_service import load_duty_intervals, rest_from_intervals
 
         tenant_cfg = db.query(TenantConfig).filter(
             TenantConfig.tenant_id == tenant_id
@@ -1399,6 +1399,11 @@ def get_driver_duty_hours_report(
         ) if driver_ids else []
         driver_map: dict[int, Driver] = {d.driver_id: d for d in drivers}
 
+        # Duty ledger of every driver over the window (+24h lookback), one query
+        duty_intervals = load_duty_intervals(
+            db, driver_ids, window_start_dt - timedelta(hours=24), window_end_dt,
+        )
+
         # Group routes by driver
         from collections import defaultdict
         by_driver: dict[int, list] = defaultdict(list)
@@ -1426,10 +1431,9 @@ def get_driver_duty_hours_report(
                 total_duty += duty_min
 
                 # Per-trip rest check: was rest sufficient before THIS trip?
-                rest_result = check_rest(
-                    driver_id=did,
+                rest_result = rest_from_intervals(
+                    duty_intervals.get(did, []),
                     proposed_start_dt=start_dt,
-                    db=db,
                     max_duty_minutes=max_duty,
                 )
                 if not rest_result["ok"]:
@@ -26,6 +26,10 @@ POST   /employee/routes/{route_id}/review         -> employee submits review by
 GET    /bookings/{booking_id}/review              -> admin/manager reads any booking review
 GET    /drivers/{driver_id}/reviews               -> driver aggregate + paginated list
 GET    /vehicles/{vehicle_id}/reviews             -> vehicle aggregate + paginated list
+DELETE /reviews/{review_id}                       -> admin deactivates a review
+
+Driver / vehicle summaries are read from review_aggregates, which are kept in
+step with every submit / deactivate (see app/services/review_aggregate_service.py).
 """
 
 from __future__ import annotations
@@ -42,7 +46,7 @@ from app.core.logging_config import get_logger
 from app.database.session import get_db
 from app.models.booking import Booking, BookingStatusEnum
 from app.models.driver import Driver
-from app.models.review import RideReview, ReviewTag, ReviewTagTypeEnum
+from app.models.review import RideReview, ReviewTag, ReviewTagTypeEnum, ReviewSubjectTypeEnum
 from app.models.route_management import RouteManagement, RouteManagementBooking
 from app.models.vehicle import Vehicle
 from app.schemas.review import (
@@ -54,6 +58,8 @@ from app.schemas.review import (
     ReviewTagsResponse,
     VehicleReviewSummary,
 )
+from app.services import review_aggregate_service
+from app.utils.pagination import cached_count, keyset_paginate
 from app.utils.response_utils import ResponseWrapper, handle_http_error
 from common_utils.auth.permission_checker import PermissionChecker
 
@@ -132,7 +138,10 @@ def _enrich_review(review: RideReview) -> dict:
 
 
 def _build_aggregate(reviews: list, rating_field: str, tags_field: str, comment_field: str) -> dict:
-    """Compute avg rating, tag frequency map, and last 5 comments."""
+    """
+    Compute avg rating, tag frequency map, and last 5 comments from rows.
+    Only used for route-filtered summaries; everything else reads review_aggregates.
+    """
     ratings = [getattr(r, rating_field) for r in reviews if getattr(r, rating_field)]
     all_tags = [
         tag
@@ -371,6 +380,8 @@ async def submit_review_by_booking(
             vehicle_comment=payload.vehicle_comment,
         )
         db.add(review)
+        db.flush()
+        review_aggregate_service.record_review(db, review)
         db.commit()
         db.refresh(review)
 
@@ -492,6 +503,8 @@ async def submit_review_by_route(
             vehicle_comment=payload.vehicle_comment,
         )
         db.add(review)
+        db.flush()
+        review_aggregate_service.record_review(db, review)
         db.commit()
         db.refresh(review)
 
@@ -615,6 +628,9 @@ async def list_reviews(
     max_rating: Optional[float] = Query(
         default=None, ge=1, le=5, description="Maximum overall_rating (inclusive)"
     ),
+    cursor: Optional[str] = Query(
+        default=None, description="meta.next_cursor of the previous page (page is then ignored)"
+    ),
     db: Session = Depends(get_db),
     user_data=Depends(PermissionChecker(["booking.read"])),
 ):
@@ -656,16 +672,16 @@ async def list_reviews(
         if max_rating is not None:
             q = q.filter(RideReview.overall_rating <= max_rating)
 
-        total = q.count()
-        reviews = (
+        total = cached_count(q, refresh=cursor is None)
+        reviews, next_cursor = keyset_paginate(
             q.options(
                 selectinload(RideReview.driver),
                 selectinload(RideReview.vehicle),
-            )
-            .order_by(RideReview.created_at.desc())
-            .offset((page - 1) * per_page)
-            .limit(per_page)
-            .all()
+            ),
+            [RideReview.created_at, RideReview.review_id],
+            cursor=cursor,
+            offset=(page - 1) * per_page,
+            limit=per_page,
         )
 
         logger.info(f"[review.list] OK tenant={tenant_id} total={total} page={page} returning={len(reviews)}")
@@ -674,6 +690,7 @@ async def list_reviews(
             total=total,
             page=page,
             per_page=per_page,
+            next_cursor=next_cursor,
         )
     except HTTPException:
         raise
@@ -743,6 +760,61 @@ async def get_booking_review(
         raise handle_http_error(e)
 
 
+# ================================================================
+# ADMIN -- DEACTIVATE A REVIEW
+# ================================================================
+
+@router.delete(
+    "/reviews/{review_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Deactivate a review (admin/manager)",
+)
+async def deactivate_review(
+    review_id: int,
+    db: Session = Depends(get_db),
+    user_data=Depends(PermissionChecker(["booking.read"])),
+):
+    """
+    Soft-deletes a review (e.g. abusive content). It disappears from listings
+    and from driver / vehicle summaries; the row is kept for audit.
+    Edge cases:
+    - Review from a different tenant or already inactive: 404
+    """
+    logger.info(f"[review.deactivate] START tenant={user_data.get('tenant_id')} review_id={review_id}")
+    try:
+        tenant_id = user_data.get("tenant_id")
+
+        review = (
+            db.query(RideReview)
+            .filter(
+                RideReview.review_id == review_id,
+                RideReview.tenant_id == tenant_id,
+                RideReview.is_active.is_(True),
+            )
+            .first()
+        )
+        if not review:
+            logger.warning(f"[review.deactivate] 404 REVIEW_NOT_FOUND tenant={tenant_id} review_id={review_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=ResponseWrapper.error("Review not found", "REVIEW_NOT_FOUND"),
+            )
+
+        review.is_active = False
+        db.flush()
+        review_aggregate_service.remove_review(db, review)
+        db.commit()
+
+        logger.info(f"[review.deactivate] OK tenant={tenant_id} review_id={review_id}")
+        return ResponseWrapper.success(message="Review deactivated successfully")
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"[review.deactivate] CRASH tenant={user_data.get('tenant_id')} review_id={review_id} error={e}")
+        raise handle_http_error(e)
+
+
 # ================================================================
 # ADMIN -- DRIVER REVIEW SUMMARY
 # ================================================================
@@ -789,6 +861,7 @@ async def get_driver_reviews(
             RideReview.driver_id == driver_id,
             RideReview.tenant_id == tenant_id,
             RideReview.driver_rating.isnot(None),
+            RideReview.is_active.is_(True),
         )
         if start_date:
             q = q.filter(RideReview.created_at >= datetime.combine(start_date, dt_time.min))
@@ -796,8 +869,16 @@ async def get_driver_reviews(
             q = q.filter(RideReview.created_at <= datetime.combine(end_date, dt_time.max))
         if route_id:
             q = q.filter(RideReview.route_id == route_id)
-        agg_reviews = q.order_by(RideReview.created_at.desc()).all()
-        agg = _build_aggregate(agg_reviews, "driver_rating", "driver_tags", "driver_comment")
+            agg_reviews = q.order_by(RideReview.created_at.desc()).all()
+            agg = _build_aggregate(agg_reviews, "driver_rating", "driver_tags", "driver_comment")
+        elif start_date or end_date:
+            agg = review_aggregate_service.get_range_summary(
+                db, tenant_id, ReviewSubjectTypeEnum.DRIVER, driver_id, start_date, end_date
+            )
+        else:
+            agg = review_aggregate_service.get_summary(
+                db, tenant_id, ReviewSubjectTypeEnum.DRIVER, driver_id
+            )
         total = agg["total_reviews"]
         offset = (page - 1) * per_page
         page_reviews = (
@@ -879,6 +960,7 @@ async def get_vehicle_reviews(
             RideReview.vehicle_id == vehicle_id,
             RideReview.tenant_id == tenant_id,
             RideReview.vehicle_rating.isnot(None),
+            RideReview.is_active.is_(True),
         )
         if start_date:
             q = q.filter(RideReview.created_at >= datetime.combine(start_date, dt_time.min))
@@ -886,8 +968,16 @@ async def get_vehicle_reviews(
             q = q.filter(RideReview.created_at <= datetime.combine(end_date, dt_time.max))
         if route_id:
             q = q.filter(RideReview.route_id == route_id)
-        agg_reviews = q.order_by(RideReview.created_at.desc()).all()
-        agg = _build_aggregate(agg_reviews, "vehicle_rating", "vehicle_tags", "vehicle_comment")
+            agg_reviews = q.order_by(RideReview.created_at.desc()).all()
+            agg = _build_aggregate(agg_reviews, "vehicle_rating", "vehicle_tags", "vehicle_comment")
+        elif start_date or end_date:
+            agg = review_aggregate_service.get_range_summary(
+                db, tenant_id, ReviewSubjectTypeEnum.VEHICLE, vehicle_id, start_date, end_date
+            )
+        else:
+            agg = review_aggregate_service.get_summary(
+                db, tenant_id, ReviewSubjectTypeEnum.VEHICLE, vehicle_id
+            )
         total = agg["total_reviews"]
         offset = (page - 1) * per_page
         page_reviews = (
@@ -11,6 +11,7 @@ import math
 from collections import defaultdict
 
 from app.database.session import get_db
+from app.crud.booking import booking_crud
 from app.models.booking import Booking, BookingStatusEnum
 from app.models.cutoff import Cutoff
 from app.models.driver import Driver
@@ -25,6 +26,8 @@ from app.models.vendor import Vendor
 from app.schemas.route import RouteWithEstimations, RouteEstimations, RouteManagementBookingResponse  # Add import for response schema
 from app.schemas.shift import ShiftResponse
 from app.services.clustering_algorithm import group_rides
+from app.services.escort_requirements import apply_escort_requirements
+from app.services.route_views import load_route_refs
 from common_utils.auth.permission_checker import PermissionChecker
 from app.core.logging_config import get_logger
 from app.utils.response_utils import ResponseWrapper, handle_db_error
@@ -566,6 +569,15 @@ def get_booking_by_id(booking_id: int, db: Session) -> Optional[Dict]:
     return booking_dict
 
 
+def _apply_shift_escort_requirements(db: Session, tenant_id: str, shift_id: int, booking_date: date) -> None:
+    """Set escort_required on every route of the shift/date and commit; failures are logged only."""
+    try:
+        apply_escort_requirements(db, tenant_id, shift_id=shift_id, booking_date=booking_date)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"[create_routes] Failed to update escort requirements for shift {shift_id} on {booking_date}: {e}")
+
 
 @router.post("/" , status_code=status.HTTP_200_OK)
 async def create_routes(
@@ -652,27 +664,10 @@ async def create_routes(
         lat_col = "pickup_latitude" if shift_type == "IN" else "drop_latitude"
         lon_col = "pickup_longitude" if shift_type == "IN" else "drop_longitude"
         
-        # ---- Fetch Already Routed Booking IDs ----
-        routed_booking_ids = (
-            db.query(RouteManagementBooking.booking_id)
-            .join(RouteManagement, RouteManagement.route_id == RouteManagementBooking.route_id)
-            .filter(RouteManagement.tenant_id == tenant_id)
-            .distinct()
-            .all()
-        )
-        routed_booking_ids = [b.booking_id for b in routed_booking_ids]
-
         # ---- Fetch Only Unrouted Bookings ----
-        bookings_query = db.query(Booking).filter(
-            Booking.booking_date == booking_date,
-            Booking.shift_id == shift_id,
-            Booking.tenant_id == tenant_id,
-            Booking.status == BookingStatusEnum.REQUEST
-        )
-        if routed_booking_ids:
-            bookings_query = bookings_query.filter(~Booking.booking_id.in_(routed_booking_ids))
-
-        bookings = bookings_query.all()
+        bookings = booking_crud.get_unrouted_query(
+            db, tenant_id=tenant_id, booking_date=booking_date, shift_id=shift_id,
+        ).all()
 
         if not bookings:
             logger.info(f"No unrouted bookings found for tenant={tenant_id}, shift={shift_id} on {booking_date}")
@@ -801,10 +796,6 @@ async def create_routes(
                         db.add(route)
                         db.flush()  # get route_id
 
-                        # Escort check
-                        from app.utils.otp_utils import update_route_escort_requirement
-                        update_route_escort_requirement(db, route.route_id, tenant_id)
-
                         pickup_order = []
                         for order_idx, booking in enumerate(chunk):
                             route_booking = RouteManagementBooking(
@@ -872,6 +863,9 @@ async def create_routes(
                         )
                         nodal_routes_failed += 1
 
+            # Escort flags for the whole shift/date in one pass (manual assignment later)
+            _apply_shift_escort_requirements(db, tenant_id, shift_id, booking_date)
+
             if nodal_routes_created == 0 and len(hub_booking_map) > 0:
                 raise HTTPException(
                     status_code=422,
@@ -982,12 +976,6 @@ async def create_routes(
                     db.add(route)
                     db.flush()  # Get the route_id
 
-                    # Check if route requires escort for safety
-                    from app.utils.otp_utils import update_route_escort_requirement
-                    update_route_escort_requirement(db, route.route_id, tenant_id)
-
-                    # Escort requirement flag is set; manual assignment will be done later if needed
-
                     for idx, booking in enumerate(optimized_route[0]["pickup_order"]):
                         otp_code = random.randint(1000, 9999)
                         # Convert datetime.time to string for SQLite
@@ -1029,6 +1017,9 @@ async def create_routes(
 
                 cluster["optimized_route"] = optimized_route
 
+        # ---- Escort flags for the whole shift/date in one pass (manual assignment later) ----
+        _apply_shift_escort_requirements(db, tenant_id, shift_id, booking_date)
+
         # ---- Final Response ----
         routes_created = sum(1 for c in cluster_data if c.get("optimized_route"))
         routes_failed = len(cluster_data) - routes_created
@@ -1216,15 +1207,13 @@ async def get_all_routes(
                 "No routes found"
             )
 
+        # --- Bulk load shifts / drivers / vehicles / vendors / escorts (one query each) ---
+        refs = load_route_refs(db, routes, tenant_id=tenant_id)
+
         # --- DATA INTEGRITY CHECK: Validate all shifts exist before processing ---
         logger.info(f"[get_all_routes] Validating data integrity for {len(routes)} routes...")
         unique_shift_ids = {r.shift_id for r in routes}
-        existing_shifts = db.query(Shift.shift_id).filter(
-            Shift.shift_id.in_(unique_shift_ids),
-            Shift.tenant_id == tenant_id
-        ).all()
-        existing_shift_ids = {s.shift_id for s in existing_shifts}
-        missing_shift_ids = unique_shift_ids - existing_shift_ids
+        missing_shift_ids = unique_shift_ids - refs.shifts.keys()
         
         if missing_shift_ids:
             # Data integrity violation - routes reference non-existent shifts
@@ -1267,38 +1256,10 @@ async def get_all_routes(
         
         logger.info(f"✅ [get_all_routes] Data integrity check passed - all shifts exist")
 
-        # --- Collect IDs ---
-        driver_ids = {r.assigned_driver_id for r in routes if r.assigned_driver_id}
-        vehicle_ids = {r.assigned_vehicle_id for r in routes if r.assigned_vehicle_id}
-        vendor_ids = {r.assigned_vendor_id for r in routes if r.assigned_vendor_id}
-        escort_ids = {r.assigned_escort_id for r in routes if r.assigned_escort_id}
-
-        # --- Bulk Load related data ---
-        drivers = (
-            db.query(Driver.driver_id, Driver.name, Driver.phone)
-            .filter(Driver.driver_id.in_(driver_ids | escort_ids))  # Include escorts
-            .all() if (driver_ids | escort_ids) else []
-        )
-        escorts = (
-            db.query(Escort.escort_id, Escort.name, Escort.phone)
-            .filter(Escort.escort_id.in_(escort_ids))
-            .all() if escort_ids else []
-        )
-        escort_map = {e.escort_id: {"id": e.escort_id, "name": e.name, "phone": e.phone} for e in escorts}
-        vehicles = (
-            db.query(Vehicle.vehicle_id, Vehicle.rc_number)
-            .filter(Vehicle.vehicle_id.in_(vehicle_ids))
-            .all() if vehicle_ids else []
-        )
-        vendors = (
-            db.query(Vendor.vendor_id, Vendor.name)
-            .filter(Vendor.vendor_id.in_(vendor_ids))
-            .all() if vendor_ids else []
-        )
-
-        driver_map = {d.driver_id: {"id": d.driver_id, "name": d.name, "phone": d.phone} for d in drivers}
-        vehicle_map = {v.vehicle_id: {"id": v.vehicle_id, "rc_number": v.rc_number} for v in vehicles}
-        vendor_map = {v.vendor_id: {"id": v.vendor_id, "name": v.name} for v in vendors}
+        driver_map = {i: {"id": i, "name": d["name"], "phone": d["phone"]} for i, d in refs.drivers.items()}
+        vehicle_map = {i: {"id": i, "rc_number": v["rc_number"]} for i, v in refs.vehicles.items()}
+        vendor_map = {i: {"id": i, "name": v["name"]} for i, v in refs.vendors.items()}
+        escort_map = {i: {"id": i, "name": e["name"], "phone": e["phone"]} for i, e in refs.escorts.items()}
 
         shifts = {}
 
@@ -1338,46 +1299,14 @@ async def get_all_routes(
 
             shift_id_key = route.shift_id
             if shift_id_key not in shifts:
-                # Get shift from cache/DB - should ALWAYS succeed due to integrity check above
-                s = get_shift_with_cache(db, tenant_id, shift_id_key)
-                if s:
-                    # Safe extraction: handle both dict (from cache) and object (from DB)
-                    if isinstance(s, dict):
-                        # Already a dict from cache
-                        shifts[shift_id_key] = {
-                            "shift_id": s.get("shift_id"),
-                            "log_type": s.get("log_type"),
-                            "shift_time": s.get("shift_time"),
-                            "routes": []
-                        }
-                    else:
-                        # SQLAlchemy object from DB
-                        shifts[shift_id_key] = {
-                            "shift_id": s.shift_id,
-                            "log_type": safe_get_enum_value(s, "log_type"),
-                            "shift_time": s.shift_time.strftime("%H:%M:%S") if s.shift_time else None,
-                            "routes": []
-                        }
-                else:
-                    # This should NEVER happen due to integrity check, but fail explicitly if it does
-                    logger.critical(
-                        f"❌ [CRITICAL ERROR] Shift {shift_id_key} passed integrity check but "
-                        f"get_shift_with_cache returned None! This indicates a race condition or "
-                        f"concurrent deletion. tenant_id={tenant_id}, shift_id={shift_id_key}"
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=ResponseWrapper.error(
-                            message=f"Critical: Shift {shift_id_key} disappeared during processing",
-                            error_code="SHIFT_RACE_CONDITION",
-                            details={
-                                "shift_id": shift_id_key,
-                                "tenant_id": tenant_id,
-                                "cause": "Shift existed during validation but not during retrieval",
-                                "solution": "Retry the request. If persists, check for concurrent deletions."
-                            }
-                        )
-                    )
+                # Present in refs.shifts - guaranteed by the integrity check above
+                shift = refs.shifts[shift_id_key]
+                shifts[shift_id_key] = {
+                    "shift_id": shift["shift_id"],
+                    "log_type": shift["log_type"],
+                    "shift_time": shift["shift_time"],
+                    "routes": []
+                }
 
             shifts[shift_id_key]["routes"].append({
                 "tenant": tenant_details,
@@ -1493,17 +1422,10 @@ async def get_unrouted_bookings(
             f"Fetching unrouted bookings for tenant {tenant_id}, shift_id: {shift_id}, booking_date: {booking_date}"
         )
 
-        # ---- Fetch all bookings with REQUEST status ----
-        unrouted_bookings = (
-            db.query(Booking)
-            .filter(
-                Booking.tenant_id == tenant_id,
-                Booking.shift_id == shift_id,
-                Booking.booking_date == booking_date,
-                Booking.status == BookingStatusEnum.REQUEST
-            )
-            .all()
-        )
+        # ---- Fetch REQUEST bookings not on any route ----
+        unrouted_bookings = booking_crud.get_unrouted_query(
+            db, tenant_id=tenant_id, booking_date=booking_date, shift_id=shift_id,
+        ).all()
 
         logger.info(f"[unrouted_bookings] Found {len(unrouted_bookings)} bookings with REQUEST status")
 
@@ -3522,6 +3444,8 @@ async def merge_routes(
                 logger.debug(f"[MERGE]   Stop {idx+1}: Booking {b['booking_id']} at pickup={est_pickup}, drop={est_drop}")
             
             logger.info(f"[MERGE] ✓ Step 9: Inserted all stops")
+
+            apply_escort_requirements(db, tenant_id, route_ids=[route.route_id])
         except Exception as e:
             logger.error(f"[MERGE] ❌ FAILED: Error inserting stops - {str(e)}", exc_info=True)
             raise
@@ -3962,6 +3886,9 @@ async def update_route(
             ))
 
         logger.info(f"✅ Created {len(optimized['pickup_order'])} new route-booking mappings")
+
+        # Stops changed → re-evaluate the escort requirement
+        apply_escort_requirements(db, tenant_id, route_ids=[route.route_id])
         
         # Update booking statuses
         logger.info(f"🔄 Updating booking statuses...")
@@ -4274,6 +4201,9 @@ async def update_route_bookings(
 
         # Add all new mappings
         db.add_all(new_mappings)
+
+        # Stop order changed → re-evaluate the escort requirement
+        apply_escort_requirements(db, tenant_id, route_ids=[route_id])
         
         # Update booking statuses to SCHEDULED
         db.query(Booking).filter(
@@ -4607,6 +4537,8 @@ async def create_route_from_bookings(
                 estimated_distance=est_distance,
             ))
 
+        apply_escort_requirements(db, tenant_id, route_ids=[new_route.route_id])
+
         # Update booking statuses to SCHEDULED
         logger.info(f"[CREATE_FROM_BOOKINGS] Updating booking statuses from REQUEST to SCHEDULED")
         updated_count = db.query(Booking).filter(
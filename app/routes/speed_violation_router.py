@@ -36,6 +36,7 @@ from app.schemas.speed_violation import (
     SpeedViolationListResponse,
     SpeedViolationRouteSummary,
 )
+from app.utils.pagination import cached_count, keyset_paginate
 from app.utils.response_utils import ResponseWrapper, handle_db_error
 from app.core.logging_config import get_logger
 from common_utils.auth.permission_checker import PermissionChecker
@@ -69,6 +70,12 @@ def _to_response(
         longitude=v.longitude,
         recorded_at=v.recorded_at,
         created_at=v.created_at,
+        avg_speed=v.avg_speed,
+        ping_count=v.ping_count,
+        ended_at=v.ended_at,
+        duration_seconds=v.duration_seconds,
+        end_latitude=v.end_latitude,
+        end_longitude=v.end_longitude,
     )
 
 
@@ -536,6 +543,7 @@ def list_speed_violations(
     date_to:         Optional[datetime] = Query(None, description="Violations on or before (ISO-8601)"),
     page:            int                = Query(1, ge=1),
     limit:           int                = Query(20, ge=1, le=200),
+    cursor:          Optional[str]      = Query(None, description="next_cursor of the previous page (page is then ignored)"),
     tenant_id_param: Optional[str]      = Query(None, alias="tenant_id"),
     db: Session = Depends(get_db),
     user_data=Depends(PermissionChecker(["speed_violation.read"], check_tenant=False)),
@@ -552,12 +560,13 @@ def list_speed_violations(
         if date_from is not None: q = q.filter(SpeedViolation.recorded_at >= date_from)
         if date_to   is not None: q = q.filter(SpeedViolation.recorded_at <= date_to)
 
-        total = q.count()
-        violations = (
-            q.order_by(SpeedViolation.recorded_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
-            .all()
+        total = cached_count(q, refresh=cursor is None)
+        violations, next_cursor = keyset_paginate(
+            q,
+            [SpeedViolation.recorded_at, SpeedViolation.violation_id],
+            cursor=cursor,
+            offset=(page - 1) * limit,
+            limit=limit,
         )
 
         return SpeedViolationListResponse(
@@ -566,6 +575,7 @@ def list_speed_violations(
             page=page,
             limit=limit,
             total_pages=math.ceil(total / limit) if total else 0,
+            next_cursor=next_cursor,
         )
 
     except HTTPException:
@@ -685,6 +695,7 @@ def get_driver_violations(
     date_to:         Optional[datetime] = Query(None),
     page:            int                = Query(1, ge=1),
     limit:           int                = Query(20, ge=1, le=200),
+    cursor:          Optional[str]      = Query(None, description="next_cursor of the previous page (page is then ignored)"),
     tenant_id_param: Optional[str]      = Query(None, alias="tenant_id"),
     db: Session = Depends(get_db),
     user_data=Depends(PermissionChecker(["speed_violation.read"], check_tenant=False)),
@@ -701,12 +712,13 @@ def get_driver_violations(
         if date_from is not None: q = q.filter(SpeedViolation.recorded_at >= date_from)
         if date_to   is not None: q = q.filter(SpeedViolation.recorded_at <= date_to)
 
-        total = q.count()
-        violations = (
-            q.order_by(SpeedViolation.recorded_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
-            .all()
+        total = cached_count(q, refresh=cursor is None)
+        violations, next_cursor = keyset_paginate(
+            q,
+            [SpeedViolation.recorded_at, SpeedViolation.violation_id],
+            cursor=cursor,
+            offset=(page - 1) * limit,
+            limit=limit,
         )
 
         return SpeedViolationListResponse(
@@ -715,6 +727,7 @@ def get_driver_violations(
             page=page,
             limit=limit,
             total_pages=math.ceil(total / limit) if total else 0,
+            next_cursor=next_cursor,
         )
 
     except HTTPException:
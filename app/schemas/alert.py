@@ -137,6 +137,7 @@ class AlertNotificationResponse(BaseModel):
     sent_at: Optional[datetime]
     delivered_at: Optional[datetime]
     failure_reason: Optional[str]
+    latency_ms: Optional[int] = None
     
     model_config = ConfigDict(from_attributes=True)
 
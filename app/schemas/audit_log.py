@@ -28,3 +28,4 @@ class AuditLogFilter(BaseModel):
     end_date: Optional[datetime] = None
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=50, ge=1, le=200)
+    cursor: Optional[str] = None
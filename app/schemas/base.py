@@ -43,6 +43,7 @@ class PaginationMeta(BaseModel):
     total_pages: int = Field(..., description="Total number of pages")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset listings only)")
 
 class PaginatedResponse(BaseModel, Generic[DataType]):
     """
@@ -91,22 +92,28 @@ def create_paginated_response(
     total: int, 
     page: int, 
     per_page: int, 
-    message: str = "Success"
+    message: str = "Success",
+    next_cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Create a paginated response with IST timestamp"""
     total_pages = (total + per_page - 1) // per_page
     
+    meta = {
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_prev": page > 1
+    }
+    if next_cursor is not None:
+        # Keyset listings: the cursor, not the (cached) total, says whether more rows exist
+        meta["has_next"] = True
+        meta["next_cursor"] = next_cursor
     return {
         "success": True,
         "message": message,
         "data": items,
-        "meta": {
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        },
+        "meta": meta,
         "timestamp": datetime.now(IST).strftime("%Y-%m-%d %H:%M:%S")
     }
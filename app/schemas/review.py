@@ -153,8 +153,11 @@ class DriverReviewSummary(BaseModel):
     driver_name: Optional[str] = None
     total_reviews: int
     average_rating: Optional[float] = None
+    average_overall_rating: Optional[float] = None
     tag_counts: dict  # {"Punctual": 12, "Polite": 8, ...}
     recent_comments: List[str]  # last 5 non-empty comments
+    last_30_days: Optional[dict] = None  # {"total_reviews": 4, "average_rating": 4.5}
+    last_90_days: Optional[dict] = None
 
 
 class VehicleReviewSummary(BaseModel):
@@ -163,8 +166,11 @@ class VehicleReviewSummary(BaseModel):
     vehicle_number: Optional[str] = None
     total_reviews: int
     average_rating: Optional[float] = None
+    average_overall_rating: Optional[float] = None
     tag_counts: dict
     recent_comments: List[str]
+    last_30_days: Optional[dict] = None
+    last_90_days: Optional[dict] = None
 
 
 class RideReviewResponse(BaseModel):
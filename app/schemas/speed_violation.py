@@ -63,6 +63,13 @@ class SpeedViolationResponse(BaseModel):
     longitude:      Optional[float]
     recorded_at:    datetime
     created_at:     datetime
+    # Episode aggregates — populated for server-detected violations
+    avg_speed:        Optional[float]    = None
+    ping_count:       Optional[int]      = None
+    ended_at:         Optional[datetime] = None
+    duration_seconds: Optional[int]      = None
+    end_latitude:     Optional[float]    = None
+    end_longitude:    Optional[float]    = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -74,6 +81,7 @@ class SpeedViolationListResponse(BaseModel):
     page:        int
     limit:       int
     total_pages: int
+    next_cursor: Optional[str] = None   # pass as ?cursor= for the next page
 
 
 class SpeedViolationRouteSummary(BaseModel):
@@ -0,0 +1,200 @@
+"""
+app/services/alert_config_index.py
+-----------------------------------
+Per-tenant compiled alert-configuration index used by
+``alert_crud.get_applicable_configuration`` on the SOS trigger path.
+
+A tenant's active configurations are compiled once into::
+
+    team_id (None = tenant-wide) → alert_type → [config_id, ...]
+
+with each list ordered by priority (highest first, ties by config_id) and
+configs without ``applicable_alert_types`` listed under every alert type.
+Resolution is then two dict lookups.
+
+Caching
+-------
+Compiled indexes live in a module-level dict.  With ``settings.USE_REDIS``
+the compiled rows are also shared through Redis::
+
+    alert_config_index:{tenant_id}      JSON  {"version", "rows"} (TTL)
+    alert_config_index:ver:{tenant_id}  INT   bumped by invalidate()
+
+Each lookup reads the version counter (one GET) and reuses the in-process
+index while it matches, so a write on one worker invalidates all of them.
+Without Redis the in-process copy expires after ``LOCAL_TTL_SECONDS``.
+
+``alert_config_router`` calls ``invalidate()`` after every create / update /
+delete.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.models.alert import AlertConfiguration, AlertTypeEnum
+
+logger = get_logger(__name__)
+
+# Lifetime of a compiled index in Redis, and of an in-process copy when
+# there is no Redis version counter to validate it against.
+REMOTE_TTL_SECONDS: int = 3600
+LOCAL_TTL_SECONDS: float = 60.0
+
+_ALL_TYPES = [t.value for t in AlertTypeEnum]
+
+
+def _index_key(tenant_id: str) -> str:
+    return f"alert_config_index:{tenant_id}"
+
+
+def _version_key(tenant_id: str) -> str:
+    return f"alert_config_index:ver:{tenant_id}"
+
+
+def _get_client(client=None):
+    """Return the shared Redis client, or None when Redis is disabled."""
+    if client is not None:
+        return client
+    if not settings.USE_REDIS:
+        return None
+    from app.utils.cache_manager import cache
+    return cache.redis_client
+
+
+class AlertConfigIndex:
+    """Compiled team → alert_type → ordered config_ids map for one tenant."""
+
+    def __init__(self, rows: List[dict], version: Optional[str] = None) -> None:
+        self.version = version
+        self.built_at = time.monotonic()
+        self.rows = rows
+        ordered = sorted(rows, key=lambda r: (-r["priority"], r["config_id"]))
+        by_team: Dict[Optional[int], Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        for row in ordered:
+            for alert_type in row["types"] if row["types"] is not None else _ALL_TYPES:
+                by_team[row["team_id"]][alert_type].append(row["config_id"])
+        self._by_team = {team: dict(types) for team, types in by_team.items()}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def candidates(self, alert_type, team_id: Optional[int] = None) -> List[int]:
+        """Config ids in resolution order: the team's, then tenant-wide."""
+        alert_type = alert_type.value if isinstance(alert_type, AlertTypeEnum) else alert_type
+        out: List[int] = []
+        if team_id:
+            out.extend(self._by_team.get(team_id, {}).get(alert_type, []))
+        out.extend(self._by_team.get(None, {}).get(alert_type, []))
+        return out
+
+    def resolve(self, alert_type, team_id: Optional[int] = None) -> Optional[int]:
+        found = self.candidates(alert_type, team_id)
+        return found[0] if found else None
+
+
+_indexes: Dict[str, AlertConfigIndex] = {}
+_lock = threading.Lock()
+
+
+def _load_rows(db: Session, tenant_id: str) -> List[dict]:
+    """One query on (tenant_id, is_active) — ix_alert_configurations_tenant."""
+    configs = (
+        db.query(
+            AlertConfiguration.config_id,
+            AlertConfiguration.team_id,
+            AlertConfiguration.applicable_alert_types,
+            AlertConfiguration.priority,
+        )
+        .filter(
+            AlertConfiguration.tenant_id == tenant_id,
+            AlertConfiguration.is_active.is_(True),
+        )
+        .all()
+    )
+    return [
+        {
+            "config_id": c.config_id,
+            "team_id": c.team_id,
+            "types": list(c.applicable_alert_types) if c.applicable_alert_types is not None else None,
+            "priority": c.priority or 0,
+        }
+        for c in configs
+    ]
+
+
+def _remote_version(r, tenant_id: str) -> Tuple[bool, Optional[str]]:
+    """(ok, version) — ok is False when Redis could not be reached."""
+    if r is None:
+        return False, None
+    try:
+        return True, r.get(_version_key(tenant_id)) or "0"
+    except Exception as e:
+        logger.warning("[alert_config_index] Redis version read failed for tenant=%s: %s", tenant_id, e)
+        return False, None
+
+
+def _fresh(index: AlertConfigIndex, shared: bool, version: Optional[str]) -> bool:
+    if shared:
+        return index.version == version
+    return time.monotonic() - index.built_at < LOCAL_TTL_SECONDS
+
+
+def get_index(db: Session, tenant_id: str, client=None) -> AlertConfigIndex:
+    """Return the tenant's compiled index, rebuilding it when stale."""
+    r = _get_client(client)
+    shared, version = _remote_version(r, tenant_id)
+
+    index = _indexes.get(tenant_id)
+    if index is not None and _fresh(index, shared, version):
+        return index
+
+    rows = None
+    if shared:
+        try:
+            raw = r.get(_index_key(tenant_id))
+            if raw:
+                payload = json.loads(raw)
+                if payload.get("version") == version:
+                    rows = payload["rows"]
+        except Exception as e:
+            logger.warning("[alert_config_index] Redis read failed for tenant=%s: %s", tenant_id, e)
+
+    if rows is None:
+        rows = _load_rows(db, tenant_id)
+        if shared:
+            try:
+                r.set(_index_key(tenant_id), json.dumps({"version": version, "rows": rows}),
+                      ex=REMOTE_TTL_SECONDS)
+            except Exception as e:
+                logger.warning("[alert_config_index] Redis write failed for tenant=%s: %s", tenant_id, e)
+        logger.info("[alert_config_index] Compiled %d config(s) for tenant=%s", len(rows), tenant_id)
+
+    index = AlertConfigIndex(rows, version if shared else None)
+    with _lock:
+        _indexes[tenant_id] = index
+    return index
+
+
+def invalidate(tenant_id: str, client=None) -> None:
+    """Drop the tenant's compiled index on this worker and, via Redis, on all."""
+    with _lock:
+        _indexes.pop(tenant_id, None)
+    r = _get_client(client)
+    if r is None:
+        return
+    try:
+        pipe = r.pipeline(transaction=True)
+        pipe.incr(_version_key(tenant_id))
+        pipe.delete(_index_key(tenant_id))
+        pipe.execute()
+    except Exception as e:
+        logger.warning("[alert_config_index] Redis invalidate failed for tenant=%s: %s", tenant_id, e)
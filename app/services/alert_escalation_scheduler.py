@@ -0,0 +1,408 @@
+"""
+app/services/alert_escalation_scheduler.py
+-------------------------------------------
+Deadline-driven auto-escalation for alerts.
+
+When an alert is triggered with an escalation-enabled configuration, its
+escalation deadline (``triggered_at + escalation_threshold_seconds``) is
+registered here.  Acknowledging or closing the alert cancels the deadline.
+If the deadline passes first, the alert is auto-escalated
+(``alert_crud.create_escalation(is_auto=True)``) and the escalation
+recipients are notified — at the moment it is due, not on the next tick of
+a polling job, and without scanning every open alert.
+
+Storage
+-------
+With ``settings.USE_REDIS`` the deadlines live in one sorted set shared by
+every worker::
+
+    alert_escalation:due      ZSET  member = alert_id, score = due epoch
+    alert_escalation:config   HASH  alert_id → config_id
+
+Registering / cancelling is ZADD / ZREM — O(log n).  Without Redis a
+process-local binary heap with lazy deletion gives the same interface
+(single-worker deployments only).
+
+Claiming
+--------
+A worker claims due members by pushing their score ``LEASE_SECONDS`` into
+the future inside a WATCH / MULTI transaction, so exactly one worker wins
+each member.  The member is removed only after the escalation committed; if
+the worker dies mid-way the lease expires and another worker retries.  The
+escalation itself re-checks the alert under ``SELECT … FOR UPDATE`` and is
+a no-op once ``auto_escalated`` is set, so a retry never escalates twice.
+
+Lifecycle
+---------
+``escalation_scheduler.start()`` / ``stop()`` are called from the FastAPI
+lifespan.  The loop sleeps until the earliest deadline; registering an
+earlier one on the same worker wakes it immediately.  ``start()`` also
+re-registers open alerts so deadlines survive a restart without Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_DUE_KEY = "alert_escalation:due"
+_CONFIG_KEY = "alert_escalation:config"
+
+# How long a claimed deadline stays hidden from other workers.
+LEASE_SECONDS: float = 60.0
+
+# Upper bound on one sleep — picks up deadlines registered by a worker that
+# has since died.
+_MAX_SLEEP_SECONDS: float = 5.0
+
+# Deadlines claimed per round trip.
+_CLAIM_BATCH: int = 50
+
+
+# ---------------------------------------------------------------------------
+# Deadline stores
+# ---------------------------------------------------------------------------
+
+class RedisDeadlineStore:
+    """Deadlines in a Redis sorted set, shared by all workers."""
+
+    def __init__(self, client) -> None:
+        self._r = client
+
+    def add(self, alert_id: int, config_id: int, due: float) -> None:
+        pipe = self._r.pipeline(transaction=True)
+        pipe.zadd(_DUE_KEY, {str(alert_id): due})
+        pipe.hset(_CONFIG_KEY, str(alert_id), str(config_id))
+        pipe.execute()
+
+    def remove(self, alert_id: int) -> None:
+        pipe = self._r.pipeline(transaction=True)
+        pipe.zrem(_DUE_KEY, str(alert_id))
+        pipe.hdel(_CONFIG_KEY, str(alert_id))
+        pipe.execute()
+
+    def contains(self, alert_id: int) -> bool:
+        return self._r.zscore(_DUE_KEY, str(alert_id)) is not None
+
+    def next_due(self) -> Optional[float]:
+        head = self._r.zrange(_DUE_KEY, 0, 0, withscores=True)
+        return head[0][1] if head else None
+
+    def claim(self, now: float, lease: float, limit: int) -> List[Tuple[int, int]]:
+        from redis.exceptions import WatchError
+
+        with self._r.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(_DUE_KEY)
+                    members = pipe.zrangebyscore(_DUE_KEY, "-inf", now, start=0, num=limit)
+                    if not members:
+                        pipe.unwatch()
+                        return []
+                    config_ids = pipe.hmget(_CONFIG_KEY, members)
+                    pipe.multi()
+                    pipe.zadd(_DUE_KEY, {m: now + lease for m in members}, xx=True)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
+        return [
+            (int(m), int(c))
+            for m, c in zip(members, config_ids)
+            if c is not None
+        ]
+
+
+class HeapDeadlineStore:
+    """Process-local deadlines — a binary heap with lazy deletion."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int]] = []
+        self._entries: Dict[int, Tuple[float, int]] = {}   # alert_id → (due, config_id)
+        self._lock = threading.Lock()
+
+    def add(self, alert_id: int, config_id: int, due: float) -> None:
+        with self._lock:
+            self._entries[alert_id] = (due, config_id)
+            heapq.heappush(self._heap, (due, alert_id))
+
+    def remove(self, alert_id: int) -> None:
+        with self._lock:
+            self._entries.pop(alert_id, None)
+
+    def contains(self, alert_id: int) -> bool:
+        return alert_id in self._entries
+
+    def _prune(self) -> None:
+        while self._heap:
+            due, alert_id = self._heap[0]
+            entry = self._entries.get(alert_id)
+            if entry is not None and entry[0] == due:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            self._prune()
+            return self._heap[0][0] if self._heap else None
+
+    def claim(self, now: float, lease: float, limit: int) -> List[Tuple[int, int]]:
+        claimed: List[Tuple[int, int]] = []
+        with self._lock:
+            while len(claimed) < limit:
+                self._prune()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, alert_id = heapq.heappop(self._heap)
+                config_id = self._entries[alert_id][1]
+                self._entries[alert_id] = (now + lease, config_id)
+                heapq.heappush(self._heap, (now + lease, alert_id))
+                claimed.append((alert_id, config_id))
+        return claimed
+
+
+def _default_store():
+    if settings.USE_REDIS:
+        from app.utils.cache_manager import cache
+        return RedisDeadlineStore(cache.redis_client)
+    return HeapDeadlineStore()
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+class AlertEscalationScheduler:
+    """
+    Registers escalation deadlines and fires them when due.
+
+    Usage::
+
+        escalation_scheduler.schedule(alert, config)   # on trigger
+        escalation_scheduler.cancel(alert.alert_id)    # on acknowledge / close
+    """
+
+    def __init__(self, store=None, session_factory=None) -> None:
+        self._store = store
+        self._session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = _default_store()
+        return self._store
+
+    def _new_session(self):
+        if self._session_factory is None:
+            from app.database.session import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def schedule(self, alert, config) -> Optional[float]:
+        """
+        Register the escalation deadline of ``alert`` under ``config``.
+        Returns the due epoch, or None when the config does not escalate.
+        Errors are logged, never raised — triggering an alert must not fail.
+        """
+        if not config.enable_escalation:
+            return None
+        from app.crud.alert import seconds_since_triggered
+
+        remaining = config.escalation_threshold_seconds - seconds_since_triggered(alert)
+        due = time.time() + max(remaining, 0.0)
+        try:
+            self.store.add(alert.alert_id, config.config_id, due)
+        except Exception as e:
+            logger.error(f"[alert.escalation_scheduler] Failed to schedule alert {alert.alert_id}: {e}")
+            return None
+        logger.info(f"[alert.escalation_scheduler] Alert {alert.alert_id} escalates in {max(remaining, 0.0):.0f}s")
+        self._notify()
+        return due
+
+    def cancel(self, alert_id: int) -> None:
+        """Drop the deadline of an acknowledged / closed alert."""
+        try:
+            self.store.remove(alert_id)
+        except Exception as e:
+            logger.error(f"[alert.escalation_scheduler] Failed to cancel alert {alert_id}: {e}")
+
+    def _notify(self) -> None:
+        if self._loop is None or self._wake is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wake.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    # ------------------------------------------------------------------
+    # Firing
+    # ------------------------------------------------------------------
+
+    def _escalate(self, alert_id: int, config_id: int) -> Optional[int]:
+        """
+        Auto-escalate one claimed alert if it still needs it and release its
+        deadline.  Returns the escalation level to notify, or None.  A
+        deadline that fired early (clock skew) is re-registered instead.
+        """
+        from app.crud import alert as alert_crud
+        from app.models.alert import Alert, AlertConfiguration, AlertStatusEnum
+
+        db = self._new_session()
+        try:
+            alert = db.query(Alert).filter(Alert.alert_id == alert_id).with_for_update().first()
+            config = db.query(AlertConfiguration).filter(AlertConfiguration.config_id == config_id).first()
+            if not alert or not config or alert.status != AlertStatusEnum.TRIGGERED:
+                self.store.remove(alert_id)
+                return None
+            if not alert_crud.check_escalation_needed(db, alert, config):
+                if config.enable_escalation and not alert.auto_escalated:
+                    self.schedule(alert, config)
+                else:
+                    self.store.remove(alert_id)
+                return None
+
+            escalation = alert_crud.create_escalation(
+                db=db,
+                alert=alert,
+                is_auto=True,
+                escalated_to_recipients=config.escalation_recipients or [],
+                reason=f"Not acknowledged within {config.escalation_threshold_seconds}s",
+            )
+            db.commit()
+            self.store.remove(alert_id)
+            return escalation.escalation_level
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def fire(self, alert_id: int, config_id: int) -> Optional[int]:
+        """Escalate one claimed deadline and notify the escalation recipients."""
+        from app.routes.alert_router import send_escalation_notification
+
+        level = await asyncio.to_thread(self._escalate, alert_id, config_id)
+        if level is not None:
+            logger.info(f"[alert.escalation_scheduler] Alert {alert_id} auto-escalated to level {level}")
+            await send_escalation_notification(alert_id=alert_id, config_id=config_id, escalation_level=level)
+        return level
+
+    async def run_due(self, now: Optional[float] = None) -> int:
+        """Claim and fire the deadlines due at ``now``.  Returns how many escalated."""
+        claimed = await asyncio.to_thread(
+            self.store.claim, time.time() if now is None else now, LEASE_SECONDS, _CLAIM_BATCH
+        )
+        fired = 0
+        for alert_id, config_id in claimed:
+            try:
+                if await self.fire(alert_id, config_id) is not None:
+                    fired += 1
+            except Exception as e:
+                # Left claimed — retried once the lease expires.
+                logger.error(f"[alert.escalation_scheduler] Escalating alert {alert_id} failed: {e}", exc_info=True)
+        return fired
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def restore_pending(self) -> int:
+        """
+        Register every open, not yet escalated alert that has no deadline —
+        alerts triggered before this feature or while the store was empty.
+        """
+        from app.crud import alert as alert_crud
+        from app.models.alert import Alert, AlertStatusEnum, AlertTypeEnum
+
+        db = self._new_session()
+        restored = 0
+        try:
+            alerts = (
+                db.query(Alert)
+                .filter(Alert.status == AlertStatusEnum.TRIGGERED, Alert.auto_escalated.is_(False))
+                .all()
+            )
+            for alert in alerts:
+                if self.store.contains(alert.alert_id):
+                    continue
+                alert_type = AlertTypeEnum(alert.alert_type) if isinstance(alert.alert_type, str) else alert.alert_type
+                config = alert_crud.get_applicable_configuration(
+                    db=db, tenant_id=alert.tenant_id, alert_type=alert_type, team_id=None
+                )
+                if config and self.schedule(alert, config) is not None:
+                    restored += 1
+        finally:
+            db.close()
+        return restored
+
+    async def _run(self) -> None:
+        while True:
+            await self.run_due()
+            self._wake.clear()
+            next_due = await asyncio.to_thread(self.store.next_due)
+            timeout = _MAX_SLEEP_SECONDS if next_due is None else next_due - time.time()
+            if timeout <= 0:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=min(timeout, _MAX_SLEEP_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _supervise(self) -> None:
+        while True:
+            try:
+                await self._run()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("[alert.escalation_scheduler] Loop crashed — restarting")
+                await asyncio.sleep(1)
+
+    async def start(self) -> None:
+        """Start the escalation loop on the running event loop.  Idempotent."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        try:
+            restored = await asyncio.to_thread(self.restore_pending)
+            if restored:
+                logger.info(f"[alert.escalation_scheduler] Restored {restored} pending escalation(s)")
+        except Exception:
+            logger.exception("[alert.escalation_scheduler] Failed to restore pending escalations")
+        self._task = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        """Cancel the escalation loop.  Pending deadlines stay in the store."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+        self._wake = None
+
+
+escalation_scheduler = AlertEscalationScheduler()
@@ -0,0 +1,281 @@
+"""
+Bulk booking engine — book a tenant's employees for a shift over one or
+more dates in a fixed number of statements.
+
+Eligibility is decided set-wise, not employee by employee:
+
+* date level   — past date, shift already started, ad-hoc / medical booking
+                 disabled, booking cutoff passed (``date_rejection``); a date
+                 that fails rejects every employee for that date;
+* employees    — active employees of the tenant (optionally a subset), one
+                 column query;
+* one trip per shift — a non-cancelled booking of the same employee, shift
+                 and date means the employee is skipped for that date (one
+                 query over the whole tenant/shift/date range);
+* weekoffs     — one query for every employee's weekoff days;
+* nodal shifts — one query for every employee's nodal point.
+
+Every eligible (employee, date) pair is then written with a single
+executemany INSERT, which SQLAlchemy sends as multi-row VALUES batches.
+
+    report = bulk_book_employees(
+        db, tenant_id, tenant, cutoff,
+        shift_id=7, shift_time=time(9, 0), log_type="IN", nodal=False,
+        booking_dates=[day1, day2], booking_type="regular",
+    )
+    db.commit()
+
+The caller commits; the report says, per employee, which dates were booked,
+skipped (already booked) or failed and why.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.models.booking import Booking, BookingStatusEnum, BookingTypeEnum
+from app.models.employee import Employee
+from app.models.nodal_point import EmployeeNodalPoint, NodalPoint
+from app.models.weekoff_config import WeekoffConfig
+from common_utils import get_current_ist_time
+
+logger = get_logger(__name__)
+
+_IST = timezone(timedelta(hours=5, minutes=30))
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+@dataclass
+class EmployeeBookingReport:
+    """Outcome of a bulk booking for one employee, date by date."""
+    employee_id: int
+    booked: List[date] = field(default_factory=list)
+    skipped: List[date] = field(default_factory=list)
+    failed: List[Dict] = field(default_factory=list)
+
+    def fail(self, booking_date: date, error_code: str, reason: str) -> None:
+        self.failed.append({"booking_date": booking_date, "reason": reason, "error_code": error_code})
+
+    def as_dict(self) -> Dict:
+        return {
+            "employee_id": self.employee_id,
+            "booked": [d.isoformat() for d in self.booked],
+            "skipped": [d.isoformat() for d in self.skipped],
+            "failed": [{**f, "booking_date": f["booking_date"].isoformat()} for f in self.failed],
+        }
+
+
+@dataclass
+class BulkBookingReport:
+    """Per-employee outcomes of bulk_book_employees, in employee_id order."""
+    employees: List[EmployeeBookingReport] = field(default_factory=list)
+
+    @property
+    def booked(self) -> int:
+        return sum(len(e.booked) for e in self.employees)
+
+    @property
+    def skipped(self) -> int:
+        return sum(len(e.skipped) for e in self.employees)
+
+    @property
+    def failed(self) -> int:
+        return sum(len(e.failed) for e in self.employees)
+
+    def failed_employees(self) -> List[Dict]:
+        """Flat list of failures, one entry per employee and date."""
+        return [
+            {"employee_id": e.employee_id, **f, "booking_date": f["booking_date"].isoformat()}
+            for e in self.employees
+            for f in e.failed
+        ]
+
+
+def date_rejection(
+    booking_date: date,
+    shift_time: Optional[time],
+    log_type: Optional[str],
+    booking_type: Optional[str],
+    cutoff=None,
+    now: Optional[datetime] = None,
+) -> Optional[Tuple[str, str]]:
+    """
+    (error_code, message) when nobody can be booked for ``booking_date``,
+    else None.  ``now`` is IST-aware, as get_current_ist_time() returns.
+    """
+    now = now or get_current_ist_time()
+    if booking_date < now.date():
+        return "INVALID_DATE", "booking_date must be today or a future date"
+
+    shift_datetime = datetime.combine(booking_date, shift_time).replace(tzinfo=_IST) if shift_time else None
+    if shift_datetime and booking_date == now.date() and now >= shift_datetime:
+        return (
+            "PAST_SHIFT_TIME",
+            f"Cannot create bookings for a shift that has already started or passed (Shift time: {shift_time})",
+        )
+
+    booking_type = getattr(booking_type, "value", booking_type)
+    if booking_type == "adhoc":
+        if not cutoff or not cutoff.allow_adhoc_booking:
+            return "ADHOC_BOOKING_DISABLED", "Ad-hoc booking is not enabled for this tenant"
+        cutoff_interval = cutoff.adhoc_booking_cutoff
+    elif booking_type == "medical_emergency":
+        if not cutoff or not cutoff.allow_medical_emergency_booking:
+            return "MEDICAL_EMERGENCY_BOOKING_DISABLED", "Medical emergency booking is not enabled for this tenant"
+        cutoff_interval = cutoff.medical_emergency_booking_cutoff
+    elif cutoff:
+        cutoff_interval = cutoff.booking_login_cutoff if log_type == "IN" else cutoff.booking_logout_cutoff
+    else:
+        cutoff_interval = None
+
+    if shift_datetime and cutoff_interval and cutoff_interval.total_seconds() > 0:
+        if shift_datetime - now < cutoff_interval:
+            return "BOOKING_CUTOFF", f"Booking cutoff time has passed for this shift (cutoff: {cutoff_interval})"
+    return None
+
+
+def _float(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def bulk_book_employees(
+    db: Session,
+    tenant_id: str,
+    tenant,
+    cutoff,
+    *,
+    shift_id: int,
+    shift_time: Optional[time],
+    log_type: Optional[str],
+    nodal: bool,
+    booking_dates: Iterable[date],
+    booking_type=None,
+    employee_ids: Optional[Sequence[int]] = None,
+    now: Optional[datetime] = None,
+) -> BulkBookingReport:
+    """
+    Book every active employee of the tenant (or ``employee_ids``) for the
+    shift on each of ``booking_dates``; see the module docstring.  Does not
+    commit.
+    """
+    dates = sorted(set(booking_dates))
+    now = now or get_current_ist_time()
+    booking_type = BookingTypeEnum(getattr(booking_type, "value", booking_type) or BookingTypeEnum.REGULAR)
+
+    emp_query = select(
+        Employee.employee_id, Employee.employee_code, Employee.team_id,
+        Employee.latitude, Employee.longitude, Employee.address,
+    ).where(Employee.tenant_id == tenant_id, Employee.is_active.is_(True))
+    if employee_ids:
+        emp_query = emp_query.where(Employee.employee_id.in_(employee_ids))
+    employees = db.execute(emp_query.order_by(Employee.employee_id)).all()
+
+    report = BulkBookingReport([EmployeeBookingReport(e.employee_id) for e in employees])
+    if not employees or not dates:
+        return report
+
+    rejected = {d: date_rejection(d, shift_time, log_type, booking_type.value, cutoff, now) for d in dates}
+    open_dates = [d for d in dates if rejected[d] is None]
+
+    booked_already = set()
+    weekoffs: Dict[int, set] = {}
+    nodal_points: Dict[int, Tuple] = {}
+    if open_dates:
+        booked_already = {
+            (employee_id, booking_date)
+            for employee_id, booking_date in db.execute(
+                select(Booking.employee_id, Booking.booking_date).where(
+                    Booking.tenant_id == tenant_id,
+                    Booking.shift_id == shift_id,
+                    Booking.booking_date.in_(open_dates),
+                    Booking.status != BookingStatusEnum.CANCELLED,
+                )
+            )
+        }
+
+        weekday_columns = [getattr(WeekoffConfig, day) for day in _WEEKDAYS]
+        for employee_id, *flags in db.execute(
+            select(WeekoffConfig.employee_id, *weekday_columns)
+            .join(Employee, Employee.employee_id == WeekoffConfig.employee_id)
+            .where(Employee.tenant_id == tenant_id)
+        ):
+            weekoffs[employee_id] = {day for day, off in zip(_WEEKDAYS, flags) if off}
+
+        if nodal:
+            for row in db.execute(
+                select(
+                    EmployeeNodalPoint.employee_id, NodalPoint.nodal_point_id, NodalPoint.is_active,
+                    NodalPoint.latitude, NodalPoint.longitude, NodalPoint.address, NodalPoint.name,
+                )
+                .join(NodalPoint, NodalPoint.nodal_point_id == EmployeeNodalPoint.nodal_point_id, isouter=True)
+                .join(Employee, Employee.employee_id == EmployeeNodalPoint.employee_id)
+                .where(Employee.tenant_id == tenant_id)
+                .order_by(EmployeeNodalPoint.id.desc())
+            ):
+                nodal_points[row.employee_id] = row   # lowest id wins, as .first() did
+
+    office = (_float(tenant.latitude), _float(tenant.longitude), tenant.address)
+    rows: List[Dict] = []
+    for employee, outcome in zip(employees, report.employees):
+        emp_id = employee.employee_id
+        nodal_point_id = None
+        nodal_error = None
+        if nodal:
+            point = nodal_points.get(emp_id)
+            if point is None:
+                nodal_error = ("NO_NODAL_ASSIGNMENT", "No nodal point assigned")
+            elif point.nodal_point_id is None or not point.is_active:
+                nodal_error = ("NODAL_POINT_INACTIVE", "Assigned nodal point is inactive")
+            else:
+                nodal_point_id = point.nodal_point_id
+            home = (_float(point.latitude), _float(point.longitude), point.address or point.name) if nodal_point_id else None
+        else:
+            home = (_float(employee.latitude), _float(employee.longitude), employee.address)
+        pickup, drop = (home, office) if log_type == "IN" else (office, home)
+
+        for booking_date in dates:
+            if rejected[booking_date]:
+                outcome.fail(booking_date, *rejected[booking_date])
+                continue
+            if (emp_id, booking_date) in booked_already:
+                outcome.skipped.append(booking_date)
+                continue
+            weekday = _WEEKDAYS[booking_date.weekday()]
+            if weekday in weekoffs.get(emp_id, ()):
+                outcome.fail(booking_date, "WEEKOFF_DAY", f"Weekoff day ({weekday})")
+                continue
+            if nodal_error:
+                outcome.fail(booking_date, *nodal_error)
+                continue
+
+            rows.append({
+                "tenant_id": tenant_id,
+                "employee_id": emp_id,
+                "employee_code": employee.employee_code,
+                "team_id": employee.team_id,
+                "shift_id": shift_id,
+                "booking_date": booking_date,
+                "pickup_latitude": pickup[0],
+                "pickup_longitude": pickup[1],
+                "pickup_location": pickup[2],
+                "drop_latitude": drop[0],
+                "drop_longitude": drop[1],
+                "drop_location": drop[2],
+                "status": BookingStatusEnum.REQUEST,
+                "booking_type": booking_type,
+                "nodal_point_id": nodal_point_id,
+            })
+            outcome.booked.append(booking_date)
+
+    if rows:
+        # Core insert: every row shares the first row's column list, so the
+        # batch is never split by which optional values happen to be None.
+        db.execute(insert(Booking.__table__), rows)
+    logger.info(
+        f"[bulk_booking] tenant={tenant_id} shift={shift_id} dates={len(dates)} employees={len(employees)}: "
+        f"booked={len(rows)} skipped={report.skipped} failed={report.failed}"
+    )
+    return report
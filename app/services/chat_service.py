@@ -7,13 +7,16 @@ Send-message flow
 2.  Get-or-create ChatSession (PostgreSQL + optional RTDB session node)(service)
 3.  Pre-generate UUID for firebase_message_id
 4.  Save message to PostgreSQL with the pre-generated UUID             (sync)
+    + publish to open chat streams           (CHAT_STREAM_ENABLED, one hop)
 5.  Return HTTP response immediately  ← caller unblocked here (~20–50 ms)
   ↓ (FastAPI BackgroundTasks — run after response is flushed to client)
 6.  Write message to Firebase RTDB   → mobile childAdded fires (~100–300 ms)
-7.  Send FCM push to recipient        (if app is backgrounded)
+                                             (CHAT_FIREBASE_MIRROR)
+7.  Send FCM push to recipient        (if app is backgrounded / not streaming)
 8.  Translate original text → target language (~100–400 ms)
 9.  Patch RTDB message node with translated_text → mobile childChanged fires
 10. Update PostgreSQL translated_texts JSONB column (audit)
+    + publish the translation to open chat streams
 """
 from __future__ import annotations
 
@@ -30,7 +33,7 @@ from app.firebase import chat as firebase_chat
 from app.models.booking import Booking
 from app.models.chat import ChatMessage, ChatSenderType, ChatSession
 from app.models.route_management import RouteManagement, RouteManagementBooking
-from app.services import translation_service
+from app.services import chat_stream, translation_service
 from app.services.fcm_service import FCMService
 from app.services.session_cache import SessionCache
 from app.services.session_manager import SessionManager
@@ -144,7 +147,7 @@ def open_chat_session(
         driver_id=driver_id,
     )
 
-    if created:
+    if created and settings.CHAT_FIREBASE_MIRROR:
         warning_key = str(uuid.uuid4())
         if background_tasks is not None:
             background_tasks.add_task(
@@ -185,6 +188,7 @@ def open_chat_session(
                 is_system=True,
                 message_key=warning_key,
             )
+    if created:
         logger.info(
             "[chat_service] Chat session opened: booking_id=%s", booking_id
         )
@@ -232,19 +236,24 @@ def send_message_sync(
         firebase_message_id=firebase_message_id,
     )
 
-    # ── Step 5: Schedule RTDB write (background — ~600 ms, non-blocking) ──
-    background_tasks.add_task(
-        firebase_chat.write_message,
-        tenant_id=tenant_id,
-        booking_id=booking_id,
-        sender_type=sender_type.value,
-        sender_id=sender_id,
-        original_text=text,
-        original_language=sender_language,
-        is_system=False,
-        translated_text=text,   # placeholder; translation task patches this ~1 s later
-        message_key=firebase_message_id,
-    )
+    # ── Step 5a: Push to open chat streams (one Redis PUBLISH) ────────────
+    if settings.CHAT_STREAM_ENABLED:
+        chat_stream.hub.publish(tenant_id, booking_id, chat_stream.message_event(msg))
+
+    # ── Step 5b: Schedule RTDB write (background — ~600 ms, non-blocking) ─
+    if settings.CHAT_FIREBASE_MIRROR:
+        background_tasks.add_task(
+            firebase_chat.write_message,
+            tenant_id=tenant_id,
+            booking_id=booking_id,
+            sender_type=sender_type.value,
+            sender_id=sender_id,
+            original_text=text,
+            original_language=sender_language,
+            is_system=False,
+            translated_text=text,   # placeholder; translation task patches this ~1 s later
+            message_key=firebase_message_id,
+        )
 
     # ── Step 6: Schedule FCM push (background — ~170 ms, non-blocking) ────
     background_tasks.add_task(
@@ -302,6 +311,17 @@ def _push_notification(
             )
             return
 
+        # A recipient with the chat stream open already has the message
+        if settings.CHAT_STREAM_ENABLED and chat_stream.hub.is_online(
+            session.tenant_id, booking_id, recipient_type, recipient_id,
+        ):
+            logger.debug(
+                "[FCM] Push skipped — %s:%s is connected to the chat stream  "
+                "(booking_id=%s  message_id=%s)",
+                recipient_type, recipient_id, booking_id, message_id,
+            )
+            return
+
         # Look up the recipient's active session (holds the FCM device token)
         session_mgr = SessionManager(db, SessionCache())
         rec_session = session_mgr.get_active_session(
@@ -420,7 +440,7 @@ async def translate_and_update(
             return   # no translation available or identical — nothing to update
 
         # ── Update Firebase RTDB ──────────────────────────────────────────
-        if firebase_message_id:
+        if firebase_message_id and settings.CHAT_FIREBASE_MIRROR:
             firebase_chat.update_translated_text(
                 tenant_id=tenant_id,
                 booking_id=booking_id,
@@ -441,6 +461,13 @@ async def translate_and_update(
         finally:
             db2.close()
 
+        # ── Push to open chat streams ─────────────────────────────────────
+        if settings.CHAT_STREAM_ENABLED:
+            chat_stream.hub.publish(
+                tenant_id, booking_id,
+                chat_stream.translation_event(message_id, target_language, translated),
+            )
+
         logger.info(
             "[chat_service] Background translation done: "
             "message_id=%s  %s→%s",
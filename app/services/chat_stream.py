@@ -0,0 +1,357 @@
+"""
+Chat Stream — in-house server push for booking chats (alternative to RTDB).
+
+With ``settings.CHAT_STREAM_ENABLED`` the send / translate paths publish
+events here and the apps can hold an SSE connection per booking chat
+(``GET /employee|driver/chat/{booking_id}/stream``) instead of an RTDB
+listener.  ``CHAT_FIREBASE_MIRROR`` keeps the RTDB writes running for apps
+that have not moved over yet.
+
+Events
+──────
+    {"type": "message",     "message": {...}}            SSE id = message id
+    {"type": "translation", "id": 42, "language": "hi", "translated_text": "..."}
+
+Fan-out
+───────
+Each worker keeps its own subscribers.  With ``settings.USE_REDIS`` an event
+is PUBLISHed on ``chat_stream:events:{tenant_id}:{booking_id}`` and every
+worker's listener thread (``start()``) hands it to its local subscribers;
+without Redis it is delivered to this worker's subscribers directly.
+
+Backpressure
+────────────
+As in ``LogStreamHandler``: every subscriber has a bounded ``asyncio.Queue``
+filled with ``loop.call_soon_threadsafe`` (publishers run in the threadpool),
+and a full queue drops the event.  Unlike the log tail a chat cannot lose
+messages, so the subscriber is flagged ``lagged`` and the stream re-reads
+everything after its cursor from PostgreSQL before going live again.
+
+Presence
+────────
+Open streams are recorded in ``chat_stream:presence:{tenant_id}:{booking_id}``
+(ZSET of ``{user_type}:{user_id}:{conn_id}`` → last keepalive), so
+``_push_notification`` only sends FCM when the recipient has no live stream
+on any worker.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.crud import chat as chat_crud
+
+logger = get_logger(__name__)
+
+CHANNEL_PREFIX = "chat_stream:events:"
+PRESENCE_PREFIX = "chat_stream:presence:"
+
+# Streams send a keepalive every KEEPALIVE_SECONDS and refresh presence with
+# it; a connection not seen for PRESENCE_TTL_SECONDS counts as gone.
+KEEPALIVE_SECONDS: float = 15.0
+PRESENCE_TTL_SECONDS: float = 45.0
+
+# Messages read per query when a stream resumes or resyncs.
+REPLAY_BATCH = 200
+
+
+def _get_client(client=None):
+    """Return the shared Redis client, or None when Redis is disabled."""
+    if client is not None:
+        return client
+    if not settings.USE_REDIS:
+        return None
+    from app.utils.cache_manager import cache
+    return cache.redis_client
+
+
+def _room(tenant_id: str, booking_id: int) -> str:
+    return f"{tenant_id}:{booking_id}"
+
+
+def message_event(msg) -> dict:
+    """JSON-safe ``message`` event for a ChatMessage row."""
+    sender_type = msg.sender_type.value if hasattr(msg.sender_type, "value") else msg.sender_type
+    return {
+        "type": "message",
+        "message": {
+            "id":                  msg.id,
+            "booking_id":          msg.booking_id,
+            "sender_type":         sender_type,
+            "sender_id":           msg.sender_id,
+            "original_text":       msg.original_text,
+            "original_language":   msg.original_language,
+            "translated_texts":    dict(msg.translated_texts or {}),
+            "firebase_message_id": msg.firebase_message_id,
+            "is_system_message":   msg.is_system_message,
+            "created_at":          msg.created_at.isoformat() if msg.created_at else None,
+        },
+    }
+
+
+def translation_event(message_id: int, language: str, translated_text: str) -> dict:
+    return {
+        "type": "translation",
+        "id": message_id,
+        "language": language,
+        "translated_text": translated_text,
+    }
+
+
+class Subscription:
+    """One open stream: its queue, owning loop and identity."""
+
+    def __init__(self, room: str, user_type: str, user_id: int, queue_size: int) -> None:
+        self.room = room
+        self.user_type = user_type
+        self.user_id = user_id
+        self.conn_id = uuid.uuid4().hex
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.loop = asyncio.get_running_loop()
+        self.lagged = False
+
+    @property
+    def member(self) -> str:
+        return f"{self.user_type}:{self.user_id}:{self.conn_id}"
+
+    def offer(self, event: dict) -> None:
+        """Runs on the subscriber's loop; drops the event when the queue is full."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if not self.lagged:
+                logger.warning(
+                    "[chat_stream] Subscriber %s:%s on %s is lagging — will resync from the database",
+                    self.user_type, self.user_id, self.room,
+                )
+            self.lagged = True
+
+
+class ChatStreamHub:
+    """Per-worker subscriber registry with optional Redis pub/sub fan-out."""
+
+    def __init__(self, client=None, queue_size: Optional[int] = None, session_factory=None) -> None:
+        self._client = client
+        self._queue_size = queue_size
+        self._session_factory = session_factory
+        self._rooms: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def client(self):
+        return _get_client(self._client)
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    def subscribe(self, tenant_id: str, booking_id: int, user_type: str, user_id: int) -> Subscription:
+        """Register a stream on the running loop and mark its user online."""
+        sub = Subscription(
+            _room(tenant_id, booking_id), user_type, user_id,
+            self._queue_size or settings.CHAT_STREAM_QUEUE_SIZE,
+        )
+        with self._lock:
+            self._rooms.setdefault(sub.room, set()).add(sub)
+        self.touch(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            room = self._rooms.get(sub.room)
+            if room is not None:
+                room.discard(sub)
+                if not room:
+                    del self._rooms[sub.room]
+        r = self.client
+        if r is not None:
+            try:
+                r.zrem(PRESENCE_PREFIX + sub.room, sub.member)
+            except Exception as e:
+                logger.warning("[chat_stream] Presence cleanup failed for %s: %s", sub.room, e)
+
+    def touch(self, sub: Subscription) -> None:
+        """Refresh the subscriber's presence entry (called with each keepalive)."""
+        r = self.client
+        if r is None:
+            return
+        key = PRESENCE_PREFIX + sub.room
+        now = time.time()
+        try:
+            pipe = r.pipeline(transaction=False)
+            pipe.zadd(key, {sub.member: now})
+            pipe.zremrangebyscore(key, "-inf", now - PRESENCE_TTL_SECONDS)
+            pipe.expire(key, int(PRESENCE_TTL_SECONDS) * 2)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("[chat_stream] Presence update failed for %s: %s", sub.room, e)
+
+    def is_online(self, tenant_id: str, booking_id: int, user_type: str, user_id: int) -> bool:
+        """True when the user has a live stream for this chat on any worker."""
+        room = _room(tenant_id, booking_id)
+        with self._lock:
+            local = list(self._rooms.get(room, ()))
+        if any(s.user_type == user_type and s.user_id == user_id for s in local):
+            return True
+        r = self.client
+        if r is None:
+            return False
+        try:
+            members = r.zrangebyscore(PRESENCE_PREFIX + room, time.time() - PRESENCE_TTL_SECONDS, "+inf")
+        except Exception as e:
+            logger.warning("[chat_stream] Presence read failed for %s: %s", room, e)
+            return False
+        prefix = f"{user_type}:{user_id}:"
+        return any(m.startswith(prefix) for m in members)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(self, tenant_id: str, booking_id: int, event: dict) -> None:
+        """Send an event to every stream of the chat.  Safe from any thread."""
+        room = _room(tenant_id, booking_id)
+        r = self.client
+        if r is not None:
+            try:
+                r.publish(CHANNEL_PREFIX + room, json.dumps(event, default=str))
+                return
+            except Exception as e:
+                logger.warning("[chat_stream] Redis publish failed for %s — local delivery only: %s", room, e)
+        self._deliver(room, event)
+
+    def _deliver(self, room: str, event: dict) -> None:
+        with self._lock:
+            subs = list(self._rooms.get(room, ()))
+        for sub in subs:
+            if sub.loop.is_closed():
+                continue
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+            except RuntimeError:
+                pass   # loop shut down between the check and the call
+
+    # ------------------------------------------------------------------
+    # Streams
+    # ------------------------------------------------------------------
+
+    def _session(self):
+        if self._session_factory is None:
+            from app.database.session import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def _last_id(self, tenant_id: str, booking_id: int) -> int:
+        db = self._session()
+        try:
+            return chat_crud.get_last_message_id(db, tenant_id, booking_id)
+        finally:
+            db.close()
+
+    def _load_after(self, tenant_id: str, booking_id: int, cursor: int) -> List[dict]:
+        db = self._session()
+        try:
+            events: List[dict] = []
+            while True:
+                batch = chat_crud.get_messages_after(db, tenant_id, booking_id, cursor, REPLAY_BATCH)
+                events.extend(message_event(m) for m in batch)
+                if len(batch) < REPLAY_BATCH:
+                    return events
+                cursor = batch[-1].id
+        finally:
+            db.close()
+
+    async def events(
+        self,
+        tenant_id: str,
+        booking_id: int,
+        user_type: str,
+        user_id: int,
+        after: Optional[int] = None,
+    ) -> AsyncIterator[Optional[dict]]:
+        """
+        Yield the chat's events for one connection, ``None`` for a keepalive.
+
+        With ``after`` (a message id) everything newer is replayed from
+        PostgreSQL first.  Messages are yielded once each, in id order.
+        """
+        sub = self.subscribe(tenant_id, booking_id, user_type, user_id)
+        try:
+            # Subscribed before reading the cursor, so nothing falls in between.
+            if after is None:
+                cursor = await asyncio.to_thread(self._last_id, tenant_id, booking_id)
+            else:
+                cursor, sub.lagged = after, True
+            while True:
+                if sub.lagged:
+                    sub.lagged = False
+                    for event in await asyncio.to_thread(self._load_after, tenant_id, booking_id, cursor):
+                        cursor = event["message"]["id"]
+                        yield event
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    self.touch(sub)
+                    yield None
+                    continue
+                if event["type"] == "message":
+                    if event["message"]["id"] <= cursor:
+                        continue
+                    cursor = event["message"]["id"]
+                yield event
+        finally:
+            self.unsubscribe(sub)
+
+    # ------------------------------------------------------------------
+    # Redis listener
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the pub/sub listener thread (no-op without Redis)."""
+        if self.client is None or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="chat-stream-listener", daemon=True)
+        self._thread.start()
+        logger.info("[chat_stream] Redis listener started")
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(CHANNEL_PREFIX + "*")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if not message:
+                        continue
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+                    self._deliver(channel[len(CHANNEL_PREFIX):], json.loads(message["data"]))
+            except Exception as e:
+                logger.error("[chat_stream] Redis listener failed — reconnecting: %s", e)
+                self._stop.wait(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+hub = ChatStreamHub()
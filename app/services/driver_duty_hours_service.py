@@ -6,20 +6,31 @@ Feature 1 — Driver Duty Hours & Rest-Time Enforcement
 Core logic for checking whether a driver has had sufficient rest before being
 assigned to a new route.
 
+Duty ledger
+-----------
+Duty time is read from ``driver_duty_days`` (app.models.driver_duty_day):
+one row per driver per day holding that day's merged duty intervals and its
+duty total.  A session flush hook (``note_route_changes`` /
+``sync_flushed_routes``) refreshes the affected days whenever a route's
+duty fields are flushed (it starts, completes or is corrected), so a rest
+check reads at most two day rows per driver (plus the row of a
+still-ONGOING route) instead of the driver's whole route history, and
+``check_rest_many`` answers a whole candidate pool with one query.
+``rebuild_duty_ledger`` backfills or repairs the ledger from
+route_management (scripts/rebuild_duty_ledger.py).
+
 Algorithm
 ---------
 1. Define a 24-hour lookback window:
        window_start = proposed_start_dt - 24h
        window_end   = proposed_start_dt
 
-2. Query all COMPLETED / ONGOING routes where:
-       assigned_driver_id = driver_id
-       actual_start_time  < window_end        (trip starts before window closes)
-       actual_end_time    > window_start       (trip ends after window opens)
-       actual_start_time IS NOT NULL
+2. Load the ledger rows of the window's days, plus any row holding an
+   ONGOING route (its open interval ends at window_end).
 
-3. Merge overlapping/adjacent busy intervals into a sorted list of
-   non-overlapping segments:  [(busy_start, busy_end), ...]
+3. Clip the intervals to the window and merge overlapping/adjacent ones
+   (trips crossing midnight are stored split per day and re-join here)
+   into a sorted list of non-overlapping segments:  [(busy_start, busy_end), ...]
 
 4. Walk the gaps between consecutive busy segments (and the gap after the last
    segment up to `proposed_start_dt`) to find the **longest continuous free
@@ -33,23 +44,34 @@ Algorithm
        rest_gap_minutes      : int,        # Longest continuous rest gap found
        required_rest_minutes : int,        # Computed from config
        total_duty_minutes    : int,        # Sum of all duty time in window
-       last_trip_end         : datetime | None,
+       last_trip_end         : datetime | None,   # latest duty end in the window
    }
 
-No exceptions are raised; all errors are handled gracefully (returns ok=True
-with rest_gap_minutes = 24*60 when data is unavailable/insufficient).
+No exceptions are raised by the checks; all errors are handled gracefully
+(returns ok=True with rest_gap_minutes = 24*60 when data is unavailable/insufficient).
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import delete, insert, inspect, or_, select
 from sqlalchemy.orm import Session
 
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+Interval = Tuple[datetime, Optional[datetime]]   # end None → route still ONGOING
+
+# RouteManagement attributes that decide which ledger days a route covers
+_DUTY_FIELDS = ("assigned_driver_id", "actual_start_time", "actual_end_time", "status")
+
 
 # ---------------------------------------------------------------------------
-# Public API
+# Public API — rest checks
 # ---------------------------------------------------------------------------
 
 def check_rest(
@@ -77,73 +99,93 @@ def check_rest(
         total_duty_minutes    int   – sum of all duty minutes in the 24h window
         last_trip_end         Optional[datetime]
     """
+    return check_rest_many([driver_id], proposed_start_dt, db, max_duty_minutes)[driver_id]
+
+
+def check_rest_many(
+    driver_ids: Iterable[int],
+    proposed_start_dt: datetime,
+    db: Session,
+    max_duty_minutes: int = 600,
+) -> Dict[int, dict]:
+    """
+    ``check_rest`` for every driver of a candidate pool, with one query.
+
+    Returns {driver_id: result dict}; every requested driver is present.
+    """
+    driver_ids = list(dict.fromkeys(driver_ids))
     try:
-        return _check_rest_impl(driver_id, proposed_start_dt, db, max_duty_minutes)
-    except Exception:
-        # Fail open: if the check crashes, do not block the assignment
-        required = 24 * 60 - max_duty_minutes
+        intervals = load_duty_intervals(
+            db, driver_ids, proposed_start_dt - timedelta(hours=24), proposed_start_dt,
+        )
         return {
-            "ok": True,
-            "rest_gap_minutes": 24 * 60,
-            "required_rest_minutes": required,
-            "total_duty_minutes": 0,
-            "last_trip_end": None,
+            did: rest_from_intervals(intervals.get(did, []), proposed_start_dt, max_duty_minutes)
+            for did in driver_ids
         }
+    except Exception as e:
+        # Fail open: if the check crashes, do not block the assignment
+        logger.warning(f"[duty] rest check failed for drivers {driver_ids}: {e}")
+        return {did: _rested(24 * 60 - max_duty_minutes) for did in driver_ids}
 
 
-# ---------------------------------------------------------------------------
-# Internal implementation
-# ---------------------------------------------------------------------------
-
-def _check_rest_impl(
-    driver_id: int,
-    proposed_start_dt: datetime,
+def load_duty_intervals(
     db: Session,
-    max_duty_minutes: int,
-) -> dict:
-    from app.models.route_management import RouteManagement, RouteManagementStatusEnum
+    driver_ids: Iterable[int],
+    window_start: datetime,
+    window_end: datetime,
+) -> Dict[int, List[Interval]]:
+    """
+    Ledger intervals of ``driver_ids`` that may touch [window_start, window_end]:
+    the rows of the window's days plus rows holding an ONGOING route.
+    One query.
+    """
+    from app.models.driver_duty_day import DriverDutyDay
 
-    window_start: datetime = proposed_start_dt - timedelta(hours=24)
-    window_end: datetime   = proposed_start_dt
-    required_rest: int     = 24 * 60 - max_duty_minutes
+    driver_ids = list(driver_ids)
+    if not driver_ids:
+        return {}
 
-    # Retrieve all routes that overlap with the 24-hour window
-    eligible_statuses = [
-        RouteManagementStatusEnum.COMPLETED,
-        RouteManagementStatusEnum.ONGOING,
-    ]
-    routes = (
-        db.query(
-            RouteManagement.actual_start_time,
-            RouteManagement.actual_end_time,
-        )
+    rows = (
+        db.query(DriverDutyDay.driver_id, DriverDutyDay.intervals)
         .filter(
-            RouteManagement.assigned_driver_id == driver_id,
-            RouteManagement.actual_start_time.isnot(None),
-            RouteManagement.actual_start_time < window_end,
-            RouteManagement.status.in_(eligible_statuses),
+            DriverDutyDay.driver_id.in_(driver_ids),
+            or_(
+                DriverDutyDay.duty_date.between(_naive(window_start).date(), _naive(window_end).date()),
+                DriverDutyDay.open_since.isnot(None),
+            ),
         )
         .all()
     )
+    intervals: Dict[int, List[Interval]] = defaultdict(list)
+    for driver_id, day_intervals in rows:
+        intervals[driver_id].extend(
+            (datetime.fromisoformat(start), datetime.fromisoformat(end) if end else None)
+            for start, end in day_intervals
+        )
+    return intervals
 
-    if not routes:
-        # No trips in window — driver is well-rested
-        return {
-            "ok": True,
-            "rest_gap_minutes": 24 * 60,
-            "required_rest_minutes": required_rest,
-            "total_duty_minutes": 0,
-            "last_trip_end": None,
-        }
+
+def rest_from_intervals(
+    intervals: Iterable[Interval],
+    proposed_start_dt: datetime,
+    max_duty_minutes: int = 600,
+) -> dict:
+    """Rest-check result (see module docstring) for one driver's duty intervals."""
+    window_end: datetime   = _naive(proposed_start_dt)
+    window_start: datetime = window_end - timedelta(hours=24)
+    required_rest: int     = 24 * 60 - max_duty_minutes
 
     # Build a list of (clipped_start, clipped_end) within the window
-    intervals: list[tuple[datetime, datetime]] = []
+    clipped: list[tuple[datetime, datetime]] = []
     last_trip_end: Optional[datetime] = None
 
-    for row in routes:
-        trip_start: datetime = row.actual_start_time
-        # If no actual_end_time (ongoing), treat end as window_end
-        trip_end: datetime = row.actual_end_time if row.actual_end_time else window_end
+    for trip_start, trip_end in intervals:
+        if trip_start >= window_end:
+            continue
+        # If no end (ongoing), treat end as window_end
+        trip_end = trip_end or window_end
+        if trip_end <= window_start:
+            continue
 
         if last_trip_end is None or trip_end > last_trip_end:
             last_trip_end = trip_end
@@ -152,27 +194,15 @@ def _check_rest_impl(
         clipped_start = max(trip_start, window_start)
         clipped_end   = min(trip_end,   window_end)
         if clipped_end > clipped_start:
-            intervals.append((clipped_start, clipped_end))
+            clipped.append((clipped_start, clipped_end))
 
-    if not intervals:
-        return {
-            "ok": True,
-            "rest_gap_minutes": 24 * 60,
-            "required_rest_minutes": required_rest,
-            "total_duty_minutes": 0,
-            "last_trip_end": last_trip_end,
-        }
+    if not clipped:
+        # No trips in window — driver is well-rested
+        result = _rested(required_rest)
+        result["last_trip_end"] = last_trip_end
+        return result
 
-    # Sort intervals by start time, then merge overlapping segments
-    intervals.sort(key=lambda x: x[0])
-    merged: list[tuple[datetime, datetime]] = [intervals[0]]
-    for seg_start, seg_end in intervals[1:]:
-        prev_start, prev_end = merged[-1]
-        if seg_start <= prev_end:
-            # Overlapping or adjacent — extend
-            merged[-1] = (prev_start, max(prev_end, seg_end))
-        else:
-            merged.append((seg_start, seg_end))
+    merged = _merge(clipped)
 
     # Compute total duty minutes (sum of merged segments)
     total_duty_minutes: int = sum(
@@ -209,3 +239,242 @@ def _check_rest_impl(
         "total_duty_minutes": total_duty_minutes,
         "last_trip_end": last_trip_end,
     }
+
+
+# ---------------------------------------------------------------------------
+# Public API — ledger maintenance
+# ---------------------------------------------------------------------------
+
+def note_route_changes(db: Session) -> None:
+    """
+    ``before_flush`` half of the ledger sync: remember which routes are about
+    to change a duty field (or be deleted) and read their duty as stored so
+    far, so the days they used to cover are refreshed too.
+    """
+    from app.models.route_management import RouteManagement
+
+    new, changed = [], []
+    for route in db.new:
+        if isinstance(route, RouteManagement) and route.assigned_driver_id and route.actual_start_time:
+            new.append(route)
+    for route in (*db.dirty, *db.deleted):
+        if not isinstance(route, RouteManagement) or inspect(route).identity is None:
+            continue
+        state = inspect(route)
+        if route in db.deleted or any(state.attrs[name].history.has_changes() for name in _DUTY_FIELDS):
+            changed.append(state.identity[0])
+    if not new and not changed:
+        return
+    db.info["duty_ledger_pending"] = (new, changed, _route_duty(db.connection(), changed))
+
+
+def sync_flushed_routes(db: Session) -> None:
+    """
+    ``after_flush`` half of the ledger sync: refresh every day the noted
+    routes covered before or after the flush, in the same transaction.
+
+    Both hooks are registered next to DriverDutyDay, so every ORM write to a
+    route's duty fields (duty start and end in the driver app, admin
+    corrections, fixtures) keeps the ledger in step.  Bulk
+    ``query.update()`` calls bypass them — follow those with
+    ``refresh_duty_days`` or ``rebuild_duty_ledger``.
+    """
+    pending = db.info.pop("duty_ledger_pending", None)
+    if pending is None:
+        return
+    new, changed, before = pending
+    connection = db.connection()
+    route_ids = changed + [route.route_id for route in new]
+
+    touched: Dict[int, Tuple[str, set]] = {}
+    for driver_id, tenant_id, start, end in before + _route_duty(connection, route_ids):
+        days = touched.setdefault(driver_id, (tenant_id, set()))[1]
+        days.update(_days_between(start, end or start))
+    for driver_id, (tenant_id, days) in touched.items():
+        _refresh(connection, driver_id, tenant_id, days)
+
+
+def refresh_duty_days(db: Session, driver_id: int, tenant_id: str, days: Iterable[date]) -> None:
+    """Recompute the ledger rows of *driver_id* for *days* from route_management."""
+    db.flush()
+    _refresh(db.connection(), driver_id, tenant_id, days)
+
+
+def rebuild_duty_ledger(
+    db: Session,
+    since: date,
+    until: date,
+    tenant_id: Optional[str] = None,
+) -> int:
+    """
+    Rebuild every ledger row in [since, until] (optionally for one tenant)
+    from route_management.  Returns the number of rows written; does not
+    commit.
+    """
+    db.flush()
+    connection = db.connection()
+    days = _days_between(since, until)
+    routes = _duty_routes(connection, since, until, tenant_id=tenant_id)
+    tenants = {r.assigned_driver_id: r.tenant_id for r in routes}
+    computed = _day_rows(routes, days)
+    _write_days(connection, days, computed, tenants, tenant_id=tenant_id)
+    return len(computed)
+
+
+# ---------------------------------------------------------------------------
+# Internal implementation
+# ---------------------------------------------------------------------------
+
+def _rested(required_rest: int) -> dict:
+    return {
+        "ok": True,
+        "rest_gap_minutes": 24 * 60,
+        "required_rest_minutes": required_rest,
+        "total_duty_minutes": 0,
+        "last_trip_end": None,
+    }
+
+
+def _naive(dt: datetime) -> datetime:
+    """route_management stores naive local times; drop any tzinfo."""
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _route_duty(connection, route_ids: List[int]) -> list:
+    """(driver_id, tenant_id, start, end) of the listed routes that have duty."""
+    from app.models.route_management import RouteManagement
+
+    if not route_ids:
+        return []
+    return [tuple(row) for row in connection.execute(
+        select(
+            RouteManagement.assigned_driver_id,
+            RouteManagement.tenant_id,
+            RouteManagement.actual_start_time,
+            RouteManagement.actual_end_time,
+        ).where(
+            RouteManagement.route_id.in_(route_ids),
+            RouteManagement.assigned_driver_id.isnot(None),
+            RouteManagement.actual_start_time.isnot(None),
+        )
+    )]
+
+
+def _days_between(first, last) -> List[date]:
+    first = _naive(first).date() if isinstance(first, datetime) else first
+    last = _naive(last).date() if isinstance(last, datetime) else last
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def _merge(intervals: List[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    """Sort intervals by start time, then merge overlapping/adjacent segments."""
+    intervals = sorted(intervals, key=lambda x: x[0])
+    merged: list[tuple[datetime, datetime]] = [intervals[0]]
+    for seg_start, seg_end in intervals[1:]:
+        prev_start, prev_end = merged[-1]
+        if seg_start <= prev_end:
+            merged[-1] = (prev_start, max(prev_end, seg_end))
+        else:
+            merged.append((seg_start, seg_end))
+    return merged
+
+
+def _refresh(connection, driver_id: int, tenant_id: str, days: Iterable[date]) -> None:
+    days = sorted(set(days))
+    if not days:
+        return
+    routes = _duty_routes(connection, days[0], days[-1], driver_ids=[driver_id])
+    _write_days(connection, days, _day_rows(routes, days), {driver_id: tenant_id}, driver_ids=[driver_id])
+
+
+def _duty_routes(connection, first_day: date, last_day: date, driver_ids=None, tenant_id=None):
+    """COMPLETED/ONGOING routes with duty on [first_day, last_day]."""
+    from app.models.route_management import RouteManagement, RouteManagementStatusEnum
+
+    lo = datetime.combine(first_day, time.min)
+    hi = datetime.combine(last_day + timedelta(days=1), time.min)
+    query = select(
+        RouteManagement.assigned_driver_id,
+        RouteManagement.tenant_id,
+        RouteManagement.actual_start_time,
+        RouteManagement.actual_end_time,
+    ).where(
+        RouteManagement.assigned_driver_id.isnot(None),
+        RouteManagement.actual_start_time.isnot(None),
+        RouteManagement.actual_start_time < hi,
+        or_(RouteManagement.actual_end_time.is_(None), RouteManagement.actual_end_time > lo),
+        RouteManagement.status.in_([
+            RouteManagementStatusEnum.COMPLETED,
+            RouteManagementStatusEnum.ONGOING,
+        ]),
+    )
+    if driver_ids is not None:
+        query = query.where(RouteManagement.assigned_driver_id.in_(driver_ids))
+    if tenant_id is not None:
+        query = query.where(RouteManagement.tenant_id == tenant_id)
+    return connection.execute(query).all()
+
+
+def _day_rows(routes, days: List[date]) -> Dict[Tuple[int, date], dict]:
+    """{(driver_id, day): {"intervals", "duty_minutes", "open_since"}} for days with duty."""
+    wanted = set(days)
+    closed: Dict[Tuple[int, date], list] = defaultdict(list)
+    open_since: Dict[Tuple[int, date], datetime] = {}
+
+    for route in routes:
+        start = _naive(route.actual_start_time)
+        if route.actual_end_time is None:
+            # ONGOING: kept whole on its start day; checks end it at window_end
+            key = (route.assigned_driver_id, start.date())
+            if start.date() in wanted and (key not in open_since or start < open_since[key]):
+                open_since[key] = start
+            continue
+        end = _naive(route.actual_end_time)
+        day = start.date()
+        while day <= end.date():
+            day_start = datetime.combine(day, time.min)
+            seg = (max(start, day_start), min(end, day_start + timedelta(days=1)))
+            if day in wanted and seg[1] > seg[0]:
+                closed[(route.assigned_driver_id, day)].append(seg)
+            day += timedelta(days=1)
+
+    rows = {}
+    for key in set(closed) | set(open_since):
+        merged = _merge(closed[key]) if closed[key] else []
+        intervals = [[s.isoformat(), e.isoformat()] for s, e in merged]
+        if key in open_since:
+            intervals.append([open_since[key].isoformat(), None])
+        rows[key] = {
+            "intervals": intervals,
+            "duty_minutes": sum(int((e - s).total_seconds() / 60) for s, e in merged),
+            "open_since": open_since.get(key),
+        }
+    return rows
+
+
+def _write_days(
+    connection,
+    days: List[date],
+    computed: Dict[Tuple[int, date], dict],
+    tenants: Dict[int, str],
+    driver_ids: Optional[List[int]] = None,
+    tenant_id: Optional[str] = None,
+) -> None:
+    """
+    Replace the ledger rows on ``days`` (of ``driver_ids`` / ``tenant_id``
+    when given) with ``computed``; ``tenants`` maps driver_id → tenant_id.
+    Core statements, so it is safe to run from inside a flush.
+    """
+    from app.models.driver_duty_day import DriverDutyDay
+
+    stale = delete(DriverDutyDay).where(DriverDutyDay.duty_date.in_(days))
+    if driver_ids is not None:
+        stale = stale.where(DriverDutyDay.driver_id.in_(driver_ids))
+    if tenant_id is not None:
+        stale = stale.where(DriverDutyDay.tenant_id == tenant_id)
+    connection.execute(stale)
+    if computed:
+        connection.execute(insert(DriverDutyDay), [
+            {"driver_id": driver_id, "duty_date": day, "tenant_id": tenants[driver_id], **values}
+            for (driver_id, day), values in computed.items()
+        ])
@@ -0,0 +1,399 @@
+"""
+Employee bulk import — stream an uploaded .xlsx / .csv file into the
+employees table without holding the workbook, or one query per row, in
+memory.
+
+Layout is the one the template download produces: header row 1,
+instructions row 2, data from row 3 (CSV files follow the same layout).
+
+    upload = EmployeeImport(db, content, filename, tenant_id=tenant_id, user_type="employee")
+    upload.missing_columns()          # required headers not in row 1
+    report = upload.validate()        # pass 1 — per-row error report
+    if report.ok:
+        created = await upload.create()   # pass 2 — hash + insert per chunk
+        db.commit()
+
+Pass 1 reads the sheet row by row (openpyxl ``read_only`` / ``csv``),
+validates every field in Python and keeps only each row's unique keys.  It
+then resolves all referenced teams in one query and the target tenants'
+existing emails, phones and codes in one more, and flags rows that clash
+with the database or repeat an earlier row of the file.
+
+Pass 2 re-reads the sheet and, per ``EMPLOYEE_IMPORT_CHUNK_SIZE`` rows,
+hashes the passwords in the bcrypt worker pool and writes the employees and
+their default weekoff configs with one executemany INSERT each.  Nothing is
+committed: the upload is all-or-nothing.
+"""
+import csv
+import io
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import openpyxl
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.crud.employee import employee_crud
+from app.models.employee import Employee
+from app.models.enums import GenderEnum
+from app.models.team import Team
+from app.models.weekoff_config import WeekoffConfig
+from app.schemas.employee import EmployeeCreate
+from common_utils.auth.password_hasher import hash_passwords_async
+from common_utils.auth.utils import check_password_length
+
+logger = get_logger(__name__)
+
+REQUIRED_COLUMNS = ("name", "email", "phone", "team_id")
+DEFAULT_PASSWORD = "Welcome@123"
+FIRST_DATA_ROW = 3
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PHONE_SEPARATORS_RE = re.compile(r"[\s\-\(\)\+]")
+_GENDERS = {"male", "female", "other"}
+
+
+@dataclass
+class EmployeeImportReport:
+    """Outcome of EmployeeImport.validate(); each failed row carries its errors."""
+    total_rows: int = 0
+    failed: List[Dict] = field(default_factory=list)
+    duplicates: List[Dict] = field(default_factory=list)
+
+    @property
+    def valid_rows(self) -> int:
+        return self.total_rows - len(self.failed) - len(self.duplicates)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.duplicates
+
+
+@dataclass
+class _RowKeys:
+    """What pass 1 keeps of a row: the report fields and its unique keys."""
+    row: int
+    name: str
+    email: str
+    phone: str
+    employee_code: str
+    team_id: Optional[int]
+    errors: List[str]
+
+    def report_entry(self) -> Dict:
+        return {
+            "row": self.row,
+            "employee_name": self.name or "Not provided",
+            "email": self.email or "Not provided",
+            "phone": self.phone or "Not provided",
+            "employee_code": self.employee_code or "Not provided",
+            "errors": self.errors,
+        }
+
+
+def clean_row(row_data: Dict[str, str]) -> Tuple[Dict, List[str]]:
+    """
+    Validate one row's fields without touching the database — the upload's
+    own rules, then EmployeeCreate's.  Returns the cleaned values (email
+    lower-cased, team_id an int, default password filled in) and the list
+    of error messages.
+    """
+    errors: List[str] = []
+    data: Dict = {}
+
+    name = row_data.get("name", "").strip()
+    if not name:
+        errors.append("Name is required")
+    data["name"] = name
+
+    email = row_data.get("email", "").strip().lower()
+    if not email:
+        errors.append("Email is required")
+    elif not _EMAIL_RE.match(email):
+        errors.append(f"Invalid email format: {email}")
+    data["email"] = email
+
+    phone = row_data.get("phone", "").strip()
+    if not phone:
+        errors.append("Phone is required")
+    else:
+        phone_clean = _PHONE_SEPARATORS_RE.sub("", phone)
+        if not phone_clean.isdigit() or len(phone_clean) < 10:
+            errors.append(f"Invalid phone format: {phone}")
+    data["phone"] = phone
+
+    team_id_str = row_data.get("team_id", "").strip()
+    data["team_id"] = None
+    if not team_id_str:
+        errors.append("Team ID is required")
+    else:
+        try:
+            data["team_id"] = int(team_id_str)
+        except ValueError:
+            errors.append(f"Team ID must be a number, got: {team_id_str}")
+
+    data["employee_code"] = row_data.get("employee_code", "").strip() or None
+    data["address"] = row_data.get("address", "").strip() or None
+
+    for key, limit in (("latitude", 90), ("longitude", 180)):
+        data[key] = None
+        raw = row_data.get(key)
+        if raw:
+            try:
+                value = float(raw)
+            except ValueError:
+                errors.append(f"Invalid {key} format: {raw}")
+                continue
+            if -limit <= value <= limit:
+                data[key] = value
+            else:
+                errors.append(f"{key.capitalize()} must be between -{limit} and {limit}, got: {value}")
+
+    gender = row_data.get("gender", "").strip()
+    data["gender"] = None
+    if gender:
+        if gender.lower() in _GENDERS:
+            data["gender"] = GenderEnum(gender.capitalize())
+        else:
+            errors.append(f"Invalid gender. Must be one of: Male, Female, Other. Got: {gender}")
+
+    password = row_data.get("password", "").strip()
+    if password:
+        if len(password) < 6:
+            errors.append("Password must be at least 6 characters long")
+        else:
+            try:
+                check_password_length(password)
+            except HTTPException:
+                errors.append("Password must be at most 72 bytes long")
+    data["password"] = password or DEFAULT_PASSWORD
+
+    if not data["employee_code"]:
+        errors.append("Employee code is required")
+    if not errors:
+        # The same rules POST /employees applies (E.164 phone, code and
+        # password format, ...).
+        try:
+            EmployeeCreate(**data)
+        except ValidationError as e:
+            errors.extend(_schema_error(err) for err in e.errors())
+
+    return data, errors
+
+
+def _schema_error(err: Dict) -> str:
+    message = err["msg"].removeprefix("Value error, ")
+    return f"{err['loc'][0]}: {message}" if err.get("loc") else message
+
+
+class EmployeeImport:
+    """One uploaded employee file; see the module docstring."""
+
+    def __init__(self, db: Session, content: bytes, filename: str, *, tenant_id: Optional[str], user_type: str):
+        self.db = db
+        self.content = content
+        self.is_csv = filename.lower().endswith(".csv")
+        self.tenant_id = tenant_id
+        self.user_type = user_type
+        self.team_tenants: Dict[int, str] = {}
+        self.headers: List[Optional[str]] = self._read_headers()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _raw_rows(self) -> Iterator[Tuple]:
+        if self.is_csv:
+            text = io.TextIOWrapper(io.BytesIO(self.content), encoding="utf-8-sig", newline="")
+            yield from csv.reader(text)
+            return
+        workbook = openpyxl.load_workbook(io.BytesIO(self.content), read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    def _read_headers(self) -> List[Optional[str]]:
+        for values in self._raw_rows():
+            return [str(v).strip().lower() if v not in (None, "") else None for v in values]
+        return []
+
+    def missing_columns(self) -> List[str]:
+        return [col for col in REQUIRED_COLUMNS if col not in self.headers]
+
+    def rows(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """(spreadsheet row number, {header: stripped text}) for each non-empty data row."""
+        for row_number, values in enumerate(self._raw_rows(), start=1):
+            if row_number < FIRST_DATA_ROW:
+                continue
+            row = {
+                header: str(value).strip()
+                for header, value in zip(self.headers, values)
+                if header and value is not None
+            }
+            if any(row.values()):
+                yield row_number, row
+
+    # ------------------------------------------------------------------
+    # Pass 1 — validation
+    # ------------------------------------------------------------------
+
+    def _row_tenant(self, team_id: Optional[int]) -> Optional[str]:
+        return self.tenant_id or self.team_tenants.get(team_id)
+
+    def validate(self) -> EmployeeImportReport:
+        report = EmployeeImportReport()
+        keys: List[_RowKeys] = []
+        for row_number, row_data in self.rows():
+            data, errors = clean_row(row_data)
+            keys.append(_RowKeys(
+                row_number, row_data.get("name", ""), data["email"], data["phone"],
+                data["employee_code"] or "", data["team_id"], errors,
+            ))
+        report.total_rows = len(keys)
+        if not keys:
+            return report
+
+        team_ids = {k.team_id for k in keys if k.team_id is not None}
+        if team_ids:
+            self.team_tenants = dict(self.db.execute(
+                select(Team.team_id, Team.tenant_id).where(Team.team_id.in_(team_ids))
+            ).all())
+
+        for k in keys:
+            if k.team_id is None:
+                continue
+            team_tenant = self.team_tenants.get(k.team_id)
+            if team_tenant is None:
+                k.errors.append(f"Team ID {k.team_id} does not exist")
+            elif self.tenant_id and team_tenant != self.tenant_id:
+                k.errors.append(f"Team ID {k.team_id} does not belong to your tenant")
+                k.team_id = None
+
+        existing = self._existing_keys({self._row_tenant(k.team_id) for k in keys} - {None})
+        for k in keys:
+            tenant = self._row_tenant(k.team_id)
+            if tenant not in existing:
+                continue
+            taken = existing[tenant]
+            if k.email and k.email in taken["emails"]:
+                k.errors.append(f"Email '{k.email}' already exists in database")
+            if k.phone and k.phone in taken["phones"]:
+                k.errors.append(f"Phone '{k.phone}' already exists in database")
+            if k.employee_code and k.employee_code in taken["codes"]:
+                k.errors.append(f"Employee code '{k.employee_code}' already exists")
+
+        report.failed = [k.report_entry() for k in keys if k.errors]
+
+        seen = {"emails": set(), "phones": set(), "codes": set()}
+        for k in keys:
+            if k.errors:
+                continue
+            for bucket, label, value in (
+                ("emails", "Email", k.email), ("phones", "Phone", k.phone), ("codes", "Employee code", k.employee_code),
+            ):
+                if not value:
+                    continue
+                if value in seen[bucket]:
+                    k.errors.append(f"{label} '{value}' is duplicated within this Excel file")
+                else:
+                    seen[bucket].add(value)
+            if k.errors:
+                report.duplicates.append(k.report_entry())
+
+        logger.info(
+            f"[employee_import] validated {report.total_rows} rows: "
+            f"{len(report.failed)} invalid, {len(report.duplicates)} duplicated in file"
+        )
+        return report
+
+    def _existing_keys(self, tenant_ids) -> Dict[str, Dict[str, set]]:
+        """Emails (lower-cased), phones and codes already used, per tenant — one query."""
+        existing = {t: {"emails": set(), "phones": set(), "codes": set()} for t in tenant_ids}
+        if not tenant_ids:
+            return existing
+        for t_id, email, phone, code in self.db.execute(
+            select(Employee.tenant_id, Employee.email, Employee.phone, Employee.employee_code)
+            .where(Employee.tenant_id.in_(tenant_ids))
+        ):
+            bucket = existing[t_id]
+            if email:
+                bucket["emails"].add(email.lower())
+            if phone:
+                bucket["phones"].add(phone)
+            if code:
+                bucket["codes"].add(code)
+        return existing
+
+    # ------------------------------------------------------------------
+    # Pass 2 — creation
+    # ------------------------------------------------------------------
+
+    async def create(self, chunk_size: Optional[int] = None) -> List[Dict]:
+        """
+        Insert every row of a file validate() passed.  Returns one dict per
+        employee: row, employee_id, name, email, phone, team_id, tenant_id.
+        Does not commit.
+        """
+        chunk_size = chunk_size or settings.EMPLOYEE_IMPORT_CHUNK_SIZE
+        role_id = employee_crud.get_system_role_id(self.db, role_name="Employee")
+        if role_id is None:
+            raise ValueError("System role 'Employee' not found in DB")
+
+        created: List[Dict] = []
+        rows = self.rows()
+        while True:
+            chunk = [(row_number, clean_row(row_data)[0]) for row_number, row_data in islice(rows, chunk_size)]
+            if not chunk:
+                break
+            hashes = await hash_passwords_async([data["password"] for _, data in chunk])
+            values = [
+                {
+                    "tenant_id": self._row_tenant(data["team_id"]),
+                    "role_id": role_id,
+                    "name": data["name"],
+                    "employee_code": data["employee_code"],
+                    "email": data["email"],
+                    "password": password_hash,
+                    "team_id": data["team_id"],
+                    "phone": data["phone"],
+                    "address": data["address"],
+                    "latitude": data["latitude"],
+                    "longitude": data["longitude"],
+                    "gender": data["gender"],
+                }
+                for (_, data), password_hash in zip(chunk, hashes)
+            ]
+            # RETURNING in parameter order would make SQLAlchemy fall back to
+            # one row per statement; match the new ids on (tenant, email),
+            # which is unique, instead.
+            table = Employee.__table__
+            ids_by_key = {
+                (tenant, email): employee_id
+                for employee_id, tenant, email in self.db.execute(
+                    insert(table).returning(table.c.employee_id, table.c.tenant_id, table.c.email), values,
+                )
+            }
+            employee_ids = [ids_by_key[(v["tenant_id"], v["email"])] for v in values]
+            self.db.execute(insert(WeekoffConfig.__table__), [
+                {
+                    "employee_id": employee_id, "sunday": True, "monday": False, "tuesday": False,
+                    "wednesday": False, "thursday": False, "friday": False, "saturday": False,
+                }
+                for employee_id in employee_ids
+            ])
+            created.extend(
+                {
+                    "row": row_number, "employee_id": employee_id, "name": v["name"], "email": v["email"],
+                    "phone": v["phone"], "team_id": v["team_id"], "tenant_id": v["tenant_id"],
+                }
+                for (row_number, _), v, employee_id in zip(chunk, values, employee_ids)
+            )
+            logger.info(f"[employee_import] inserted {len(created)} employees so far")
+        return created
@@ -244,7 +244,75 @@ class FCMService:
         )
         
         return result
-    
+
+    def send_each(self, notifications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send a different notification to each device, batched
+
+        send_batch() multicasts one message to many tokens; personalised
+        messages (trip reminders) go through this instead, still 1 API call
+        per 500 messages.
+
+        Args:
+            notifications: List of dicts with 'token', 'title', 'body' and
+                           optional 'data', 'priority', 'platform'
+
+        Returns:
+            One dict per notification, in order, shaped like send_notification()'s
+        """
+        results: List[Dict[str, Any]] = []
+
+        for start in range(0, len(notifications), self.batch_size):
+            batch = notifications[start:start + self.batch_size]
+            try:
+                messages = [
+                    self._build_message(
+                        token=n["token"],
+                        title=n["title"],
+                        body=n["body"],
+                        data=n.get("data"),
+                        priority=n.get("priority", "high"),
+                        platform=n.get("platform")
+                    )
+                    for n in batch
+                ]
+                response = messaging.send_each(messages)
+            except Exception as e:
+                logger.error(f"[fcm_service] Error sending batch of {len(batch)} messages: {e}", exc_info=True)
+                results.extend(
+                    {"success": False, "error": "SEND_ERROR", "error_message": str(e), "token": n["token"], "should_retry": True}
+                    for n in batch
+                )
+                continue
+
+            for n, resp in zip(batch, response.responses):
+                if resp.success:
+                    results.append({"success": True, "message_id": resp.message_id, "token": n["token"]})
+                else:
+                    results.append(self._error_result(n["token"], resp.exception))
+
+            logger.info(
+                f"[fcm_service] send_each batch complete: "
+                f"success={response.success_count}, failure={response.failure_count}"
+            )
+
+        return results
+
+    @staticmethod
+    def _error_result(token: str, error: Exception) -> Dict[str, Any]:
+        """Map a per-message FCM exception to send_notification()'s error shape."""
+        if isinstance(error, messaging.UnregisteredError):
+            logger.warning(f"[fcm_service] Token unregistered (invalid/expired): {token[:20]}...")
+            return {"success": False, "error": "TOKEN_UNREGISTERED", "token": token, "should_delete": True}
+        if isinstance(error, messaging.SenderIdMismatchError):
+            logger.error(f"[fcm_service] Sender ID mismatch for token: {token[:20]}...")
+            return {"success": False, "error": "SENDER_ID_MISMATCH", "token": token, "should_delete": True}
+        if isinstance(error, messaging.QuotaExceededError):
+            logger.error("[fcm_service] FCM quota exceeded - rate limited")
+            return {"success": False, "error": "QUOTA_EXCEEDED", "token": token, "should_retry": True}
+        logger.error(f"[fcm_service] Error sending notification: {error}")
+        return {"success": False, "error": "SEND_ERROR", "error_message": str(error), "token": token, "should_retry": True}
+
     def _build_message(
         self,
         token: str,
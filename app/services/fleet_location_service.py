@@ -0,0 +1,350 @@
+"""
+app/services/fleet_location_service.py
+---------------------------------------
+Live fleet position store backed by Redis GEO sets.
+
+Every GPS ping accepted by ``POST /driver/location`` is mirrored here so the
+admin / vendor live map can be served from Redis instead of fanning out
+reads against Firebase RTDB.
+
+Key layout
+----------
+``fleet_geo:{tenant_id}``                 GEO set — every active driver of the tenant
+``fleet_geo:{tenant_id}:{vendor_id}``     GEO set — drivers of one vendor
+``fleet_driver:{tenant_id}:{driver_id}``  HASH   — per-driver metadata (name,
+                                          route, speed, updated_at, ...)
+
+GEO members are the driver_id as a string.  Lookups use GEOSEARCH, which is
+O(N+log(M)) in the number of members inside the search area.
+
+Staleness
+---------
+The metadata hash carries a TTL (``LOCATION_TTL_SECONDS``).  A driver whose
+hash has expired stopped pinging without ending duty; such members are
+dropped from the GEO sets lazily on the next read, so no sweeper is needed.
+
+Redis is optional: when ``settings.USE_REDIS`` is False every write is a
+no-op and every read returns an empty result.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from geopy.distance import geodesic
+
+from app.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Metadata TTL — a driver that has not pinged for this long drops off the map.
+LOCATION_TTL_SECONDS: int = 300
+
+# Upper bound for "all drivers" searches (covers the whole planet).
+_EARTH_RADIUS_KM: int = 20_100
+
+
+# ---------------------------------------------------------------------------
+# Key helpers
+# ---------------------------------------------------------------------------
+
+def _tenant_key(tenant_id: str) -> str:
+    return f"fleet_geo:{tenant_id}"
+
+
+def _vendor_key(tenant_id: str, vendor_id) -> str:
+    return f"fleet_geo:{tenant_id}:{vendor_id}"
+
+
+def _meta_key(tenant_id: str, driver_id) -> str:
+    return f"fleet_driver:{tenant_id}:{driver_id}"
+
+
+def _get_client(client=None):
+    """Return the shared Redis client, or None when Redis is disabled."""
+    if client is not None:
+        return client
+    if not settings.USE_REDIS:
+        return None
+    from app.utils.cache_manager import cache
+    return cache.redis_client
+
+
+# ---------------------------------------------------------------------------
+# Writes
+# ---------------------------------------------------------------------------
+
+def record_driver_location(
+    tenant_id: str,
+    vendor_id: Optional[int],
+    driver_id: int,
+    latitude: float,
+    longitude: float,
+    speed: Optional[float] = None,
+    driver_name: Optional[str] = None,
+    driver_code: Optional[str] = None,
+    route_id: Optional[int] = None,
+    client=None,
+) -> bool:
+    """
+    Mirror one GPS ping into the tenant / vendor GEO sets and refresh the
+    driver's metadata hash.  All commands go out in a single pipeline.
+
+    Returns True on success, False when Redis is disabled or the write failed.
+    Exceptions are swallowed — the live map must never fail a location ping.
+    """
+    r = _get_client(client)
+    if r is None:
+        return False
+
+    member = str(driver_id)
+    meta = {
+        "driver_id":  member,
+        "vendor_id":  "" if vendor_id is None else str(vendor_id),
+        "latitude":   repr(float(latitude)),
+        "longitude":  repr(float(longitude)),
+        "updated_at": datetime.utcnow().isoformat(),
+    }
+    if speed is not None:
+        meta["speed"] = repr(float(speed))
+    if driver_name:
+        meta["driver_name"] = driver_name
+    if driver_code:
+        meta["driver_code"] = driver_code
+    if route_id:
+        meta["route_id"] = str(route_id)
+
+    try:
+        pipe = r.pipeline(transaction=False)
+        # GEOADD takes (longitude, latitude, member) triples.
+        pipe.geoadd(_tenant_key(tenant_id), (longitude, latitude, member))
+        if vendor_id is not None:
+            pipe.geoadd(_vendor_key(tenant_id, vendor_id), (longitude, latitude, member))
+        pipe.hset(_meta_key(tenant_id, driver_id), mapping=meta)
+        pipe.expire(_meta_key(tenant_id, driver_id), LOCATION_TTL_SECONDS)
+        pipe.execute()
+        return True
+    except Exception as exc:
+        logger.warning(
+            "[fleet_location] Redis write failed tenant=%s driver=%s: %s",
+            tenant_id, driver_id, exc,
+        )
+        return False
+
+
+def remove_driver(
+    tenant_id: str,
+    vendor_id: Optional[int],
+    driver_id: int,
+    client=None,
+) -> bool:
+    """Drop a driver from the live map (called on duty end)."""
+    r = _get_client(client)
+    if r is None:
+        return False
+
+    member = str(driver_id)
+    try:
+        pipe = r.pipeline(transaction=False)
+        pipe.zrem(_tenant_key(tenant_id), member)
+        if vendor_id is not None:
+            pipe.zrem(_vendor_key(tenant_id, vendor_id), member)
+        pipe.delete(_meta_key(tenant_id, driver_id))
+        pipe.execute()
+        return True
+    except Exception as exc:
+        logger.warning(
+            "[fleet_location] Redis remove failed tenant=%s driver=%s: %s",
+            tenant_id, driver_id, exc,
+        )
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+def _search(
+    r,
+    key: str,
+    longitude: float,
+    latitude: float,
+    radius_km: float,
+    limit: Optional[int] = None,
+) -> List[Tuple[str, float, Tuple[float, float]]]:
+    """GEOSEARCH wrapper returning ``[(member, dist_km, (lng, lat)), ...]``."""
+    kwargs = dict(
+        longitude=longitude,
+        latitude=latitude,
+        radius=radius_km,
+        unit="km",
+        withdist=True,
+        withcoord=True,
+        sort="ASC",
+    )
+    if limit:
+        kwargs.update(count=limit)
+    return r.geosearch(key, **kwargs)
+
+
+def _hydrate(
+    r,
+    tenant_id: str,
+    hits: Sequence[Tuple[str, float, Tuple[float, float]]],
+    key: str,
+    include_distance: bool,
+) -> List[dict]:
+    """
+    Join GEO hits with their metadata hashes (one pipelined round-trip) and
+    lazily evict members whose metadata has expired.
+    """
+    if not hits:
+        return []
+
+    pipe = r.pipeline(transaction=False)
+    for member, _dist, _coord in hits:
+        pipe.hgetall(_meta_key(tenant_id, member))
+    metas = pipe.execute()
+
+    drivers: List[dict] = []
+    expired: List[str] = []
+    for (member, dist, (lng, lat)), meta in zip(hits, metas):
+        if not meta:
+            expired.append(member)
+            continue
+        entry = {
+            "driver_id":   int(member),
+            "vendor_id":   int(meta["vendor_id"]) if meta.get("vendor_id") else None,
+            "latitude":    float(meta.get("latitude") or lat),
+            "longitude":   float(meta.get("longitude") or lng),
+            "speed":       float(meta["speed"]) if meta.get("speed") else None,
+            "driver_name": meta.get("driver_name"),
+            "driver_code": meta.get("driver_code"),
+            "route_id":    int(meta["route_id"]) if meta.get("route_id") else None,
+            "updated_at":  meta.get("updated_at"),
+        }
+        if include_distance:
+            entry["distance_km"] = round(float(dist), 3)
+        drivers.append(entry)
+
+    if expired:
+        try:
+            cleanup = r.pipeline(transaction=False)
+            cleanup.zrem(_tenant_key(tenant_id), *expired)
+            if key != _tenant_key(tenant_id):
+                cleanup.zrem(key, *expired)
+            cleanup.execute()
+            logger.debug(
+                "[fleet_location] Evicted %d stale driver(s) for tenant=%s",
+                len(expired), tenant_id,
+            )
+        except Exception as exc:
+            logger.warning("[fleet_location] Stale eviction failed: %s", exc)
+
+    return drivers
+
+
+def get_active_drivers(
+    tenant_id: str,
+    vendor_id: Optional[int] = None,
+    client=None,
+) -> List[dict]:
+    """All drivers currently on the live map for a tenant (optionally one vendor)."""
+    r = _get_client(client)
+    if r is None:
+        return []
+
+    key = _vendor_key(tenant_id, vendor_id) if vendor_id is not None else _tenant_key(tenant_id)
+    try:
+        hits = _search(r, key, 0.0, 0.0, _EARTH_RADIUS_KM)
+        return _hydrate(r, tenant_id, hits, key, include_distance=False)
+    except Exception as exc:
+        logger.warning("[fleet_location] Snapshot read failed tenant=%s: %s", tenant_id, exc)
+        return []
+
+
+def get_drivers_within_radius(
+    tenant_id: str,
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    vendor_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    client=None,
+) -> List[dict]:
+    """Drivers within ``radius_km`` of a point, nearest first."""
+    r = _get_client(client)
+    if r is None:
+        return []
+
+    key = _vendor_key(tenant_id, vendor_id) if vendor_id is not None else _tenant_key(tenant_id)
+    try:
+        hits = _search(r, key, longitude, latitude, radius_km, limit=limit)
+        return _hydrate(r, tenant_id, hits, key, include_distance=True)
+    except Exception as exc:
+        logger.warning("[fleet_location] Radius read failed tenant=%s: %s", tenant_id, exc)
+        return []
+
+
+def point_in_polygon(latitude: float, longitude: float, polygon: Sequence[Tuple[float, float]]) -> bool:
+    """
+    Ray-casting point-in-polygon test.
+
+    ``polygon`` is a sequence of ``(latitude, longitude)`` vertices; the ring
+    is closed implicitly.  Planar approximation — adequate for city-scale
+    geofences that do not straddle the antimeridian.
+    """
+    inside = False
+    n = len(polygon)
+    j = n - 1
+    for i in range(n):
+        lat_i, lng_i = polygon[i]
+        lat_j, lng_j = polygon[j]
+        if (lat_i > latitude) != (lat_j > latitude):
+            cross_lng = (lng_j - lng_i) * (latitude - lat_i) / (lat_j - lat_i) + lng_i
+            if longitude < cross_lng:
+                inside = not inside
+        j = i
+    return inside
+
+
+def get_drivers_in_polygon(
+    tenant_id: str,
+    polygon: Iterable[Tuple[float, float]],
+    vendor_id: Optional[int] = None,
+    client=None,
+) -> List[dict]:
+    """
+    Drivers inside a polygon of ``(latitude, longitude)`` vertices.
+
+    Redis narrows candidates with a GEOSEARCH over the circle enclosing the
+    polygon; the exact containment test then runs on that small set.
+    """
+    ring = [(float(lat), float(lng)) for lat, lng in polygon]
+    if len(ring) < 3:
+        return []
+
+    r = _get_client(client)
+    if r is None:
+        return []
+
+    lats = [p[0] for p in ring]
+    lngs = [p[1] for p in ring]
+    center_lat = (min(lats) + max(lats)) / 2
+    center_lng = (min(lngs) + max(lngs)) / 2
+
+    # Circle around the polygon: the farthest vertex from the bbox centre,
+    # padded slightly so edge points are not clipped.
+    radius_km = max(geodesic((center_lat, center_lng), p).km for p in ring) * 1.01 + 0.01
+
+    key = _vendor_key(tenant_id, vendor_id) if vendor_id is not None else _tenant_key(tenant_id)
+    try:
+        hits = _search(r, key, center_lng, center_lat, radius_km)
+        hits = [h for h in hits if point_in_polygon(h[2][1], h[2][0], ring)]
+        return _hydrate(r, tenant_id, hits, key, include_distance=False)
+    except Exception as exc:
+        logger.warning("[fleet_location] Polygon read failed tenant=%s: %s", tenant_id, exc)
+        return []
+
@@ -0,0 +1,223 @@
+"""
+app/services/job_coordination.py
+---------------------------------
+Cluster-wide coordination for SchedulerService's periodic jobs.
+
+Every Uvicorn/Gunicorn worker starts its own APScheduler, so without
+coordination each job runs once per worker per tick.  A coordinator decides,
+at the moment a job fires, whether *this* worker should run it:
+
+* leader-only jobs (reminders) run on the single worker holding the leader
+  lease;
+* sharded jobs (per-tenant scans such as the stale-driver check) run on every
+  worker, each handling only the keys it owns.
+
+Storage
+-------
+With ``settings.USE_REDIS`` the workers share::
+
+    scheduler:leader    STRING  worker id, PX = lease        (SET NX / renew)
+    scheduler:workers   ZSET    member = worker id, score = last heartbeat epoch
+
+Leader lease
+------------
+``is_leader()`` takes the lease with ``SET NX PX`` or, when this worker
+already holds it, pushes its expiry out inside a WATCH / MULTI transaction,
+so at most one worker holds it at any time.  Every worker calls it on each
+coordination tick (``lease / 3``) and again right before a leader-only job,
+so the leader keeps renewing while it is alive.
+
+Failover: a leader that dies stops renewing and the key expires after at
+most one lease; the next worker to tick takes over.  ``release()`` on a
+clean shutdown deletes the key so the hand-over is immediate.  When Redis
+cannot be reached the worker keeps the leadership it already had until its
+own lease would have run out (no other worker can have taken it before
+then), and does not claim a new one.
+
+Sharding
+--------
+Live workers are the members heartbeated within the last lease.  A key is
+owned by the live worker with the highest ``crc32(worker:key)`` (rendezvous
+hashing), so when a worker joins or leaves only its own share of the keys
+moves.  Membership is cached between refreshes; right after a change two
+workers may briefly disagree for one tick.
+
+Without Redis ``LocalCoordinator`` makes every worker the leader and owner of
+every key (single-worker deployments only).
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import time
+import uuid
+import zlib
+from typing import Callable, List, Optional
+
+from app.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_LEADER_KEY = "scheduler:leader"
+_WORKERS_KEY = "scheduler:workers"
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def shard_owner(key, workers: List[str]) -> Optional[str]:
+    """Rendezvous-hash owner of ``key`` among ``workers`` (None if empty)."""
+    if not workers:
+        return None
+    return max(workers, key=lambda worker: (zlib.crc32(f"{worker}:{key}".encode()), worker))
+
+
+class LocalCoordinator:
+    """Single-process coordinator: always the leader, owns every key."""
+
+    distributed = False
+
+    def __init__(self, worker_id: Optional[str] = None) -> None:
+        self.worker_id = worker_id or _default_worker_id()
+
+    def tick(self) -> None:
+        pass
+
+    def is_leader(self) -> bool:
+        return True
+
+    def owns(self, key) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+
+class RedisCoordinator:
+    """Leader lease and shard membership shared through Redis."""
+
+    distributed = True
+
+    def __init__(
+        self,
+        client,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._r = client
+        self.worker_id = worker_id or _default_worker_id()
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._lease_until = 0.0               # monotonic end of the lease we hold
+        self._workers: List[str] = [self.worker_id]
+
+    # ------------------------------------------------------------------
+    # Leader lease
+    # ------------------------------------------------------------------
+
+    def is_leader(self) -> bool:
+        """Take or renew the leader lease; True while this worker holds it."""
+        try:
+            held = self._acquire_or_renew()
+        except Exception as e:
+            held = time.monotonic() < self._lease_until
+            logger.warning(f"[job_coordination] Leader lease check failed ({e}); leader={held}")
+            return held
+        if held:
+            if not self._lease_until:
+                logger.info(f"[job_coordination] {self.worker_id} became scheduler leader")
+            self._lease_until = time.monotonic() + self.lease_seconds
+        else:
+            if self._lease_until:
+                logger.info(f"[job_coordination] {self.worker_id} lost scheduler leadership")
+            self._lease_until = 0.0
+        return held
+
+    def _acquire_or_renew(self) -> bool:
+        from redis.exceptions import WatchError
+
+        lease_ms = int(self.lease_seconds * 1000)
+        if self._r.set(_LEADER_KEY, self.worker_id, nx=True, px=lease_ms):
+            return True
+        with self._r.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(_LEADER_KEY)
+                    if pipe.get(_LEADER_KEY) != self.worker_id:
+                        pipe.unwatch()
+                        return False
+                    pipe.multi()
+                    pipe.pexpire(_LEADER_KEY, lease_ms)
+                    pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+
+    def release(self) -> None:
+        """Give up leadership and leave the shard ring (clean shutdown)."""
+        from redis.exceptions import WatchError
+
+        self._lease_until = 0.0
+        try:
+            with self._r.pipeline(transaction=True) as pipe:
+                while True:
+                    try:
+                        pipe.watch(_LEADER_KEY)
+                        mine = pipe.get(_LEADER_KEY) == self.worker_id
+                        pipe.multi()
+                        if mine:
+                            pipe.delete(_LEADER_KEY)
+                        pipe.zrem(_WORKERS_KEY, self.worker_id)
+                        pipe.execute()
+                        break
+                    except WatchError:
+                        continue
+        except Exception as e:
+            logger.warning(f"[job_coordination] Failed to release {self.worker_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Shard membership
+    # ------------------------------------------------------------------
+
+    def heartbeat(self) -> List[str]:
+        """Publish this worker's heartbeat and refresh the live worker list."""
+        now = self._clock()
+        pipe = self._r.pipeline(transaction=True)
+        pipe.zadd(_WORKERS_KEY, {self.worker_id: now})
+        pipe.zremrangebyscore(_WORKERS_KEY, "-inf", now - 3 * self.lease_seconds)
+        pipe.zrangebyscore(_WORKERS_KEY, now - self.lease_seconds, "+inf")
+        workers = pipe.execute()[-1]
+        self._workers = sorted(set(workers) | {self.worker_id})
+        return self._workers
+
+    @property
+    def workers(self) -> List[str]:
+        """Live workers as of the last heartbeat (always includes this one)."""
+        return list(self._workers)
+
+    def owns(self, key) -> bool:
+        """True when this worker handles ``key`` of a sharded job."""
+        return shard_owner(key, self._workers) == self.worker_id
+
+    # ------------------------------------------------------------------
+    # Coordination tick
+    # ------------------------------------------------------------------
+
+    def tick(self) -> None:
+        """Heartbeat and renew / claim leadership; runs every lease / 3."""
+        try:
+            self.heartbeat()
+        except Exception as e:
+            logger.warning(f"[job_coordination] Heartbeat failed, keeping {len(self._workers)} known worker(s): {e}")
+        self.is_leader()
+
+
+def default_coordinator():
+    if settings.USE_REDIS:
+        from app.utils.cache_manager import cache
+        return RedisCoordinator(cache.redis_client, lease_seconds=settings.SCHEDULER_LEASE_SECONDS)
+    return LocalCoordinator()
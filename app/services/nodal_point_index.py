@@ -0,0 +1,130 @@
+"""
+app/services/nodal_point_index.py
+----------------------------------
+Per-tenant spatial index of active nodal points (pickup / drop hubs).
+
+Nearest-hub lookups used to load every active hub for the tenant and run
+geopy ``geodesic()`` against each one — per employee in the bulk path.  This
+module keeps a scikit-learn ``BallTree`` (haversine metric) per tenant so a
+lookup is O(log H) and a bulk assignment is a single vectorised k-NN query.
+
+Cache coherence
+---------------
+- Hub create / update / deactivate call ``invalidate(tenant_id)``.
+- Every ``get_index()`` also compares a cheap fingerprint
+  (``COUNT(*)``, ``MAX(updated_at)`` of active hubs) so an index built in
+  another worker process is never served stale.
+
+Distances are great-circle (mean Earth radius), which differs from the
+ellipsoidal ``geodesic()`` by well under 0.5 % — irrelevant for picking a hub.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.neighbors import BallTree
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.models.nodal_point import NodalPoint
+
+logger = get_logger(__name__)
+
+EARTH_RADIUS_KM: float = 6371.0088
+
+
+class NodalPointIndex:
+    """Immutable BallTree over one tenant's active nodal points."""
+
+    def __init__(self, ids: Sequence[int], coords_deg: np.ndarray, fingerprint=None):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.fingerprint = fingerprint
+        self._tree = BallTree(np.radians(coords_deg), metric="haversine") if len(ids) else None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 1,
+        radius_km: Optional[float] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Up to ``k`` nearest hubs as ``[(nodal_point_id, distance_km), ...]``,
+        closest first.  With ``radius_km`` only hubs inside the radius are kept.
+        """
+        if self._tree is None:
+            return []
+        point = np.radians([[latitude, longitude]])
+        if radius_km is not None:
+            idx, dist = self._tree.query_radius(
+                point, r=radius_km / EARTH_RADIUS_KM, return_distance=True, sort_results=True,
+            )
+            idx, dist = idx[0][:k], dist[0][:k]
+        else:
+            dist, idx = self._tree.query(point, k=min(k, len(self.ids)))
+            idx, dist = idx[0], dist[0]
+        return [
+            (int(self.ids[i]), float(d) * EARTH_RADIUS_KM)
+            for i, d in zip(idx, dist)
+        ]
+
+    def nearest_bulk(self, coords_deg: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest hub for every ``(lat, lng)`` row of ``coords_deg`` in one query.
+        Returns ``(nodal_point_ids, distances_km)`` aligned with the input rows.
+        """
+        if self._tree is None or len(coords_deg) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        dist, idx = self._tree.query(np.radians(coords_deg), k=1)
+        return self.ids[idx[:, 0]], dist[:, 0] * EARTH_RADIUS_KM
+
+
+_indexes: Dict[str, NodalPointIndex] = {}
+_lock = threading.Lock()
+
+
+def _fingerprint(db: Session, tenant_id: str):
+    count, last_updated = (
+        db.query(func.count(NodalPoint.nodal_point_id), func.max(NodalPoint.updated_at))
+        .filter(NodalPoint.tenant_id == tenant_id, NodalPoint.is_active.is_(True))
+        .one()
+    )
+    return int(count or 0), last_updated
+
+
+def _build(db: Session, tenant_id: str, fingerprint) -> NodalPointIndex:
+    rows = (
+        db.query(NodalPoint.nodal_point_id, NodalPoint.latitude, NodalPoint.longitude)
+        .filter(NodalPoint.tenant_id == tenant_id, NodalPoint.is_active.is_(True))
+        .order_by(NodalPoint.nodal_point_id)
+        .all()
+    )
+    coords = np.array([[float(r.latitude), float(r.longitude)] for r in rows]).reshape(-1, 2)
+    index = NodalPointIndex([r.nodal_point_id for r in rows], coords, fingerprint)
+    logger.info("[nodal_point_index] Built index tenant=%s hubs=%d", tenant_id, len(index))
+    return index
+
+
+def get_index(db: Session, tenant_id: str) -> NodalPointIndex:
+    """Return the cached index for a tenant, rebuilding it if hubs changed."""
+    fingerprint = _fingerprint(db, tenant_id)
+    index = _indexes.get(tenant_id)
+    if index is not None and index.fingerprint == fingerprint:
+        return index
+    index = _build(db, tenant_id, fingerprint)
+    with _lock:
+        _indexes[tenant_id] = index
+    return index
+
+
+def invalidate(tenant_id: str) -> None:
+    """Drop a tenant's index; the next lookup rebuilds it."""
+    with _lock:
+        _indexes.pop(tenant_id, None)
@@ -1,24 +1,79 @@
 """
 Notification Service for Alert System
 Handles multi-channel notifications (Email, SMS, Push, Voice)
+
+Fan-out model
+-------------
+One alert produces one AlertNotification row per (recipient, channel).  All
+rows are created first, then every channel is sent concurrently:
+
+- blocking providers (Twilio SMS, FCM push) run in worker threads,
+- all emails of one fan-out share a single SMTP session,
+- the whole fan-out is bounded by ``ALERT_NOTIFICATION_BUDGET_SECONDS``;
+  sends still outstanding at the deadline are marked FAILED so a slow
+  channel never delays the others.
+
+Each row records ``latency_ms`` (fan-out start → provider answer).  Per-alert
+time-to-first / time-to-all-notified are exported as Prometheus histograms.
 """
+import asyncio
+import time
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
+from prometheus_client import Counter, Histogram
 from app.models.alert import (
     Alert, AlertConfiguration, AlertNotification,
     NotificationChannelEnum, NotificationStatusEnum
 )
 from app.crud.alert import create_notification, update_notification_status
-from app.core.email_service import EmailService
+from app.core.email_service import EmailService, EmailPriority
 from app.core.logging_config import get_logger
 from app.config import settings
+from app.database.session import SessionLocal
 from app.services.unified_notification_service import UnifiedNotificationService
 from app.services.session_cache import SessionCache
 from app.services.sms_service import SMSService
 
 logger = get_logger(__name__)
 
+# Fastest providers are started first.
+_CHANNEL_ORDER = {
+    NotificationChannelEnum.PUSH: 0,
+    NotificationChannelEnum.SMS: 1,
+    NotificationChannelEnum.WHATSAPP: 2,
+    NotificationChannelEnum.VOICE: 3,
+    NotificationChannelEnum.EMAIL: 4,
+}
+
+_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 15, 30, 60)
+
+_TIME_TO_FIRST = Histogram(
+    "alert_notification_time_to_first_seconds",
+    "Seconds from the start of an alert fan-out until the first recipient was notified",
+    ["phase"],
+    buckets=_LATENCY_BUCKETS,
+)
+_TIME_TO_ALL = Histogram(
+    "alert_notification_time_to_all_seconds",
+    "Seconds from the start of an alert fan-out until every send succeeded",
+    ["phase"],
+    buckets=_LATENCY_BUCKETS,
+)
+_SENDS = Counter(
+    "alert_notifications_total",
+    "Alert notification sends by channel and outcome",
+    ["channel", "status"],
+)
+_BUDGET_EXCEEDED = Counter(
+    "alert_notification_budget_exceeded_total",
+    "Alert notification sends abandoned at the latency budget",
+    ["channel"],
+)
+
+# (notification row, recipient dict, channel)
+_Job = Tuple[AlertNotification, Dict[str, Any], NotificationChannelEnum]
+
 
 class NotificationService:
     """
@@ -26,12 +81,16 @@ class NotificationService:
     Supports: Email, SMS, Push notifications, Voice calls
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, budget_seconds: Optional[float] = None):
         self.db = db
         self.email_service = EmailService()
         self.sms_service = SMSService()
-        # Initialize push notification service
-        self.push_service = UnifiedNotificationService(db, SessionCache())
+        # Push sends build a UnifiedNotificationService per worker thread
+        self.session_cache = SessionCache()
+        self.budget_seconds = (
+            budget_seconds if budget_seconds is not None
+            else settings.ALERT_NOTIFICATION_BUDGET_SECONDS
+        )
     
     async def notify_alert_triggered(
         self,
@@ -41,26 +100,12 @@ class NotificationService:
         """
         Send notifications when alert is triggered
         """
-        notifications = []
-        
-        # Build notification message
         subject = self._build_subject(alert, "TRIGGERED")
         message = self._build_message(alert, "triggered")
         
-        # Send to primary recipients
-        for recipient in config.primary_recipients:
-            for channel in recipient.get("channels", []):
-                notification = await self._send_notification(
-                    alert=alert,
-                    recipient=recipient,
-                    channel=channel,
-                    subject=subject,
-                    message=message
-                )
-                if notification:
-                    notifications.append(notification)
-        
-        self.db.commit()
+        notifications = await self._dispatch(
+            alert, config.primary_recipients or [], subject, message, phase="triggered"
+        )
         logger.info(f"[notification] Sent {len(notifications)} notifications for alert {alert.alert_id}")
         
         return notifications
@@ -77,26 +122,12 @@ class NotificationService:
         if not config.notify_on_escalation:
             return []
         
-        notifications = []
-        
         subject = self._build_subject(alert, f"ESCALATED - Level {escalation_level}")
         message = self._build_message(alert, f"escalated to level {escalation_level}")
         
-        # Send to escalation recipients
-        if config.escalation_recipients:
-            for recipient in config.escalation_recipients:
-                for channel in recipient.get("channels", []):
-                    notification = await self._send_notification(
-                        alert=alert,
-                        recipient=recipient,
-                        channel=channel,
-                        subject=subject,
-                        message=message
-                    )
-                    if notification:
-                        notifications.append(notification)
-        
-        self.db.commit()
+        notifications = await self._dispatch(
+            alert, config.escalation_recipients or [], subject, message, phase="escalated"
+        )
         logger.info(f"[notification] Sent {len(notifications)} escalation notifications for alert {alert.alert_id}")
         
         return notifications
@@ -113,115 +144,164 @@ class NotificationService:
         if not config.notify_on_status_change:
             return []
         
-        notifications = []
-        
         subject = self._build_subject(alert, f"Status Update: {new_status}")
         message = self._build_message(alert, f"status changed to {new_status}")
         
         # Notify all recipients (primary + escalation)
-        all_recipients = config.primary_recipients.copy()
+        all_recipients = list(config.primary_recipients or [])
         if config.escalation_recipients:
             all_recipients.extend(config.escalation_recipients)
         
-        for recipient in all_recipients:
+        notifications = await self._dispatch(
+            alert, all_recipients, subject, message, phase="status_change"
+        )
+        logger.info(f"[notification] Sent {len(notifications)} status change notifications for alert {alert.alert_id}")
+        
+        return notifications
+    
+    # ── Concurrent fan-out ───────────────────────────────────────
+    
+    def _create_jobs(
+        self,
+        alert: Alert,
+        recipients: List[Dict[str, Any]],
+        subject: str,
+        message: str
+    ) -> List[_Job]:
+        """Create one PENDING row per (recipient, channel), fastest channels first."""
+        jobs: List[_Job] = []
+        for recipient in recipients:
             for channel in recipient.get("channels", []):
-                notification = await self._send_notification(
+                try:
+                    channel_enum = NotificationChannelEnum(channel)
+                except ValueError:
+                    logger.warning(f"[notification] Unknown channel: {channel}")
+                    continue
+                notification = create_notification(
+                    db=self.db,
                     alert=alert,
-                    recipient=recipient,
-                    channel=channel,
+                    recipient_name=recipient.get("name"),
+                    recipient_email=recipient.get("email"),
+                    recipient_phone=recipient.get("phone"),
+                    recipient_role=recipient.get("role"),
+                    channel=channel_enum,
                     subject=subject,
                     message=message
                 )
-                if notification:
-                    notifications.append(notification)
-        
-        self.db.commit()
-        logger.info(f"[notification] Sent {len(notifications)} status change notifications for alert {alert.alert_id}")
-        
-        return notifications
+                jobs.append((notification, recipient, channel_enum))
+        jobs.sort(key=lambda j: _CHANNEL_ORDER[j[2]])
+        return jobs
     
-    async def _send_notification(
+    async def _dispatch(
         self,
         alert: Alert,
-        recipient: Dict[str, Any],
-        channel: str,
+        recipients: List[Dict[str, Any]],
         subject: str,
-        message: str
-    ) -> Optional[AlertNotification]:
+        message: str,
+        phase: str
+    ) -> List[AlertNotification]:
         """
-        Send notification via specified channel
+        Send every (recipient, channel) concurrently within the latency budget,
+        then persist statuses and latencies in one commit.
         """
-        try:
-            # Create notification record
-            notification = create_notification(
+        jobs = self._create_jobs(alert, recipients, subject, message)
+        if not jobs:
+            self.db.commit()
+            return []
+        # Assign notification_ids (the push payload carries them).
+        self.db.flush()
+        
+        started = time.perf_counter()
+        # job index -> (success, failure_reason, seconds since start)
+        outcomes: Dict[int, Tuple[bool, Optional[str], float]] = {}
+        
+        async def _run_one(index: int, notification, recipient, channel) -> None:
+            try:
+                success = await self._deliver(notification, recipient, channel, subject, message, alert)
+                outcomes[index] = (success, None if success else "Failed to send", time.perf_counter() - started)
+            except Exception as e:
+                logger.error(f"[notification] Error sending notification: {str(e)}")
+                outcomes[index] = (False, str(e), time.perf_counter() - started)
+        
+        async def _run_emails(indexes: List[int]) -> None:
+            results = await self._send_emails([jobs[i][1].get("email") for i in indexes], subject, message)
+            elapsed = time.perf_counter() - started
+            for i, success in zip(indexes, results):
+                outcomes[i] = (success, None if success else "Failed to send", elapsed)
+        
+        email_indexes = [i for i, job in enumerate(jobs) if job[2] == NotificationChannelEnum.EMAIL]
+        tasks = [
+            asyncio.create_task(_run_one(i, *job))
+            for i, job in enumerate(jobs)
+            if job[2] != NotificationChannelEnum.EMAIL
+        ]
+        if email_indexes:
+            tasks.append(asyncio.create_task(_run_emails(email_indexes)))
+        
+        _done, pending = await asyncio.wait(tasks, timeout=self.budget_seconds)
+        for task in pending:
+            task.cancel()
+        
+        delivered: List[float] = []
+        for i, (notification, _recipient, channel) in enumerate(jobs):
+            outcome = outcomes.get(i)
+            if outcome is None:
+                _BUDGET_EXCEEDED.labels(channel=channel.value).inc()
+                success, reason = False, f"No provider response within {self.budget_seconds:g}s budget"
+                notification.latency_ms = int(self.budget_seconds * 1000)
+            else:
+                success, reason, elapsed = outcome
+                notification.latency_ms = int(elapsed * 1000)
+                if success:
+                    delivered.append(elapsed)
+            update_notification_status(
                 db=self.db,
-                alert=alert,
-                recipient_name=recipient.get("name"),
-                recipient_email=recipient.get("email"),
-                recipient_phone=recipient.get("phone"),
-                recipient_role=recipient.get("role"),
-                channel=NotificationChannelEnum(channel),
-                subject=subject,
-                message=message
+                notification=notification,
+                status=NotificationStatusEnum.SENT if success else NotificationStatusEnum.FAILED,
+                failure_reason=reason
             )
-            
-            # Send based on channel
-            if channel == NotificationChannelEnum.EMAIL.value:
-                success = await self._send_email(notification, recipient.get("email"), subject, message)
-            elif channel == NotificationChannelEnum.SMS.value:
-                success = await self._send_sms(notification, recipient.get("phone"), message)
-            elif channel == NotificationChannelEnum.PUSH.value:
-                success = await self._send_push(notification, recipient, subject, message, alert)
-            elif channel == NotificationChannelEnum.VOICE.value:
-                success = await self._send_voice_call(notification, recipient.get("phone"), message)
-            elif channel == NotificationChannelEnum.WHATSAPP.value:
-                success = await self._send_whatsapp(notification, recipient.get("phone"), message)
-            else:
-                logger.warning(f"[notification] Unknown channel: {channel}")
-                success = False
-            
-            # Update status
-            if success:
-                update_notification_status(
-                    db=self.db,
-                    notification=notification,
-                    status=NotificationStatusEnum.SENT
-                )
-            else:
-                update_notification_status(
-                    db=self.db,
-                    notification=notification,
-                    status=NotificationStatusEnum.FAILED,
-                    failure_reason="Failed to send"
-                )
-            
-            return notification
-            
-        except Exception as e:
-            logger.error(f"[notification] Error sending notification: {str(e)}")
-            if notification:
-                update_notification_status(
-                    db=self.db,
-                    notification=notification,
-                    status=NotificationStatusEnum.FAILED,
-                    failure_reason=str(e)
-                )
-            return None
+            _SENDS.labels(channel=channel.value, status="sent" if success else "failed").inc()
+        
+        self.db.commit()
+        
+        if delivered:
+            _TIME_TO_FIRST.labels(phase=phase).observe(min(delivered))
+        if len(delivered) == len(jobs):
+            _TIME_TO_ALL.labels(phase=phase).observe(max(delivered))
+        logger.info(
+            f"[notification] alert={alert.alert_id} phase={phase} sends={len(jobs)} "
+            f"ok={len(delivered)} pending_at_budget={len(pending)} "
+            f"first={min(delivered) if delivered else None} "
+            f"all={max(delivered) if len(delivered) == len(jobs) else None}"
+        )
+        return [job[0] for job in jobs]
     
-    async def _send_email(
+    async def _deliver(
         self,
         notification: AlertNotification,
-        to_email: str,
+        recipient: Dict[str, Any],
+        channel: NotificationChannelEnum,
         subject: str,
-        message: str
+        message: str,
+        alert: Alert
     ) -> bool:
-        """Send email notification"""
-        try:
-            if not to_email:
-                logger.warning("[notification.email] No email provided")
-                return False
-            
-            html_body = f"""
+        """Send one non-email notification via its channel."""
+        if channel == NotificationChannelEnum.SMS:
+            return await self._send_sms(notification, recipient.get("phone"), message)
+        if channel == NotificationChannelEnum.PUSH:
+            return await self._send_push(notification, recipient, subject, message, alert)
+        if channel == NotificationChannelEnum.VOICE:
+            return await self._send_voice_call(notification, recipient.get("phone"), message)
+        if channel == NotificationChannelEnum.WHATSAPP:
+            return await self._send_whatsapp(notification, recipient.get("phone"), message)
+        if channel == NotificationChannelEnum.EMAIL:
+            return await self._send_email(notification, recipient.get("email"), subject, message)
+        logger.warning(f"[notification] Unknown channel: {channel}")
+        return False
+    
+    @staticmethod
+    def _email_html(message: str) -> str:
+        return f"""
             <html>
                 <body>
                     <h2 style="color: #dc3545;">🚨 Alert Notification</h2>
@@ -236,6 +316,43 @@ class NotificationService:
                 </body>
             </html>
             """
+    
+    async def _send_emails(
+        self,
+        to_emails: List[Optional[str]],
+        subject: str,
+        message: str
+    ) -> List[bool]:
+        """Send one email per recipient over a single SMTP session."""
+        try:
+            html_body = self._email_html(message)
+            results = await self.email_service.send_individual_emails(
+                [
+                    {"to_email": to, "subject": subject, "html_content": html_body, "text_content": message}
+                    for to in to_emails
+                ],
+                priority=EmailPriority.URGENT,
+            )
+            logger.info(f"[notification.email] {sum(results)}/{len(results)} email(s) sent")
+            return results
+        except Exception as e:
+            logger.error(f"[notification.email] Error: {str(e)}")
+            return [False] * len(to_emails)
+    
+    async def _send_email(
+        self,
+        notification: AlertNotification,
+        to_email: str,
+        subject: str,
+        message: str
+    ) -> bool:
+        """Send email notification"""
+        try:
+            if not to_email:
+                logger.warning("[notification.email] No email provided")
+                return False
+            
+            html_body = self._email_html(message)
             
             success = await self.email_service.send_email(
                 to_emails=[to_email],
@@ -265,8 +382,9 @@ class NotificationService:
                 logger.warning("[notification.sms] No phone provided")
                 return False
             
-            # Use the SMSService
-            success = self.sms_service.send_sms(
+            # Twilio's client is blocking — keep it off the event loop
+            success = await asyncio.to_thread(
+                self.sms_service.send_sms,
                 to_phone=to_phone,
                 message=message
             )
@@ -320,8 +438,9 @@ class NotificationService:
                 "notification_id": str(notification.notification_id) if notification.notification_id else "",
             }
             
-            # Send via UnifiedNotificationService
-            result = self.push_service.send_to_user(
+            # FCM and the session lookup are blocking — run in a worker thread
+            result = await asyncio.to_thread(
+                self._push_blocking,
                 user_type=user_type,
                 user_id=user_id,
                 title=subject,
@@ -356,6 +475,17 @@ class NotificationService:
             logger.error(f"[notification.push] Unexpected error: {e}", exc_info=True)
             return False
     
+    def _push_blocking(self, **kwargs) -> Dict[str, Any]:
+        """
+        Worker-thread body for a push send.  Uses its own DB session because
+        SQLAlchemy sessions must not be shared across threads.
+        """
+        db = SessionLocal()
+        try:
+            return UnifiedNotificationService(db, self.session_cache).send_to_user(**kwargs)
+        finally:
+            db.close()
+    
     async def _send_voice_call(
         self,
         notification: AlertNotification,
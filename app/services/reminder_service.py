@@ -23,17 +23,24 @@ Query logic (single SQL join, no N+1):
 
 Vehicle / driver resolved lazily from route_management.assigned_vehicle_id /
 assigned_driver_id (plain Integer columns, no FK).
+
+Batching: rows are read in booking_id order, REMINDER_BATCH_SIZE at a time.
+Per chunk there is one claim UPDATE (... WHERE reminder_sent_at IS NULL
+RETURNING booking_id, committed before anything is sent) and one
+send_trip_reminders call (FCM send_each, 500 messages per request), instead
+of one push, one UPDATE and one COMMIT per booking.
 """
 
 from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 
-from sqlalchemy import text
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.core.logging_config import get_logger
 from app.database.session import SessionLocal
 from app.models.booking import Booking, BookingStatusEnum
@@ -117,6 +124,11 @@ class ReminderService:
         """
         Main entry point called by the scheduler every 5 minutes.
 
+        Due bookings are handled in chunks of ``settings.REMINDER_BATCH_SIZE``:
+        each chunk is claimed with one guarded UPDATE (see _claim), pushed with
+        one send_trip_reminders call, and only the claims of a chunk whose
+        send raised are released again for the next tick.
+
         Returns a summary dict for logging:
             {
                 "scanned": int,   # bookings that were candidates
@@ -125,44 +137,51 @@ class ReminderService:
                 "skipped": int,   # driver/vehicle info missing → still marked sent
             }
         """
-        candidates = self._find_candidates()
-
-        if not candidates:
-            logger.debug("[reminder_service] No reminders due this tick.")
-            return {"scanned": 0, "sent": 0, "failed": 0, "skipped": 0}
-
-        logger.info("[reminder_service] %d reminder(s) due this tick.", len(candidates))
+        scanned = sent = failed = skipped = 0
+        notification_svc = None
+
+        for chunk in self._candidate_chunks(settings.REMINDER_BATCH_SIZE):
+            scanned += len(chunk)
+            stamp = datetime.utcnow()
+            claimed = self._claim([c.booking_id for c in chunk], stamp)
+            # Anything not claimed was stamped by another worker since the scan.
+            chunk = [c for c in chunk if c.booking_id in claimed]
+            if not chunk:
+                continue
 
-        sent = failed = skipped = 0
-        notification_svc = UnifiedNotificationService(self.db)
+            if notification_svc is None:
+                notification_svc = UnifiedNotificationService(self.db)
 
-        for candidate in candidates:
             try:
-                result = notification_svc.send_trip_reminder(
-                    employee_id=candidate.employee_id,
-                    employee_phone=candidate.employee_phone,
-                    pickup_time_str=candidate.pickup_time_str,
-                    vehicle_plate=candidate.vehicle_plate,
-                    driver_name=candidate.driver_name,
-                    driver_phone=candidate.driver_phone,
-                    booking_id=candidate.booking_id,
-                    route_id=candidate.route_id,
-                    send_sms=candidate.send_sms,
+                results = notification_svc.send_trip_reminders([
+                    {
+                        "employee_id": c.employee_id,
+                        "employee_phone": c.employee_phone,
+                        "pickup_time_str": c.pickup_time_str,
+                        "vehicle_plate": c.vehicle_plate,
+                        "driver_name": c.driver_name,
+                        "driver_phone": c.driver_phone,
+                        "booking_id": c.booking_id,
+                        "route_id": c.route_id,
+                        "send_sms": c.send_sms,
+                    }
+                    for c in chunk
+                ])
+            except Exception as exc:
+                failed += len(chunk)
+                logger.error(
+                    "[reminder_service] Error sending %d reminder(s) booking_ids=%s..: %s",
+                    len(chunk), [c.booking_id for c in chunk[:10]], exc, exc_info=True,
                 )
+                # Don't keep them marked as sent — will retry on next tick.
+                self._release([c.booking_id for c in chunk], stamp)
+                continue
 
-                # Mark as sent regardless of push outcome so we don't spam.
-                # A push failure (e.g. no active FCM session) is still recorded.
-                self._mark_sent(candidate.booking_id)
-
+            # Claimed bookings stay marked regardless of push outcome so we
+            # don't spam; a push failure (e.g. no active FCM session) is recorded.
+            for candidate, result in zip(chunk, results):
                 if result.get("push_success"):
                     sent += 1
-                    logger.info(
-                        "[reminder_service] Reminder sent "
-                        "booking_id=%s employee_id=%s pickup=%s",
-                        candidate.booking_id,
-                        candidate.employee_id,
-                        candidate.pickup_time_str,
-                    )
                 else:
                     skipped += 1
                     logger.warning(
@@ -172,22 +191,15 @@ class ReminderService:
                         result.get("errors"),
                     )
 
-            except Exception as exc:
-                failed += 1
-                logger.error(
-                    "[reminder_service] Error processing booking_id=%s: %s",
-                    candidate.booking_id,
-                    exc,
-                    exc_info=True,
-                )
-                # Don't mark as sent — will retry on next tick.
-
-        logger.info(
-            "[reminder_service] Tick complete: scanned=%d sent=%d skipped=%d failed=%d",
-            len(candidates), sent, skipped, failed,
-        )
+        if not scanned:
+            logger.debug("[reminder_service] No reminders due this tick.")
+        else:
+            logger.info(
+                "[reminder_service] Tick complete: scanned=%d sent=%d skipped=%d failed=%d",
+                scanned, sent, skipped, failed,
+            )
         return {
-            "scanned": len(candidates),
+            "scanned": scanned,
             "sent": sent,
             "failed": failed,
             "skipped": skipped,
@@ -198,22 +210,36 @@ class ReminderService:
     # ------------------------------------------------------------------
 
     def _find_candidates(self) -> List[_ReminderCandidate]:
+        """Return all bookings that need a reminder right now."""
+        return [c for chunk in self._candidate_chunks(settings.REMINDER_BATCH_SIZE) for c in chunk]
+
+    def _candidate_chunks(self, chunk_size: int) -> Iterator[List[_ReminderCandidate]]:
         """
-        Return all bookings that need a reminder right now.
+        Yield the bookings that need a reminder right now, chunk by chunk.
 
-        Strategy:
-        1. One query to get all (booking, route_booking, route, employee, tenant_config)
-           rows where the reminder is due.
+        Strategy, per chunk of up to ``chunk_size`` eligible rows (keyset on
+        booking_id, so a chunk's claims never shift the next page):
+        1. One query to get the (booking, route_booking, route, employee,
+           tenant_config) rows where the reminder may be due.
         2. Batch-fetch vehicles and drivers by their IDs.
-        3. Assemble _ReminderCandidate objects.
+        3. Assemble _ReminderCandidate objects for the rows inside the window.
         """
         now = datetime.now(tz=timezone.utc).replace(tzinfo=None)  # naive UTC matches DB
-        today = now.date()
-
-        # ------------------------------------------------------------------
-        # Step 1: Find eligible (booking, route_booking, route, employee, config)
-        # ------------------------------------------------------------------
-        rows = (
+        after_booking_id = None
+
+        while True:
+            rows = self._eligible_rows(now.date(), after_booking_id, chunk_size)
+            if not rows:
+                return
+            after_booking_id = rows[-1][0].booking_id
+            candidates = self._build_candidates(rows, now)
+            if candidates:
+                yield candidates
+            if len(rows) < chunk_size:
+                return
+
+    def _eligible_rows(self, today, after_booking_id: Optional[int], limit: int) -> list:
+        query = (
             self.db.query(
                 Booking,
                 RouteManagementBooking,
@@ -247,15 +273,13 @@ class ReminderService:
                 RouteManagement.assigned_driver_id.isnot(None),
                 RouteManagement.assigned_vehicle_id.isnot(None),
             )
-            .all()
         )
+        if after_booking_id is not None:
+            query = query.filter(Booking.booking_id > after_booking_id)
+        return query.order_by(Booking.booking_id).limit(limit).all()
 
-        if not rows:
-            return []
-
-        # ------------------------------------------------------------------
-        # Step 2: Filter to only those inside the reminder window
-        # ------------------------------------------------------------------
+    def _build_candidates(self, rows: list, now: datetime) -> List[_ReminderCandidate]:
+        today = now.date()
         candidates: List[_ReminderCandidate] = []
 
         # Batch load vehicles and drivers referenced by the routes (avoid N+1)
@@ -348,18 +372,34 @@ class ReminderService:
         except ValueError:
             return None
 
-    def _mark_sent(self, booking_id: int) -> None:
-        """Stamp reminder_sent_at = now() on the booking row."""
-        (
-            self.db.query(Booking)
-            .filter(Booking.booking_id == booking_id)
-            .update(
-                {"reminder_sent_at": datetime.utcnow()},
-                synchronize_session=False,
-            )
+    def _claim(self, booking_ids: List[int], stamp: datetime) -> Set[int]:
+        """
+        Stamp reminder_sent_at on every booking of a chunk in one UPDATE.
+
+        The ``reminder_sent_at IS NULL`` guard is the idempotency check: a
+        booking already stamped (by an overlapping tick or another worker) is
+        not returned, so it is never sent twice.
+        """
+        claimed = set(self.db.execute(
+            update(Booking)
+            .where(Booking.booking_id.in_(booking_ids), Booking.reminder_sent_at.is_(None))
+            .values(reminder_sent_at=stamp)
+            .returning(Booking.booking_id),
+            execution_options={"synchronize_session": False},
+        ).scalars())
+        self.db.commit()
+        logger.debug("[reminder_service] Claimed %d/%d booking(s)", len(claimed), len(booking_ids))
+        return claimed
+
+    def _release(self, booking_ids: List[int], stamp: datetime) -> None:
+        """Undo this tick's claims on bookings whose send failed."""
+        self.db.execute(
+            update(Booking)
+            .where(Booking.booking_id.in_(booking_ids), Booking.reminder_sent_at == stamp)
+            .values(reminder_sent_at=None),
+            execution_options={"synchronize_session": False},
         )
         self.db.commit()
-        logger.debug("[reminder_service] Marked reminder_sent_at for booking_id=%s", booking_id)
 
 
 # ---------------------------------------------------------------------------
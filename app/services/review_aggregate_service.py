@@ -0,0 +1,325 @@
+"""
+app/services/review_aggregate_service.py
+-----------------------------------------
+Maintains the per-driver / per-vehicle review aggregates used by
+``GET /drivers/{id}/reviews`` and ``GET /vehicles/{id}/reviews``.
+
+Write path
+----------
+``record_review()`` / ``remove_review()`` run inside the caller's transaction
+right after the review row is flushed, so aggregates commit (or roll back)
+atomically with the review.  The aggregate row is locked with
+``SELECT … FOR UPDATE`` while its JSON tag map is merged.
+
+Read path
+---------
+``get_summary()`` reads one ``review_aggregates`` row plus at most 90
+``review_aggregate_daily`` rows — independent of the subject's history.
+``get_range_summary()`` answers a date-range summary from the daily buckets.
+
+Backfill
+--------
+There is no separate backfill job.  The first time a subject without an
+aggregate row is read or written, ``rebuild_subject()`` computes it from
+``ride_reviews`` once; from then on it is maintained incrementally.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.models.review import (
+    ReviewAggregate,
+    ReviewAggregateDaily,
+    ReviewSubjectTypeEnum,
+    RideReview,
+)
+
+logger = get_logger(__name__)
+
+# subject type → (subject column, rating column, tags column) on RideReview
+_DIMENSIONS = {
+    ReviewSubjectTypeEnum.DRIVER:  ("driver_id", "driver_rating", "driver_tags"),
+    ReviewSubjectTypeEnum.VEHICLE: ("vehicle_id", "vehicle_rating", "vehicle_tags"),
+}
+
+ROLLING_WINDOWS_DAYS = (30, 90)
+
+
+# ──────────────────────────────────────────────────────────────
+# Helpers
+# ──────────────────────────────────────────────────────────────
+
+def _merge_tags(current: Optional[dict], tags: Iterable[str], sign: int) -> dict:
+    """Return a new tag map with ``tags`` added (sign=1) or removed (sign=-1)."""
+    merged = dict(current or {})
+    for tag, n in Counter(tags or []).items():
+        value = merged.get(tag, 0) + sign * n
+        if value > 0:
+            merged[tag] = value
+        else:
+            merged.pop(tag, None)
+    return merged
+
+
+def _review_day(review: RideReview) -> date:
+    created = review.created_at or datetime.utcnow()
+    return created.date()
+
+
+def _average(total: int, count: int) -> Optional[float]:
+    return round(total / count, 2) if count else None
+
+
+def _locked_aggregate(db: Session, tenant_id: str, subject_type, subject_id: int) -> Optional[ReviewAggregate]:
+    return (
+        db.query(ReviewAggregate)
+        .filter(
+            ReviewAggregate.tenant_id == tenant_id,
+            ReviewAggregate.subject_type == subject_type,
+            ReviewAggregate.subject_id == subject_id,
+        )
+        .with_for_update()
+        .first()
+    )
+
+
+def _locked_bucket(db: Session, tenant_id: str, subject_type, subject_id: int, day: date) -> ReviewAggregateDaily:
+    bucket = (
+        db.query(ReviewAggregateDaily)
+        .filter(
+            ReviewAggregateDaily.tenant_id == tenant_id,
+            ReviewAggregateDaily.subject_type == subject_type,
+            ReviewAggregateDaily.subject_id == subject_id,
+            ReviewAggregateDaily.day == day,
+        )
+        .with_for_update()
+        .first()
+    )
+    if bucket is None:
+        bucket = ReviewAggregateDaily(
+            tenant_id=tenant_id, subject_type=subject_type, subject_id=subject_id,
+            day=day, rating_sum=0, rating_count=0, tag_counts={},
+        )
+        db.add(bucket)
+    return bucket
+
+
+# ──────────────────────────────────────────────────────────────
+# Rebuild from raw reviews
+# ──────────────────────────────────────────────────────────────
+
+def rebuild_subject(db: Session, tenant_id: str, subject_type, subject_id: int) -> ReviewAggregate:
+    """
+    Recompute one subject's aggregate and daily buckets from ``ride_reviews``.
+    Flushes but does not commit.
+    """
+    subject_type = ReviewSubjectTypeEnum(subject_type)
+    subject_col, rating_col, tags_col = _DIMENSIONS[subject_type]
+
+    reviews = (
+        db.query(RideReview)
+        .filter(
+            RideReview.tenant_id == tenant_id,
+            getattr(RideReview, subject_col) == subject_id,
+            getattr(RideReview, rating_col).isnot(None),
+            RideReview.is_active.is_(True),
+        )
+        .all()
+    )
+
+    totals = {"rating_sum": 0, "rating_count": 0, "overall_sum": 0, "overall_count": 0}
+    tags: Counter = Counter()
+    days: Dict[date, dict] = {}
+    for r in reviews:
+        rating = getattr(r, rating_col)
+        review_tags = getattr(r, tags_col) or []
+        totals["rating_sum"] += rating
+        totals["rating_count"] += 1
+        if r.overall_rating is not None:
+            totals["overall_sum"] += r.overall_rating
+            totals["overall_count"] += 1
+        tags.update(review_tags)
+
+        bucket = days.setdefault(_review_day(r), {"rating_sum": 0, "rating_count": 0, "tags": Counter()})
+        bucket["rating_sum"] += rating
+        bucket["rating_count"] += 1
+        bucket["tags"].update(review_tags)
+
+    db.query(ReviewAggregateDaily).filter(
+        ReviewAggregateDaily.tenant_id == tenant_id,
+        ReviewAggregateDaily.subject_type == subject_type,
+        ReviewAggregateDaily.subject_id == subject_id,
+    ).delete(synchronize_session=False)
+    db.bulk_insert_mappings(ReviewAggregateDaily, [
+        {
+            "tenant_id": tenant_id,
+            "subject_type": subject_type,
+            "subject_id": subject_id,
+            "day": day,
+            "rating_sum": b["rating_sum"],
+            "rating_count": b["rating_count"],
+            "tag_counts": dict(b["tags"]),
+        }
+        for day, b in days.items()
+    ])
+
+    agg = _locked_aggregate(db, tenant_id, subject_type, subject_id)
+    if agg is None:
+        agg = ReviewAggregate(tenant_id=tenant_id, subject_type=subject_type, subject_id=subject_id)
+        try:
+            with db.begin_nested():
+                db.add(agg)
+                for field, value in totals.items():
+                    setattr(agg, field, value)
+                agg.tag_counts = dict(tags)
+        except IntegrityError:
+            # Another transaction created it first — take theirs and overwrite.
+            agg = _locked_aggregate(db, tenant_id, subject_type, subject_id)
+    for field, value in totals.items():
+        setattr(agg, field, value)
+    agg.tag_counts = dict(tags)
+    db.flush()
+
+    logger.info(
+        "[review_aggregate] Rebuilt %s=%s tenant=%s reviews=%d",
+        subject_type.value, subject_id, tenant_id, len(reviews),
+    )
+    return agg
+
+
+# ──────────────────────────────────────────────────────────────
+# Incremental maintenance
+# ──────────────────────────────────────────────────────────────
+
+def _apply(db: Session, review: RideReview, sign: int) -> None:
+    for subject_type, (subject_col, rating_col, tags_col) in _DIMENSIONS.items():
+        subject_id = getattr(review, subject_col)
+        rating = getattr(review, rating_col)
+        if subject_id is None or rating is None:
+            continue
+
+        agg = _locked_aggregate(db, review.tenant_id, subject_type, subject_id)
+        if agg is None:
+            # First touch: the rebuild already reflects this review's state.
+            rebuild_subject(db, review.tenant_id, subject_type, subject_id)
+            continue
+
+        tags = getattr(review, tags_col) or []
+        agg.rating_sum += sign * rating
+        agg.rating_count += sign
+        if review.overall_rating is not None:
+            agg.overall_sum += sign * review.overall_rating
+            agg.overall_count += sign
+        agg.tag_counts = _merge_tags(agg.tag_counts, tags, sign)
+
+        bucket = _locked_bucket(db, review.tenant_id, subject_type, subject_id, _review_day(review))
+        bucket.rating_sum = (bucket.rating_sum or 0) + sign * rating
+        bucket.rating_count = (bucket.rating_count or 0) + sign
+        bucket.tag_counts = _merge_tags(bucket.tag_counts, tags, sign)
+    db.flush()
+
+
+def record_review(db: Session, review: RideReview) -> None:
+    """Fold a newly flushed review into its driver / vehicle aggregates."""
+    _apply(db, review, +1)
+
+
+def remove_review(db: Session, review: RideReview) -> None:
+    """
+    Take a review back out of its aggregates.  Call *after* setting
+    ``is_active = False`` and flushing, so a first-touch rebuild excludes it.
+    """
+    _apply(db, review, -1)
+
+
+# ──────────────────────────────────────────────────────────────
+# Reads
+# ──────────────────────────────────────────────────────────────
+
+def _bucket_rows(db: Session, tenant_id: str, subject_type, subject_id: int,
+                 start: Optional[date] = None, end: Optional[date] = None) -> List[ReviewAggregateDaily]:
+    q = db.query(ReviewAggregateDaily).filter(
+        ReviewAggregateDaily.tenant_id == tenant_id,
+        ReviewAggregateDaily.subject_type == subject_type,
+        ReviewAggregateDaily.subject_id == subject_id,
+    )
+    if start:
+        q = q.filter(ReviewAggregateDaily.day >= start)
+    if end:
+        q = q.filter(ReviewAggregateDaily.day <= end)
+    return q.all()
+
+
+def _sum_buckets(buckets: Iterable[ReviewAggregateDaily], with_tags: bool = True) -> dict:
+    rating_sum = rating_count = 0
+    tags: Counter = Counter()
+    for b in buckets:
+        rating_sum += b.rating_sum
+        rating_count += b.rating_count
+        if with_tags:
+            tags.update(b.tag_counts or {})
+    out = {"total_reviews": rating_count, "average_rating": _average(rating_sum, rating_count)}
+    if with_tags:
+        out["tag_counts"] = {t: n for t, n in tags.items() if n > 0}
+    return out
+
+
+def _ensure_aggregate(db: Session, tenant_id: str, subject_type, subject_id: int) -> ReviewAggregate:
+    agg = (
+        db.query(ReviewAggregate)
+        .filter(
+            ReviewAggregate.tenant_id == tenant_id,
+            ReviewAggregate.subject_type == subject_type,
+            ReviewAggregate.subject_id == subject_id,
+        )
+        .first()
+    )
+    if agg is None:
+        agg = rebuild_subject(db, tenant_id, subject_type, subject_id)
+        db.commit()
+    return agg
+
+
+def get_summary(db: Session, tenant_id: str, subject_type, subject_id: int,
+                today: Optional[date] = None) -> dict:
+    """
+    All-time summary plus rolling windows for one driver / vehicle::
+
+        {"total_reviews", "average_rating", "average_overall_rating",
+         "tag_counts", "last_30_days": {...}, "last_90_days": {...}}
+    """
+    subject_type = ReviewSubjectTypeEnum(subject_type)
+    agg = _ensure_aggregate(db, tenant_id, subject_type, subject_id)
+
+    today = today or date.today()
+    longest = max(ROLLING_WINDOWS_DAYS)
+    buckets = _bucket_rows(db, tenant_id, subject_type, subject_id,
+                           start=today - timedelta(days=longest - 1))
+
+    summary = {
+        "total_reviews": agg.rating_count,
+        "average_rating": _average(agg.rating_sum, agg.rating_count),
+        "average_overall_rating": _average(agg.overall_sum, agg.overall_count),
+        "tag_counts": dict(agg.tag_counts or {}),
+    }
+    for days in ROLLING_WINDOWS_DAYS:
+        since = today - timedelta(days=days - 1)
+        summary[f"last_{days}_days"] = _sum_buckets(
+            (b for b in buckets if b.day >= since), with_tags=False,
+        )
+    return summary
+
+
+def get_range_summary(db: Session, tenant_id: str, subject_type, subject_id: int,
+                      start_date: Optional[date], end_date: Optional[date]) -> dict:
+    """Summary restricted to reviews created between two dates (inclusive)."""
+    subject_type = ReviewSubjectTypeEnum(subject_type)
+    _ensure_aggregate(db, tenant_id, subject_type, subject_id)
+    return _sum_buckets(_bucket_rows(db, tenant_id, subject_type, subject_id, start_date, end_date))
@@ -0,0 +1,155 @@
+"""
+Route views — batched lookup of everything a route listing shows.
+
+Route listings used to resolve the vehicle (and its type), driver, vendor
+and shift of each route with their own queries, so a page of N routes cost
+about 4N round trips.  ``load_route_refs`` collects the referenced ids of a
+whole page and loads each entity type with one ``IN`` query (the vehicle
+type is joined onto the vehicle query), returning plain dicts keyed by id.
+Serializers then read from those maps and issue no queries of their own.
+
+    refs = load_route_refs(db, routes)
+    views = [serialize_employee_route(r, refs) for r in routes]
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.driver import Driver
+from app.models.escort import Escort
+from app.models.route_management import RouteManagement
+from app.models.shift import Shift
+from app.models.vehicle import Vehicle
+from app.models.vehicle_type import VehicleType
+from app.models.vendor import Vendor
+
+
+@dataclass
+class RouteRefs:
+    """Entities referenced by a page of routes, as dicts keyed by id."""
+    vehicles: Dict[int, dict] = field(default_factory=dict)
+    drivers: Dict[int, dict] = field(default_factory=dict)
+    vendors: Dict[int, dict] = field(default_factory=dict)
+    escorts: Dict[int, dict] = field(default_factory=dict)
+    shifts: Dict[int, dict] = field(default_factory=dict)
+
+
+def _enum_value(value):
+    return value.value if hasattr(value, "value") else value
+
+
+def load_route_refs(
+    db: Session,
+    routes: Iterable[RouteManagement],
+    shift_ids: Iterable[int] = (),
+    tenant_id: Optional[str] = None,
+) -> RouteRefs:
+    """
+    Load the vehicles, drivers, vendors, escorts and shifts of ``routes``.
+
+    At most one query per entity type, whatever the number of routes.
+    ``shift_ids`` adds shifts needed beyond the routes' own (e.g. the shifts
+    of unrouted bookings on the same page); ``tenant_id`` restricts shifts
+    to that tenant.
+    """
+    routes = list(routes)
+    vehicle_ids = {r.assigned_vehicle_id for r in routes if r.assigned_vehicle_id}
+    driver_ids = {r.assigned_driver_id for r in routes if r.assigned_driver_id}
+    vendor_ids = {r.assigned_vendor_id for r in routes if r.assigned_vendor_id}
+    escort_ids = {r.assigned_escort_id for r in routes if r.assigned_escort_id}
+    all_shift_ids = {r.shift_id for r in routes if r.shift_id} | {s for s in shift_ids if s}
+
+    refs = RouteRefs()
+
+    if vehicle_ids:
+        rows = (
+            db.query(Vehicle.vehicle_id, Vehicle.rc_number, VehicleType.name, VehicleType.seats)
+            .outerjoin(VehicleType, VehicleType.vehicle_type_id == Vehicle.vehicle_type_id)
+            .filter(Vehicle.vehicle_id.in_(vehicle_ids))
+            .all()
+        )
+        refs.vehicles = {
+            vehicle_id: {"vehicle_id": vehicle_id, "rc_number": rc_number, "vehicle_type": type_name, "seats": seats}
+            for vehicle_id, rc_number, type_name, seats in rows
+        }
+
+    if driver_ids:
+        rows = (
+            db.query(Driver.driver_id, Driver.name, Driver.phone, Driver.license_number)
+            .filter(Driver.driver_id.in_(driver_ids))
+            .all()
+        )
+        refs.drivers = {row.driver_id: row._asdict() for row in rows}
+
+    if vendor_ids:
+        rows = (
+            db.query(Vendor.vendor_id, Vendor.name, Vendor.vendor_code)
+            .filter(Vendor.vendor_id.in_(vendor_ids))
+            .all()
+        )
+        refs.vendors = {row.vendor_id: row._asdict() for row in rows}
+
+    if escort_ids:
+        rows = (
+            db.query(Escort.escort_id, Escort.name, Escort.phone)
+            .filter(Escort.escort_id.in_(escort_ids))
+            .all()
+        )
+        refs.escorts = {row.escort_id: row._asdict() for row in rows}
+
+    if all_shift_ids:
+        query = db.query(Shift.shift_id, Shift.shift_time, Shift.log_type).filter(Shift.shift_id.in_(all_shift_ids))
+        if tenant_id is not None:
+            query = query.filter(Shift.tenant_id == tenant_id)
+        refs.shifts = {
+            shift_id: {
+                "shift_id": shift_id,
+                "shift_time": shift_time.strftime("%H:%M:%S") if shift_time else None,
+                "log_type": _enum_value(log_type),
+            }
+            for shift_id, shift_time, log_type in query.all()
+        }
+
+    return refs
+
+
+def serialize_employee_route(route: RouteManagement, refs: RouteRefs) -> dict:
+    """Route details as shown in the employee app's booking list."""
+    vehicle = refs.vehicles.get(route.assigned_vehicle_id)
+    driver = refs.drivers.get(route.assigned_driver_id)
+    vendor = refs.vendors.get(route.assigned_vendor_id)
+    shift = refs.shifts.get(route.shift_id)
+
+    return {
+        "route_id": route.route_id,
+        "route_code": route.route_code,
+        "status": route.status.value,
+        "shift_details": shift and {
+            "shift_id": shift["shift_id"],
+            "shift_time": shift["shift_time"],
+            "log_type": shift["log_type"],
+        },
+        "vehicle_details": vehicle and {
+            "vehicle_id": vehicle["vehicle_id"],
+            "vehicle_number": vehicle["rc_number"],
+            "vehicle_type": vehicle["vehicle_type"],
+            "capacity": vehicle["seats"],
+        },
+        "driver_details": driver and {
+            "driver_id": driver["driver_id"],
+            "driver_name": driver["name"],
+            "driver_phone": driver["phone"],
+            "license_number": driver["license_number"],
+        },
+        "vendor_details": vendor and {
+            "vendor_id": vendor["vendor_id"],
+            "vendor_name": vendor["name"],
+            "vendor_code": vendor["vendor_code"],
+        },
+        "escort_required": route.escort_required,
+        "estimated_total_time": route.estimated_total_time,
+        "estimated_total_distance": route.estimated_total_distance,
+        "actual_total_time": route.actual_total_time,
+        "actual_total_distance": route.actual_total_distance,
+    }
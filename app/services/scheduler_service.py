@@ -5,14 +5,25 @@ Wraps APScheduler's BackgroundScheduler to run periodic background jobs.
 
 Current jobs
 ------------
-- reminder_job  : fires every 5 minutes → run_reminder_job()
+- reminder_job      : fires every 5 minutes → run_reminder_job()          (leader only)
+- stale_driver_job  : fires every 2 minutes → run_stale_driver_check_job() (sharded by tenant)
+- coordination_job  : fires every lease / 3 → coordinator.tick()          (every worker)
+
+Cluster coordination
+--------------------
+Every Uvicorn/Gunicorn worker runs its own scheduler.  A coordinator
+(app/services/job_coordination.py) makes each job run once per cluster:
+leader-only jobs are skipped unless this worker holds the Redis leader
+lease, and sharded jobs only handle the tenants this worker owns.  Without
+Redis the local coordinator runs everything (single-worker deployments).
 
 Lifecycle
 ---------
 Call SchedulerService.start() inside the FastAPI lifespan startup block and
 SchedulerService.stop() inside the shutdown block.  Both methods are
 idempotent: calling start() on an already-running scheduler is a no-op,
-calling stop() on an already-stopped scheduler is a no-op.
+calling stop() on an already-stopped scheduler is a no-op.  stop() also
+releases the leader lease so another worker takes over immediately.
 
 Thread safety
 -------------
@@ -25,10 +36,14 @@ We still call shutdown() explicitly to allow in-flight jobs to complete
 
 from __future__ import annotations
 
+from functools import wraps
+from typing import Callable
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.logging_config import get_logger
+from app.services.job_coordination import default_coordinator
 from app.services.reminder_service import run_reminder_job
 from app.services.stale_driver_service import run_stale_driver_check_job
 
@@ -53,7 +68,8 @@ class SchedulerService:
         scheduler.stop()    # called in FastAPI lifespan shutdown
     """
 
-    def __init__(self) -> None:
+    def __init__(self, coordinator=None) -> None:
+        self.coordinator = coordinator or default_coordinator()
         self._scheduler = BackgroundScheduler(
             job_defaults={
                 # Prevent job pile-up: if the previous run is still going
@@ -82,10 +98,12 @@ class SchedulerService:
             return
 
         self._register_jobs()
+        self.coordinator.tick()
         self._scheduler.start()
         self._running = True
         logger.info(
-            "[scheduler_service] Started. reminder_job interval=%ds, stale_driver_job interval=%ds",
+            "[scheduler_service] Started as %s. reminder_job interval=%ds, stale_driver_job interval=%ds",
+            self.coordinator.worker_id,
             _REMINDER_INTERVAL_SECONDS,
             _STALE_DRIVER_INTERVAL_SECONDS,
         )
@@ -109,15 +127,44 @@ class SchedulerService:
             logger.info("[scheduler_service] Stopped (wait=%s).", wait)
         except Exception as exc:
             logger.error("[scheduler_service] Error during shutdown: %s", exc, exc_info=True)
+        self.coordinator.release()
 
     # ------------------------------------------------------------------
     # Job registration
     # ------------------------------------------------------------------
 
+    def leader_only(self, job_id: str, func: Callable[[], None]) -> Callable[[], None]:
+        """Wrap *func* so it only runs on the cluster's scheduler leader."""
+        @wraps(func)
+        def run() -> None:
+            if not self.coordinator.is_leader():
+                logger.debug("[scheduler_service] %s skipped — not the leader.", job_id)
+                return
+            func()
+        return run
+
+    def sharded(self, func: Callable[..., None]) -> Callable[[], None]:
+        """Wrap *func* so it runs everywhere, handling only this worker's keys (``owns=``)."""
+        @wraps(func)
+        def run() -> None:
+            func(owns=self.coordinator.owns if self.coordinator.distributed else None)
+        return run
+
     def _register_jobs(self) -> None:
         """Add all recurring jobs to the scheduler."""
+        if self.coordinator.distributed:
+            interval = max(1, self.coordinator.lease_seconds // 3)
+            self._scheduler.add_job(
+                func=self.coordinator.tick,
+                trigger=IntervalTrigger(seconds=interval, timezone="UTC"),
+                id="coordination_job",
+                name="Scheduler Leader Lease / Shard Heartbeat",
+                replace_existing=True,
+            )
+            logger.debug("[scheduler_service] Registered coordination_job (every %ds).", interval)
+
         self._scheduler.add_job(
-            func=run_reminder_job,
+            func=self.leader_only("reminder_job", run_reminder_job),
             trigger=IntervalTrigger(seconds=_REMINDER_INTERVAL_SECONDS, timezone="UTC"),
             id="reminder_job",
             name="Schedule Reminder Notifications",
@@ -129,7 +176,7 @@ class SchedulerService:
         )
 
         self._scheduler.add_job(
-            func=run_stale_driver_check_job,
+            func=self.sharded(run_stale_driver_check_job),
             trigger=IntervalTrigger(seconds=_STALE_DRIVER_INTERVAL_SECONDS, timezone="UTC"),
             id="stale_driver_job",
             name="Stale Driver Location Alerting",
@@ -8,12 +8,27 @@ device reports a speed value**.
 
 Logic
 -----
+Violations are detected as *episodes* — one continuous overspeed stretch
+per route — rather than one row per over-limit ping.
+
 1. Resolve the effective speed limit for the vehicle+tenant
-   (vehicle override → tenant config → 60 km/h fallback).
-2. If the reported speed does not exceed the limit → return immediately.
-3. Insert a SpeedViolation row.
-4. Push FCM to all active admin sessions for the tenant so the ops team
-   is alerted in real-time.
+   (vehicle override → tenant config → 60 km/h fallback).  Limits are cached
+   in-process for ``_LIMIT_CACHE_TTL_SECONDS`` so pings do not hit the DB.
+2. Over the limit, no open episode → insert one SpeedViolation row, push
+   FCM to the tenant's active admins, and open the episode state.
+3. Over the limit, episode open → fold the ping into the episode state
+   (peak, running average, end position).  No DB write, no alert.
+4. Under the limit → the episode closes once no over-limit ping has been
+   seen for ``_CLOSE_AFTER_SECONDS`` (hysteresis, so a driver hovering
+   around the limit does not open a new episode every few seconds).  The
+   row is then updated once with peak / average / duration / end position.
+5. Duty end closes any episode still open for the route.
+
+Episode state
+-------------
+Kept in Redis (``speed_episode:{route_id}``) when ``settings.USE_REDIS`` is
+enabled so that pings for one route landing on different workers share
+the same episode; otherwise in a process-local dict.
 
 Design decisions
 ----------------
@@ -28,11 +43,14 @@ Design decisions
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models.speed_violation import SpeedViolation
 from app.models.tenant_config import TenantConfig
 from app.models.vehicle import Vehicle
@@ -40,6 +58,21 @@ from app.models.user_session import UserSession
 
 logger = logging.getLogger(__name__)
 
+# An episode closes after this many seconds without an over-limit ping.
+_CLOSE_AFTER_SECONDS: int = 30
+
+# Open-episode state expires if the route stops pinging altogether.
+_EPISODE_STATE_TTL_SECONDS: int = 6 * 3600
+
+# Resolved speed limits: (tenant_id, vehicle_id) → km/h
+_LIMIT_CACHE_TTL_SECONDS: int = 300
+_limit_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_LIMIT_CACHE_TTL_SECONDS)
+_limit_cache_lock = threading.Lock()
+
+# Fallback episode store when Redis is disabled: route_id → state
+_local_episodes: Dict[int, dict] = {}
+_local_episodes_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Public entry point
@@ -57,8 +90,9 @@ def detect_and_record_speed_violation(
     recorded_at: datetime,
 ) -> None:
     """
-    Check whether *speed_kmph* exceeds the effective limit; if so, insert a
-    SpeedViolation row and push FCM alerts to all active tenant admins.
+    Feed one speed sample into the route's overspeed episode detector.
+    Opening an episode inserts a SpeedViolation row and alerts tenant admins;
+    closing it updates that row with the episode aggregates.
 
     All exceptions are caught and logged — never re-raised.
     """
@@ -111,6 +145,62 @@ def _get_speed_limit(db: Session, tenant_id: str, vehicle_id: Optional[int]) ->
     return float(tenant_limit) if tenant_limit is not None else 60.0
 
 
+def _get_speed_limit_cached(db: Session, tenant_id: str, vehicle_id: Optional[int]) -> float:
+    """``_get_speed_limit`` behind a short-lived in-process cache."""
+    key = (tenant_id, vehicle_id)
+    with _limit_cache_lock:
+        cached = _limit_cache.get(key)
+    if cached is not None:
+        return cached
+    limit = _get_speed_limit(db, tenant_id, vehicle_id)
+    with _limit_cache_lock:
+        _limit_cache[key] = limit
+    return limit
+
+
+# ---------------------------------------------------------------------------
+# Episode state store
+# ---------------------------------------------------------------------------
+
+def _episode_key(route_id: int) -> str:
+    return f"speed_episode:{route_id}"
+
+
+def _load_episode(route_id: int) -> Optional[dict]:
+    if settings.USE_REDIS:
+        from app.utils.cache_manager import cache
+        return cache.get(_episode_key(route_id))
+    with _local_episodes_lock:
+        state = _local_episodes.get(route_id)
+        return dict(state) if state else None
+
+
+def _save_episode(route_id: int, state: dict) -> None:
+    if settings.USE_REDIS:
+        from app.utils.cache_manager import cache
+        cache.set(_episode_key(route_id), state, _EPISODE_STATE_TTL_SECONDS)
+        return
+    with _local_episodes_lock:
+        _local_episodes[route_id] = dict(state)
+
+
+def _drop_episode(route_id: int) -> None:
+    if settings.USE_REDIS:
+        from app.utils.cache_manager import cache
+        cache.delete(_episode_key(route_id))
+        return
+    with _local_episodes_lock:
+        _local_episodes.pop(route_id, None)
+
+
+def _as_aware(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Episode detection
+# ---------------------------------------------------------------------------
+
 def _run_violation_check(
     db: Session,
     tenant_id: str,
@@ -122,21 +212,40 @@ def _run_violation_check(
     longitude: float,
     recorded_at: datetime,
 ) -> None:
-    limit = _get_speed_limit(db, tenant_id, vehicle_id)
+    limit = _get_speed_limit_cached(db, tenant_id, vehicle_id)
+    episode = _load_episode(route_id)
+    recorded_at = _as_aware(recorded_at)
 
     if speed_kmph <= limit:
-        logger.debug(
-            "[speed_violation] route=%s driver=%s speed=%.1f <= limit=%.1f — no violation",
-            route_id, driver_id, speed_kmph, limit,
-        )
+        if episode is None:
+            logger.debug(
+                "[speed_violation] route=%s driver=%s speed=%.1f <= limit=%.1f — no violation",
+                route_id, driver_id, speed_kmph, limit,
+            )
+            return
+
+        last_over = datetime.fromisoformat(episode["last_over_at"])
+        if (recorded_at - last_over).total_seconds() >= _CLOSE_AFTER_SECONDS:
+            _close_episode(db, route_id, episode)
+        return
+
+    if episode is not None:
+        # --- Fold the ping into the open episode (state only, no DB write) ---
+        episode["peak_speed"] = max(episode["peak_speed"], speed_kmph)
+        episode["speed_sum"] += speed_kmph
+        episode["ping_count"] += 1
+        episode["last_over_at"] = recorded_at.isoformat()
+        episode["end_latitude"] = latitude
+        episode["end_longitude"] = longitude
+        _save_episode(route_id, episode)
         return
 
     logger.info(
-        "[speed_violation] route=%s driver=%s speed=%.1f > limit=%.1f — recording violation",
+        "[speed_violation] route=%s driver=%s speed=%.1f > limit=%.1f — opening episode",
         route_id, driver_id, speed_kmph, limit,
     )
 
-    # --- Persist violation ---
+    # --- Persist the episode row (aggregates are filled in on close) ---
     violation = SpeedViolation(
         tenant_id      = tenant_id,
         route_id       = route_id,
@@ -147,16 +256,24 @@ def _run_violation_check(
         latitude       = latitude,
         longitude      = longitude,
         recorded_at    = recorded_at,
+        avg_speed      = speed_kmph,
+        ping_count     = 1,
     )
     db.add(violation)
     db.commit()
 
-    logger.debug(
-        "[speed_violation] Inserted violation for route=%s overspeed_by=%.1f",
-        route_id, speed_kmph - limit,
-    )
-
-    # --- Notify admins via FCM ---
+    _save_episode(route_id, {
+        "violation_id":  violation.violation_id,
+        "started_at":    recorded_at.isoformat(),
+        "last_over_at":  recorded_at.isoformat(),
+        "peak_speed":    speed_kmph,
+        "speed_sum":     speed_kmph,
+        "ping_count":    1,
+        "end_latitude":  latitude,
+        "end_longitude": longitude,
+    })
+
+    # --- Notify admins via FCM (once per episode) ---
     _notify_admins(
         db=db,
         tenant_id=tenant_id,
@@ -167,6 +284,49 @@ def _run_violation_check(
     )
 
 
+def _close_episode(db: Session, route_id: int, episode: dict) -> None:
+    """Write the episode aggregates onto its row and drop the state."""
+    started_at = datetime.fromisoformat(episode["started_at"])
+    ended_at = datetime.fromisoformat(episode["last_over_at"])
+    ping_count = episode["ping_count"]
+
+    db.query(SpeedViolation).filter(
+        SpeedViolation.violation_id == episode["violation_id"]
+    ).update(
+        {
+            SpeedViolation.speed_recorded:   episode["peak_speed"],
+            SpeedViolation.avg_speed:        round(episode["speed_sum"] / ping_count, 2),
+            SpeedViolation.ping_count:       ping_count,
+            SpeedViolation.ended_at:         ended_at,
+            SpeedViolation.duration_seconds: int((ended_at - started_at).total_seconds()),
+            SpeedViolation.end_latitude:     episode["end_latitude"],
+            SpeedViolation.end_longitude:    episode["end_longitude"],
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+    _drop_episode(route_id)
+
+    logger.info(
+        "[speed_violation] Closed episode violation=%s route=%s peak=%.1f pings=%d",
+        episode["violation_id"], route_id, episode["peak_speed"], ping_count,
+    )
+
+
+def close_speed_episode(db: Session, route_id: int) -> None:
+    """
+    Close any episode still open for *route_id* (called on duty end).
+
+    All exceptions are caught and logged — never re-raised.
+    """
+    try:
+        episode = _load_episode(route_id)
+        if episode is not None:
+            _close_episode(db, route_id, episode)
+    except Exception:
+        logger.exception("[speed_violation] Failed to close episode for route=%s", route_id)
+
+
 def _notify_admins(
     db: Session,
     tenant_id: str,
@@ -12,8 +12,27 @@ a GPS ping within the past `stale_driver_threshold_minutes` (default 5 min).
 When a stale route is detected, an FCM alert is dispatched to all active
 admins for that tenant.
 
-Deduplication
--------------
+Heartbeats (``settings.USE_REDIS``)
+-----------------------------------
+Duty start and every location ping stamp the route in one sorted set shared
+by all workers::
+
+    driver_heartbeat:last_seen         ZSET    member = "tenant_id:route_id",
+                                               score  = last ping epoch
+    driver_heartbeat:alerted:<route>   STRING  SET NX EX cooldown — alert claim
+
+Duty end removes the member.  The check is then one ZRANGEBYSCORE for the
+routes silent for at least a minute; the database is only read for the
+tenant thresholds and the ONGOING state of those candidates (a member whose
+route ended without a duty-end call is dropped there).  Before alerting, a
+worker claims the route with SET NX EX, so every route is alerted at most
+once per cooldown across the whole cluster.
+
+Without Redis the job falls back to scanning ONGOING routes and their latest
+driver_location_history ping.
+
+Deduplication (without Redis)
+-----------------------------
 A module-level dict ``_last_alert_at`` keyed by route_id holds the last time
 an alert was sent for that route.  A new alert is suppressed if the previous
 one was sent within the last 10 minutes.  The dict is reset on process restart
@@ -24,17 +43,26 @@ Session ownership
 The job creates its own ``SessionLocal()`` instance so the scheduler thread
 owns the connection — it is not shared with any request-handler session.
 The session is always closed in a ``finally`` block.
+
+Sharding
+--------
+With several workers SchedulerService passes ``owns`` (see
+app/services/job_coordination.py): each worker checks only the tenants it
+owns, so the per-tenant scans are spread across the cluster and every
+route is alerted by exactly one worker.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.core.logging_config import get_logger
 from app.database.session import SessionLocal
 from app.models.driver_location_history import DriverLocationHistory
@@ -56,19 +84,97 @@ _ALERT_COOLDOWN_MINUTES: int = 10
 # Default staleness threshold when TenantConfig row is missing.
 _DEFAULT_THRESHOLD_MINUTES: int = 5
 
+# Smallest threshold a tenant can configure — the heartbeat range query
+# only returns routes silent for at least this long.
+_MIN_THRESHOLD_MINUTES: int = 1
+
+_HEARTBEAT_KEY = "driver_heartbeat:last_seen"
+_ALERTED_KEY = "driver_heartbeat:alerted:{route_id}"
+
+
+# ---------------------------------------------------------------------------
+# Heartbeats — written on duty start / location ping, removed on duty end
+# ---------------------------------------------------------------------------
+
+def _get_client(client=None):
+    """Return the shared Redis client, or None when Redis is disabled."""
+    if client is not None:
+        return client
+    if not settings.USE_REDIS:
+        return None
+    from app.utils.cache_manager import cache
+    return cache.redis_client
+
+
+def _member(tenant_id: str, route_id: int) -> str:
+    return f"{tenant_id}:{route_id}"
+
+
+def record_heartbeat(tenant_id: str, route_id: int, at: Optional[float] = None, client=None) -> bool:
+    """
+    Stamp *route_id* as seen at epoch *at* (default now).  Returns False when
+    Redis is disabled or the write failed — a ping never fails on this.
+    """
+    r = _get_client(client)
+    if r is None:
+        return False
+    try:
+        r.zadd(_HEARTBEAT_KEY, {_member(tenant_id, route_id): time.time() if at is None else at})
+        return True
+    except Exception as exc:
+        logger.warning("[stale_driver] Heartbeat write failed route=%s: %s", route_id, exc)
+        return False
+
+
+def forget_heartbeat(tenant_id: str, route_id: int, client=None) -> bool:
+    """Stop tracking *route_id* (duty ended) and drop its alert claim."""
+    r = _get_client(client)
+    if r is None:
+        return False
+    try:
+        pipe = r.pipeline(transaction=False)
+        pipe.zrem(_HEARTBEAT_KEY, _member(tenant_id, route_id))
+        pipe.delete(_ALERTED_KEY.format(route_id=route_id))
+        pipe.execute()
+        return True
+    except Exception as exc:
+        logger.warning("[stale_driver] Heartbeat removal failed route=%s: %s", route_id, exc)
+        return False
+
+
+def silent_routes(r, now: float, min_silence_seconds: float) -> List[Tuple[str, int, float]]:
+    """(tenant_id, route_id, last_seen) of every route silent for ``min_silence_seconds``."""
+    rows = r.zrangebyscore(_HEARTBEAT_KEY, "-inf", now - min_silence_seconds, withscores=True)
+    silent = []
+    for member, last_seen in rows:
+        tenant_id, _, route_id = member.rpartition(":")
+        silent.append((tenant_id, int(route_id), last_seen))
+    return silent
+
+
+def claim_alerts(r, route_ids: List[int], cooldown_seconds: int) -> List[int]:
+    """Route ids this worker may alert now — one SET NX EX each, one round trip."""
+    if not route_ids:
+        return []
+    pipe = r.pipeline(transaction=False)
+    for route_id in route_ids:
+        pipe.set(_ALERTED_KEY.format(route_id=route_id), "1", nx=True, ex=cooldown_seconds)
+    return [route_id for route_id, won in zip(route_ids, pipe.execute()) if won]
+
 
 # ---------------------------------------------------------------------------
 # Module-level runner — used by SchedulerService
 # ---------------------------------------------------------------------------
 
-def run_stale_driver_check_job() -> None:
+def run_stale_driver_check_job(owns: Optional[Callable[[str], bool]] = None) -> None:
     """
     Called by APScheduler every 2 minutes.
     Creates its own DB session so the scheduler thread owns the connection.
+    ``owns(tenant_id)`` limits the check to this worker's tenants (all if None).
     """
     db: Session = SessionLocal()
     try:
-        _run_check(db)
+        _run_check(db, owns)
     except Exception:
         logger.exception("[stale_driver_job] Unhandled error")
     finally:
@@ -79,15 +185,89 @@ def run_stale_driver_check_job() -> None:
 # Internal logic
 # ---------------------------------------------------------------------------
 
-def _run_check(db: Session) -> None:
+def _run_check(db: Session, owns: Optional[Callable[[str], bool]] = None, client=None) -> None:
+    r = _get_client(client)
+    if r is not None:
+        _run_heartbeat_check(db, r, owns)
+        return
+    _run_db_check(db, owns)
+
+
+def _run_heartbeat_check(db: Session, r, owns: Optional[Callable[[str], bool]] = None) -> None:
     now_utc = datetime.now(timezone.utc)
+    now = now_utc.timestamp()
+
+    # ── Step 1: One range query for the routes gone quiet ─────────────────
+    candidates = [
+        (tenant_id, route_id, last_seen)
+        for tenant_id, route_id, last_seen in silent_routes(r, now, _MIN_THRESHOLD_MINUTES * 60)
+        if owns is None or owns(tenant_id)
+    ]
+    if not candidates:
+        logger.debug("[stale_driver] No silent heartbeats this tick.")
+        return
 
-    # ── Step 1: Find all ONGOING routes grouped by tenant ─────────────────
-    ongoing_routes = (
+    # ── Step 2: Apply each tenant's threshold ─────────────────────────────
+    tenant_ids = list({tenant_id for tenant_id, _, _ in candidates})
+    threshold_map: Dict[str, int] = {
+        c.tenant_id: (c.stale_driver_threshold_minutes or _DEFAULT_THRESHOLD_MINUTES)
+        for c in db.query(TenantConfig).filter(TenantConfig.tenant_id.in_(tenant_ids)).all()
+    }
+    overdue: Dict[int, float] = {}
+    for tenant_id, route_id, last_seen in candidates:
+        elapsed_min = (now - last_seen) / 60
+        if elapsed_min >= threshold_map.get(tenant_id, _DEFAULT_THRESHOLD_MINUTES):
+            overdue[route_id] = elapsed_min
+    if not overdue:
+        return
+
+    # ── Step 3: Keep routes that are still ONGOING; forget the rest ───────
+    routes = (
         db.query(RouteManagement)
-        .filter(RouteManagement.status == RouteManagementStatusEnum.ONGOING)
+        .filter(
+            RouteManagement.route_id.in_(list(overdue)),
+            RouteManagement.status == RouteManagementStatusEnum.ONGOING,
+        )
         .all()
     )
+    ongoing_ids = {route.route_id for route in routes}
+    ended = [
+        _member(tenant_id, route_id)
+        for tenant_id, route_id, _ in candidates
+        if route_id in overdue and route_id not in ongoing_ids
+    ]
+    if ended:
+        r.zrem(_HEARTBEAT_KEY, *ended)
+
+    # ── Step 4: Claim (cluster-wide cooldown) and alert ───────────────────
+    claimed = set(claim_alerts(r, sorted(ongoing_ids), _ALERT_COOLDOWN_MINUTES * 60))
+    stale_routes = [route for route in routes if route.route_id in claimed]
+    if not stale_routes:
+        return
+
+    logger.info("[stale_driver] %d stale route(s) detected.", len(stale_routes))
+    for route in stale_routes:
+        _alert_admins(db=db, route=route, elapsed_min=overdue[route.route_id], now_utc=now_utc)
+
+
+def _run_db_check(db: Session, owns: Optional[Callable[[str], bool]] = None) -> None:
+    now_utc = datetime.now(timezone.utc)
+
+    # ── Step 1: Find all ONGOING routes grouped by tenant ─────────────────
+    query = db.query(RouteManagement).filter(RouteManagement.status == RouteManagementStatusEnum.ONGOING)
+    if owns is not None:
+        tenant_ids = [
+            tenant_id
+            for (tenant_id,) in db.query(RouteManagement.tenant_id)
+            .filter(RouteManagement.status == RouteManagementStatusEnum.ONGOING)
+            .distinct()
+            if owns(tenant_id)
+        ]
+        if not tenant_ids:
+            logger.debug("[stale_driver] No ONGOING routes in this worker's tenants.")
+            return
+        query = query.filter(RouteManagement.tenant_id.in_(tenant_ids))
+    ongoing_routes = query.all()
 
     if not ongoing_routes:
         logger.debug("[stale_driver] No ONGOING routes — nothing to check.")
@@ -6,8 +6,15 @@ requirements.txt — no new dependency needed).
 
 Features
 ────────
-• Async HTTP calls (httpx.AsyncClient)
+• One pooled httpx.AsyncClient (keep-alive) and one async Redis client,
+  shared by every call on the event loop — no per-message TCP/TLS handshake
+  or Redis PING
+• In-process LRU of recent translations in front of Redis — the canned
+  driver / employee phrases never leave the process
 • Redis caching — 24 h TTL — keyed on md5(text:src:tgt)
+• Request coalescing: identical concurrent texts share one upstream call
+• translate_batch(): a whole transcript per source language in one upstream
+  call (newline-joined; chunked by TRANSLATION_BATCH_MAX_CHARS)
 • Auto language detection
 • Graceful fallback: returns original text on any failure
 • Controlled by settings.TRANSLATION_ENABLED flag
@@ -18,9 +25,10 @@ Production upgrade:    swap _call_google_translate() for the official
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
 
 import httpx
 
@@ -58,27 +66,60 @@ SUPPORTED_LANGUAGES: dict[str, str] = {
 }
 
 
-# ── Redis helpers ──────────────────────────────────────────────────────────
+# ── Shared clients (one per event loop) ────────────────────────────────────
+
+_http: Optional[httpx.AsyncClient] = None
+_http_loop: Optional[asyncio.AbstractEventLoop] = None
+_redis = None
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Identical texts being translated right now: cache key → Future
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _get_http() -> httpx.AsyncClient:
+    """Return the pooled HTTP client for the running event loop."""
+    global _http, _http_loop
+    loop = asyncio.get_running_loop()
+    if _http is None or _http_loop is not loop or _http.is_closed:
+        _http = httpx.AsyncClient(
+            timeout=6.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_loop = loop
+    return _http
+
 
 def _get_redis():
-    """Return a Redis client if USE_REDIS is enabled and reachable, else None."""
+    """Return the shared async Redis client if USE_REDIS is enabled, else None."""
+    global _redis, _redis_loop
     if not settings.USE_REDIS:
         return None
-    try:
-        import redis as redis_lib  # already in requirements.txt
-        client = redis_lib.Redis(
+    loop = asyncio.get_running_loop()
+    if _redis is None or _redis_loop is not loop:
+        import redis.asyncio as redis_async  # already in requirements.txt
+        _redis = redis_async.Redis(
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             db=settings.REDIS_DB,
             password=settings.REDIS_PASSWORD or None,
             decode_responses=True,
             socket_connect_timeout=2,
+            socket_timeout=2,
         )
-        client.ping()
-        return client
-    except Exception as exc:
-        logger.warning("[translation] Redis unavailable, skipping cache: %s", exc)
-        return None
+        _redis_loop = loop
+    return _redis
+
+
+async def aclose() -> None:
+    """Close the shared clients (FastAPI lifespan shutdown)."""
+    global _http, _redis
+    http, _http = _http, None
+    redis, _redis = _redis, None
+    if http is not None:
+        await http.aclose()
+    if redis is not None:
+        await redis.aclose()
 
 
 def _cache_key(text: str, src: str, tgt: str) -> str:
@@ -86,6 +127,72 @@ def _cache_key(text: str, src: str, tgt: str) -> str:
     return f"chat_trans:{hashlib.md5(raw.encode()).hexdigest()}"
 
 
+# ── In-process LRU ─────────────────────────────────────────────────────────
+
+class _LRU:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_lru = _LRU(settings.TRANSLATION_LRU_SIZE)
+
+
+async def _cache_get_many(keys: Sequence[str]) -> Dict[str, str]:
+    """LRU first, then one Redis MGET for the rest."""
+    found: Dict[str, str] = {}
+    missing = []
+    for key in keys:
+        value = _lru.get(key)
+        if value is not None:
+            found[key] = value
+        else:
+            missing.append(key)
+
+    redis = _get_redis() if missing else None
+    if redis:
+        try:
+            for key, value in zip(missing, await redis.mget(missing)):
+                if value:
+                    found[key] = value
+                    _lru.put(key, value)
+        except Exception as exc:
+            logger.warning("[translation] Redis read failed, skipping cache: %s", exc)
+    return found
+
+
+async def _cache_put_many(items: Dict[str, str]) -> None:
+    for key, value in items.items():
+        _lru.put(key, value)
+    redis = _get_redis() if items else None
+    if redis:
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, settings.TRANSLATION_CACHE_TTL, value)
+            await pipe.execute()
+        except Exception as exc:
+            logger.warning("[translation] Redis write failed: %s", exc)
+
+
 # ── Core API call ──────────────────────────────────────────────────────────
 
 async def _call_google_translate(
@@ -98,27 +205,26 @@ async def _call_google_translate(
     Returns translated string or None on failure.
     """
     try:
-        async with httpx.AsyncClient(timeout=6.0) as client:
-            resp = await client.get(
-                _GTRANS_URL,
-                params={
-                    "client": "gtx",
-                    "sl": source_language,
-                    "tl": target_language,
-                    "dt": "t",
-                    "q": text,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Response structure: [[["translated","original",...],...], ..., detected_lang]
-            translated_parts = []
-            for part in data[0]:
-                if part and part[0]:
-                    translated_parts.append(part[0])
-            result = "".join(translated_parts)
-            return result if result else None
+        resp = await _get_http().post(
+            _GTRANS_URL,
+            params={
+                "client": "gtx",
+                "sl": source_language,
+                "tl": target_language,
+                "dt": "t",
+            },
+            data={"q": text},
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        # Response structure: [[["translated","original",...],...], ..., detected_lang]
+        translated_parts = []
+        for part in data[0]:
+            if part and part[0]:
+                translated_parts.append(part[0])
+        result = "".join(translated_parts)
+        return result if result else None
     except httpx.TimeoutException:
         logger.warning("[translation] Timeout translating to %s", target_language)
         return None
@@ -127,6 +233,68 @@ async def _call_google_translate(
         return None
 
 
+async def _coalesced_call(key: str, text: str, target_language: str, source_language: str) -> Optional[str]:
+    """Share one upstream call between identical concurrent requests."""
+    pending = _inflight.get(key)
+    if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        translated = await _call_google_translate(text, target_language, source_language)
+        future.set_result(translated)
+        return translated
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()   # mark retrieved — waiters re-raise it themselves
+        raise
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+def _batch_chunks(texts: Sequence[str]) -> List[List[str]]:
+    chunks: List[List[str]] = [[]]
+    size = 0
+    for text in texts:
+        if chunks[-1] and size + len(text) + 1 > settings.TRANSLATION_BATCH_MAX_CHARS:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(text)
+        size += len(text) + 1
+    return chunks if chunks[0] else []
+
+
+async def _translate_chunk(
+    texts: List[str], target_language: str, source_language: str,
+) -> List[Optional[str]]:
+    """
+    One upstream call for a list of single-line texts (newline-joined).
+    Falls back to per-text calls if the line structure does not survive.
+    """
+    if len(texts) == 1:
+        return [await _coalesced_call(_cache_key(texts[0], source_language, target_language),
+                                      texts[0], target_language, source_language)]
+
+    translated = await _call_google_translate("\n".join(texts), target_language, source_language)
+    lines = translated.split("\n") if translated else []
+    if len(lines) == len(texts):
+        return [line.strip() or None for line in lines]
+
+    logger.warning(
+        "[translation] Batch of %d came back as %d line(s) — translating individually",
+        len(texts), len(lines),
+    )
+    return list(await asyncio.gather(*(
+        _coalesced_call(_cache_key(t, source_language, target_language), t, target_language, source_language)
+        for t in texts
+    )))
+
+
 # ── Public interface ───────────────────────────────────────────────────────
 
 async def translate_text(
@@ -158,22 +326,15 @@ async def translate_text(
     if source_language != "auto" and source_language == target_language:
         return text
 
-    # ── Cache lookup ───────────────────────────────────────────────────────
+    # ── Cache lookup (LRU, then Redis) ─────────────────────────────────────
     key = _cache_key(text, source_language, target_language)
-    redis = _get_redis()
-    if redis:
-        try:
-            cached = redis.get(key)
-            if cached:
-                logger.debug(
-                    "[translation] Cache hit %s→%s", source_language, target_language
-                )
-                return cached
-        except Exception:
-            pass
-
-    # ── API call ───────────────────────────────────────────────────────────
-    translated = await _call_google_translate(text, target_language, source_language)
+    cached = (await _cache_get_many([key])).get(key)
+    if cached:
+        logger.debug("[translation] Cache hit %s→%s", source_language, target_language)
+        return cached
+
+    # ── API call (coalesced) ───────────────────────────────────────────────
+    translated = await _coalesced_call(key, text, target_language, source_language)
 
     if not translated:
         logger.info(
@@ -182,12 +343,7 @@ async def translate_text(
         )
         return text
 
-    # ── Cache result ───────────────────────────────────────────────────────
-    if redis:
-        try:
-            redis.setex(key, settings.TRANSLATION_CACHE_TTL, translated)
-        except Exception:
-            pass
+    await _cache_put_many({key: translated})
 
     logger.info(
         "[translation] %s→%s: '%s' → '%s'",
@@ -197,6 +353,47 @@ async def translate_text(
     return translated
 
 
+async def translate_batch(
+    texts: Sequence[str],
+    target_language: str,
+    source_language: str = "auto",
+) -> List[str]:
+    """
+    Translate many texts from one source language, e.g. a chat transcript.
+
+    Duplicates and cached texts are resolved locally; the rest go upstream
+    newline-joined — one call per TRANSLATION_BATCH_MAX_CHARS.  Results are
+    in input order; any text that could not be translated is returned as is.
+    """
+    texts = list(texts)
+    if not settings.TRANSLATION_ENABLED or not texts:
+        return texts
+    if source_language != "auto" and source_language == target_language:
+        return texts
+
+    # Newlines are the batch separator, so a text is sent as a single line.
+    flat = {t: " ".join(t.split()) for t in texts if t and t.strip()}
+    keys = {t: _cache_key(t, source_language, target_language) for t in flat}
+    cached = await _cache_get_many(list(dict.fromkeys(keys.values())))
+
+    todo = [t for t in dict.fromkeys(flat) if keys[t] not in cached]
+    fresh: Dict[str, str] = {}
+    for chunk in _batch_chunks(todo):
+        results = await _translate_chunk([flat[t] for t in chunk], target_language, source_language)
+        for text, translated in zip(chunk, results):
+            if translated:
+                fresh[keys[text]] = translated
+    await _cache_put_many(fresh)
+
+    if todo:
+        logger.info(
+            "[translation] Batch %s→%s: %d text(s), %d from cache, %d translated",
+            source_language, target_language, len(texts), len(flat) - len(todo), len(fresh),
+        )
+    resolved = {**cached, **fresh}
+    return [resolved.get(keys[t], t) if t in keys else t for t in texts]
+
+
 async def detect_language(text: str) -> str:
     """
     Detect the language of *text*.
@@ -205,22 +402,22 @@ async def detect_language(text: str) -> str:
     if not settings.TRANSLATION_ENABLED or not text:
         return "en"
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(
-                _GTRANS_URL,
-                params={
-                    "client": "gtx",
-                    "sl": "auto",
-                    "tl": "en",
-                    "dt": "t",
-                    "q": text[:200],   # send only the first 200 chars for detection
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            detected = data[2] if len(data) > 2 and data[2] else "en"
-            logger.debug("[translation] Detected language: %s", detected)
-            return detected
+        resp = await _get_http().get(
+            _GTRANS_URL,
+            params={
+                "client": "gtx",
+                "sl": "auto",
+                "tl": "en",
+                "dt": "t",
+                "q": text[:200],   # send only the first 200 chars for detection
+            },
+            timeout=5.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        detected = data[2] if len(data) > 2 and data[2] else "en"
+        logger.debug("[translation] Detected language: %s", detected)
+        return detected
     except Exception as exc:
         logger.warning("[translation] Language detection failed: %s", exc)
         return "en"
@@ -390,26 +390,10 @@ class UnifiedNotificationService:
             Dict with keys:
                 push_success (bool), sms_success (bool | None), errors (list[str])
         """
-        # Normalise time to HH:MM
-        pickup_display = pickup_time_str[:5] if len(pickup_time_str) >= 5 else pickup_time_str
-
-        title = "Cab Reminder"
-        body = (
-            f"Your cab arrives at {pickup_display}. "
-            f"Vehicle: {vehicle_plate}. "
-            f"Driver: {driver_name} {driver_phone}"
+        title, body, data_payload = self._trip_reminder_content(
+            pickup_time_str, vehicle_plate, driver_name, driver_phone, booking_id, route_id,
         )
 
-        data_payload: Dict[str, str] = {
-            "type": "trip_reminder",
-            "booking_id": str(booking_id),
-            "route_id": str(route_id),
-            "pickup_time": pickup_display,
-            "vehicle_plate": vehicle_plate,
-            "driver_name": driver_name,
-            "driver_phone": driver_phone,
-        }
-
         errors: list = []
 
         # ── Push notification ──────────────────────────────────────
@@ -454,3 +438,131 @@ class UnifiedNotificationService:
             "sms_success": sms_success,
             "errors": errors,
         }
+
+    def send_trip_reminders(self, reminders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Batch form of send_trip_reminder for a whole chunk of due bookings.
+
+        Tokens are resolved with one cache pipeline plus one session query for
+        the misses, and the personalised pushes go out through FCM send_each
+        (1 call per 500).  SMS is still one Twilio request per message, over a
+        single SMSService client.
+
+        Args:
+            reminders: List of dicts with send_trip_reminder's keyword arguments
+
+        Returns:
+            One result dict per reminder, in order, shaped like send_trip_reminder's
+        """
+        if not reminders:
+            return []
+
+        contents = [
+            self._trip_reminder_content(
+                r["pickup_time_str"], r["vehicle_plate"], r["driver_name"], r["driver_phone"],
+                r["booking_id"], r["route_id"],
+            )
+            for r in reminders
+        ]
+        results: List[Dict[str, Any]] = [
+            {"push_success": False, "sms_success": None, "errors": []} for _ in reminders
+        ]
+
+        # ── Push notifications ─────────────────────────────────────
+        recipients = [{"user_type": "employee", "user_id": r["employee_id"]} for r in reminders]
+        tokens = self.cache.get_tokens_batch(recipients)
+        platforms: Dict[str, Optional[str]] = {}
+        misses = [r for r in recipients if f"employee:{r['user_id']}" not in tokens]
+        if misses:
+            for session in self.session_manager.get_active_sessions_batch(misses):
+                key = f"{session.user_type}:{session.user_id}"
+                tokens[key] = session.fcm_token
+                platforms[key] = session.platform
+
+        outgoing: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for i, (r, (title, body, data_payload)) in enumerate(zip(reminders, contents)):
+            key = f"employee:{r['employee_id']}"
+            token = tokens.get(key)
+            if not token:
+                results[i]["errors"].append("push: NO_ACTIVE_SESSION")
+                continue
+            if key not in platforms:
+                platforms[key] = self.cache.get_platform("employee", r["employee_id"])
+            outgoing.append({
+                "token": token,
+                "title": title,
+                "body": body,
+                "data": data_payload,
+                "priority": "high",
+                "platform": platforms[key],
+            })
+            positions.append(i)
+
+        for i, push_result in zip(positions, self.fcm.send_each(outgoing)):
+            if push_result["success"]:
+                results[i]["push_success"] = True
+                continue
+            results[i]["errors"].append(f"push: {push_result.get('error', 'unknown')}")
+            if push_result.get("should_delete"):
+                employee_id = reminders[i]["employee_id"]
+                self.session_manager.logout_session("employee", employee_id, platforms[f"employee:{employee_id}"])
+
+        logger.info(
+            "[unified_notification_service] Trip reminder batch: reminders=%d pushed=%d",
+            len(reminders), sum(1 for r in results if r["push_success"]),
+        )
+
+        # ── Optional SMS ───────────────────────────────────────────
+        sms = None
+        for r, (_, body, _), result in zip(reminders, contents, results):
+            if not (r.get("send_sms") and r.get("employee_phone")):
+                continue
+            try:
+                if sms is None:
+                    from app.services.sms_service import SMSService
+                    sms = SMSService()
+                result["sms_success"] = sms.send_sms(to_phone=r["employee_phone"], message=body)
+                if not result["sms_success"]:
+                    result["errors"].append("sms: send failed")
+            except Exception as exc:
+                logger.error(
+                    "[unified_notification_service] SMS reminder failed "
+                    "employee_id=%s booking_id=%s error=%s",
+                    r["employee_id"], r["booking_id"], exc,
+                )
+                result["errors"].append(f"sms: {exc}")
+                result["sms_success"] = False
+
+        return results
+
+    @staticmethod
+    def _trip_reminder_content(
+        pickup_time_str: str,
+        vehicle_plate: str,
+        driver_name: str,
+        driver_phone: str,
+        booking_id: int,
+        route_id: int,
+    ):
+        """Title, body and FCM data payload of a trip reminder."""
+        # Normalise time to HH:MM
+        pickup_display = pickup_time_str[:5] if len(pickup_time_str) >= 5 else pickup_time_str
+
+        title = "Cab Reminder"
+        body = (
+            f"Your cab arrives at {pickup_display}. "
+            f"Vehicle: {vehicle_plate}. "
+            f"Driver: {driver_name} {driver_phone}"
+        )
+
+        data_payload: Dict[str, str] = {
+            "type": "trip_reminder",
+            "booking_id": str(booking_id),
+            "route_id": str(route_id),
+            "pickup_time": pickup_display,
+            "vehicle_plate": vehicle_plate,
+            "driver_name": driver_name,
+            "driver_phone": driver_phone,
+        }
+        return title, body, data_payload
@@ -134,14 +134,37 @@ def cached(ttl_seconds: int = 300, key_prefix: str = ""):
 # Specific caching functions for common operations
 
 def cache_driver_locations(tenant_id: str, vendor_id: int, locations: list, ttl: int = 30):
-    """Cache driver locations for 30 seconds (real-time data)"""
-    key = f"driver_locations:{tenant_id}:{vendor_id}"
-    return cache.set(key, locations, ttl)
+    """
+    Write driver positions into the live-map GEO sets.
+
+    Each entry needs driver_id, latitude and longitude; speed, driver_name,
+    driver_code and route_id are optional.  ``ttl`` is kept for backwards
+    compatibility — freshness is governed by the per-driver metadata TTL in
+    fleet_location_service.
+    """
+    from app.services.fleet_location_service import record_driver_location
+    written = 0
+    for loc in locations:
+        ok = record_driver_location(
+            tenant_id=tenant_id,
+            vendor_id=vendor_id,
+            driver_id=loc["driver_id"],
+            latitude=loc["latitude"],
+            longitude=loc["longitude"],
+            speed=loc.get("speed"),
+            driver_name=loc.get("driver_name"),
+            driver_code=loc.get("driver_code"),
+            route_id=loc.get("route_id"),
+            client=cache.redis_client,
+        )
+        written += int(bool(ok))
+    return written == len(locations)
 
 def get_cached_driver_locations(tenant_id: str, vendor_id: int) -> Optional[list]:
-    """Get cached driver locations"""
-    key = f"driver_locations:{tenant_id}:{vendor_id}"
-    return cache.get(key)
+    """Get live driver positions for one vendor (None when nothing is on the map)"""
+    from app.services.fleet_location_service import get_active_drivers
+    drivers = get_active_drivers(tenant_id, vendor_id, client=cache.redis_client)
+    return drivers or None
 
 def cache_booking_stats(tenant_id: str, date: str, stats: dict, ttl: int = 300):
     """Cache booking statistics for 5 minutes"""
@@ -154,8 +177,8 @@ def get_cached_booking_stats(tenant_id: str, date: str) -> Optional[dict]:
     return cache.get(key)
 
 def invalidate_driver_locations(tenant_id: str, vendor_id: int):
-    """Invalidate driver location cache when location updates"""
-    key = f"driver_locations:{tenant_id}:{vendor_id}"
+    """Drop a vendor's live-map GEO set"""
+    key = f"fleet_geo:{tenant_id}:{vendor_id}"
     return cache.delete(key)
 
 def invalidate_booking_stats(tenant_id: str, date: str):
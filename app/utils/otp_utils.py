@@ -71,51 +71,14 @@ def is_time_in_escort_range(check_time: time, start_time: time, end_time: time)
         return check_time >= start_time or check_time <= end_time
 
 
-def _employee_gender_at_position(booking_ids_ordered: list, db: Session):
-    """
-    Return a list of (booking_id, gender_value) in stop order.
-    gender_value is the string value of GenderEnum or None.
-    """
-    from app.models.booking import Booking
-    from app.models.employee import Employee
-
-    # Preserve order: query once, map by booking_id
-    employees_by_booking = {}
-    rows = (
-        db.query(Booking.booking_id, Employee.gender)
-        .join(Employee, Employee.employee_id == Booking.employee_id)
-        .filter(Booking.booking_id.in_(booking_ids_ordered))
-        .all()
-    )
-    for booking_id, gender in rows:
-        # gender may be an Enum member or a string
-        gender_val = gender.value if hasattr(gender, "value") else str(gender) if gender else None
-        employees_by_booking[booking_id] = gender_val
-
-    return [(bid, employees_by_booking.get(bid)) for bid in booking_ids_ordered]
-
-
-def _is_female(gender_val) -> bool:
-    return gender_val in ("Female", "FEMALE")
-
-
 def route_requires_escort(db: Session, route_id: int, tenant_id: str) -> bool:
     """
     Determine if a route requires escort based on:
       1. The shift's female_constraint (shift-level override), OR
       2. The tenant escort config (time-window + any-female fallback).
 
-    female_constraint precedence (evaluated first):
-      DISABLE                   → always False  (no escort for this shift)
-      ANY_FEMALE                → True if any female employee on the route
-      FIRST_LAST_FEMALE         → True if first OR last stop has a female employee
-      SECOND_SECOND_LAST_FEMALE → True if 2nd OR 2nd-last stop has a female employee
-      None (not set)            → fall back to tenant config logic below
-
-    Tenant config fallback (when female_constraint is None):
-      - escort_required_for_women must be True
-      - shift time must fall inside [escort_required_start_time, escort_required_end_time]
-      - at least one female employee on the route
+    The rules are in app.services.escort_requirements.requires_escort; use
+    apply_escort_requirements there to evaluate many routes at once.
 
     Args:
         db: Database session
@@ -125,120 +88,10 @@ def route_requires_escort(db: Session, route_id: int, tenant_id: str) -> bool:
     Returns:
         True if route requires escort
     """
-    from app.models.tenant import Tenant
-    from app.models.route_management import RouteManagement, RouteManagementBooking
-    from app.models.booking import Booking
-    from app.models.employee import Employee
-    from app.models.enums import GenderEnum, FemaleConstraintEnum
+    from app.services.escort_requirements import evaluate_escort_requirements
 
     try:
-        # ── Load route ────────────────────────────────────────────────
-        route = db.query(RouteManagement).filter(
-            RouteManagement.route_id == route_id,
-            RouteManagement.tenant_id == tenant_id,
-        ).first()
-
-        if not route or not route.shift_id:
-            return False
-
-        # ── Load shift ────────────────────────────────────────────────
-        from app.models.shift import Shift
-        shift = db.query(Shift).filter(Shift.shift_id == route.shift_id).first()
-        if not shift:
-            return False
-
-        shift_time = shift.shift_time
-
-        # ── Resolve female_constraint value ───────────────────────────
-        fc_raw = shift.female_constraint
-        if fc_raw is None:
-            female_constraint = None
-        elif hasattr(fc_raw, "value"):
-            female_constraint = fc_raw.value          # Enum member → string value
-        else:
-            female_constraint = str(fc_raw)           # already a string from DB
-
-        # ── DISABLE: short-circuit immediately ────────────────────────
-        if female_constraint == FemaleConstraintEnum.DISABLE.value:
-            logger.info(
-                f"[escort] route {route_id}: female_constraint=DISABLE → no escort"
-            )
-            return False
-
-        # ── Load ordered stops ────────────────────────────────────────
-        route_bookings = (
-            db.query(RouteManagementBooking)
-            .filter(RouteManagementBooking.route_id == route_id)
-            .order_by(RouteManagementBooking.order_id)
-            .all()
-        )
-        booking_ids_ordered = [rb.booking_id for rb in route_bookings]
-        if not booking_ids_ordered:
-            return False
-
-        ordered_gender = _employee_gender_at_position(booking_ids_ordered, db)
-        # ordered_gender: [(booking_id, gender_val), ...]
-
-        # ── Shift-level female_constraint rules ───────────────────────
-        if female_constraint == FemaleConstraintEnum.ANY_FEMALE.value:
-            result = any(_is_female(g) for _, g in ordered_gender)
-            logger.info(
-                f"[escort] route {route_id}: ANY_FEMALE → {result}"
-            )
-            return result
-
-        if female_constraint == FemaleConstraintEnum.FIRST_LAST_FEMALE.value:
-            first_female = _is_female(ordered_gender[0][1])
-            last_female = _is_female(ordered_gender[-1][1])
-            result = first_female or last_female
-            logger.info(
-                f"[escort] route {route_id}: FIRST_LAST_FEMALE "
-                f"first={first_female} last={last_female} → {result}"
-            )
-            return result
-
-        if female_constraint == FemaleConstraintEnum.SECOND_SECOND_LAST_FEMALE.value:
-            if len(ordered_gender) < 2:
-                # Only one stop — no second/second-last distinction
-                logger.info(
-                    f"[escort] route {route_id}: SECOND_SECOND_LAST_FEMALE "
-                    f"only 1 stop → False"
-                )
-                return False
-            second_female = _is_female(ordered_gender[1][1])
-            second_last_female = _is_female(ordered_gender[-2][1])
-            result = second_female or second_last_female
-            logger.info(
-                f"[escort] route {route_id}: SECOND_SECOND_LAST_FEMALE "
-                f"2nd={second_female} 2nd-last={second_last_female} → {result}"
-            )
-            return result
-
-        # ── Tenant config fallback (female_constraint is None) ────────
-        from app.utils import cache_manager
-        safety_config = cache_manager.get_tenant_config_with_cache(db, tenant_id)
-
-        if not safety_config or not safety_config.escort_required_for_women:
-            return False
-
-        if not safety_config.escort_required_start_time or not safety_config.escort_required_end_time:
-            return False
-
-        time_requires_escort = is_time_in_escort_range(
-            shift_time,
-            safety_config.escort_required_start_time,
-            safety_config.escort_required_end_time,
-        )
-        if not time_requires_escort:
-            return False
-
-        result = any(_is_female(g) for _, g in ordered_gender)
-        logger.info(
-            f"[escort] route {route_id}: tenant-config fallback "
-            f"time_in_window=True any_female={result}"
-        )
-        return result
-
+        return evaluate_escort_requirements(db, tenant_id, route_ids=[route_id]).get(route_id, False)
     except Exception as e:
         logger.error(f"Error checking if route {route_id} requires escort: {str(e)}")
         return False
@@ -256,17 +109,9 @@ def update_route_escort_requirement(db: Session, route_id: int, tenant_id: str)
     Returns:
         True if route requires escort
     """
-    from app.models.route_management import RouteManagement
-
-    requires_escort = route_requires_escort(db, route_id, tenant_id)
+    from app.services.escort_requirements import apply_escort_requirements
 
-    # Update route escort requirement
-    db.query(RouteManagement).filter(
-        RouteManagement.route_id == route_id,
-        RouteManagement.tenant_id == tenant_id
-    ).update({
-        RouteManagement.escort_required: requires_escort
-    })
+    requires_escort = apply_escort_requirements(db, tenant_id, route_ids=[route_id]).get(route_id, False)
 
     logger.info(f"Route {route_id} escort requirement updated: {requires_escort}")
     return requires_escort
@@ -1,6 +1,18 @@
-from typing import Tuple, List, TypeVar, Generic, Any
+import base64
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Tuple, List, TypeVar, Generic, Any, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Query
 
+from app.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
 T = TypeVar('T')
 
 def paginate_query(query: Query, skip: int = 0, limit: int = 100) -> Tuple[int, List[Any]]:
@@ -11,3 +23,115 @@ def paginate_query(query: Query, skip: int = 0, limit: int = 100) -> Tuple[int,
     total = query.count()
     items = query.offset(skip).limit(limit).all()
     return total, items
+
+
+# ── Keyset (cursor) pagination ────────────────────────────────────────────
+#
+# A cursor is the sort key of the last row served, e.g. (created_at, id),
+# as opaque url-safe base64.  The next page is read with
+# ``WHERE (created_at, id) < (:last_created_at, :last_id)`` on an index
+# ending in those columns, so page 500 costs the same as page 1 instead of
+# scanning and discarding everything before it.  Sort keys must be
+# NOT NULL and end in a unique column.
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for a row's sort key."""
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append({"dt": value.isoformat()})
+        elif isinstance(value, date):
+            encoded.append({"d": value.isoformat()})
+        else:
+            encoded.append(value)
+    raw = json.dumps(encoded, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort key from a cursor; 400 INVALID_CURSOR if it is malformed."""
+    from app.utils.response_utils import ResponseWrapper
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        encoded = json.loads(raw)
+        if not isinstance(encoded, list) or len(encoded) != size:
+            raise ValueError("wrong cursor size")
+        values = []
+        for value in encoded:
+            if isinstance(value, dict) and "dt" in value:
+                values.append(datetime.fromisoformat(value["dt"]))
+            elif isinstance(value, dict) and "d" in value:
+                values.append(date.fromisoformat(value["d"]))
+            else:
+                values.append(value)
+        return values
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Rejected pagination cursor {cursor!r}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ResponseWrapper.error(
+                message="Invalid pagination cursor",
+                error_code="INVALID_CURSOR",
+            ),
+        )
+
+
+def keyset_paginate(
+    query: Query,
+    keys: Sequence[Any],
+    *,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 100,
+    descending: bool = True,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Page of ``query`` ordered by ``keys`` (all in one direction).
+
+    With ``cursor`` the page starts right after the row it encodes and
+    ``offset`` is ignored; without one, ``offset`` is applied as before so
+    existing page/skip clients keep working.  Returns ``(items,
+    next_cursor)``; ``next_cursor`` is None on the last page.
+    """
+    ordered = query.order_by(*[k.desc() if descending else k.asc() for k in keys])
+    if cursor:
+        after = tuple_(*keys)
+        last = tuple_(*decode_cursor(cursor, len(keys)))
+        ordered = ordered.filter(after < last if descending else after > last)
+    elif offset:
+        ordered = ordered.offset(offset)
+
+    rows = ordered.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], k.key) for k in keys])
+
+
+def cached_count(query: Query, refresh: bool = False) -> int:
+    """
+    ``query.count()`` shared through Redis for PAGINATION_COUNT_CACHE_TTL.
+
+    Listings pass ``refresh=True`` for their first page, so totals are exact
+    when a listing is opened and deeper cursor pages skip the COUNT.  The
+    key is the statement plus its parameters, so filters and tenants never
+    share a total.
+    """
+    if not settings.USE_REDIS:
+        return query.count()
+
+    from app.utils.cache_manager import cache
+
+    compiled = query.statement.compile()
+    fingerprint = f"{compiled}|{sorted((k, repr(v)) for k, v in compiled.params.items())}"
+    key = "page_count:" + hashlib.sha1(fingerprint.encode()).hexdigest()
+
+    if not refresh:
+        total = cache.get(key)
+        if total is not None:
+            return total
+    total = query.count()
+    cache.set(key, total, ttl_seconds=settings.PAGINATION_COUNT_CACHE_TTL)
+    return total
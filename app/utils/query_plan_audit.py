@@ -0,0 +1,472 @@
+"""
+Query-plan audit for the hot ORM queries.
+
+Each entry in ``AUDITED_QUERIES`` rebuilds one query from a booking /
+routing / reminder / dashboard path with the same predicates as its source
+(named in ``source``).  ``audit()`` EXPLAINs every one of them and reports
+a full scan of any table in ``LARGE_TABLES``:
+
+* PostgreSQL — ``EXPLAIN (FORMAT JSON)`` with ``enable_seqscan = off`` for
+  the transaction, so a ``Seq Scan`` that survives means no usable index,
+  however small the seeded tables are.
+* SQLite (the test database) — ``EXPLAIN QUERY PLAN``; a ``SCAN <table>``
+  row is a full scan.
+
+Statements are compiled with literal parameters, as psycopg2 sends them,
+so partial indexes are matched the same way PostgreSQL matches them in
+production.
+
+Run against a database::
+
+    python scripts/audit_query_plans.py --timings
+
+and ``tests/test_query_plan_audit.py`` runs it against a seeded SQLite
+database on every build.
+"""
+
+import json
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Query, Session, joinedload
+
+from app.core.logging_config import get_logger
+from app.crud.booking import booking_crud
+from app.models.alert import Alert, AlertEscalation, AlertStatusEnum
+from app.models.audit_log import AuditLog
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.chat import ChatMessage
+from app.models.driver_location_history import DriverLocationHistory
+from app.models.employee import Employee
+from app.models.notification_log import NotificationLog
+from app.models.route_management import (
+    RouteManagement,
+    RouteManagementBooking,
+    RouteManagementStatusEnum,
+)
+from app.models.shift import Shift
+from app.models.tenant_config import TenantConfig
+from app.models.user_session import UserSession
+
+logger = get_logger(__name__)
+
+# Tables that grow with trips; a full scan of any of them fails the audit.
+LARGE_TABLES = frozenset({
+    "bookings",
+    "route_management",
+    "route_management_bookings",
+    "chat_messages",
+    "driver_location_history",
+    "alerts",
+    "alert_escalations",
+    "audit_logs",
+    "notification_logs",
+    "user_sessions",
+})
+
+
+@dataclass
+class AuditParams:
+    """Literal values the audited queries are built with."""
+    tenant_id: str
+    booking_date: date
+    shift_id: int
+    driver_id: int
+    employee_id: int
+    route_id: int
+    booking_id: int
+
+    @property
+    def range_start(self) -> date:
+        return self.booking_date - timedelta(days=30)
+
+
+@dataclass
+class AuditedQuery:
+    name: str
+    source: str
+    build: Callable[[Session, AuditParams], Query]
+
+
+@dataclass
+class PlanReport:
+    name: str
+    source: str
+    plan: List[str]
+    full_scans: List[str] = field(default_factory=list)
+    median_ms: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.full_scans
+
+
+def _day_bounds(day: date):
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+# ── The audited queries ────────────────────────────────────────────────────
+
+def _booking_list(db, p):
+    return (
+        db.query(Booking)
+        .options(joinedload(Booking.employee), joinedload(Booking.shift))
+        .filter(Booking.tenant_id == p.tenant_id, Booking.booking_date == p.booking_date)
+    )
+
+
+def _booking_list_by_status(db, p):
+    return _booking_list(db, p).filter(Booking.status == BookingStatusEnum.SCHEDULED)
+
+
+def _employee_bookings(db, p):
+    return db.query(Booking).filter(
+        Booking.employee_id == p.employee_id,
+        Booking.booking_date == p.booking_date,
+        Booking.tenant_id == p.tenant_id,
+    )
+
+
+def _route_links_for_page(db, p):
+    return (
+        db.query(RouteManagementBooking)
+        .options(joinedload(RouteManagementBooking.route_management))
+        .filter(RouteManagementBooking.booking_id.in_([p.booking_id, p.booking_id + 1]))
+    )
+
+
+def _shift_grouping_bookings(db, p):
+    return (
+        db.query(Booking, Shift.shift_code, Shift.shift_time, Shift.log_type)
+        .join(Shift, Shift.shift_id == Booking.shift_id)
+        .filter(Booking.tenant_id == p.tenant_id, Booking.booking_date == p.booking_date)
+        .order_by(Shift.shift_time)
+    )
+
+
+def _shift_grouping_routes(db, p):
+    return (
+        db.query(
+            RouteManagement.shift_id,
+            RouteManagement.status,
+            RouteManagement.route_id,
+            RouteManagementBooking.booking_id,
+        )
+        .join(RouteManagementBooking, RouteManagementBooking.route_id == RouteManagement.route_id)
+        .join(Booking, Booking.booking_id == RouteManagementBooking.booking_id)
+        .filter(
+            RouteManagement.tenant_id == p.tenant_id,
+            Booking.tenant_id == p.tenant_id,
+            Booking.booking_date == p.booking_date,
+        )
+    )
+
+
+def _driver_trip_route_ids(db, p):
+    return (
+        db.query(RouteManagement.route_id)
+        .join(RouteManagementBooking, RouteManagementBooking.route_id == RouteManagement.route_id)
+        .join(Booking, Booking.booking_id == RouteManagementBooking.booking_id)
+        .filter(
+            RouteManagement.tenant_id == p.tenant_id,
+            RouteManagement.assigned_driver_id == p.driver_id,
+            RouteManagement.status == RouteManagementStatusEnum.DRIVER_ASSIGNED,
+            Booking.booking_date == p.booking_date,
+        )
+        .group_by(RouteManagement.route_id)
+        .order_by(RouteManagement.route_id.desc())
+        .limit(20)
+    )
+
+
+def _driver_trip_bookings(db, p):
+    return (
+        db.query(RouteManagementBooking, Booking, Employee)
+        .join(Booking, RouteManagementBooking.booking_id == Booking.booking_id)
+        .outerjoin(Employee, Booking.employee_id == Employee.employee_id)
+        .filter(
+            RouteManagementBooking.route_id.in_([p.route_id]),
+            Booking.booking_date == p.booking_date,
+        )
+        .order_by(RouteManagementBooking.route_id, RouteManagementBooking.order_id)
+    )
+
+
+def _unrouted_bookings(db, p):
+    return booking_crud.get_unrouted_query(
+        db, tenant_id=p.tenant_id, booking_date=p.booking_date, shift_id=p.shift_id,
+    )
+
+
+def _route_suggestion_bookings(db, p):
+    return booking_crud.get_unrouted_query(
+        db, tenant_id=p.tenant_id, booking_date=p.booking_date, shift_id=p.shift_id, status=None,
+    )
+
+
+def _shift_routes(db, p):
+    return db.query(RouteManagement).filter(
+        RouteManagement.tenant_id == p.tenant_id,
+        RouteManagement.shift_id == p.shift_id,
+    )
+
+
+def _analytics_base(db, p):
+    return db.query(Booking).filter(
+        Booking.tenant_id == p.tenant_id,
+        Booking.booking_date >= p.range_start,
+        Booking.booking_date <= p.booking_date,
+    )
+
+
+def _analytics_status_breakdown(db, p):
+    return (
+        _analytics_base(db, p)
+        .with_entities(Booking.status, func.count(Booking.booking_id))
+        .group_by(Booking.status)
+    )
+
+
+def _analytics_route_status(db, p):
+    return (
+        db.query(RouteManagement.status, func.count(func.distinct(Booking.booking_id)))
+        .join(RouteManagementBooking, RouteManagement.route_id == RouteManagementBooking.route_id)
+        .join(Booking, RouteManagementBooking.booking_id == Booking.booking_id)
+        .filter(
+            RouteManagement.tenant_id == p.tenant_id,
+            Booking.booking_date >= p.range_start,
+            Booking.booking_date <= p.booking_date,
+        )
+        .group_by(RouteManagement.status)
+    )
+
+
+def _reminder_candidates(db, p):
+    return (
+        db.query(Booking, RouteManagementBooking, RouteManagement, Employee, TenantConfig)
+        .join(RouteManagementBooking, RouteManagementBooking.booking_id == Booking.booking_id)
+        .join(RouteManagement, RouteManagement.route_id == RouteManagementBooking.route_id)
+        .join(Employee, Employee.employee_id == Booking.employee_id)
+        .join(TenantConfig, TenantConfig.tenant_id == Booking.tenant_id)
+        .filter(
+            Booking.status == BookingStatusEnum.SCHEDULED,
+            Booking.booking_date == p.booking_date,
+            Booking.reminder_sent_at.is_(None),
+            TenantConfig.schedule_reminder_enabled.is_(True),
+            RouteManagementBooking.estimated_pick_up_time.isnot(None),
+            RouteManagement.assigned_driver_id.isnot(None),
+            RouteManagement.assigned_vehicle_id.isnot(None),
+        )
+    )
+
+
+def _dashboard_bookings(db, p):
+    return (
+        db.query(Booking.status, func.count(Booking.booking_id))
+        .filter(Booking.tenant_id == p.tenant_id, Booking.booking_date == p.booking_date)
+        .group_by(Booking.status)
+    )
+
+
+def _dashboard_routes(db, p):
+    start, end = _day_bounds(p.booking_date)
+    return (
+        db.query(RouteManagement.status, func.count(RouteManagement.route_id))
+        .filter(
+            RouteManagement.tenant_id == p.tenant_id,
+            RouteManagement.is_active.is_(True),
+            RouteManagement.created_at >= start,
+            RouteManagement.created_at < end,
+        )
+        .group_by(RouteManagement.status)
+    )
+
+
+def _chat_messages(db, p):
+    return (
+        db.query(ChatMessage)
+        .filter_by(tenant_id=p.tenant_id, booking_id=p.booking_id)
+        .order_by(ChatMessage.created_at.asc())
+        .limit(50)
+    )
+
+
+def _chat_route_for_booking(db, p):
+    return db.query(RouteManagementBooking).filter_by(booking_id=p.booking_id)
+
+
+def _route_playback(db, p):
+    return (
+        db.query(DriverLocationHistory)
+        .filter(DriverLocationHistory.route_id == p.route_id)
+        .order_by(DriverLocationHistory.recorded_at)
+    )
+
+
+def _active_alerts(db, p):
+    return (
+        db.query(Alert)
+        .filter(
+            Alert.tenant_id == p.tenant_id,
+            Alert.status.in_([AlertStatusEnum.TRIGGERED, AlertStatusEnum.ACKNOWLEDGED]),
+        )
+        .order_by(Alert.triggered_at.desc())
+    )
+
+
+def _alert_escalations(db, p):
+    return (
+        db.query(AlertEscalation)
+        .filter(AlertEscalation.alert_id == p.booking_id)
+        .order_by(AlertEscalation.escalated_at)
+    )
+
+
+def _active_session(db, p):
+    return db.query(UserSession).filter(
+        UserSession.user_type == "driver",
+        UserSession.user_id == p.driver_id,
+        UserSession.is_active.is_(True),
+    )
+
+
+def _audit_logs(db, p):
+    return (
+        db.query(AuditLog)
+        .filter(AuditLog.tenant_id == p.tenant_id, AuditLog.module == "booking")
+        .order_by(AuditLog.created_at.desc())
+        .limit(50)
+    )
+
+
+def _shift_notifications(db, p):
+    return db.query(NotificationLog).filter(
+        NotificationLog.tenant_id == p.tenant_id,
+        NotificationLog.shift_id == p.shift_id,
+        NotificationLog.booking_date == p.booking_date,
+    )
+
+
+AUDITED_QUERIES: List[AuditedQuery] = [
+    AuditedQuery("booking_list",               "booking_router.get_bookings",                 _booking_list),
+    AuditedQuery("booking_list_by_status",     "booking_router.get_bookings",                 _booking_list_by_status),
+    AuditedQuery("employee_bookings",          "booking_router.get_employee_bookings",        _employee_bookings),
+    AuditedQuery("route_links_for_page",       "booking_router.get_bookings",                 _route_links_for_page),
+    AuditedQuery("shift_grouping_bookings",    "booking_router.get_bookings_grouped_by_shift", _shift_grouping_bookings),
+    AuditedQuery("shift_grouping_routes",      "booking_router.get_bookings_grouped_by_shift", _shift_grouping_routes),
+    AuditedQuery("driver_trip_route_ids",      "app_driver_router.get_driver_trips",          _driver_trip_route_ids),
+    AuditedQuery("driver_trip_bookings",       "app_driver_router.get_driver_trips",          _driver_trip_bookings),
+    AuditedQuery("unrouted_bookings",          "booking_crud.get_unrouted_query",             _unrouted_bookings),
+    AuditedQuery("route_suggestion_bookings",  "grouping.route_suggestion",                   _route_suggestion_bookings),
+    AuditedQuery("shift_routes",               "route_management.get_routes",                 _shift_routes),
+    AuditedQuery("analytics_bookings",         "reports_router.get_bookings_analytics",       _analytics_base),
+    AuditedQuery("analytics_status_breakdown", "reports_router.get_bookings_analytics",       _analytics_status_breakdown),
+    AuditedQuery("analytics_route_status",     "reports_router.get_bookings_analytics",       _analytics_route_status),
+    AuditedQuery("reminder_candidates",        "reminder_service._find_candidates",           _reminder_candidates),
+    AuditedQuery("dashboard_bookings",         "dashboard_router._build_summary",             _dashboard_bookings),
+    AuditedQuery("dashboard_routes",           "dashboard_router._build_summary",             _dashboard_routes),
+    AuditedQuery("chat_messages",              "chat_crud.get_messages",                      _chat_messages),
+    AuditedQuery("chat_route_for_booking",     "chat_service.get_driver_id_for_booking",      _chat_route_for_booking),
+    AuditedQuery("route_playback",             "driver_location_history playback",            _route_playback),
+    AuditedQuery("active_alerts",              "alert_crud.get_alerts",                       _active_alerts),
+    AuditedQuery("alert_escalations",          "alert_crud.get_escalations",                  _alert_escalations),
+    AuditedQuery("active_session",             "session_manager.get_active_session",          _active_session),
+    AuditedQuery("audit_logs",                 "audit_log_router.get_audit_logs",             _audit_logs),
+    AuditedQuery("shift_notifications",        "notification_log lookups",                    _shift_notifications),
+]
+
+
+# ── EXPLAIN ────────────────────────────────────────────────────────────────
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+def _literal_sql(db: Session, query: Query) -> str:
+    return str(query.statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True},
+    ))
+
+
+def _table_of(name: str, tables: Iterable[str]) -> Optional[str]:
+    """Map a plan relation / alias (``bookings_1``) to its table name."""
+    if name in tables:
+        return name
+    base = re.sub(r"_\d+$", "", name)
+    return base if base in tables else None
+
+
+def _walk_pg(node: dict):
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk_pg(child)
+
+
+def explain(db: Session, query: Query, large_tables: Iterable[str] = LARGE_TABLES):
+    """Return (plan lines, full-scanned large tables) for one query."""
+    tables = set(large_tables)
+    sql = _literal_sql(db, query)
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        with db.get_bind().connect() as conn:
+            trans = conn.begin()
+            try:
+                conn.execute(text("SET LOCAL enable_seqscan = off"))
+                raw = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+            finally:
+                trans.rollback()
+        root = (raw if isinstance(raw, list) else json.loads(raw))[0]["Plan"]
+        plan, scans = [], []
+        for node in _walk_pg(root):
+            relation = node.get("Relation Name")
+            plan.append(f"{node['Node Type']} {relation or ''} {node.get('Index Name', '')}".strip())
+            if node["Node Type"] == "Seq Scan" and relation in tables:
+                scans.append(relation)
+        return plan, scans
+
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+    plan = [row[-1] for row in rows]
+    scans = []
+    for detail in plan:
+        match = _SQLITE_SCAN.match(detail)
+        table = _table_of(match.group(1), tables) if match else None
+        if table:
+            scans.append(table)
+    return plan, scans
+
+
+def time_query(query: Query, repeat: int = 5) -> float:
+    """Median wall time of ``query.all()`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query.all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def audit(
+    db: Session,
+    params: AuditParams,
+    queries: Optional[Iterable[AuditedQuery]] = None,
+    timings: bool = False,
+    large_tables: Iterable[str] = LARGE_TABLES,
+) -> List[PlanReport]:
+    """EXPLAIN every audited query; ``PlanReport.ok`` is False on a full scan."""
+    reports = []
+    for entry in queries if queries is not None else AUDITED_QUERIES:
+        query = entry.build(db, params)
+        plan, scans = explain(db, query, large_tables)
+        report = PlanReport(entry.name, entry.source, plan, sorted(set(scans)))
+        if timings:
+            report.median_ms = time_query(query)
+        if not report.ok:
+            logger.warning("[query_plan_audit] %s (%s) scans %s", entry.name, entry.source, report.full_scans)
+        reports.append(report)
+    return reports
@@ -37,9 +37,10 @@ class ResponseWrapper:
         total: int,
         page: int = 1,
         per_page: int = 10,
-        message: str = "Success"
+        message: str = "Success",
+        next_cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        return create_paginated_response(items, total, page, per_page, message)
+        return create_paginated_response(items, total, page, per_page, message, next_cursor)
 
     @staticmethod
     def created(data: Any = None, message: str = "Resource created successfully") -> Dict[str, Any]:
@@ -96,6 +96,7 @@ async def send_email_async(recipient: str, subject: str, body: str, **kwargs):
 async def optimize_routes_async(job_id: str, route_data: dict):
     """Run route optimization asynchronously"""
     from app.database.session import get_db
+    from app.crud.booking import booking_crud
     from app.models.booking import Booking, BookingStatusEnum
     from app.models.route_management import RouteManagement, RouteManagementBooking
     from app.models.shift import Shift
@@ -126,27 +127,10 @@ async def optimize_routes_async(job_id: str, route_data: dict):
         lat_col = "pickup_latitude" if shift_type == "IN" else "drop_latitude"
         lon_col = "pickup_longitude" if shift_type == "IN" else "drop_longitude"
 
-        # Fetch already routed booking IDs
-        routed_booking_ids = (
-            db.query(RouteManagementBooking.booking_id)
-            .join(RouteManagement, RouteManagement.route_id == RouteManagementBooking.route_id)
-            .filter(RouteManagement.tenant_id == tenant_id)
-            .distinct()
-            .all()
-        )
-        routed_booking_ids = [b.booking_id for b in routed_booking_ids]
-
         # Fetch unrouted bookings
-        bookings_query = db.query(Booking).filter(
-            Booking.booking_date == booking_date,
-            Booking.shift_id == shift_id,
-            Booking.tenant_id == tenant_id,
-            Booking.status == BookingStatusEnum.REQUEST
-        )
-        if routed_booking_ids:
-            bookings_query = bookings_query.filter(~Booking.booking_id.in_(routed_booking_ids))
-
-        bookings = bookings_query.all()
+        bookings = booking_crud.get_unrouted_query(
+            db, tenant_id=tenant_id, booking_date=booking_date, shift_id=shift_id,
+        ).all()
 
         if not bookings:
             result = {"clusters": [], "total_bookings": 0, "total_clusters": 0}
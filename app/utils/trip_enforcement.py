@@ -20,11 +20,18 @@ one_trip_per_shift_enabled = True, auto_move_on_conflict = False
     → Block the entire operation if the booking already exists on another active
       route (same tenant), even if it has not been picked up yet.
       Also block if already ONGOING.
+
+Conflicts of the whole candidate set are found with one query
+(``find_trip_conflicts``), so adding N bookings costs one round trip instead
+of one or two per booking; verdicts are then applied in the order the
+per-booking checker used, so the same booking is reported when several
+would block.
 """
 
+from dataclasses import dataclass, field
 from fastapi import HTTPException, status as http_status
 from sqlalchemy.orm import Session
-from typing import Set
+from typing import Dict, Iterable, List, Optional, Set
 import logging
 
 from app.models.booking import Booking, BookingStatusEnum
@@ -37,6 +44,58 @@ logger = logging.getLogger(__name__)
 _ACTIVE_BOOKING_STATUSES = {BookingStatusEnum.ONGOING, BookingStatusEnum.COMPLETED}
 
 
+@dataclass
+class TripConflict:
+    """A candidate booking's links on other active routes of the tenant."""
+    booking_id: int
+    booking_status: Optional[BookingStatusEnum]
+    conflict_route_ids: List[int] = field(default_factory=list)
+    link_ids: List[int] = field(default_factory=list)
+
+    @property
+    def is_active(self) -> bool:
+        """Already being serviced — never moved, whatever the tenant config."""
+        return self.booking_status in _ACTIVE_BOOKING_STATUSES
+
+
+def find_trip_conflicts(
+    db: Session,
+    route_id: int,
+    tenant_id: str,
+    booking_ids: Iterable[int],
+) -> Dict[int, TripConflict]:
+    """
+    Every booking of *booking_ids* that is linked to an active route of
+    *tenant_id* other than *route_id*, keyed by booking_id (bookings without
+    a conflict are absent).  One query for the whole set.
+    """
+    booking_ids = list(booking_ids)
+    if not booking_ids:
+        return {}
+
+    rows = (
+        db.query(RouteManagementBooking.id, RouteManagementBooking.booking_id,
+                 RouteManagementBooking.route_id, Booking.status)
+        .join(RouteManagement, RouteManagementBooking.route_id == RouteManagement.route_id)
+        .outerjoin(Booking, Booking.booking_id == RouteManagementBooking.booking_id)
+        .filter(
+            RouteManagementBooking.booking_id.in_(booking_ids),
+            RouteManagementBooking.route_id != route_id,
+            RouteManagement.tenant_id == tenant_id,
+            RouteManagement.is_active == True,
+        )
+        .order_by(RouteManagementBooking.booking_id, RouteManagementBooking.id)
+        .all()
+    )
+
+    conflicts: Dict[int, TripConflict] = {}
+    for link_id, booking_id, other_route_id, booking_status in rows:
+        conflict = conflicts.setdefault(booking_id, TripConflict(booking_id, booking_status))
+        conflict.conflict_route_ids.append(other_route_id)
+        conflict.link_ids.append(link_id)
+    return conflicts
+
+
 def enforce_one_trip_per_shift(
     db: Session,
     route_id: int,
@@ -71,46 +130,37 @@ def enforce_one_trip_per_shift(
         )
         return
 
-    for booking_id in booking_ids:
-        # Find every link for this booking on a *different* route within this tenant
-        existing_links = (
-            db.query(RouteManagementBooking)
-            .join(RouteManagement, RouteManagementBooking.route_id == RouteManagement.route_id)
-            .filter(
-                RouteManagementBooking.booking_id == booking_id,
-                RouteManagementBooking.route_id != route_id,
-                RouteManagement.tenant_id == tenant_id,
-                RouteManagement.is_active == True,
-            )
-            .all()
-        )
+    conflicts = find_trip_conflicts(db, route_id, tenant_id, booking_ids)
 
-        if not existing_links:
+    # Verdicts in the caller's order: the first blocking booking is reported
+    for booking_id in booking_ids:
+        conflict = conflicts.get(booking_id)
+        if conflict is None:
             continue  # No conflict for this booking
 
         # Check if the booking is already being actively serviced
-        booking = db.query(Booking).filter(Booking.booking_id == booking_id).first()
-        if booking and booking.status in _ACTIVE_BOOKING_STATUSES:
+        if conflict.is_active:
+            booking_status = conflict.booking_status.value
             logger.warning(
                 "[enforce_one_trip] Blocked: booking %s is %s — cannot reassign.",
                 booking_id,
-                booking.status.value,
+                booking_status,
             )
             raise HTTPException(
                 status_code=http_status.HTTP_409_CONFLICT,
                 detail=ResponseWrapper.error(
                     message=(
-                        f"Booking {booking_id} is already {booking.status.value} "
+                        f"Booking {booking_id} is already {booking_status} "
                         "and cannot be moved to another route."
                     ),
                     error_code="BOOKING_ALREADY_ACTIVE",
-                    details={"booking_id": booking_id, "booking_status": booking.status.value},
+                    details={"booking_id": booking_id, "booking_status": booking_status},
                 ),
             )
 
         if not auto_move_on_conflict:
             # Block mode: reject the entire request
-            conflict_route_ids = [link.route_id for link in existing_links]
+            conflict_route_ids = conflict.conflict_route_ids
             logger.warning(
                 "[enforce_one_trip] Blocked: booking %s already on routes %s.",
                 booking_id,
@@ -132,15 +182,18 @@ def enforce_one_trip_per_shift(
                 ),
             )
 
-        # auto_move_on_conflict == True → silently remove from other routes
-        for link in existing_links:
-            logger.info(
-                "[enforce_one_trip] Auto-moving booking %s from route %s → route %s.",
-                booking_id,
-                link.route_id,
-                route_id,
-            )
-            db.delete(link)
+    if not conflicts:
+        return
 
-    # Flush removals so the subsequent INSERT does not hit the unique constraint
-    db.flush()
+    # auto_move_on_conflict == True → silently remove from other routes
+    for conflict in conflicts.values():
+        logger.info(
+            "[enforce_one_trip] Auto-moving booking %s from route(s) %s → route %s.",
+            conflict.booking_id,
+            conflict.conflict_route_ids,
+            route_id,
+        )
+    # One DELETE for every link, before the subsequent INSERT can hit the unique constraint
+    db.query(RouteManagementBooking).filter(
+        RouteManagementBooking.id.in_([i for c in conflicts.values() for i in c.link_ids])
+    ).delete(synchronize_session="evaluate")
@@ -0,0 +1,231 @@
+"""
+common_utils/auth/password_hasher.py
+-------------------------------------
+bcrypt off the event loop.
+
+A bcrypt hash / check costs ~250 ms of CPU.  Called directly from an
+``async def`` handler it blocks every other request on that worker, so the
+login endpoints and bulk user creation go through this module instead:
+
+    hashed = await hash_password_async(plain)
+    ok     = await verify_password_async(plain, stored)
+    hashes = await hash_passwords_async([p1, p2, ...])      # bulk paths
+
+Work runs in a dedicated ``ProcessPoolExecutor`` (``PASSWORD_HASH_WORKERS``).
+Each event loop admits at most ``PASSWORD_HASH_MAX_CONCURRENCY`` jobs into
+the pool at a time; the rest wait on a FIFO semaphore, so a 500-row bulk
+import interleaves with logins instead of queueing ahead of them.  If the
+pool cannot be started the work falls back to threads — bcrypt releases
+the GIL while hashing.
+
+Legacy hashes
+-------------
+Accounts still stored as SHA-256 (or plaintext) are upgraded to bcrypt on
+their next successful login by ``upgrade_legacy_hash()``.
+
+The synchronous ``hash_password`` / ``verify_password`` in
+``common_utils.auth.utils`` remain for sync code paths and scripts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Sequence
+
+from fastapi import HTTPException
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from common_utils.auth.utils import (
+    bcrypt_hash,
+    check_password_length,
+    needs_rehash,
+    verify_password,
+)
+
+logger = get_logger(__name__)
+
+_QUEUED = Gauge(
+    "password_hash_queued",
+    "Password hash / verify jobs waiting for a pool slot",
+)
+_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hash / verify jobs running in the pool",
+)
+_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time a password job waited for a pool slot",
+    ["op"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+_RUN_SECONDS = Histogram(
+    "password_hash_run_seconds",
+    "Time a password job spent in the pool",
+    ["op"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+_REHASHED = Counter(
+    "password_legacy_rehash_total",
+    "Legacy password hashes upgraded to bcrypt on login",
+)
+
+
+def _default_workers() -> int:
+    return settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+
+
+class PasswordHasher:
+    """Process-pool bcrypt with per-event-loop bounded admission."""
+
+    def __init__(self, workers: Optional[int] = None, max_concurrency: Optional[int] = None) -> None:
+        self._workers = workers
+        self._max_concurrency = max_concurrency
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def workers(self) -> int:
+        return self._workers or _default_workers()
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency or settings.PASSWORD_HASH_MAX_CONCURRENCY or 2 * self.workers
+
+    # ------------------------------------------------------------------
+    # Pool management
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning("[password_hasher] Process pool unavailable (%s) — using threads", e)
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-hash",
+                    )
+                logger.info("[password_hasher] Started %s with %d worker(s)",
+                            type(self._executor).__name__, self.workers)
+            return self._executor
+
+    def _reset_executor(self, broken: Executor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the pool.  The next job starts a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+    async def _run(self, op: str, fn, *args):
+        queued_at = time.perf_counter()
+        _QUEUED.inc()
+        try:
+            await self._semaphore().acquire()
+        finally:
+            _QUEUED.dec()
+        started = time.perf_counter()
+        _WAIT_SECONDS.labels(op=op).observe(started - queued_at)
+        _IN_FLIGHT.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                logger.error("[password_hasher] Process pool broke — restarting it")
+                self._reset_executor(executor)
+                return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            _IN_FLIGHT.dec()
+            _RUN_SECONDS.labels(op=op).observe(time.perf_counter() - started)
+            self._semaphore().release()
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    async def hash(self, password: str) -> str:
+        check_password_length(password)
+        return await self._run("hash", bcrypt_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        if not plain_password or not hashed_password:
+            return False
+        if needs_rehash(hashed_password):
+            # SHA-256 / plaintext comparison is cheap — no need for the pool.
+            return verify_password(plain_password, hashed_password)
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> List[Optional[str]]:
+        """
+        Hash a batch in parallel.  Identical inputs still get distinct salts.
+        Passwords over bcrypt's limit come back as None so the caller can
+        report them per row (``hash_password()`` raises the 422).
+        """
+        async def one(password: str) -> Optional[str]:
+            try:
+                check_password_length(password)
+            except HTTPException:
+                return None
+            return await self._run("hash", bcrypt_hash, password)
+
+        return list(await asyncio.gather(*(one(p) for p in passwords)))
+
+
+password_hasher = PasswordHasher()
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
+
+
+async def hash_passwords_async(passwords: Sequence[str]) -> List[Optional[str]]:
+    return await password_hasher.hash_many(passwords)
+
+
+async def upgrade_legacy_hash(db, user, plain_password: str, attr: str = "password") -> bool:
+    """
+    After a successful login, replace a legacy SHA-256 / plaintext password
+    with a bcrypt hash and commit.  Never fails the login: errors are logged
+    and rolled back.  Returns True when the hash was upgraded.
+    """
+    if not needs_rehash(getattr(user, attr, None)):
+        return False
+    try:
+        setattr(user, attr, await hash_password_async(plain_password))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning("[password_hasher] Legacy rehash failed for %s: %s", type(user).__name__, e)
+        return False
+    _REHASHED.inc()
+    logger.info("[password_hasher] Upgraded legacy password hash for %s", type(user).__name__)
+    return True
@@ -94,6 +94,18 @@ def hash_password(password: str) -> str:
         72-byte hard limit.  The caller receives a clear validation error
         instead of an opaque 500.
     """
+    check_password_length(password)
+    return bcrypt_hash(password)
+
+
+def bcrypt_hash(password: str) -> str:
+    """bcrypt-hash a password already checked by check_password_length()."""
+    hashed = _bcrypt.hashpw(password.encode("utf-8"), _bcrypt.gensalt())
+    return hashed.decode("utf-8")
+
+
+def check_password_length(password: str) -> None:
+    """Raise HTTPException 422 if the password exceeds bcrypt's 72-byte limit."""
     encoded = password.encode("utf-8")
     if len(encoded) > _BCRYPT_MAX_BYTES:
         raise HTTPException(
@@ -112,8 +124,6 @@ def hash_password(password: str) -> str:
                 },
             },
         )
-    hashed = _bcrypt.hashpw(encoded, _bcrypt.gensalt())
-    return hashed.decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -142,3 +152,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     # Final fallback for unexpected legacy/plaintext storage
     return hmac.compare_digest(plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: Optional[str]) -> bool:
+    """True for stored passwords that are not bcrypt (legacy SHA-256 or plaintext)."""
+    return bool(hashed_password) and not hashed_password.startswith("$2")
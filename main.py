@@ -111,10 +111,29 @@ async def lifespan(app: FastAPI):
     scheduler.start()
     logger.info("Background scheduler started")
 
+    # ── Alert auto-escalation deadlines ────────────────────────
+    from app.services.alert_escalation_scheduler import escalation_scheduler
+    await escalation_scheduler.start()
+    logger.info("Alert escalation scheduler started")
+
+    # ── Chat stream fan-out (Redis pub/sub listener) ───────────
+    from app.services.chat_stream import hub as chat_stream_hub
+    if settings.CHAT_STREAM_ENABLED:
+        chat_stream_hub.start()
+
     yield  # ← application runs here
 
     # ── Graceful shutdown ──────────────────────────────────────
+    await escalation_scheduler.stop()
+    chat_stream_hub.stop()
     scheduler.stop(wait=True)
+    # Flush any coalesced driver locations still waiting for Firebase
+    from app.firebase.location_writer import location_writer
+    location_writer.stop()
+    from common_utils.auth.password_hasher import password_hasher
+    password_hasher.shutdown()
+    from app.services import translation_service
+    await translation_service.aclose()
     logger.info("🛑 Application shutting down…")
 
 
@@ -0,0 +1,52 @@
+"""add_speed_violation_episodes
+
+Revision ID: 20260620_speed_episodes
+Revises: 20260611_contracts
+Create Date: 2026-06-20 10:00:00.000000
+
+Server-side speed detection now records one row per overspeed episode
+instead of one row per GPS ping:
+
+  speed_violations.avg_speed         mean over-limit speed in the episode
+  speed_violations.ping_count        over-limit pings folded into the row
+  speed_violations.ended_at          NULL while the episode is still open
+  speed_violations.duration_seconds  ended_at - recorded_at
+  speed_violations.end_latitude      position when the episode closed
+  speed_violations.end_longitude
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision      = "20260620_speed_episodes"
+down_revision = "20260611_contracts"
+branch_labels = None
+depends_on    = None
+
+
+_COLUMNS = [
+    ("avg_speed",        sa.Float()),
+    ("ping_count",       sa.Integer()),
+    ("ended_at",         sa.DateTime(timezone=True)),
+    ("duration_seconds", sa.Integer()),
+    ("end_latitude",     sa.Float()),
+    ("end_longitude",    sa.Float()),
+]
+
+
+def _has_column(table: str, column: str) -> bool:
+    bind = op.get_bind()
+    cols = [c["name"] for c in sa.inspect(bind).get_columns(table)]
+    return column in cols
+
+
+def upgrade() -> None:
+    for name, type_ in _COLUMNS:
+        if not _has_column("speed_violations", name):
+            op.add_column("speed_violations", sa.Column(name, type_, nullable=True))
+
+
+def downgrade() -> None:
+    for name, _type in reversed(_COLUMNS):
+        op.drop_column("speed_violations", name)
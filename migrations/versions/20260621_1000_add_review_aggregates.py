@@ -0,0 +1,70 @@
+"""add_review_aggregates
+
+Revision ID: 20260621_review_aggregates
+Revises: 20260620_speed_episodes
+Create Date: 2026-06-21 10:00:00.000000
+
+Precomputed driver / vehicle review summaries:
+
+  review_aggregates       running rating sums / counts and tag map per subject
+  review_aggregate_daily  per-day buckets for rolling 30 / 90-day windows
+
+No data backfill here — a subject's rows are built from ride_reviews the
+first time it is read or reviewed (review_aggregate_service.rebuild_subject).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers
+revision      = "20260621_review_aggregates"
+down_revision = "20260620_speed_episodes"
+branch_labels = None
+depends_on    = None
+
+_JsonB = sa.JSON().with_variant(JSONB(), "postgresql")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "review_aggregates",
+        sa.Column("aggregate_id",  sa.Integer(),    autoincrement=True, nullable=False),
+        sa.Column("tenant_id",     sa.String(50),   nullable=False),
+        sa.Column("subject_type",  sa.String(20),   nullable=False),   # "DRIVER" | "VEHICLE"
+        sa.Column("subject_id",    sa.Integer(),    nullable=False),
+        sa.Column("rating_sum",    sa.Integer(),    nullable=False, server_default="0"),
+        sa.Column("rating_count",  sa.Integer(),    nullable=False, server_default="0"),
+        sa.Column("overall_sum",   sa.Integer(),    nullable=False, server_default="0"),
+        sa.Column("overall_count", sa.Integer(),    nullable=False, server_default="0"),
+        sa.Column("tag_counts",    _JsonB,          nullable=False, server_default="{}"),
+        sa.Column("created_at",    sa.DateTime(),   server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at",    sa.DateTime(),   server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("aggregate_id"),
+        sa.UniqueConstraint("tenant_id", "subject_type", "subject_id", name="uq_review_aggregate_subject"),
+    )
+    op.create_index("ix_review_aggregates_tenant_id", "review_aggregates", ["tenant_id"])
+
+    op.create_table(
+        "review_aggregate_daily",
+        sa.Column("bucket_id",     sa.Integer(),    autoincrement=True, nullable=False),
+        sa.Column("tenant_id",     sa.String(50),   nullable=False),
+        sa.Column("subject_type",  sa.String(20),   nullable=False),
+        sa.Column("subject_id",    sa.Integer(),    nullable=False),
+        sa.Column("day",           sa.Date(),       nullable=False),
+        sa.Column("rating_sum",    sa.Integer(),    nullable=False, server_default="0"),
+        sa.Column("rating_count",  sa.Integer(),    nullable=False, server_default="0"),
+        sa.Column("tag_counts",    _JsonB,          nullable=False, server_default="{}"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("bucket_id"),
+        sa.UniqueConstraint("tenant_id", "subject_type", "subject_id", "day", name="uq_review_aggregate_daily"),
+    )
+    op.create_index("ix_review_aggregate_daily_tenant_id", "review_aggregate_daily", ["tenant_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_aggregate_daily_tenant_id", table_name="review_aggregate_daily")
+    op.drop_table("review_aggregate_daily")
+    op.drop_index("ix_review_aggregates_tenant_id", table_name="review_aggregates")
+    op.drop_table("review_aggregates")
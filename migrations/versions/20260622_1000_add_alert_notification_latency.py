@@ -0,0 +1,36 @@
+"""add_alert_notification_latency
+
+Revision ID: 20260622_alert_latency
+Revises: 20260621_review_aggregates
+Create Date: 2026-06-22 10:00:00.000000
+
+Alert fan-out now sends every channel concurrently and records, per
+notification, how long the provider took from the start of the fan-out:
+
+  alert_notifications.latency_ms   MIN / MAX per alert = time-to-first /
+                                   time-to-all-notified
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision      = "20260622_alert_latency"
+down_revision = "20260621_review_aggregates"
+branch_labels = None
+depends_on    = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    bind = op.get_bind()
+    cols = [c["name"] for c in sa.inspect(bind).get_columns(table)]
+    return column in cols
+
+
+def upgrade() -> None:
+    if not _has_column("alert_notifications", "latency_ms"):
+        op.add_column("alert_notifications", sa.Column("latency_ms", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("alert_notifications", "latency_ms")
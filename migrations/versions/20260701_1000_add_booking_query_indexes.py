@@ -0,0 +1,71 @@
+"""add_booking_query_indexes
+
+Revision ID: 20260701_booking_query_idx
+Revises: 20260622_alert_latency
+Create Date: 2026-07-01 10:00:00.000000
+
+Indexes for the booking list / grouping / routing hot paths (see
+app/utils/query_plan_audit.py):
+
+  - Index: bookings(tenant_id, booking_date, shift_id, status) INCLUDE (booking_id)
+           — create_routes, route_suggestion, shift grouping, analytics.
+           Replaces bookings(tenant_id, booking_date), its leading prefix.
+  - Partial index: bookings(booking_date) WHERE status = 'SCHEDULED'
+           AND reminder_sent_at IS NULL — reminder scheduler tick
+  - Index: route_management(tenant_id, created_at) — dashboard route counts
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision      = "20260701_booking_query_idx"
+down_revision = "20260622_alert_latency"
+branch_labels = None
+depends_on    = None
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    result = bind.execute(
+        sa.text("SELECT 1 FROM pg_indexes WHERE indexname = :name"),
+        {"name": index_name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _index_exists(bind, "ix_bookings_tenant_date_shift_status"):
+        op.create_index(
+            "ix_bookings_tenant_date_shift_status",
+            "bookings",
+            ["tenant_id", "booking_date", "shift_id", "status"],
+            postgresql_include=["booking_id"],
+        )
+    if _index_exists(bind, "ix_bookings_tenant_date"):
+        op.drop_index("ix_bookings_tenant_date", table_name="bookings")
+
+    if not _index_exists(bind, "ix_bookings_reminder_due"):
+        op.create_index(
+            "ix_bookings_reminder_due",
+            "bookings",
+            ["booking_date"],
+            postgresql_where=sa.text("status = 'SCHEDULED' AND reminder_sent_at IS NULL"),
+        )
+
+    if not _index_exists(bind, "ix_rm_tenant_created"):
+        op.create_index("ix_rm_tenant_created", "route_management", ["tenant_id", "created_at"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if _index_exists(bind, "ix_rm_tenant_created"):
+        op.drop_index("ix_rm_tenant_created", table_name="route_management")
+    if _index_exists(bind, "ix_bookings_reminder_due"):
+        op.drop_index("ix_bookings_reminder_due", table_name="bookings")
+    if not _index_exists(bind, "ix_bookings_tenant_date"):
+        op.create_index("ix_bookings_tenant_date", "bookings", ["tenant_id", "booking_date"])
+    if _index_exists(bind, "ix_bookings_tenant_date_shift_status"):
+        op.drop_index("ix_bookings_tenant_date_shift_status", table_name="bookings")
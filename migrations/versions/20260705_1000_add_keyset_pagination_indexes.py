@@ -0,0 +1,84 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 20260705_keyset_page_idx
+Revises: 20260701_booking_query_idx
+Create Date: 2026-07-05 10:00:00.000000
+
+Indexes ending in each listing's keyset sort key (see
+app/utils/pagination.keyset_paginate), so a cursor page is one index range
+scan however deep it is:
+
+  - audit_logs(tenant_id, module, created_at, audit_id)
+           — replaces audit_logs(tenant_id, module), its leading prefix
+  - ride_reviews(tenant_id, created_at, review_id)
+  - speed_violations(tenant_id, recorded_at, violation_id)
+           — replaces speed_violations(tenant_id, recorded_at)
+  - speed_violations(tenant_id, driver_id, recorded_at, violation_id)
+           — replaces speed_violations(tenant_id, driver_id)
+  - announcement_recipients(announcement_id, recipient_id)
+  - bookings(tenant_id, booking_id)
+  - bookings(employee_id, booking_id) — replaces bookings(employee_id)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision      = "20260705_keyset_page_idx"
+down_revision = "20260701_booking_query_idx"
+branch_labels = None
+depends_on    = None
+
+
+# (name, table, columns, replaced index or None, its columns)
+_INDEXES = [
+    ("idx_tenant_module_created", "audit_logs",
+     ["tenant_id", "module", "created_at", "audit_id"],
+     "idx_tenant_module", ["tenant_id", "module"]),
+    ("ix_ride_reviews_tenant_created", "ride_reviews",
+     ["tenant_id", "created_at", "review_id"],
+     None, None),
+    ("ix_speed_violations_tenant_recorded", "speed_violations",
+     ["tenant_id", "recorded_at", "violation_id"],
+     "ix_speed_violations_recorded_at", ["tenant_id", "recorded_at"]),
+    ("ix_speed_violations_tenant_driver_recorded", "speed_violations",
+     ["tenant_id", "driver_id", "recorded_at", "violation_id"],
+     "ix_speed_violations_tenant_driver", ["tenant_id", "driver_id"]),
+    ("ix_announcement_recipients_ann_recipient", "announcement_recipients",
+     ["announcement_id", "recipient_id"],
+     None, None),
+    ("ix_bookings_tenant_booking", "bookings",
+     ["tenant_id", "booking_id"],
+     None, None),
+    ("ix_bookings_employee_booking", "bookings",
+     ["employee_id", "booking_id"],
+     "ix_bookings_employee_id", ["employee_id"]),
+]
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    result = bind.execute(
+        sa.text("SELECT 1 FROM pg_indexes WHERE indexname = :name"),
+        {"name": index_name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    for name, table, columns, replaced, _ in _INDEXES:
+        if not _index_exists(bind, name):
+            op.create_index(name, table, columns)
+        if replaced and _index_exists(bind, replaced):
+            op.drop_index(replaced, table_name=table)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    for name, table, _, replaced, replaced_columns in reversed(_INDEXES):
+        if replaced and not _index_exists(bind, replaced):
+            op.create_index(replaced, table, replaced_columns)
+        if _index_exists(bind, name):
+            op.drop_index(name, table_name=table)
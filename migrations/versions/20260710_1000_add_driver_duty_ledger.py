@@ -0,0 +1,64 @@
+"""add_driver_duty_ledger
+
+Revision ID: 20260710_driver_duty_ledger
+Revises: 20260705_keyset_page_idx
+Create Date: 2026-07-10 10:00:00.000000
+
+Driver duty ledger (app.models.driver_duty_day): one row per driver per day
+with that day's merged duty intervals and duty total, read by the rest
+checks in app/services/driver_duty_hours_service.py.
+
+  driver_duty_days   PK (driver_id, duty_date)
+                     partial index on driver_id WHERE open_since IS NOT NULL
+                     — drivers with an ONGOING route
+
+No data backfill here — run scripts/rebuild_duty_ledger.py (default: the
+last 2 days, enough for the 24h rest window) right after upgrading.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers
+revision      = "20260710_driver_duty_ledger"
+down_revision = "20260705_keyset_page_idx"
+branch_labels = None
+depends_on    = None
+
+_JsonB = sa.JSON().with_variant(JSONB(), "postgresql")
+
+
+def _has_table(name: str) -> bool:
+    bind = op.get_bind()
+    return sa.inspect(bind).has_table(name)
+
+
+def upgrade() -> None:
+    if _has_table("driver_duty_days"):
+        return
+    op.create_table(
+        "driver_duty_days",
+        sa.Column("driver_id",    sa.Integer(),   nullable=False),
+        sa.Column("duty_date",    sa.Date(),      nullable=False),
+        sa.Column("tenant_id",    sa.String(50),  nullable=False),
+        sa.Column("intervals",    _JsonB,         nullable=False, server_default="[]"),
+        sa.Column("duty_minutes", sa.Integer(),   nullable=False, server_default="0"),
+        sa.Column("open_since",   sa.DateTime(),  nullable=True),
+        sa.Column("updated_at",   sa.DateTime(),  server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["driver_id"], ["drivers.driver_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("driver_id", "duty_date"),
+    )
+    op.create_index("ix_driver_duty_days_tenant_id", "driver_duty_days", ["tenant_id"])
+    op.create_index(
+        "ix_driver_duty_days_open", "driver_duty_days", ["driver_id"],
+        postgresql_where=sa.text("open_since IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    if not _has_table("driver_duty_days"):
+        return
+    op.drop_index("ix_driver_duty_days_open", table_name="driver_duty_days")
+    op.drop_index("ix_driver_duty_days_tenant_id", table_name="driver_duty_days")
+    op.drop_table("driver_duty_days")
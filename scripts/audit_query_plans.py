@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Query Plan Audit Script
+
+Purpose:
+- EXPLAIN the hot booking / routing / reminder / dashboard queries against a
+  real database (see app/utils/query_plan_audit.py)
+- Fail when any of them full-scans a large table
+
+Parameters default to the most recent booking in the database.
+
+Usage:
+    python scripts/audit_query_plans.py [--tenant-id HS001] [--date 2026-07-01]
+                                        [--shift-id 3] [--timings] [--verbose]
+"""
+import sys
+import os
+import argparse
+from datetime import date
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.database.session import SessionLocal
+from app.models.booking import Booking
+from app.models.route_management import RouteManagement, RouteManagementBooking
+from app.utils.query_plan_audit import AuditParams, audit
+
+
+def default_params(db, tenant_id: str = None) -> AuditParams:
+    """Build parameters from the newest booking (and its route, if any)."""
+    query = db.query(Booking)
+    if tenant_id:
+        query = query.filter(Booking.tenant_id == tenant_id)
+    booking = query.order_by(Booking.booking_id.desc()).first()
+    if booking is None:
+        raise SystemExit("No bookings found — pass --tenant-id/--date/--shift-id explicitly")
+
+    route = (
+        db.query(RouteManagement)
+        .join(RouteManagementBooking, RouteManagementBooking.route_id == RouteManagement.route_id)
+        .filter(RouteManagementBooking.booking_id == booking.booking_id)
+        .first()
+    )
+    return AuditParams(
+        tenant_id=booking.tenant_id,
+        booking_date=booking.booking_date,
+        shift_id=booking.shift_id,
+        driver_id=(route.assigned_driver_id if route else None) or 0,
+        employee_id=booking.employee_id,
+        route_id=route.route_id if route else 0,
+        booking_id=booking.booking_id,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="EXPLAIN the hot ORM queries and flag full scans of large tables"
+    )
+    parser.add_argument("--tenant-id", type=str, help="Tenant to build the queries for")
+    parser.add_argument("--date", type=date.fromisoformat, help="Booking date (YYYY-MM-DD)")
+    parser.add_argument("--shift-id", type=int, help="Shift id")
+    parser.add_argument("--timings", action="store_true", help="Also report the median run time")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan")
+
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        params = default_params(db, args.tenant_id)
+        if args.date:
+            params.booking_date = args.date
+        if args.shift_id:
+            params.shift_id = args.shift_id
+
+        print(f"🔍 Auditing query plans for {params}")
+        reports = audit(db, params, timings=args.timings)
+        db.rollback()
+    finally:
+        db.close()
+
+    for report in reports:
+        verdict = "✅" if report.ok else f"❌ full scan: {', '.join(report.full_scans)}"
+        timing = f"  {report.median_ms:8.2f} ms" if report.median_ms is not None else ""
+        print(f"{report.name:32s}{timing}  {verdict}  ({report.source})")
+        if args.verbose or not report.ok:
+            for line in report.plan:
+                print(f"      {line}")
+
+    failing = [r for r in reports if not r.ok]
+    print(f"\n{len(reports) - len(failing)}/{len(reports)} queries avoid full scans")
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
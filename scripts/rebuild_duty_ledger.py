@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Duty Ledger Rebuild Script
+
+Purpose:
+- Backfill driver_duty_days from route_management after the ledger
+  migration (20260710_driver_duty_ledger)
+- Repair the ledger after routes were changed with bulk UPDATEs, which
+  bypass the session hook that normally keeps it in step
+
+Usage:
+    python scripts/rebuild_duty_ledger.py [--days 2] [--since 2026-07-01]
+                                          [--until 2026-07-10] [--tenant-id HS001]
+"""
+import sys
+import os
+import argparse
+from datetime import date, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.database.session import SessionLocal
+from app.services.driver_duty_hours_service import rebuild_duty_ledger
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the driver duty ledger from route_management"
+    )
+    parser.add_argument("--days", type=int, default=2,
+                        help="Days back from --until to rebuild (default 2: the rest-check window)")
+    parser.add_argument("--since", type=date.fromisoformat, help="First day (YYYY-MM-DD); overrides --days")
+    parser.add_argument("--until", type=date.fromisoformat, default=date.today(), help="Last day (YYYY-MM-DD)")
+    parser.add_argument("--tenant-id", type=str, help="Only rebuild this tenant")
+
+    args = parser.parse_args()
+    since = args.since or args.until - timedelta(days=args.days - 1)
+    if since > args.until:
+        parser.error("--since is after --until")
+
+    db = SessionLocal()
+    try:
+        print(f"🔁 Rebuilding duty ledger {since} → {args.until}"
+              + (f" for tenant {args.tenant_id}" if args.tenant_id else ""))
+        rows = rebuild_duty_ledger(db, since, args.until, tenant_id=args.tenant_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"✅ {rows} driver-day rows written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
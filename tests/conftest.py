@@ -23,6 +23,15 @@ from common_utils.auth.utils import hash_password, create_access_token
 # Test database URL - using in-memory SQLite for tests
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
 
+@pytest.fixture(autouse=True)
+def _reset_alert_config_index():
+    """Each test gets a fresh database, so compiled config indexes must not carry over."""
+    from app.services import alert_config_index
+    alert_config_index._indexes.clear()
+    yield
+    alert_config_index._indexes.clear()
+
+
 @pytest.fixture(scope="function")
 def test_db():
     """
@@ -0,0 +1,127 @@
+"""
+tests/test_alert_config_index.py
+---------------------------------
+Compiled per-tenant alert configuration index.
+
+Test coverage:
+1. Resolution order: team config before tenant-wide, higher priority first,
+   configs without applicable_alert_types match every type.
+2. A warm index resolves without touching the database.
+3. invalidate() through Redis makes every worker's in-process copy stale;
+   a worker with a stale copy picks up the compiled rows from Redis.
+4. get_applicable_configuration recovers from a write that skipped
+   invalidation.
+
+Redis is fakeredis.
+"""
+
+import fakeredis
+import pytest
+from sqlalchemy import event
+
+from app.crud import alert as alert_crud
+from app.models.alert import AlertConfiguration, AlertTypeEnum
+from app.services import alert_config_index
+from app.services.alert_config_index import AlertConfigIndex
+
+
+def _row(config_id, team_id=None, types=None, priority=100):
+    return {"config_id": config_id, "team_id": team_id, "types": types, "priority": priority}
+
+
+class TestResolution:
+
+    def test_team_before_tenant_and_priority_order(self):
+        index = AlertConfigIndex([
+            _row(1, types=None, priority=100),
+            _row(2, types=["SOS"], priority=200),
+            _row(3, team_id=7, types=["MEDICAL"], priority=10),
+        ])
+
+        assert index.resolve(AlertTypeEnum.SOS) == 2
+        assert index.resolve(AlertTypeEnum.SOS, team_id=7) == 2
+        assert index.resolve(AlertTypeEnum.MEDICAL, team_id=7) == 3
+        assert index.resolve(AlertTypeEnum.MEDICAL) == 1
+        assert index.candidates("SOS", team_id=7) == [2, 1]
+
+    def test_no_match(self):
+        index = AlertConfigIndex([_row(1, types=["SOS"])])
+        assert index.resolve(AlertTypeEnum.MEDICAL) is None
+        assert AlertConfigIndex([]).resolve(AlertTypeEnum.SOS) is None
+
+
+def _config(db, tenant_id, team_id=None, types=None, priority=100):
+    cfg = AlertConfiguration(
+        tenant_id=tenant_id,
+        team_id=team_id,
+        config_name=f"cfg-{team_id}-{priority}",
+        applicable_alert_types=types,
+        primary_recipients=[],
+        notification_channels=["EMAIL"],
+        priority=priority,
+    )
+    db.add(cfg)
+    db.commit()
+    return cfg
+
+
+def _count_statements(db, fn):
+    statements = []
+    engine = db.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, statements
+
+
+class TestTenantCache:
+
+    def test_warm_index_skips_the_database(self, test_db, test_tenant):
+        cfg = _config(test_db, test_tenant.tenant_id, types=["SOS"])
+        alert_crud.get_applicable_configuration(test_db, test_tenant.tenant_id, AlertTypeEnum.SOS)
+
+        found, statements = _count_statements(
+            test_db,
+            lambda: alert_crud.get_applicable_configuration(test_db, test_tenant.tenant_id, AlertTypeEnum.SOS),
+        )
+        assert found.config_id == cfg.config_id
+        assert statements == []
+
+    def test_redis_invalidation_reaches_other_workers(self, test_db, test_tenant):
+        tid = test_tenant.tenant_id
+        client = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+        first = _config(test_db, tid, types=["SOS"], priority=100)
+
+        stale = alert_config_index.get_index(test_db, tid, client=client)
+        assert stale.resolve(AlertTypeEnum.SOS) == first.config_id
+
+        # Another worker adds a higher-priority config and invalidates.
+        second = _config(test_db, tid, types=["SOS"], priority=500)
+        alert_config_index._indexes.clear()
+        alert_config_index.invalidate(tid, client=client)
+        rebuilt = alert_config_index.get_index(test_db, tid, client=client)
+        assert rebuilt.resolve(AlertTypeEnum.SOS) == second.config_id
+
+        # This worker still holds the stale copy; the version bump retires it
+        # and the compiled rows come from Redis rather than the database.
+        alert_config_index._indexes[tid] = stale
+        index, statements = _count_statements(
+            test_db, lambda: alert_config_index.get_index(test_db, tid, client=client),
+        )
+        assert index.resolve(AlertTypeEnum.SOS) == second.config_id
+        assert statements == []
+
+    def test_recovers_from_unindexed_write(self, test_db, test_tenant):
+        tid = test_tenant.tenant_id
+        old = _config(test_db, tid, types=["SOS"], priority=500)
+        fallback = _config(test_db, tid, types=None, priority=100)
+        alert_crud.get_applicable_configuration(test_db, tid, AlertTypeEnum.SOS)
+
+        old.is_active = False      # written without invalidate()
+        test_db.commit()
+
+        found = alert_crud.get_applicable_configuration(test_db, tid, AlertTypeEnum.SOS)
+        assert found.config_id == fallback.config_id
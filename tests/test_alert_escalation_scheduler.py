@@ -0,0 +1,197 @@
+"""
+tests/test_alert_escalation_scheduler.py
+-----------------------------------------
+Deadline-driven alert auto-escalation.
+
+Test coverage:
+1. Heap and Redis deadline stores return due alerts in due order, honour
+   cancel, and hide a claimed deadline for the lease.
+2. Two workers sharing one Redis never claim the same deadline.
+3. run_due escalates an overdue alert exactly once and notifies; an
+   acknowledged alert is dropped; a deadline that fires early is re-registered.
+4. The running loop escalates an alert when its deadline passes.
+
+Redis is fakeredis; notifications are stubbed at send_escalation_notification.
+"""
+
+import asyncio
+import sys
+import time
+from datetime import timedelta
+
+import fakeredis
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.alert import (
+    Alert, AlertConfiguration, AlertEscalation, AlertSeverityEnum, AlertStatusEnum, AlertTypeEnum,
+)
+import app.routes.alert_router  # noqa: F401 — registers the module patched below
+from app.services.alert_escalation_scheduler import (
+    AlertEscalationScheduler, HeapDeadlineStore, RedisDeadlineStore,
+)
+from common_utils import get_current_ist_time
+
+
+def _redis():
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+@pytest.fixture(params=["heap", "redis"])
+def store(request):
+    return HeapDeadlineStore() if request.param == "heap" else RedisDeadlineStore(_redis())
+
+
+class TestDeadlineStore:
+
+    def test_claims_due_in_order_and_honours_cancel(self, store):
+        store.add(1, 10, 100.0)
+        store.add(2, 20, 50.0)
+        store.add(3, 30, 300.0)
+        store.remove(3)
+
+        assert store.next_due() == 50.0
+        assert store.claim(now=200.0, lease=60, limit=10) == [(2, 20), (1, 10)]
+        assert not store.contains(3)
+
+    def test_claim_hides_until_lease_expires(self, store):
+        store.add(1, 10, 100.0)
+
+        assert store.claim(now=100.0, lease=60, limit=10) == [(1, 10)]
+        assert store.claim(now=150.0, lease=60, limit=10) == []
+        # Worker died without releasing — retried after the lease.
+        assert store.claim(now=161.0, lease=60, limit=10) == [(1, 10)]
+
+    def test_reschedule_replaces_deadline(self, store):
+        store.add(1, 10, 100.0)
+        store.add(1, 10, 500.0)
+
+        assert store.claim(now=200.0, lease=60, limit=10) == []
+        assert store.next_due() == 500.0
+
+
+def test_workers_never_share_a_claim():
+    client = _redis()
+    first, second = RedisDeadlineStore(client), RedisDeadlineStore(client)
+    for alert_id in range(40):
+        first.add(alert_id, 1, float(alert_id))
+
+    a = first.claim(now=100.0, lease=60, limit=25)
+    b = second.claim(now=100.0, lease=60, limit=25)
+
+    assert len(a) == 25 and len(b) == 15
+    assert not {x for x, _ in a} & {x for x, _ in b}
+
+
+@pytest.fixture
+def config(test_db, test_tenant):
+    cfg = AlertConfiguration(
+        tenant_id=test_tenant.tenant_id,
+        config_name="Default",
+        primary_recipients=[],
+        escalation_recipients=[{"name": "Ops", "email": "ops@example.com", "channels": ["EMAIL"]}],
+        notification_channels=["EMAIL"],
+        enable_escalation=True,
+        escalation_threshold_seconds=300,
+    )
+    test_db.add(cfg)
+    test_db.commit()
+    return cfg
+
+
+def _alert(db, employee_user, age_seconds, status=AlertStatusEnum.TRIGGERED):
+    alert = Alert(
+        tenant_id=employee_user["tenant"].tenant_id,
+        employee_id=employee_user["employee"].employee_id,
+        alert_type=AlertTypeEnum.SOS,
+        severity=AlertSeverityEnum.CRITICAL,
+        status=status,
+        trigger_latitude=12.9716,
+        trigger_longitude=77.5946,
+        triggered_at=get_current_ist_time() - timedelta(seconds=age_seconds),
+    )
+    db.add(alert)
+    db.commit()
+    return alert
+
+
+@pytest.fixture
+def notified(monkeypatch):
+    calls = []
+
+    async def fake_notification(alert_id, config_id, escalation_level):
+        calls.append((alert_id, config_id, escalation_level))
+
+    monkeypatch.setattr(sys.modules["app.routes.alert_router"], "send_escalation_notification", fake_notification)
+    return calls
+
+
+def _scheduler(db):
+    return AlertEscalationScheduler(
+        store=HeapDeadlineStore(),
+        session_factory=sessionmaker(autoflush=False, bind=db.get_bind()),
+    )
+
+
+def _escalations(db, alert):
+    db.expire_all()
+    return db.query(AlertEscalation).filter(AlertEscalation.alert_id == alert.alert_id).all()
+
+
+class TestFiring:
+
+    def test_overdue_alert_escalates_once(self, test_db, employee_user, config, notified):
+        alert = _alert(test_db, employee_user, age_seconds=400)
+        scheduler = _scheduler(test_db)
+        assert scheduler.schedule(alert, config) <= time.time()
+
+        assert asyncio.run(scheduler.run_due()) == 1
+        assert asyncio.run(scheduler.run_due(now=time.time() + 3600)) == 0
+
+        escalations = _escalations(test_db, alert)
+        assert len(escalations) == 1 and escalations[0].is_automatic
+        assert test_db.get(Alert, alert.alert_id).auto_escalated
+        assert notified == [(alert.alert_id, config.config_id, 1)]
+        assert not scheduler.store.contains(alert.alert_id)
+
+    def test_acknowledged_alert_is_dropped(self, test_db, employee_user, config, notified):
+        alert = _alert(test_db, employee_user, age_seconds=400)
+        scheduler = _scheduler(test_db)
+        scheduler.schedule(alert, config)
+        alert.status = AlertStatusEnum.ACKNOWLEDGED
+        test_db.commit()
+
+        assert asyncio.run(scheduler.run_due()) == 0
+        assert _escalations(test_db, alert) == []
+        assert notified == []
+        assert not scheduler.store.contains(alert.alert_id)
+
+    def test_early_fire_is_rescheduled(self, test_db, employee_user, config, notified):
+        alert = _alert(test_db, employee_user, age_seconds=10)
+        scheduler = _scheduler(test_db)
+        due = scheduler.schedule(alert, config)
+
+        # Claimed well before the threshold (e.g. clock skew between workers).
+        assert asyncio.run(scheduler.run_due(now=due)) == 0
+        assert _escalations(test_db, alert) == []
+        assert scheduler.store.next_due() == pytest.approx(due, abs=1)
+
+    def test_loop_fires_when_due(self, test_db, employee_user, config, notified):
+        config.escalation_threshold_seconds = 1
+        test_db.commit()
+        alert = _alert(test_db, employee_user, age_seconds=0)
+        scheduler = _scheduler(test_db)
+
+        async def scenario():
+            await scheduler.start()
+            try:
+                scheduler.schedule(alert, config)
+                for _ in range(40):
+                    if notified:
+                        break
+                    await asyncio.sleep(0.05)
+            finally:
+                await scheduler.stop()
+
+        asyncio.run(scenario())
+        assert notified == [(alert.alert_id, config.config_id, 1)]
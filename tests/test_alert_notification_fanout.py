@@ -0,0 +1,133 @@
+"""
+tests/test_alert_notification_fanout.py
+----------------------------------------
+Concurrent, latency-budgeted alert notification fan-out.
+
+Test coverage:
+1. Every (recipient, channel) is sent concurrently — wall time is one
+   provider call, not the sum — and latency_ms is recorded per row.
+2. A channel that outlives the budget is marked FAILED without delaying
+   the others.
+3. All emails of one fan-out go through a single batched send.
+4. A provider exception only fails its own row.
+
+Providers are stubbed at NotificationService._deliver / _send_emails — no
+SMTP, Twilio or FCM.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.alert import (
+    Alert, AlertNotification, AlertSeverityEnum, AlertStatusEnum, AlertTypeEnum,
+    NotificationChannelEnum, NotificationStatusEnum,
+)
+from app.services.notification_service import NotificationService
+
+
+@pytest.fixture
+def alert(test_db, employee_user):
+    a = Alert(
+        tenant_id=employee_user["tenant"].tenant_id,
+        employee_id=employee_user["employee"].employee_id,
+        alert_type=AlertTypeEnum.SOS,
+        severity=AlertSeverityEnum.CRITICAL,
+        status=AlertStatusEnum.TRIGGERED,
+        trigger_latitude=12.9716,
+        trigger_longitude=77.5946,
+    )
+    test_db.add(a)
+    test_db.commit()
+    test_db.refresh(a)
+    return a
+
+
+def _config(recipients):
+    return SimpleNamespace(primary_recipients=recipients, escalation_recipients=[],
+                           notify_on_escalation=True, notify_on_status_change=True)
+
+
+def _recipient(i, channels):
+    return {"name": f"R{i}", "email": f"r{i}@example.com", "phone": f"+9100000000{i}",
+            "user_type": "admin", "user_id": i, "channels": channels}
+
+
+def _service(test_db, delays, budget=5.0, fail=()):
+    svc = NotificationService(test_db, budget_seconds=budget)
+    calls = {"emails": []}
+
+    async def fake_deliver(notification, recipient, channel, subject, message, alert):
+        if channel.value in fail:
+            raise RuntimeError(f"{channel.value} provider down")
+        await asyncio.sleep(delays.get(channel.value, 0))
+        return True
+
+    async def fake_emails(to_emails, subject, message):
+        calls["emails"].append(list(to_emails))
+        await asyncio.sleep(delays.get("EMAIL", 0))
+        return [True] * len(to_emails)
+
+    svc._deliver = fake_deliver
+    svc._send_emails = fake_emails
+    return svc, calls
+
+
+def _rows(db, alert):
+    db.expire_all()
+    return db.query(AlertNotification).filter(AlertNotification.alert_id == alert.alert_id).all()
+
+
+class TestFanOut:
+
+    def test_channels_are_sent_concurrently(self, test_db, alert):
+        svc, _ = _service(test_db, {"SMS": 0.2, "PUSH": 0.2, "VOICE": 0.2})
+        recipients = [_recipient(i, ["SMS", "PUSH", "VOICE"]) for i in range(4)]
+
+        started = time.perf_counter()
+        notifications = asyncio.run(svc.notify_alert_triggered(alert, _config(recipients)))
+        elapsed = time.perf_counter() - started
+
+        assert len(notifications) == 12
+        assert elapsed < 1.0   # sequential would be 12 × 0.2 s
+        rows = _rows(test_db, alert)
+        assert all(r.status == NotificationStatusEnum.SENT for r in rows)
+        assert all(r.latency_ms is not None and r.latency_ms >= 150 for r in rows)
+
+    def test_slow_channel_is_cut_at_budget(self, test_db, alert):
+        svc, _ = _service(test_db, {"SMS": 0.01, "VOICE": 5}, budget=0.3)
+        recipients = [_recipient(1, ["SMS", "VOICE"])]
+
+        started = time.perf_counter()
+        asyncio.run(svc.notify_alert_triggered(alert, _config(recipients)))
+        assert time.perf_counter() - started < 1.5
+
+        by_channel = {r.channel: r for r in _rows(test_db, alert)}
+        assert by_channel[NotificationChannelEnum.SMS].status == NotificationStatusEnum.SENT
+        assert by_channel[NotificationChannelEnum.SMS].latency_ms < 300
+        voice = by_channel[NotificationChannelEnum.VOICE]
+        assert voice.status == NotificationStatusEnum.FAILED
+        assert "budget" in voice.failure_reason
+
+    def test_emails_share_one_batch(self, test_db, alert):
+        svc, calls = _service(test_db, {})
+        recipients = [_recipient(i, ["EMAIL", "PUSH"]) for i in range(3)]
+
+        asyncio.run(svc.notify_alert_triggered(alert, _config(recipients)))
+
+        assert calls["emails"] == [["r0@example.com", "r1@example.com", "r2@example.com"]]
+        assert len(_rows(test_db, alert)) == 6
+
+    def test_provider_error_only_fails_its_row(self, test_db, alert):
+        svc, _ = _service(test_db, {}, fail=("SMS",))
+        recipients = [_recipient(1, ["SMS", "PUSH", "BOGUS"])]
+
+        asyncio.run(svc.notify_alert_triggered(alert, _config(recipients)))
+
+        by_channel = {r.channel: r for r in _rows(test_db, alert)}
+        assert set(by_channel) == {NotificationChannelEnum.SMS, NotificationChannelEnum.PUSH}
+        assert by_channel[NotificationChannelEnum.SMS].status == NotificationStatusEnum.FAILED
+        assert "provider down" in by_channel[NotificationChannelEnum.SMS].failure_reason
+        assert by_channel[NotificationChannelEnum.PUSH].status == NotificationStatusEnum.SENT
@@ -31,7 +31,7 @@ from app.models.employee import Employee, GenderEnum
 from app.models.admin import Admin
 from app.models.driver import Driver, GenderEnum as DriverGenderEnum, VerificationStatusEnum
 from app.models.vendor_user import VendorUser
-from common_utils.auth.utils import hash_password
+from common_utils.auth.utils import hash_password, verify_password
 
 
 # ==========================================
@@ -173,6 +173,28 @@ class TestEmployeeLogin:
         assert "permissions" in data["data"]["user"]
         assert "tenant" in data["data"]["user"]
 
+    def test_employee_login_upgrades_legacy_sha256_hash(
+        self, client: TestClient, test_db, test_employee_auth, test_tenant
+    ):
+        """A legacy SHA-256 password still logs in and is rehashed to bcrypt"""
+        import hashlib
+        test_employee_auth.password = hashlib.sha256(b"TestPassword123!").hexdigest()
+        test_db.commit()
+
+        response = client.post(
+            "/api/v1/auth/employee/login",
+            json={
+                "username": test_employee_auth.email,
+                "password": "TestPassword123!",
+                "tenant_id": test_tenant.tenant_id
+            }
+        )
+
+        assert response.status_code == 200
+        test_db.refresh(test_employee_auth)
+        assert test_employee_auth.password.startswith("$2")
+        assert verify_password("TestPassword123!", test_employee_auth.password)
+
     def test_employee_login_invalid_credentials(
         self, client: TestClient, test_employee_auth, test_tenant
     ):
@@ -0,0 +1,148 @@
+"""
+tests/test_bulk_booking.py
+---------------------------
+Set-wise bulk booking engine (app/services/bulk_booking.py) and the
+POST /bookings/bulk-all-employees endpoint built on it.
+
+Test coverage:
+1. Employees x dates are booked, skipped (already booked) or failed
+   (weekoff, date-level cutoff / past shift) with a per-employee report,
+   and the number of statements does not grow with the employee count.
+2. Nodal shifts use the assigned nodal point and report employees with no
+   or an inactive nodal point.
+3. The endpoint returns the summary plus the per-employee report.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.cutoff import Cutoff
+from app.models.employee import Employee
+from app.models.nodal_point import EmployeeNodalPoint, NodalPoint
+from app.models.weekoff_config import WeekoffConfig
+from app.services.bulk_booking import bulk_book_employees
+
+IST = timezone(timedelta(hours=5, minutes=30))
+NOW = datetime(2026, 7, 6, 7, 0, tzinfo=IST)         # Monday 07:00 IST
+MON, TUE, WED = (date(2026, 7, 6) + timedelta(days=i) for i in range(3))
+
+
+@pytest.fixture
+def staff(test_db, test_tenant, test_employee):
+    """Active employee ids of the tenant, after adding four active and one inactive."""
+    base = test_employee["employee"]
+    for i in range(5):
+        employee = Employee(
+            employee_id=200 + i, tenant_id=test_tenant.tenant_id, role_id=base.role_id,
+            name=f"Bulk {i}", employee_code=f"BULK{i}", email=f"bulk{i}@test.com",
+            phone=f"+12000000{i:02d}", password="x", address=f"{i} Bulk Road",
+            latitude=12.0 + i, longitude=77.0, is_active=i < 4,
+        )
+        test_db.add(employee)
+    test_db.commit()
+    return [e for (e,) in test_db.query(Employee.employee_id).filter(
+        Employee.tenant_id == test_tenant.tenant_id, Employee.is_active.is_(True),
+    ).order_by(Employee.employee_id)]
+
+
+def _book(db, tenant, dates, **kwargs):
+    kwargs.setdefault("shift_id", 20)
+    kwargs.setdefault("shift_time", time(9, 0))
+    kwargs.setdefault("log_type", "IN")
+    kwargs.setdefault("nodal", False)
+    return bulk_book_employees(db, tenant.tenant_id, tenant, kwargs.pop("cutoff", None), booking_dates=dates, now=NOW, **kwargs)
+
+
+def test_eligibility_is_decided_per_employee_and_date(test_db, test_tenant, test_shift, staff):
+    weekoff_emp, booked_emp = staff[1], staff[2]
+    test_db.add(WeekoffConfig(employee_id=weekoff_emp, tuesday=True))
+    test_db.add(Booking(
+        tenant_id=test_tenant.tenant_id, employee_id=booked_emp, employee_code="BULK0",
+        shift_id=test_shift.shift_id, booking_date=WED, status=BookingStatusEnum.SCHEDULED,
+    ))
+    test_db.add(Booking(   # cancelled bookings don't block a new one
+        tenant_id=test_tenant.tenant_id, employee_id=booked_emp, employee_code="BULK0",
+        shift_id=test_shift.shift_id, booking_date=TUE, status=BookingStatusEnum.CANCELLED,
+    ))
+    test_db.commit()
+
+    # MON 09:00 is two hours away, inside the 3h login cutoff.
+    cutoff = Cutoff(tenant_id=test_tenant.tenant_id, booking_login_cutoff=timedelta(hours=3))
+    report = _book(test_db, test_tenant, [WED, MON, TUE], cutoff=cutoff)
+    test_db.commit()
+
+    by_id = {e.employee_id: e for e in report.employees}
+    assert sorted(by_id) == staff
+    assert by_id[weekoff_emp].booked == [WED]
+    assert by_id[weekoff_emp].failed[1] == {"booking_date": TUE, "reason": "Weekoff day (tuesday)", "error_code": "WEEKOFF_DAY"}
+    assert by_id[booked_emp].booked == [TUE] and by_id[booked_emp].skipped == [WED]
+    assert all(e.failed[0]["error_code"] == "BOOKING_CUTOFF" and e.failed[0]["booking_date"] == MON for e in report.employees)
+    n = len(staff)
+    assert (report.booked, report.skipped, report.failed) == (2 * n - 2, 1, n + 1)
+
+    created = test_db.query(Booking).filter(Booking.status == BookingStatusEnum.REQUEST).all()
+    assert len(created) == 2 * n - 2
+    row = next(b for b in created if b.employee_id == 201)
+    assert (row.pickup_latitude, row.pickup_location) == (13.0, "1 Bulk Road")
+    assert (row.drop_latitude, row.drop_location) == (test_tenant.latitude, test_tenant.address)
+
+
+def test_statement_count_does_not_depend_on_employees(test_db, test_tenant, test_shift, staff):
+    def run(employee_ids):
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(test_db.get_bind(), "before_cursor_execute", listener)
+        try:
+            _book(test_db, test_tenant, [TUE, WED], employee_ids=employee_ids)
+        finally:
+            event.remove(test_db.get_bind(), "before_cursor_execute", listener)
+        test_db.rollback()
+        test_db.refresh(test_tenant)
+        return statements
+
+    few, many = run(staff[:1]), run(staff)
+    assert len(few) == len(many) == 4
+    assert sum(1 for s in many if s.lstrip().upper().startswith("INSERT")) == 1
+
+
+def test_nodal_shift_uses_assigned_points(test_db, test_tenant, test_shift, staff):
+    active = NodalPoint(tenant_id=test_tenant.tenant_id, name="Gate A", latitude=13.5, longitude=77.5)
+    closed = NodalPoint(tenant_id=test_tenant.tenant_id, name="Gate B", latitude=13.6, longitude=77.6, is_active=False)
+    test_db.add_all([active, closed])
+    test_db.flush()
+    test_db.add(EmployeeNodalPoint(employee_id=staff[0], nodal_point_id=active.nodal_point_id, tenant_id=test_tenant.tenant_id))
+    test_db.add(EmployeeNodalPoint(employee_id=staff[1], nodal_point_id=closed.nodal_point_id, tenant_id=test_tenant.tenant_id))
+    test_db.commit()
+
+    report = _book(test_db, test_tenant, [TUE], nodal=True, log_type="OUT", employee_ids=staff[:3])
+    test_db.commit()
+
+    codes = {e.employee_id: [f["error_code"] for f in e.failed] for e in report.employees}
+    assert codes == {staff[0]: [], staff[1]: ["NODAL_POINT_INACTIVE"], staff[2]: ["NO_NODAL_ASSIGNMENT"]}
+    booking = test_db.query(Booking).filter(Booking.employee_id == staff[0]).one()
+    assert booking.nodal_point_id == active.nodal_point_id
+    assert (booking.drop_latitude, booking.drop_location) == (13.5, "Gate A")
+    assert booking.pickup_location == test_tenant.address
+
+
+def test_endpoint_returns_per_employee_report(client, admin_token, test_db, test_tenant, test_shift, staff):
+    day = date.today() + timedelta(days=2)
+    test_db.add(WeekoffConfig(employee_id=staff[1], **{day.strftime("%A").lower(): True}))
+    test_db.commit()
+
+    response = client.post(
+        "/api/v1/bookings/bulk-all-employees",
+        json={"tenant_id": test_tenant.tenant_id, "shift_id": test_shift.shift_id, "booking_date": str(day)},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert (data["booked"], data["skipped"], data["failed"]) == (len(staff) - 1, 0, 1)
+    assert data["failed_employees"][0]["employee_id"] == staff[1]
+    assert data["failed_employees"][0]["error_code"] == "WEEKOFF_DAY"
+    assert [e["employee_id"] for e in data["employees"]] == staff
+    assert data["employees"][0] == {"employee_id": staff[0], "booked": [str(day)], "skipped": [], "failed": []}
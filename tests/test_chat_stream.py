@@ -0,0 +1,209 @@
+"""
+tests/test_chat_stream.py
+--------------------------
+In-house chat push channel (SSE hub with Redis pub/sub fan-out).
+
+Test coverage:
+1. A message published from a worker thread reaches a local stream once,
+   and translation events follow it.
+2. Resume: a stream opened with ``after`` replays newer messages from the
+   database before going live, without duplicates.
+3. Backpressure: a subscriber whose queue overflows is resynced from the
+   database and still sees every message exactly once, in order.
+4. Two hubs sharing one Redis: an event published on one is delivered by
+   the other's listener, and presence is visible across them.
+5. FCM is sent only while the recipient has no stream open.
+6. SSE framing per viewer language.
+
+Redis is fakeredis.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.crud import chat as chat_crud
+from app.models.chat import ChatSenderType, ChatSession
+from app.routes.chat_router import _sse_frame
+from app.services import chat_service, chat_stream
+from app.services.chat_stream import ChatStreamHub, message_event, translation_event
+
+BOOKING_ID = 9001
+
+
+def _redis(server=None):
+    return fakeredis.FakeRedis(server=server or fakeredis.FakeServer(), decode_responses=True)
+
+
+@pytest.fixture
+def chat(test_db, test_tenant):
+    session = ChatSession(
+        tenant_id=test_tenant.tenant_id, booking_id=BOOKING_ID,
+        employee_id=1, driver_id=2, employee_language="en", driver_language="hi",
+    )
+    test_db.add(session)
+    test_db.commit()
+    return session
+
+
+def _save(db, chat, text):
+    return chat_crud.save_message(
+        db, chat.tenant_id, BOOKING_ID, chat.id, ChatSenderType.EMPLOYEE, 1, text, "en",
+    )
+
+
+def _hub(db, **kwargs):
+    return ChatStreamHub(session_factory=sessionmaker(bind=db.get_bind()), **kwargs)
+
+
+async def _collect(stream, count, timeout=2.0):
+    out = []
+
+    async def read():
+        async for event in stream:
+            if event is not None:
+                out.append(event)
+                if len(out) == count:
+                    return
+
+    await asyncio.wait_for(read(), timeout)
+    await stream.aclose()
+    return out
+
+
+async def _wait_subscribed(hub):
+    for _ in range(100):
+        if hub._rooms:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestLocalHub:
+
+    def test_thread_publish_reaches_stream(self, test_db, chat, monkeypatch):
+        monkeypatch.setattr(settings, "USE_REDIS", False)
+        hub = _hub(test_db)
+        msg = _save(test_db, chat, "hello")
+
+        async def scenario():
+            # Cursor starts at the newest message, so "hello" is not replayed.
+            stream = hub.events(chat.tenant_id, BOOKING_ID, "driver", 2)
+            task = asyncio.create_task(_collect(stream, 2))
+            await _wait_subscribed(hub)
+            newer = _save(test_db, chat, "on my way")
+            publisher = threading.Thread(target=lambda: (
+                hub.publish(chat.tenant_id, BOOKING_ID, message_event(newer)),
+                hub.publish(chat.tenant_id, BOOKING_ID, message_event(newer)),   # duplicate
+                hub.publish(chat.tenant_id, BOOKING_ID, translation_event(newer.id, "hi", "HI")),
+            ))
+            publisher.start()
+            publisher.join()
+            return newer, await task
+
+        newer, events = asyncio.run(scenario())
+        assert [e["type"] for e in events] == ["message", "translation"]
+        assert events[0]["message"]["id"] == newer.id != msg.id
+        assert hub._rooms == {}
+
+    def test_resume_replays_after_cursor(self, test_db, chat, monkeypatch):
+        monkeypatch.setattr(settings, "USE_REDIS", False)
+        hub = _hub(test_db)
+        first = _save(test_db, chat, "one")
+        missed = [_save(test_db, chat, t) for t in ("two", "three")]
+
+        async def scenario():
+            stream = hub.events(chat.tenant_id, BOOKING_ID, "driver", 2, after=first.id)
+            task = asyncio.create_task(_collect(stream, 3))
+            await _wait_subscribed(hub)
+            hub.publish(chat.tenant_id, BOOKING_ID, message_event(missed[-1]))   # already replayed
+            live = _save(test_db, chat, "four")
+            hub.publish(chat.tenant_id, BOOKING_ID, message_event(live))
+            return await task
+
+        events = asyncio.run(scenario())
+        assert [e["message"]["original_text"] for e in events] == ["two", "three", "four"]
+
+    def test_overflow_resyncs_from_database(self, test_db, chat, monkeypatch):
+        monkeypatch.setattr(settings, "USE_REDIS", False)
+        hub = _hub(test_db, queue_size=2)
+
+        async def scenario():
+            stream = hub.events(chat.tenant_id, BOOKING_ID, "driver", 2)
+            task = asyncio.create_task(_collect(stream, 6))
+            await _wait_subscribed(hub)
+            # Six events arrive in one burst before the stream reads any.
+            for i in range(6):
+                hub._deliver(f"{chat.tenant_id}:{BOOKING_ID}", message_event(_save(test_db, chat, f"m{i}")))
+            return await task
+
+        events = asyncio.run(scenario())
+        assert [e["message"]["original_text"] for e in events] == [f"m{i}" for i in range(6)]
+
+
+class TestRedisFanOut:
+
+    def test_publish_on_one_worker_reaches_another(self, test_db, chat):
+        server = fakeredis.FakeServer()
+        sender = _hub(test_db, client=_redis(server))
+        receiver = _hub(test_db, client=_redis(server))
+        receiver.start()
+        try:
+            async def scenario():
+                stream = receiver.events(chat.tenant_id, BOOKING_ID, "driver", 2)
+                task = asyncio.create_task(_collect(stream, 1))
+                await _wait_subscribed(receiver)
+                await asyncio.sleep(0.2)   # listener thread subscribed
+                assert sender.is_online(chat.tenant_id, BOOKING_ID, "driver", 2)
+                assert not sender.is_online(chat.tenant_id, BOOKING_ID, "employee", 1)
+                sender.publish(chat.tenant_id, BOOKING_ID, message_event(_save(test_db, chat, "via redis")))
+                return await task
+
+            events = asyncio.run(scenario())
+        finally:
+            receiver.stop()
+
+        assert events[0]["message"]["original_text"] == "via redis"
+        assert not sender.is_online(chat.tenant_id, BOOKING_ID, "driver", 2)
+
+
+@pytest.mark.parametrize("online", [True, False])
+def test_fcm_only_when_recipient_not_streaming(test_db, chat, monkeypatch, online):
+    monkeypatch.setattr(settings, "FCM_ENABLED", True)
+    monkeypatch.setattr(settings, "CHAT_STREAM_ENABLED", True)
+    monkeypatch.setattr(chat_stream.hub, "is_online", lambda *args: online)
+
+    class _Sessions:
+        def __init__(self, *args):
+            pass
+
+        def get_active_session(self, **kwargs):
+            return SimpleNamespace(fcm_token="token-" + "x" * 30)
+
+    monkeypatch.setattr(chat_service, "SessionManager", _Sessions)
+    monkeypatch.setattr(chat_service, "SessionCache", lambda: None)
+    sent = []
+    monkeypatch.setattr(chat_service._fcm, "send_notification",
+                        lambda **kw: sent.append(kw) or {"success": True})
+
+    chat_service._push_notification(
+        db=test_db, session=chat, sender_type=ChatSenderType.EMPLOYEE,
+        text="hi", booking_id=BOOKING_ID, message_id=1,
+    )
+    assert len(sent) == (0 if online else 1)
+
+
+def test_sse_frames_follow_viewer_language(test_db, chat):
+    msg = _save(test_db, chat, "hello")
+    msg.translated_texts = {"hi": "namaste"}
+    event = message_event(msg)
+
+    assert _sse_frame(event, "hi").startswith(f"id: {msg.id}\nevent: message\n")
+    assert '"translated_text": "namaste"' in _sse_frame(event, "hi")
+    assert '"translated_text": "hello"' in _sse_frame(event, "en")
+    assert _sse_frame(translation_event(msg.id, "hi", "namaste"), "en") is None
+    assert _sse_frame(None, "en") == ": keepalive\n\n"
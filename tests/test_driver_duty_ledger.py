@@ -0,0 +1,139 @@
+"""
+tests/test_driver_duty_ledger.py
+---------------------------------
+Driver duty ledger (app/models/driver_duty_day.py) behind the rest checks.
+
+Test coverage:
+1. Flushing a route's duty fields keeps the ledger in step: a trip across
+   midnight is split per day, an ONGOING route is an open interval until
+   it completes, reassigning or deleting a route moves/removes its rows.
+2. check_rest_many answers a pool of drivers with one SELECT and agrees
+   with check_rest per driver.
+3. rebuild_duty_ledger repairs rows after a bulk UPDATE bypassed the hook.
+"""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from app.models.driver_duty_day import DriverDutyDay
+from app.models.route_management import RouteManagement, RouteManagementStatusEnum
+from app.services.driver_duty_hours_service import (
+    check_rest, check_rest_many, rebuild_duty_ledger,
+)
+
+COMPLETED = RouteManagementStatusEnum.COMPLETED
+ONGOING = RouteManagementStatusEnum.ONGOING
+
+
+def _route(db, tenant_id, driver_id, start, end, status=COMPLETED):
+    route = RouteManagement(
+        tenant_id=tenant_id, route_code="LEDGER", status=status,
+        assigned_driver_id=driver_id, actual_start_time=start, actual_end_time=end,
+    )
+    db.add(route)
+    db.commit()
+    return route
+
+
+def _ledger(db, driver_id):
+    db.expire_all()
+    return {
+        row.duty_date: row
+        for row in db.query(DriverDutyDay).filter(DriverDutyDay.driver_id == driver_id)
+    }
+
+
+def test_trip_across_midnight_is_split_per_day(test_db, test_tenant, test_driver):
+    did = test_driver.driver_id
+    _route(test_db, test_tenant.tenant_id, did, datetime(2026, 7, 1, 22, 0), datetime(2026, 7, 2, 1, 30))
+
+    rows = _ledger(test_db, did)
+
+    assert set(rows) == {date(2026, 7, 1), date(2026, 7, 2)}
+    assert rows[date(2026, 7, 1)].intervals == [["2026-07-01T22:00:00", "2026-07-02T00:00:00"]]
+    assert rows[date(2026, 7, 1)].duty_minutes == 120
+    assert rows[date(2026, 7, 2)].duty_minutes == 90
+    # The halves re-join in the rest check: one 3.5h block
+    result = check_rest(did, datetime(2026, 7, 2, 8, 0), test_db)
+    assert result["total_duty_minutes"] == 210
+    assert result["last_trip_end"] == datetime(2026, 7, 2, 1, 30)
+
+
+def test_ongoing_route_is_open_until_completed(test_db, test_tenant, test_driver):
+    did = test_driver.driver_id
+    route = _route(test_db, test_tenant.tenant_id, did, datetime(2026, 7, 1, 6, 0), None, status=ONGOING)
+
+    row = _ledger(test_db, did)[date(2026, 7, 1)]
+    assert row.open_since == datetime(2026, 7, 1, 6, 0)
+    assert row.intervals == [["2026-07-01T06:00:00", None]]
+    # Still on duty: counted up to the proposed start, even the next day
+    assert check_rest(did, datetime(2026, 7, 2, 5, 0), test_db, max_duty_minutes=600)["ok"] is False
+
+    route.status = COMPLETED
+    route.actual_end_time = datetime(2026, 7, 1, 9, 0)
+    test_db.commit()
+
+    row = _ledger(test_db, did)[date(2026, 7, 1)]
+    assert row.open_since is None
+    assert row.duty_minutes == 180
+    assert check_rest(did, datetime(2026, 7, 2, 5, 0), test_db, max_duty_minutes=600)["ok"] is True
+
+
+def test_reassign_and_delete_move_rows(test_db, test_tenant, test_driver):
+    did, other = test_driver.driver_id, 9901
+    route = _route(test_db, test_tenant.tenant_id, did, datetime(2026, 7, 1, 6, 0), datetime(2026, 7, 1, 8, 0))
+
+    route.assigned_driver_id = other
+    test_db.commit()
+    assert _ledger(test_db, did) == {}
+    assert _ledger(test_db, other)[date(2026, 7, 1)].duty_minutes == 120
+
+    test_db.delete(route)
+    test_db.commit()
+    assert _ledger(test_db, other) == {}
+
+
+def test_check_rest_many_is_one_query(test_db, test_tenant, test_driver):
+    tenant_id = test_tenant.tenant_id
+    drivers = [test_driver.driver_id] + list(range(9901, 9921))
+    for i, did in enumerate(drivers):
+        # Every third driver has been on duty 06:00-18:00 the day before
+        hours = 12 if i % 3 == 0 else 2
+        _route(test_db, tenant_id, did, datetime(2026, 7, 1, 6, 0), datetime(2026, 7, 1, 6 + hours, 0))
+    proposed = datetime(2026, 7, 2, 4, 0)
+    test_db.expire_all()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(test_db.get_bind(), "before_cursor_execute", listener)
+    try:
+        results = check_rest_many(drivers, proposed, test_db, max_duty_minutes=600)
+    finally:
+        event.remove(test_db.get_bind(), "before_cursor_execute", listener)
+
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+    assert set(results) == set(drivers)
+    assert [did for did, r in results.items() if not r["ok"]] == drivers[::3]
+    for did in drivers:
+        assert results[did] == check_rest(did, proposed, test_db, max_duty_minutes=600)
+
+
+def test_rebuild_repairs_bulk_updates(test_db, test_tenant, test_driver):
+    did = test_driver.driver_id
+    _route(test_db, test_tenant.tenant_id, did, datetime(2026, 7, 1, 6, 0), datetime(2026, 7, 1, 8, 0))
+
+    # Bulk UPDATEs skip the flush hook, so the ledger goes stale...
+    test_db.query(RouteManagement).filter(RouteManagement.assigned_driver_id == did).update(
+        {RouteManagement.actual_end_time: datetime(2026, 7, 1, 11, 0)}, synchronize_session=False,
+    )
+    test_db.commit()
+    assert _ledger(test_db, did)[date(2026, 7, 1)].duty_minutes == 120
+
+    # ...until it is rebuilt
+    written = rebuild_duty_ledger(test_db, date(2026, 6, 30), date(2026, 7, 2), tenant_id=test_tenant.tenant_id)
+    test_db.commit()
+
+    assert written == 1
+    assert _ledger(test_db, did)[date(2026, 7, 1)].duty_minutes == 300
+    assert check_rest(did, datetime(2026, 7, 1, 12, 0), test_db)["total_duty_minutes"] == 300
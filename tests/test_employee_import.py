@@ -0,0 +1,153 @@
+"""
+tests/test_employee_import.py
+------------------------------
+Streaming employee import (app/services/employee_import.py) and the
+POST /employees/bulk-upload endpoint built on it.
+
+Test coverage:
+1. Validation streams the file and checks every row against the database
+   in a fixed number of queries, reporting each rejected row with all of
+   its errors; repeats within the file are reported separately.
+2. Creation inserts employees and their default weekoff configs one chunk
+   at a time with bcrypt hashes from the worker pool.
+3. The endpoint accepts CSV, creates the employees and returns the per-row
+   error report when any row is rejected.
+"""
+
+import asyncio
+import csv
+import io
+
+import openpyxl
+import pytest
+from sqlalchemy import event
+
+from app.models.employee import Employee
+from app.models.weekoff_config import WeekoffConfig
+from app.services.employee_import import EmployeeImport
+from common_utils.auth.utils import verify_password
+
+HEADERS = ["name", "email", "phone", "employee_code", "team_id", "gender", "password"]
+INSTRUCTIONS = ["Required", "Required (unique)", "Required", "Optional", "Required", "Optional", "Optional"]
+
+
+def _csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([HEADERS, INSTRUCTIONS, *rows])
+    return buffer.getvalue().encode("utf-8")
+
+
+def _xlsx(rows):
+    workbook = openpyxl.Workbook()
+    for row in [HEADERS, INSTRUCTIONS, *rows]:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class _Statements:
+    def __init__(self, db):
+        self.bind = db.get_bind()
+        self.seen = []
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._record)
+        return self.seen
+
+    def __exit__(self, *exc):
+        event.remove(self.bind, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, *args):
+        self.seen.append(statement)
+
+
+def test_validation_reports_every_rejected_row(test_db, test_tenant, test_team):
+    team = str(test_team.team_id)
+    rows = [
+        ["Ann", "ann@test.com", "+919000000001", "IMP1", team, "female", ""],
+        ["Ben", "EMPLOYEE@test.com", "+1234567891", "EMP001", team, "", ""],   # all three taken in the DB
+        ["Cat", "cat@test.com", "+919000000003", "", "999", "robot", "123"],
+        ["Dee", "dee@test.com", "919000000005", "IMP5", team, "", ""],          # not E.164
+        [],                                                                     # blank rows are skipped
+        ["Dan", "ann@test.com", "+919000000004", "IMP4", team, "", ""],         # repeats row 3's email
+    ]
+    upload = EmployeeImport(test_db, _csv(rows), "staff.csv", tenant_id=test_tenant.tenant_id, user_type="employee")
+    assert upload.missing_columns() == []
+
+    with _Statements(test_db) as statements:
+        report = upload.validate()
+
+    assert len(statements) == 2
+    assert (report.total_rows, report.valid_rows) == (5, 1)
+    assert [f["row"] for f in report.failed] == [4, 5, 6]
+    assert report.failed[0]["errors"] == [
+        "Email 'employee@test.com' already exists in database",
+        "Phone '+1234567891' already exists in database",
+        "Employee code 'EMP001' already exists",
+    ]
+    assert report.failed[1]["errors"] == [
+        "Invalid gender. Must be one of: Male, Female, Other. Got: robot",
+        "Password must be at least 6 characters long",
+        "Employee code is required",
+        "Team ID 999 does not exist",
+    ]
+    assert report.failed[2]["errors"] == ["phone: Phone must be in E.164 format (e.g., +1234567890)"]
+    assert report.duplicates == [{
+        "row": 8, "employee_name": "Dan", "email": "ann@test.com", "phone": "+919000000004",
+        "employee_code": "IMP4", "errors": ["Email 'ann@test.com' is duplicated within this Excel file"],
+    }]
+
+
+def test_create_inserts_in_chunks(test_db, test_tenant, test_team):
+    team = str(test_team.team_id)
+    rows = [
+        [f"New {c}", f"new{c}@test.com", f"+91900000001{i}", f"NEW{i}", team, "Male", "Secret@1"]
+        for i, c in enumerate("abc")
+    ]
+    upload = EmployeeImport(test_db, _xlsx(rows), "staff.xlsx", tenant_id=test_tenant.tenant_id, user_type="employee")
+    assert upload.validate().ok
+
+    with _Statements(test_db) as statements:
+        created = asyncio.run(upload.create(chunk_size=2))
+    test_db.commit()
+
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 4            # employees + weekoffs, for each of the two chunks
+    assert [c["row"] for c in created] == [3, 4, 5]
+
+    employees = test_db.query(Employee).filter(Employee.employee_code.like("NEW%")).order_by(Employee.employee_id).all()
+    assert [e.employee_id for e in employees] == [c["employee_id"] for c in created]
+    assert all(e.tenant_id == test_tenant.tenant_id and e.team_id == test_team.team_id for e in employees)
+    assert verify_password("Secret@1", employees[0].password)
+    weekoffs = test_db.query(WeekoffConfig).filter(WeekoffConfig.employee_id.in_([e.employee_id for e in employees])).all()
+    assert len(weekoffs) == 3 and all(w.sunday and not w.monday for w in weekoffs)
+
+
+def test_endpoint_imports_csv_and_reports_rejected_rows(client, employee_token, test_db, test_tenant, test_team):
+    headers = {"Authorization": f"Bearer {employee_token}"}
+    team = str(test_team.team_id)
+    good = [["Eve", "eve@test.com", "+919000000021", "IMP21", team, "", ""]]
+    bad = [*good, ["Fay", "fay@test.com", "12", "IMP22", team, "", ""]]
+
+    response = client.post(
+        "/api/v1/employees/bulk-upload", headers=headers,
+        files={"file": ("staff.csv", _csv(bad), "text/csv")},
+    )
+    assert response.status_code == 400
+    details = response.json()["detail"]["details"]
+    assert (details["total_rows"], details["invalid_rows"]) == (2, 1)
+    assert details["failed_employees"][0]["errors"] == ["Invalid phone format: 12"]
+    assert test_db.query(Employee).filter(Employee.email == "eve@test.com").count() == 0
+
+    response = client.post(
+        "/api/v1/employees/bulk-upload", headers=headers,
+        files={"file": ("staff.csv", _csv(good), "text/csv")},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert (data["successful"], data["failed"]) == (1, 0)
+    created = data["created_employees"][0]
+    assert (created["row"], created["email"]) == (3, "eve@test.com")
+    assert test_db.get(Employee, created["employee_id"]).employee_code == "IMP21"
@@ -0,0 +1,174 @@
+"""
+tests/test_escort_requirements.py
+----------------------------------
+Bulk escort evaluation (app/services/escort_requirements.py).
+
+Test coverage:
+1. Each female_constraint rule, and the tenant-config fallback, decides
+   routes from their stops in order; routes of other shifts/dates are
+   left alone.
+2. apply_escort_requirements writes every flag with one UPDATE and runs
+   the same number of statements for 2 routes as for 40.
+3. route_requires_escort / update_route_escort_requirement give the
+   same answer for a single route.
+"""
+
+from datetime import date, time
+
+import pytest
+from sqlalchemy import event
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.employee import Employee
+from app.models.enums import FemaleConstraintEnum, GenderEnum
+from app.models.route_management import (
+    RouteManagement, RouteManagementBooking, RouteManagementStatusEnum,
+)
+from app.models.shift import Shift, ShiftLogTypeEnum
+from app.models.tenant_config import TenantConfig
+from app.services.escort_requirements import apply_escort_requirements, evaluate_escort_requirements
+from app.utils.otp_utils import route_requires_escort, update_route_escort_requirement
+
+DAY = date(2026, 7, 1)
+F, M = GenderEnum.FEMALE, GenderEnum.MALE
+
+
+@pytest.fixture
+def world(test_db, test_tenant, employee_user):
+    """Shifts per constraint, one female and one male employee, and a route factory."""
+    tenant_id = test_tenant.tenant_id
+    role_id = employee_user["employee"].role_id
+
+    people = {}
+    for gender, code in ((F, "EF"), (M, "EM")):
+        employee = Employee(
+            tenant_id=tenant_id, role_id=role_id, name=code, employee_code=code,
+            email=f"{code.lower()}@test.com", password="x", phone=f"70000000{len(people)}",
+            gender=gender,
+        )
+        test_db.add(employee)
+        test_db.flush()
+        people[gender] = employee.employee_id
+
+    shifts = {}
+    constraints = [None] + list(FemaleConstraintEnum)
+    for i, constraint in enumerate(constraints):
+        shift = Shift(
+            shift_id=300 + i, tenant_id=tenant_id, shift_code=f"ESC{i}",
+            log_type=ShiftLogTypeEnum.OUT, shift_time=time(22, 0), is_active=True,
+            female_constraint=constraint,
+        )
+        test_db.add(shift)
+        shifts[constraint] = shift.shift_id
+
+    test_db.merge(TenantConfig(
+        tenant_id=tenant_id, escort_required_for_women=True,
+        escort_required_start_time=time(20, 0), escort_required_end_time=time(6, 0),
+    ))
+    test_db.commit()
+
+    def route(constraint, genders, day=DAY):
+        shift_id = shifts[constraint]
+        r = RouteManagement(tenant_id=tenant_id, shift_id=shift_id, status=RouteManagementStatusEnum.PLANNED)
+        test_db.add(r)
+        test_db.flush()
+        # Stops are inserted last-first; evaluation must follow order_id.
+        for order, gender in reversed(list(enumerate(genders, start=1))):
+            b = Booking(
+                tenant_id=tenant_id, employee_id=people[gender], employee_code="E",
+                shift_id=shift_id, booking_date=day, status=BookingStatusEnum.SCHEDULED,
+            )
+            test_db.add(b)
+            test_db.flush()
+            test_db.add(RouteManagementBooking(route_id=r.route_id, booking_id=b.booking_id, order_id=order))
+            test_db.flush()
+        test_db.commit()
+        return r.route_id
+
+    return tenant_id, shifts, route
+
+
+def _statements(db):
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    return statements, lambda: event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+
+@pytest.mark.parametrize("constraint,genders,expected", [
+    (FemaleConstraintEnum.DISABLE, [F, F], False),
+    (FemaleConstraintEnum.ANY_FEMALE, [M, F, M], True),
+    (FemaleConstraintEnum.ANY_FEMALE, [M, M], False),
+    (FemaleConstraintEnum.FIRST_LAST_FEMALE, [M, F, M], False),
+    (FemaleConstraintEnum.FIRST_LAST_FEMALE, [M, M, F], True),
+    (FemaleConstraintEnum.SECOND_SECOND_LAST_FEMALE, [F], False),
+    (FemaleConstraintEnum.SECOND_SECOND_LAST_FEMALE, [M, F, M, M], True),
+    (FemaleConstraintEnum.SECOND_SECOND_LAST_FEMALE, [F, M, M, F], False),
+    (None, [M, F], True),       # 22:00 is inside the tenant's 20:00-06:00 window
+    (None, [M, M], False),
+])
+def test_rules(test_db, world, constraint, genders, expected):
+    tenant_id, shifts, route = world
+    route_id = route(constraint, genders)
+
+    flags = apply_escort_requirements(test_db, tenant_id, shift_id=shifts[constraint], booking_date=DAY)
+
+    assert flags == {route_id: expected}
+    assert test_db.get(RouteManagement, route_id).escort_required is expected
+    assert route_requires_escort(test_db, route_id, tenant_id) is expected
+
+
+def test_scope_is_the_shift_and_date(test_db, world):
+    tenant_id, shifts, route = world
+    any_female = FemaleConstraintEnum.ANY_FEMALE
+    in_scope = route(any_female, [F])
+    other_day = route(any_female, [F], day=date(2026, 7, 2))
+    other_shift = route(FemaleConstraintEnum.FIRST_LAST_FEMALE, [F])
+
+    flags = apply_escort_requirements(test_db, tenant_id, shift_id=shifts[any_female], booking_date=DAY)
+
+    assert flags == {in_scope: True}
+    test_db.expire_all()
+    assert test_db.get(RouteManagement, other_day).escort_required is False
+    assert test_db.get(RouteManagement, other_shift).escort_required is False
+
+
+def test_statement_count_is_constant(test_db, world):
+    tenant_id, shifts, route = world
+    shift_id = shifts[None]
+
+    def run():
+        test_db.expire_all()
+        statements, stop = _statements(test_db)
+        try:
+            flags = apply_escort_requirements(test_db, tenant_id, shift_id=shift_id, booking_date=DAY)
+        finally:
+            stop()
+        return flags, statements
+
+    for _ in range(2):
+        route(None, [M, F])
+    few_flags, few = run()
+
+    for i in range(38):
+        route(None, [F, M] if i % 2 else [M, M])
+    many_flags, many = run()
+
+    assert len(few_flags) == 2 and len(many_flags) == 40
+    assert sum(many_flags.values()) == 2 + 19
+    assert len(many) == len(few)
+    assert sum(1 for s in many if s.lstrip().upper().startswith("UPDATE")) == 1
+
+
+def test_single_route_helpers(test_db, world):
+    tenant_id, shifts, route = world
+    route_id = route(FemaleConstraintEnum.FIRST_LAST_FEMALE, [F, M])
+
+    assert evaluate_escort_requirements(test_db, tenant_id, route_ids=[route_id]) == {route_id: True}
+    assert update_route_escort_requirement(test_db, route_id, tenant_id) is True
+    test_db.commit()
+    test_db.expire_all()
+    assert test_db.get(RouteManagement, route_id).escort_required is True
+
+    # A route of another tenant is never touched.
+    assert route_requires_escort(test_db, route_id, "OTHER") is False
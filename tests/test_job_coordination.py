@@ -0,0 +1,162 @@
+"""
+tests/test_job_coordination.py
+-------------------------------
+Cluster coordination of SchedulerService jobs (app/services/job_coordination.py).
+
+Test coverage:
+1. Leader lease: one holder at a time, renewed by its holder, taken over
+   after expiry (failover) or immediately after release; a holder that
+   loses Redis keeps leadership only until its own lease runs out.
+2. Sharding: every key has exactly one owner among live workers, and only
+   a departed worker's keys move.
+3. SchedulerService wrappers: a leader-only job runs on one worker of two,
+   a sharded job receives ``owns``; the stale-driver check only scans the
+   tenants it owns.
+
+Redis is fakeredis; lease expiry uses short real TTLs.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import fakeredis
+import pytest
+
+from app.models.route_management import RouteManagement, RouteManagementStatusEnum
+from app.services import stale_driver_service
+from app.services.job_coordination import LocalCoordinator, RedisCoordinator, shard_owner
+from app.services.scheduler_service import SchedulerService
+
+LEASE = 0.3
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _worker(server, name, lease=LEASE, clock=time.time):
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    return RedisCoordinator(client, worker_id=name, lease_seconds=lease, clock=clock)
+
+
+class TestLeaderLease:
+
+    def test_single_leader_renews(self, server):
+        a, b = _worker(server, "a"), _worker(server, "b")
+
+        assert a.is_leader() is True
+        assert b.is_leader() is False
+        # Renewing past the original expiry keeps the lease with a
+        for _ in range(3):
+            time.sleep(LEASE / 2)
+            assert a.is_leader() is True
+            assert b.is_leader() is False
+
+    def test_failover_after_expiry(self, server):
+        a, b = _worker(server, "a"), _worker(server, "b")
+        assert a.is_leader() is True
+
+        time.sleep(LEASE + 0.1)   # a stops renewing (crashed)
+
+        assert b.is_leader() is True
+        assert a.is_leader() is False
+
+    def test_release_hands_over_immediately(self, server):
+        a, b = _worker(server, "a", lease=30), _worker(server, "b", lease=30)
+        assert a.is_leader() is True
+
+        b.release()               # a non-holder never drops a's lease
+        assert b.is_leader() is False
+        a.release()
+        assert b.is_leader() is True
+
+    def test_redis_outage_keeps_lease_until_it_would_expire(self, server):
+        a = _worker(server, "a")
+        assert a.is_leader() is True
+
+        server.connected = False
+        assert a.is_leader() is True
+        time.sleep(LEASE + 0.05)
+        assert a.is_leader() is False
+
+        never = _worker(server, "never")
+        assert never.is_leader() is False
+
+
+class TestSharding:
+
+    def test_each_key_has_one_owner_and_only_departed_keys_move(self, server):
+        now = [1000.0]
+        workers = [_worker(server, name, lease=30, clock=lambda: now[0]) for name in ("a", "b", "c")]
+        for w in workers:
+            w.heartbeat()
+        for w in workers:
+            w.heartbeat()
+        keys = [f"T{i:03d}" for i in range(200)]
+
+        owners = {key: [w.worker_id for w in workers if w.owns(key)] for key in keys}
+        assert all(len(o) == 1 for o in owners.values())
+        assert {o[0] for o in owners.values()} == {"a", "b", "c"}
+
+        # c stops heartbeating; after a lease the others take over its keys only
+        now[0] += 31
+        for _ in range(2):
+            for w in workers[:2]:
+                w.heartbeat()
+        assert workers[0].workers == ["a", "b"]
+        for key in keys:
+            after = [w.worker_id for w in workers[:2] if w.owns(key)]
+            assert len(after) == 1
+            if owners[key] != ["c"]:
+                assert after == owners[key]
+
+    def test_shard_owner_is_stable(self):
+        assert shard_owner("T1", ["a", "b"]) == shard_owner("T1", ["b", "a"])
+        assert shard_owner("T1", []) is None
+        assert LocalCoordinator().owns("anything") is True
+
+
+class TestSchedulerWrappers:
+
+    def test_leader_only_job_runs_once_per_cluster(self, server):
+        runs = []
+        services = [SchedulerService(coordinator=_worker(server, name, lease=30)) for name in ("a", "b")]
+        jobs = [svc.leader_only("job", lambda name=name: runs.append(name)) for svc, name in zip(services, "ab")]
+
+        for _ in range(3):
+            for job in jobs:
+                job()
+
+        assert runs == ["a", "a", "a"]
+
+    def test_sharded_job_gets_owns(self, server):
+        seen = {}
+        coordinator = _worker(server, "a", lease=30)
+        coordinator.heartbeat()
+        job = SchedulerService(coordinator=coordinator).sharded(lambda owns: seen.setdefault("owns", owns))
+        job()
+        assert seen["owns"] == coordinator.owns
+
+        local_job = SchedulerService(coordinator=LocalCoordinator()).sharded(lambda owns: seen.update(local=owns))
+        local_job()
+        assert seen["local"] is None
+
+
+def test_stale_driver_check_scans_owned_tenants_only(test_db, test_tenant, monkeypatch):
+    started = datetime.utcnow() - timedelta(hours=1)
+    for tenant_id in (test_tenant.tenant_id, "OTHER"):
+        test_db.add(RouteManagement(
+            tenant_id=tenant_id, route_code=f"R-{tenant_id}", status=RouteManagementStatusEnum.ONGOING,
+            actual_start_time=started,
+        ))
+    test_db.commit()
+    alerted = []
+    monkeypatch.setattr(stale_driver_service, "_alert_admins", lambda db, route, **kw: alerted.append(route.tenant_id))
+    monkeypatch.setattr(stale_driver_service, "_last_alert_at", {})
+
+    stale_driver_service._run_check(test_db, owns=lambda tenant_id: tenant_id == "OTHER")
+    assert alerted == ["OTHER"]
+
+    stale_driver_service._run_check(test_db, owns=lambda tenant_id: False)
+    assert alerted == ["OTHER"]
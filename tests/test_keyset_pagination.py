@@ -0,0 +1,136 @@
+"""
+tests/test_keyset_pagination.py
+--------------------------------
+Keyset (cursor) pagination helpers in app/utils/pagination.py.
+
+Test coverage:
+1. Cursors round-trip datetimes and dates; a malformed cursor is a 400
+   INVALID_CURSOR.
+2. Walking a listing by next_cursor returns every row once, in the same
+   order as offset pages, and cursor pages carry no OFFSET.
+3. cached_count counts on the first page and serves deeper pages from
+   Redis (fakeredis).
+4. GET /bookings/tenant/{tenant_id} returns meta.next_cursor and follows it.
+"""
+
+from datetime import date, datetime, timedelta
+
+import fakeredis
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.config import settings
+from app.models.audit_log import AuditLog
+from app.models.booking import Booking, BookingStatusEnum
+from app.utils import cache_manager
+from app.utils.pagination import cached_count, decode_cursor, encode_cursor, keyset_paginate
+
+START = datetime(2026, 7, 1, 9, 0)
+KEYS = [AuditLog.created_at, AuditLog.audit_id]
+
+
+@pytest.fixture
+def audit_rows(test_db, test_tenant):
+    # Pairs of rows share a timestamp so the id tiebreaker matters.
+    test_db.add_all([
+        AuditLog(
+            tenant_id=test_tenant.tenant_id, module="employee",
+            audit_data={"i": i}, created_at=START + timedelta(minutes=i // 2),
+        )
+        for i in range(23)
+    ])
+    test_db.commit()
+    return test_db.query(AuditLog).filter(AuditLog.tenant_id == test_tenant.tenant_id)
+
+
+def _statements(db):
+    """(statement, parameters) of everything executed from now on."""
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters)))
+    return statements
+
+
+def test_cursor_round_trip():
+    values = [datetime(2026, 7, 1, 9, 30, 15), date(2026, 7, 1), 42, "E1"]
+    assert decode_cursor(encode_cursor(values), 4) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor([1]), "W10"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, 2)
+    assert exc.value.status_code == 400
+    assert exc.value.detail["error_code"] == "INVALID_CURSOR"
+
+
+def test_cursor_walk_matches_offset_pages(test_db, audit_rows):
+    by_offset = []
+    for offset in range(0, 23, 5):
+        rows, _ = keyset_paginate(audit_rows, KEYS, offset=offset, limit=5)
+        by_offset += [r.audit_id for r in rows]
+
+    statements = _statements(test_db)
+    by_cursor, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = keyset_paginate(audit_rows, KEYS, cursor=cursor, limit=5)
+        by_cursor += [r.audit_id for r in rows]
+        pages += 1
+        if cursor is None:
+            break
+
+    assert pages == 5
+    assert by_cursor == by_offset
+    assert len(set(by_cursor)) == 23
+    # SQLite always renders "LIMIT ? OFFSET ?"; the bound offset stays 0.
+    assert all(params[-1] == 0 for statement, params in statements if "OFFSET" in statement)
+
+
+def test_count_is_cached_for_cursor_pages(test_db, audit_rows, monkeypatch):
+    monkeypatch.setattr(settings, "USE_REDIS", True)
+    monkeypatch.setattr(cache_manager.cache, "redis_client", fakeredis.FakeRedis(decode_responses=True))
+
+    assert cached_count(audit_rows, refresh=True) == 23
+    statements = _statements(test_db)
+    assert cached_count(audit_rows) == 23
+    assert not any("count(" in statement.lower() for statement, _ in statements)
+
+    other_module = audit_rows.filter(AuditLog.module == "driver")
+    assert cached_count(other_module) == 0
+
+
+def test_booking_listing_follows_next_cursor(client, test_db, test_tenant, employee_user, admin_token):
+    employee = employee_user["employee"]
+    day = date.today() + timedelta(days=1)
+    test_db.add_all([
+        Booking(
+            tenant_id=test_tenant.tenant_id, employee_id=employee.employee_id,
+            employee_code=employee.employee_code, shift_id=1, booking_date=day,
+            status=BookingStatusEnum.REQUEST,
+        )
+        for _ in range(7)
+    ])
+    test_db.commit()
+
+    seen, cursor = [], None
+    for _ in range(3):
+        params = {"booking_date": day.isoformat(), "limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = client.get(
+            f"/api/v1/bookings/tenant/{test_tenant.tenant_id}",
+            params=params, headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["meta"]["total"] == 7
+        seen += [b["booking_id"] for b in body["data"]]
+        cursor = body["meta"].get("next_cursor")
+
+    assert cursor is None
+    assert seen == sorted(seen) and len(set(seen)) == 7
+
+    response = client.get(
+        f"/api/v1/bookings/tenant/{test_tenant.tenant_id}",
+        params={"booking_date": day.isoformat(), "cursor": "bogus"}, headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 400
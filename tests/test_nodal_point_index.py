@@ -0,0 +1,180 @@
+"""
+tests/test_nodal_point_index.py
+--------------------------------
+Spatial index for nearest-nodal-point lookups.
+
+Test coverage:
+1. BallTree nearest / top-k / radius lookups agree with geodesic brute force.
+2. The per-tenant index is cached, and rebuilt after invalidate() or when
+   the active hub set changes.
+3. bulk_assign_nearest assigns every employee in a constant number of
+   queries, respects overridden assignments and updates stale ones.
+"""
+
+import numpy as np
+import pytest
+from geopy.distance import geodesic
+from sqlalchemy import event
+
+from app.models.employee import Employee
+from app.models.nodal_point import NodalPoint, EmployeeNodalPoint
+from app.routes.nodal_point_router import bulk_assign_nearest
+from app.services import nodal_point_index
+from app.services.nodal_point_index import NodalPointIndex
+
+
+HUBS = {
+    1: (12.9756, 77.6050),   # MG Road
+    2: (12.9352, 77.6245),   # Koramangala
+    3: (12.9698, 77.7500),   # Whitefield
+    4: (13.1986, 77.7066),   # Airport
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_indexes():
+    nodal_point_index._indexes.clear()
+    yield
+    nodal_point_index._indexes.clear()
+
+
+def _index():
+    return NodalPointIndex(list(HUBS), np.array(list(HUBS.values())))
+
+
+class TestIndex:
+
+    def test_matches_geodesic_brute_force(self):
+        rng = np.random.default_rng(7)
+        points = np.column_stack([rng.uniform(12.8, 13.3, 200), rng.uniform(77.4, 77.9, 200)])
+
+        ids, dists = _index().nearest_bulk(points)
+
+        for (lat, lng), pid, d in zip(points, ids, dists):
+            expected = min(HUBS, key=lambda h: geodesic((lat, lng), HUBS[h]).km)
+            assert pid == expected
+            assert d == pytest.approx(geodesic((lat, lng), HUBS[pid]).km, rel=0.01)
+
+    def test_top_k_sorted(self):
+        hits = _index().nearest(*HUBS[1], k=3)
+        assert [pid for pid, _ in hits] == [1, 2, 3]
+        assert hits[0][1] == pytest.approx(0.0, abs=1e-6)
+
+    def test_radius(self):
+        hits = _index().nearest(*HUBS[1], k=10, radius_km=6)
+        assert [pid for pid, _ in hits] == [1, 2]
+
+    def test_empty(self):
+        index = NodalPointIndex([], np.empty((0, 2)))
+        assert index.nearest(12.9, 77.6) == []
+        ids, _ = index.nearest_bulk(np.array([[12.9, 77.6]]))
+        assert len(ids) == 0
+
+
+def _add_hubs(db, tenant_id):
+    rows = []
+    for pid, (lat, lng) in HUBS.items():
+        hub = NodalPoint(tenant_id=tenant_id, name=f"Hub {pid}", latitude=lat, longitude=lng)
+        db.add(hub)
+        rows.append(hub)
+    db.commit()
+    return rows
+
+
+class TestTenantCache:
+
+    def test_index_is_reused_and_invalidated(self, test_db, test_tenant):
+        _add_hubs(test_db, test_tenant.tenant_id)
+        first = nodal_point_index.get_index(test_db, test_tenant.tenant_id)
+        assert len(first) == 4
+        assert nodal_point_index.get_index(test_db, test_tenant.tenant_id) is first
+
+        nodal_point_index.invalidate(test_tenant.tenant_id)
+        assert nodal_point_index.get_index(test_db, test_tenant.tenant_id) is not first
+
+    def test_deactivated_hub_triggers_rebuild(self, test_db, test_tenant):
+        hubs = _add_hubs(test_db, test_tenant.tenant_id)
+        nodal_point_index.get_index(test_db, test_tenant.tenant_id)
+
+        hubs[0].is_active = False
+        test_db.commit()
+
+        index = nodal_point_index.get_index(test_db, test_tenant.tenant_id)
+        assert len(index) == 3
+        assert hubs[0].nodal_point_id not in index.ids
+
+
+class TestBulkAssign:
+
+    def _employees(self, db, tenant_id, team_id, n):
+        rng = np.random.default_rng(3)
+        for i in range(n):
+            db.add(Employee(
+                tenant_id=tenant_id,
+                team_id=team_id,
+                role_id=3,
+                name=f"Bulk {i}",
+                employee_code=f"BULK{i:04d}",
+                email=f"bulk{i}@example.com",
+                phone=f"+9100000{i:04d}",
+                password="x",
+                latitude=float(rng.uniform(12.8, 13.3)),
+                longitude=float(rng.uniform(77.4, 77.9)),
+                is_active=True,
+            ))
+        db.commit()
+
+    def _run(self, db, tenant_id):
+        return bulk_assign_nearest(
+            tenant_id=tenant_id, db=db, user_data={"user_type": "admin"},
+        )
+
+    def test_assigns_nearest_in_constant_queries(self, test_db, test_tenant, test_team):
+        tid = test_tenant.tenant_id
+        hubs = _add_hubs(test_db, tid)
+        self._employees(test_db, tid, test_team.team_id, 60)
+
+        statements = []
+        engine = test_db.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = self._run(test_db, tid)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert response["data"]["assigned"] == 60
+        # fingerprint + build + employees + assignments + bulk insert
+        assert len(statements) <= 6
+
+        by_id = {h.nodal_point_id: (float(h.latitude), float(h.longitude)) for h in hubs}
+        for emp in test_db.query(Employee).filter(Employee.employee_code.like("BULK%")).all():
+            assignment = test_db.query(EmployeeNodalPoint).filter_by(employee_id=emp.employee_id).one()
+            home = (float(emp.latitude), float(emp.longitude))
+            expected = min(by_id, key=lambda h: geodesic(home, by_id[h]).km)
+            assert assignment.nodal_point_id == expected
+
+    def test_overridden_kept_and_stale_updated(self, test_db, test_tenant, test_team):
+        tid = test_tenant.tenant_id
+        hubs = _add_hubs(test_db, tid)
+        self._employees(test_db, tid, test_team.team_id, 2)
+        emps = test_db.query(Employee).filter(Employee.employee_code.like("BULK%")).all()
+        airport = hubs[3].nodal_point_id
+
+        test_db.add_all([
+            EmployeeNodalPoint(employee_id=emps[0].employee_id, nodal_point_id=airport,
+                               tenant_id=tid, is_overridden=True),
+            EmployeeNodalPoint(employee_id=emps[1].employee_id, nodal_point_id=airport,
+                               tenant_id=tid, is_overridden=False),
+        ])
+        test_db.commit()
+
+        self._run(test_db, tid)
+        test_db.expire_all()
+
+        kept = test_db.query(EmployeeNodalPoint).filter_by(employee_id=emps[0].employee_id).one()
+        moved = test_db.query(EmployeeNodalPoint).filter_by(employee_id=emps[1].employee_id).one()
+        assert kept.nodal_point_id == airport and kept.is_overridden
+        home = (float(emps[1].latitude), float(emps[1].longitude))
+        by_id = {h.nodal_point_id: (float(h.latitude), float(h.longitude)) for h in hubs}
+        assert moved.nodal_point_id == min(by_id, key=lambda h: geodesic(home, by_id[h]).km)
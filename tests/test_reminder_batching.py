@@ -0,0 +1,175 @@
+"""
+tests/test_reminder_batching.py
+--------------------------------
+Chunked reminder dispatch (ReminderService.process_due_reminders) and the
+batch send path (UnifiedNotificationService.send_trip_reminders).
+
+Test coverage:
+1. Due bookings are claimed and sent REMINDER_BATCH_SIZE at a time, with
+   one claim UPDATE and one send call per chunk.
+2. A booking stamped by another worker after the scan is never sent.
+3. A chunk whose send raises is released and picked up on the next tick.
+4. send_trip_reminders resolves tokens in batch, sends through one
+   send_each call and logs out sessions whose token FCM rejected.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import event, update
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.route_management import (
+    RouteManagement, RouteManagementBooking, RouteManagementStatusEnum,
+)
+from app.models.tenant_config import TenantConfig
+from app.services.reminder_service import ReminderService
+from app.services.unified_notification_service import UnifiedNotificationService
+
+_PATCH_TARGET = "app.services.reminder_service.UnifiedNotificationService"
+
+
+@pytest.fixture
+def due_bookings(test_db, test_tenant, test_employee, test_driver, test_vehicle, test_shift):
+    """Seven SCHEDULED bookings on one route, all with pickup 15 minutes from now."""
+    test_db.add(TenantConfig(
+        tenant_id=test_tenant.tenant_id, schedule_reminder_enabled=True, schedule_reminder_minutes=30,
+    ))
+    route = RouteManagement(
+        route_id=9100, tenant_id=test_tenant.tenant_id, shift_id=test_shift.shift_id,
+        route_code="BATCH_ROUTE", status=RouteManagementStatusEnum.DRIVER_ASSIGNED,
+        assigned_vehicle_id=test_vehicle.vehicle_id, assigned_driver_id=test_driver.driver_id,
+    )
+    test_db.add(route)
+    test_db.flush()
+
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    pickup = (now + timedelta(minutes=15)).strftime("%H:%M:%S")
+    employee = test_employee["employee"]
+    booking_ids = []
+    for i in range(7):
+        booking = Booking(
+            booking_id=9101 + i, tenant_id=test_tenant.tenant_id, employee_id=employee.employee_id,
+            employee_code=employee.employee_code, shift_id=test_shift.shift_id,
+            booking_date=now.date(), status=BookingStatusEnum.SCHEDULED,
+        )
+        test_db.add(booking)
+        test_db.flush()
+        test_db.add(RouteManagementBooking(
+            route_id=route.route_id, booking_id=booking.booking_id, order_id=i + 1,
+            estimated_pick_up_time=pickup,
+        ))
+        booking_ids.append(booking.booking_id)
+    test_db.commit()
+    return booking_ids
+
+
+def _stamped(db, booking_ids):
+    db.expire_all()
+    return {b.booking_id for b in db.query(Booking).filter(Booking.booking_id.in_(booking_ids)) if b.reminder_sent_at}
+
+
+def _ok(reminders):
+    return [{"push_success": True, "sms_success": None, "errors": []} for _ in reminders]
+
+
+def test_chunks_share_one_claim_and_one_send(test_db, due_bookings):
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+
+    with patch(_PATCH_TARGET) as MockUNS, patch("app.services.reminder_service.settings.REMINDER_BATCH_SIZE", 3):
+        send = MockUNS.return_value.send_trip_reminders
+        send.side_effect = _ok
+        event.listen(test_db.get_bind(), "before_cursor_execute", listener)
+        try:
+            summary = ReminderService(test_db).process_due_reminders()
+        finally:
+            event.remove(test_db.get_bind(), "before_cursor_execute", listener)
+
+    assert summary == {"scanned": 7, "sent": 7, "failed": 0, "skipped": 0}
+    assert [len(call.args[0]) for call in send.call_args_list] == [3, 3, 1]
+    assert [r["booking_id"] for call in send.call_args_list for r in call.args[0]] == due_bookings
+    assert sum(1 for s in statements if s.lstrip().upper().startswith("UPDATE")) == 3
+    assert _stamped(test_db, due_bookings) == set(due_bookings)
+    MockUNS.assert_called_once()
+
+
+def test_booking_claimed_elsewhere_is_not_sent(test_db, due_bookings):
+    taken = due_bookings[2]
+    svc = ReminderService(test_db)
+    eligible_rows = svc._eligible_rows
+
+    def rows_then_other_worker_claims(*args):
+        rows = eligible_rows(*args)
+        test_db.execute(
+            update(Booking).where(Booking.booking_id == taken).values(reminder_sent_at=datetime.utcnow()),
+            execution_options={"synchronize_session": False},
+        )
+        return rows
+
+    svc._eligible_rows = rows_then_other_worker_claims
+    with patch(_PATCH_TARGET) as MockUNS:
+        send = MockUNS.return_value.send_trip_reminders
+        send.side_effect = _ok
+        summary = svc.process_due_reminders()
+
+    sent_ids = [r["booking_id"] for call in send.call_args_list for r in call.args[0]]
+    assert taken not in sent_ids and len(sent_ids) == 6
+    assert summary["scanned"] == 7 and summary["sent"] == 6
+    assert svc._claim([taken], datetime.utcnow()) == set()
+
+
+def test_failed_chunk_is_released_for_next_tick(test_db, due_bookings):
+    with patch(_PATCH_TARGET) as MockUNS, patch("app.services.reminder_service.settings.REMINDER_BATCH_SIZE", 4):
+        MockUNS.return_value.send_trip_reminders.side_effect = [_ok(range(4)), RuntimeError("fcm down")]
+        first = ReminderService(test_db).process_due_reminders()
+
+    assert first == {"scanned": 7, "sent": 4, "failed": 3, "skipped": 0}
+    assert _stamped(test_db, due_bookings) == set(due_bookings[:4])
+
+    with patch(_PATCH_TARGET) as MockUNS:
+        send = MockUNS.return_value.send_trip_reminders
+        send.side_effect = _ok
+        second = ReminderService(test_db).process_due_reminders()
+
+    assert second == {"scanned": 3, "sent": 3, "failed": 0, "skipped": 0}
+    assert [r["booking_id"] for r in send.call_args.args[0]] == due_bookings[4:]
+    assert _stamped(test_db, due_bookings) == set(due_bookings)
+
+
+def test_send_trip_reminders_batches_push(test_db):
+    cache = MagicMock()
+    cache.get_tokens_batch.return_value = {"employee:1": "tok-1", "employee:3": "tok-3"}
+    cache.get_platform.return_value = "app"
+    with patch("app.services.unified_notification_service.FCMService") as MockFCM:
+        svc = UnifiedNotificationService(test_db, cache=cache)
+    svc.session_manager = MagicMock()
+    svc.session_manager.get_active_sessions_batch.return_value = []
+    svc.fcm.send_each.return_value = [
+        {"success": True, "token": "tok-1"},
+        {"success": False, "error": "TOKEN_UNREGISTERED", "token": "tok-3", "should_delete": True},
+    ]
+
+    reminders = [
+        {
+            "employee_id": employee_id, "employee_phone": None, "pickup_time_str": "08:30:00",
+            "vehicle_plate": "KA01", "driver_name": "D", "driver_phone": "99",
+            "booking_id": 100 + employee_id, "route_id": 7, "send_sms": True,
+        }
+        for employee_id in (1, 2, 3)
+    ]
+    results = svc.send_trip_reminders(reminders)
+
+    assert [r["push_success"] for r in results] == [True, False, False]
+    assert results[1]["errors"] == ["push: NO_ACTIVE_SESSION"]
+    assert results[2]["errors"] == ["push: TOKEN_UNREGISTERED"]
+    assert all(r["sms_success"] is None for r in results)
+
+    svc.session_manager.get_active_sessions_batch.assert_called_once_with([{"user_type": "employee", "user_id": 2}])
+    (outgoing,), _ = svc.fcm.send_each.call_args
+    assert [m["token"] for m in outgoing] == ["tok-1", "tok-3"]
+    assert outgoing[0]["body"] == "Your cab arrives at 08:30. Vehicle: KA01. Driver: D 99"
+    assert outgoing[0]["data"]["booking_id"] == "101"
+    svc.session_manager.logout_session.assert_called_once_with("employee", 3, "app")
+    MockFCM.assert_called_once()
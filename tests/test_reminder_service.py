@@ -159,7 +159,7 @@ def test_fires_when_due(test_db, reminder_setup):
     produce scanned=1, sent=1, and have reminder_sent_at stamped.
     """
     with patch(_PATCH_TARGET) as MockUNS:
-        MockUNS.return_value.send_trip_reminder.return_value = _PUSH_OK
+        MockUNS.return_value.send_trip_reminders.return_value = [_PUSH_OK]
 
         svc = ReminderService(test_db)
         summary = svc.process_due_reminders()
@@ -302,7 +302,7 @@ def test_push_fail_still_marks_sent(test_db, reminder_setup):
     failed pushes (spamming).  The summary should record skipped=1.
     """
     with patch(_PATCH_TARGET) as MockUNS:
-        MockUNS.return_value.send_trip_reminder.return_value = _PUSH_FAIL
+        MockUNS.return_value.send_trip_reminders.return_value = [_PUSH_FAIL]
 
         svc = ReminderService(test_db)
         summary = svc.process_due_reminders()
@@ -326,20 +326,22 @@ def test_correct_notification_content(
     test_db, reminder_setup, test_driver, test_vehicle
 ):
     """
-    `send_trip_reminder` must be called with the correct vehicle plate,
+    `send_trip_reminders` must be called with the correct vehicle plate,
     driver name, driver phone, booking_id, and pickup_time_str.
     """
     with patch(_PATCH_TARGET) as MockUNS:
-        mock_send = MockUNS.return_value.send_trip_reminder
-        mock_send.return_value = _PUSH_OK
+        mock_send = MockUNS.return_value.send_trip_reminders
+        mock_send.return_value = [_PUSH_OK]
 
         svc = ReminderService(test_db)
         svc.process_due_reminders()
 
         mock_send.assert_called_once()
 
-    # Retrieve the kwargs the service passed to send_trip_reminder
-    _, call_kwargs = mock_send.call_args
+    # Retrieve the reminder the service passed to send_trip_reminders
+    (reminders,), _ = mock_send.call_args
+    assert len(reminders) == 1
+    call_kwargs = reminders[0]
 
     assert call_kwargs["booking_id"] == reminder_setup["booking"].booking_id
     assert call_kwargs["vehicle_plate"] == test_vehicle.rc_number   # "TEST123"
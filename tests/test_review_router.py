@@ -1191,3 +1191,130 @@ class TestAdminListReviews:
         """No token → 401 Unauthorized."""
         resp = client.get(self.URL)
         assert resp.status_code in (401, 403)
+
+
+# ----------------------------------------------------------------
+# Review aggregates (review_aggregates / review_aggregate_daily)
+# ----------------------------------------------------------------
+
+class TestReviewAggregates:
+
+    def _submit(self, client, db, token, emp, shift_id, driver_id, vehicle_id, booking_id, payload):
+        bk = _make_completed_booking(db, emp.tenant_id, emp.employee_id, shift_id, booking_id)
+        _make_route_with_booking(db, emp.tenant_id, shift_id, driver_id, vehicle_id,
+                                 bk.booking_id, route_id=booking_id)
+        resp = client.post(
+            f"/api/v1/employee/bookings/{bk.booking_id}/review",
+            json=payload,
+            headers={"Authorization": token},
+        )
+        assert resp.status_code == 201
+        return resp.json()["data"]
+
+    def _aggregate(self, db, subject_type, subject_id):
+        from app.models.review import ReviewAggregate
+        db.expire_all()
+        return (
+            db.query(ReviewAggregate)
+            .filter(ReviewAggregate.subject_type == subject_type,
+                    ReviewAggregate.subject_id == subject_id)
+            .first()
+        )
+
+    def test_submit_maintains_aggregates(self, client, test_db, employee_token, admin_token,
+                                         employee_user, test_shift, test_driver, test_vehicle):
+        from app.models.review import ReviewSubjectTypeEnum
+        emp = employee_user["employee"]
+        args = (client, test_db, employee_token, emp, test_shift.shift_id,
+                test_driver.driver_id, test_vehicle.vehicle_id)
+        self._submit(*args, 6001, {"overall_rating": 5, "driver_rating": 5,
+                                   "driver_tags": ["Polite", "Fast"], "vehicle_rating": 3})
+        self._submit(*args, 6002, {"driver_rating": 2, "driver_tags": ["Fast"]})
+
+        agg = self._aggregate(test_db, ReviewSubjectTypeEnum.DRIVER, test_driver.driver_id)
+        assert (agg.rating_sum, agg.rating_count) == (7, 2)
+        assert (agg.overall_sum, agg.overall_count) == (5, 1)
+        assert agg.tag_counts == {"Polite": 1, "Fast": 2}
+
+        vagg = self._aggregate(test_db, ReviewSubjectTypeEnum.VEHICLE, test_vehicle.vehicle_id)
+        assert (vagg.rating_sum, vagg.rating_count) == (3, 1)
+
+        summary = client.get(
+            f"/api/v1/drivers/{test_driver.driver_id}/reviews",
+            headers={"Authorization": admin_token},
+        ).json()["data"]["summary"]
+        assert summary["total_reviews"] == 2
+        assert summary["average_rating"] == 3.5
+        assert summary["average_overall_rating"] == 5.0
+        assert summary["last_30_days"] == {"total_reviews": 2, "average_rating": 3.5}
+        assert summary["last_90_days"]["total_reviews"] == 2
+
+    def test_existing_reviews_are_backfilled_on_first_read(self, client, test_db, admin_token,
+                                                           employee_user, test_shift, test_driver):
+        from app.models.review import ReviewSubjectTypeEnum
+        emp = employee_user["employee"]
+        for i, rating in enumerate([4, 2]):
+            bk = _make_completed_booking(test_db, emp.tenant_id, emp.employee_id, test_shift.shift_id, 6100 + i)
+            test_db.add(RideReview(
+                tenant_id=emp.tenant_id, booking_id=bk.booking_id, employee_id=emp.employee_id,
+                driver_id=test_driver.driver_id, driver_rating=rating, driver_tags=["Calm"],
+            ))
+        test_db.commit()
+        assert self._aggregate(test_db, ReviewSubjectTypeEnum.DRIVER, test_driver.driver_id) is None
+
+        summary = client.get(
+            f"/api/v1/drivers/{test_driver.driver_id}/reviews",
+            headers={"Authorization": admin_token},
+        ).json()["data"]["summary"]
+
+        assert summary["total_reviews"] == 2
+        assert summary["tag_counts"] == {"Calm": 2}
+        agg = self._aggregate(test_db, ReviewSubjectTypeEnum.DRIVER, test_driver.driver_id)
+        assert agg.rating_count == 2
+
+    def test_deactivate_removes_review_from_aggregates(self, client, test_db, employee_token, admin_token,
+                                                       employee_user, test_shift, test_driver, test_vehicle):
+        from app.models.review import ReviewSubjectTypeEnum
+        emp = employee_user["employee"]
+        args = (client, test_db, employee_token, emp, test_shift.shift_id,
+                test_driver.driver_id, test_vehicle.vehicle_id)
+        self._submit(*args, 6201, {"driver_rating": 5, "driver_tags": ["Polite"]})
+        bad = self._submit(*args, 6202, {"driver_rating": 1, "driver_tags": ["Rude"]})
+
+        resp = client.delete(f"/api/v1/reviews/{bad['review_id']}", headers={"Authorization": admin_token})
+        assert resp.status_code == 200
+
+        agg = self._aggregate(test_db, ReviewSubjectTypeEnum.DRIVER, test_driver.driver_id)
+        assert (agg.rating_sum, agg.rating_count) == (5, 1)
+        assert agg.tag_counts == {"Polite": 1}
+
+        body = client.get(
+            f"/api/v1/drivers/{test_driver.driver_id}/reviews",
+            headers={"Authorization": admin_token},
+        ).json()["data"]
+        assert body["summary"]["total_reviews"] == 1
+        assert bad["review_id"] not in [r["review_id"] for r in body["reviews"]]
+
+        again = client.delete(f"/api/v1/reviews/{bad['review_id']}", headers={"Authorization": admin_token})
+        assert again.status_code == 404
+
+    def test_date_range_summary_uses_daily_buckets(self, client, test_db, employee_token, admin_token,
+                                                   employee_user, test_shift, test_driver, test_vehicle):
+        emp = employee_user["employee"]
+        self._submit(client, test_db, employee_token, emp, test_shift.shift_id,
+                     test_driver.driver_id, test_vehicle.vehicle_id, 6301,
+                     {"driver_rating": 4, "driver_tags": ["Safe"]})
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+        inside = client.get(
+            f"/api/v1/drivers/{test_driver.driver_id}/reviews?start_date={yesterday}",
+            headers={"Authorization": admin_token},
+        ).json()["data"]["summary"]
+        before = client.get(
+            f"/api/v1/drivers/{test_driver.driver_id}/reviews?end_date={yesterday}",
+            headers={"Authorization": admin_token},
+        ).json()["data"]["summary"]
+
+        assert inside["total_reviews"] == 1
+        assert inside["tag_counts"] == {"Safe": 1}
+        assert before["total_reviews"] == 0
@@ -0,0 +1,145 @@
+"""
+tests/test_route_views.py
+--------------------------
+Batched route views (app/services/route_views.py).
+
+Test coverage:
+1. load_route_refs issues one query per entity type however many routes
+   are on the page, and serialize_employee_route issues none.
+2. GET /employee/bookings and GET /routes/ run the same number of queries
+   for one routed booking as for five, each on its own route with its own
+   vehicle, driver, vendor and shift.
+"""
+
+from contextlib import contextmanager
+from datetime import date, time, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.route_management import (
+    RouteManagement, RouteManagementBooking, RouteManagementStatusEnum,
+)
+from app.models.shift import Shift, ShiftLogTypeEnum
+from app.services.route_views import load_route_refs, serialize_employee_route
+
+DAY = date.today() + timedelta(days=1)
+
+
+@contextmanager
+def count_queries(db):
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def _clone(obj, **overrides):
+    """Copy of a fixture row with new ids / unique columns."""
+    values = {c.key: getattr(obj, c.key) for c in obj.__mapper__.column_attrs}
+    values.update(overrides)
+    return type(obj)(**values)
+
+
+@pytest.fixture
+def make_routes(test_db, test_tenant, test_vendor, test_driver, test_vehicle, employee_user):
+    """make_routes(n) → n routes, each with its own shift/vendor/driver/vehicle and one booking."""
+    employee = employee_user["employee"]
+    made = []
+
+    def make(n):
+        routes = []
+        for _ in range(n):
+            i = len(made)
+            k = 100 + i
+            test_db.add(Shift(
+                shift_id=k, tenant_id=test_tenant.tenant_id, shift_code=f"S{k}",
+                log_type=ShiftLogTypeEnum.IN, shift_time=time(6 + i, 0), is_active=True,
+            ))
+            test_db.add(_clone(
+                test_vendor, vendor_id=k, name=f"Vendor {k}", vendor_code=f"V{k}",
+                email=f"v{k}@test.com", phone=f"80000000{k}",
+            ))
+            test_db.add(_clone(
+                test_driver, driver_id=k, vendor_id=k, code=f"D{k}", email=f"d{k}@test.com",
+                phone=f"90000000{k}", license_number=f"L{k}", badge_number=f"B{k}",
+            ))
+            test_db.add(_clone(test_vehicle, vehicle_id=k, vendor_id=k, rc_number=f"RC{k}"))
+            route = RouteManagement(
+                tenant_id=test_tenant.tenant_id, route_code=f"R{k}", shift_id=k,
+                assigned_vendor_id=k, assigned_driver_id=k, assigned_vehicle_id=k,
+                status=RouteManagementStatusEnum.DRIVER_ASSIGNED,
+            )
+            booking = Booking(
+                tenant_id=test_tenant.tenant_id, employee_id=employee.employee_id,
+                employee_code=employee.employee_code, shift_id=k, booking_date=DAY,
+                status=BookingStatusEnum.SCHEDULED,
+            )
+            test_db.add_all([route, booking])
+            test_db.flush()
+            test_db.add(RouteManagementBooking(route_id=route.route_id, booking_id=booking.booking_id, order_id=1))
+            routes.append(route)
+            made.append(route)
+        test_db.commit()
+        return routes
+
+    return make
+
+
+def test_refs_cost_one_query_per_entity_type(test_db, make_routes):
+    routes = make_routes(6)
+    test_db.expire_all()
+
+    with count_queries(test_db) as statements:
+        refs = load_route_refs(test_db, routes)
+    # Route columns themselves were expired above; only the ref queries count.
+    ref_queries = [s for s in statements if "FROM route_management" not in s]
+    assert len(ref_queries) == 4   # vehicles (+ type), drivers, vendors, shifts
+
+    with count_queries(test_db) as statements:
+        views = [serialize_employee_route(r, refs) for r in routes]
+    assert statements == []
+
+    first = views[0]
+    assert first["vehicle_details"]["vehicle_number"] == "RC100"
+    assert first["vehicle_details"]["capacity"] is not None
+    assert first["driver_details"]["driver_name"] == "Test Driver"
+    assert first["vendor_details"]["vendor_code"] == "V100"
+    assert first["shift_details"] == {"shift_id": 100, "shift_time": "06:00:00", "log_type": "IN"}
+
+
+def _employee_bookings(client, token):
+    return client.get(
+        "/api/v1/employee/bookings",
+        params={"start_date": DAY.isoformat(), "end_date": DAY.isoformat()},
+        headers={"Authorization": token},
+    )
+
+
+def _all_routes(client, token):
+    return client.get("/api/v1/routes/", params={"booking_date": DAY.isoformat()}, headers={"Authorization": token})
+
+
+@pytest.mark.parametrize("endpoint", [_employee_bookings, _all_routes], ids=["employee_bookings", "all_routes"])
+def test_listing_query_count_is_constant(client, test_db, employee_token, make_routes, endpoint):
+    make_routes(1)
+    with count_queries(test_db) as one:
+        response = endpoint(client, employee_token)
+    assert response.status_code == 200
+
+    make_routes(5)   # five more routed bookings on five more routes
+    with count_queries(test_db) as six:
+        response = endpoint(client, employee_token)
+    assert response.status_code == 200
+
+    body = response.json()["data"]
+    if endpoint is _all_routes:
+        assert body["total_routes"] == 6
+    else:
+        assert sum(1 for b in body if b["route_details"]) == 6
+    assert len(six) == len(one)
@@ -0,0 +1,149 @@
+"""
+tests/test_speed_violation_episodes.py
+----------------------------------------
+IMP-10 — Episode-based server-side speed violation detection.
+
+Test coverage:
+1. A continuous overspeed stretch produces one SpeedViolation row and one
+   admin notification, with peak / average / duration / end position.
+2. Hysteresis: dipping under the limit briefly keeps the episode open;
+   staying under for _CLOSE_AFTER_SECONDS closes it.
+3. Two separated overspeed stretches produce two rows.
+4. close_speed_episode() finalises an open episode on duty end.
+5. Speed limits are cached — repeated pings do not re-query the DB.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.models.speed_violation import SpeedViolation
+from app.services import speed_violation_service as svc
+
+
+T0 = datetime(2026, 6, 1, 9, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state(monkeypatch):
+    monkeypatch.setattr(svc.settings, "USE_REDIS", False)
+    svc._local_episodes.clear()
+    svc._limit_cache.clear()
+    yield
+    svc._local_episodes.clear()
+    svc._limit_cache.clear()
+
+
+@pytest.fixture
+def route(test_db, test_tenant, test_driver, test_shift):
+    from app.models.route_management import RouteManagement, RouteManagementStatusEnum
+
+    r = RouteManagement(
+        tenant_id=test_tenant.tenant_id,
+        shift_id=test_shift.shift_id,
+        route_code="SPEEDTEST",
+        estimated_total_time=60.0,
+        status=RouteManagementStatusEnum.ONGOING,
+        ota_grace_minutes=5,
+        assigned_driver_id=test_driver.driver_id,
+    )
+    test_db.add(r)
+    test_db.commit()
+    return r
+
+
+@pytest.fixture
+def notify():
+    with patch.object(svc, "_notify_admins") as m:
+        yield m
+
+
+def _ping(db, route, seconds, speed, lat=12.9, lng=77.6):
+    svc.detect_and_record_speed_violation(
+        db=db,
+        tenant_id=route.tenant_id,
+        route_id=route.route_id,
+        driver_id=route.assigned_driver_id,
+        vehicle_id=None,
+        speed_kmph=speed,
+        latitude=lat,
+        longitude=lng,
+        recorded_at=T0 + timedelta(seconds=seconds),
+    )
+
+
+def _rows(db, route):
+    return (
+        db.query(SpeedViolation)
+        .filter(SpeedViolation.route_id == route.route_id)
+        .order_by(SpeedViolation.violation_id)
+        .all()
+    )
+
+
+class TestEpisodes:
+
+    def test_continuous_overspeed_is_one_row_and_one_alert(self, test_db, route, notify):
+        # 2 minutes over the 60 km/h default, one ping every 6 s
+        speeds = [70, 75, 90, 85, 80] * 4
+        for i, speed in enumerate(speeds):
+            _ping(test_db, route, i * 6, speed, lat=12.9 + i * 0.001)
+
+        assert len(_rows(test_db, route)) == 1
+        assert notify.call_count == 1
+
+        # Back under the limit long enough to close
+        _ping(test_db, route, len(speeds) * 6 + 40, 40)
+
+        (row,) = _rows(test_db, route)
+        test_db.refresh(row)
+        assert row.speed_recorded == 90
+        assert row.avg_speed == pytest.approx(sum(speeds) / len(speeds), abs=0.01)
+        assert row.ping_count == len(speeds)
+        assert row.duration_seconds == (len(speeds) - 1) * 6
+        assert row.ended_at is not None
+        assert row.end_latitude == pytest.approx(12.9 + (len(speeds) - 1) * 0.001)
+        assert route.route_id not in svc._local_episodes
+
+    def test_brief_dip_keeps_episode_open(self, test_db, route, notify):
+        _ping(test_db, route, 0, 80)
+        _ping(test_db, route, 6, 55)    # dip, within hysteresis window
+        _ping(test_db, route, 12, 82)
+
+        assert len(_rows(test_db, route)) == 1
+        assert notify.call_count == 1
+        assert svc._local_episodes[route.route_id]["ping_count"] == 2
+
+    def test_separate_stretches_are_separate_rows(self, test_db, route, notify):
+        _ping(test_db, route, 0, 80)
+        _ping(test_db, route, 60, 40)   # closes first episode
+        _ping(test_db, route, 120, 95)  # opens second
+
+        assert len(_rows(test_db, route)) == 2
+        assert notify.call_count == 2
+
+    def test_under_limit_without_episode_writes_nothing(self, test_db, route, notify):
+        for i in range(5):
+            _ping(test_db, route, i * 6, 50)
+        assert _rows(test_db, route) == []
+        notify.assert_not_called()
+
+    def test_duty_end_closes_open_episode(self, test_db, route, notify):
+        _ping(test_db, route, 0, 80)
+        _ping(test_db, route, 10, 100)
+
+        svc.close_speed_episode(test_db, route.route_id)
+
+        (row,) = _rows(test_db, route)
+        test_db.refresh(row)
+        assert row.speed_recorded == 100
+        assert row.ended_at is not None
+        assert row.duration_seconds == 10
+        assert route.route_id not in svc._local_episodes
+
+    def test_speed_limit_is_cached(self, test_db, route, notify):
+        with patch.object(svc, "_get_speed_limit", return_value=60.0) as lookup:
+            for i in range(10):
+                _ping(test_db, route, i * 6, 70)
+        assert lookup.call_count == 1
@@ -0,0 +1,123 @@
+"""
+tests/test_stale_driver_heartbeats.py
+--------------------------------------
+Redis heartbeat stale-driver detection (app/services/stale_driver_service.py).
+
+Test coverage:
+1. record_heartbeat / forget_heartbeat keep one member per route; both are
+   no-ops without Redis.
+2. With 10,000 tracked routes the check reads only the silent ones: one
+   range query, then two SELECTs (thresholds, ONGOING state) — alerts the
+   ONGOING ones and forgets routes that already ended.
+3. Alert dedup lives in Redis: a second worker sharing it sends nothing.
+4. Tenant thresholds and the sharding predicate are honoured.
+
+Redis is fakeredis; _alert_admins is stubbed to record the alerted routes.
+"""
+
+import time
+
+import fakeredis
+import pytest
+from sqlalchemy import event
+
+from app.models.route_management import RouteManagement, RouteManagementStatusEnum
+from app.models.tenant_config import TenantConfig
+from app.services import stale_driver_service as svc
+
+DRIVERS = 10_000
+TENANTS = [f"HB{i:02d}" for i in range(10)]
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+@pytest.fixture
+def alerted(monkeypatch):
+    sent = []
+    monkeypatch.setattr(svc, "_alert_admins", lambda db, route, elapsed_min, now_utc: sent.append(route.route_id))
+    return sent
+
+
+def _route(db, tenant_id, status=RouteManagementStatusEnum.ONGOING):
+    route = RouteManagement(tenant_id=tenant_id, route_code="HB", status=status)
+    db.add(route)
+    db.flush()
+    return route.route_id
+
+
+def _selects(db):
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    return statements, lambda: event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+
+def test_heartbeat_lifecycle(redis):
+    assert svc.record_heartbeat("T1", 7, at=100.0, client=redis) is True
+    assert svc.record_heartbeat("T1", 7, at=160.0, client=redis) is True
+    assert svc.silent_routes(redis, now=1000.0, min_silence_seconds=60) == [("T1", 7, 160.0)]
+
+    assert svc.forget_heartbeat("T1", 7, client=redis) is True
+    assert svc.silent_routes(redis, now=1000.0, min_silence_seconds=60) == []
+
+    # Redis disabled (the test settings) → nothing to write to
+    assert svc.record_heartbeat("T1", 7) is False
+    assert svc.forget_heartbeat("T1", 7) is False
+
+
+def test_ten_thousand_drivers_one_range_query(test_db, redis, alerted):
+    now = time.time()
+    silent_ongoing = [_route(test_db, TENANTS[i % len(TENANTS)]) for i in range(25)]
+    silent_ended = [_route(test_db, TENANTS[0], status=RouteManagementStatusEnum.COMPLETED) for _ in range(5)]
+    test_db.commit()
+
+    pipe = redis.pipeline(transaction=False)
+    for i in range(DRIVERS - 30):
+        pipe.zadd(svc._HEARTBEAT_KEY, {svc._member(TENANTS[i % len(TENANTS)], 100_000 + i): now - 20})
+    for i, route_id in enumerate(silent_ongoing):
+        pipe.zadd(svc._HEARTBEAT_KEY, {svc._member(TENANTS[i % len(TENANTS)], route_id): now - 600})
+    for route_id in silent_ended:
+        pipe.zadd(svc._HEARTBEAT_KEY, {svc._member(TENANTS[0], route_id): now - 600})
+    pipe.execute()
+    assert redis.zcard(svc._HEARTBEAT_KEY) == DRIVERS
+
+    test_db.expire_all()
+    statements, stop = _selects(test_db)
+    try:
+        svc._run_check(test_db, client=redis)
+    finally:
+        stop()
+
+    assert sorted(alerted) == sorted(silent_ongoing)
+    assert len(statements) == 2
+    # Ended routes are no longer tracked; everyone else still is
+    assert redis.zcard(svc._HEARTBEAT_KEY) == DRIVERS - len(silent_ended)
+
+    # A second worker sharing Redis sees the claims and stays quiet
+    svc._run_check(test_db, client=redis)
+    assert sorted(alerted) == sorted(silent_ongoing)
+
+    # Duty end clears the claim, so a restarted route can alert again
+    svc.forget_heartbeat(TENANTS[0], silent_ongoing[0], client=redis)
+    svc.record_heartbeat(TENANTS[0], silent_ongoing[0], at=now - 600, client=redis)
+    svc._run_check(test_db, client=redis)
+    assert alerted.count(silent_ongoing[0]) == 2
+
+
+def test_tenant_threshold_and_sharding(test_db, redis, alerted):
+    now = time.time()
+    lenient, strict = "HBLENIENT", "HBSTRICT"
+    test_db.add(TenantConfig(tenant_id=lenient, stale_driver_threshold_minutes=15))
+    quiet_lenient, quiet_strict = _route(test_db, lenient), _route(test_db, strict)
+    test_db.commit()
+    for tenant_id, route_id in ((lenient, quiet_lenient), (strict, quiet_strict)):
+        svc.record_heartbeat(tenant_id, route_id, at=now - 10 * 60, client=redis)
+
+    svc._run_check(test_db, owns=lambda tenant_id: tenant_id != strict, client=redis)
+    assert alerted == []          # 10 min < lenient's 15; strict belongs to another worker
+
+    svc._run_check(test_db, owns=lambda tenant_id: tenant_id == strict, client=redis)
+    assert alerted == [quiet_strict]
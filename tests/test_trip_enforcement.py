@@ -0,0 +1,147 @@
+"""
+tests/test_trip_enforcement.py
+-------------------------------
+One-trip-per-shift enforcement (app/utils/trip_enforcement.py).
+
+Test coverage:
+1. find_trip_conflicts reports links on other active routes of the tenant
+   only, for the whole candidate set in one query.
+2. enforce_one_trip_per_shift
+   - disabled → nothing is touched
+   - auto-move → every conflicting link is removed with one DELETE
+   - block mode → 409 BOOKING_ALREADY_ASSIGNED for the first conflicting booking
+   - ONGOING/COMPLETED booking → 409 BOOKING_ALREADY_ACTIVE even with auto-move
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.route_management import (
+    RouteManagement, RouteManagementBooking, RouteManagementStatusEnum,
+)
+from app.utils.trip_enforcement import enforce_one_trip_per_shift, find_trip_conflicts
+
+DAY = date(2026, 7, 1)
+
+
+@pytest.fixture
+def world(test_db, test_tenant, test_shift):
+    """A target route, two other routes (one inactive) and a booking factory."""
+    tenant_id = test_tenant.tenant_id
+
+    def route(is_active=True, tenant=tenant_id):
+        r = RouteManagement(
+            tenant_id=tenant, shift_id=test_shift.shift_id,
+            status=RouteManagementStatusEnum.PLANNED, is_active=is_active,
+        )
+        test_db.add(r)
+        test_db.flush()
+        return r.route_id
+
+    target, other, inactive, foreign = route(), route(), route(is_active=False), route(tenant="OTHER")
+
+    def booking(*route_ids, status=BookingStatusEnum.SCHEDULED):
+        b = Booking(
+            tenant_id=tenant_id, employee_id=1, employee_code="E1",
+            shift_id=test_shift.shift_id, booking_date=DAY, status=status,
+        )
+        test_db.add(b)
+        test_db.flush()
+        for rid in route_ids:
+            test_db.add(RouteManagementBooking(route_id=rid, booking_id=b.booking_id, order_id=1))
+        test_db.flush()
+        return b.booking_id
+
+    test_db.commit()
+    return tenant_id, {"target": target, "other": other, "inactive": inactive, "foreign": foreign}, booking
+
+
+def _links(db, booking_id):
+    db.expire_all()
+    return sorted(
+        rid for (rid,) in db.query(RouteManagementBooking.route_id)
+        .filter(RouteManagementBooking.booking_id == booking_id)
+    )
+
+
+def _enforce(db, tenant_id, route_id, booking_ids, enabled=True, auto_move=True):
+    enforce_one_trip_per_shift(
+        db=db, route_id=route_id, tenant_id=tenant_id, booking_ids=booking_ids,
+        one_trip_per_shift_enabled=enabled, auto_move_on_conflict=auto_move,
+    )
+
+
+def test_find_trip_conflicts_scope(test_db, world):
+    tenant_id, routes, booking = world
+    conflicting = booking(routes["other"], routes["target"])
+    only_elsewhere = booking(routes["inactive"], routes["foreign"])
+    fresh = booking()
+
+    conflicts = find_trip_conflicts(test_db, routes["target"], tenant_id, [conflicting, only_elsewhere, fresh])
+
+    assert list(conflicts) == [conflicting]
+    assert conflicts[conflicting].conflict_route_ids == [routes["other"]]
+    assert conflicts[conflicting].is_active is False
+
+
+def test_disabled_touches_nothing(test_db, world):
+    tenant_id, routes, booking = world
+    b = booking(routes["other"], status=BookingStatusEnum.ONGOING)
+
+    _enforce(test_db, tenant_id, routes["target"], {b}, enabled=False)
+
+    assert _links(test_db, b) == [routes["other"]]
+
+
+def test_auto_move_is_one_select_and_one_delete(test_db, world):
+    tenant_id, routes, booking = world
+    moved = [booking(routes["other"]) for _ in range(30)]
+    kept = booking(routes["inactive"], routes["foreign"])
+    test_db.commit()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(test_db.get_bind(), "before_cursor_execute", listener)
+    try:
+        _enforce(test_db, tenant_id, routes["target"], set(moved) | {kept})
+    finally:
+        event.remove(test_db.get_bind(), "before_cursor_execute", listener)
+    test_db.commit()
+
+    assert [s.split()[0].upper() for s in statements] == ["SELECT", "DELETE"]
+    assert all(_links(test_db, b) == [] for b in moved)
+    assert _links(test_db, kept) == sorted([routes["inactive"], routes["foreign"]])
+
+
+def test_block_mode_reports_first_conflict(test_db, world):
+    tenant_id, routes, booking = world
+    fresh = booking()
+    first = booking(routes["other"])
+    second = booking(routes["other"])
+
+    with pytest.raises(HTTPException) as exc:
+        _enforce(test_db, tenant_id, routes["target"], [fresh, first, second], auto_move=False)
+
+    assert exc.value.status_code == 409
+    assert exc.value.detail["error_code"] == "BOOKING_ALREADY_ASSIGNED"
+    assert exc.value.detail["details"] == {"booking_id": first, "conflict_route_ids": [routes["other"]]}
+    assert _links(test_db, first) == [routes["other"]]
+
+
+@pytest.mark.parametrize("status", [BookingStatusEnum.ONGOING, BookingStatusEnum.COMPLETED])
+def test_active_booking_is_never_moved(test_db, world, status):
+    tenant_id, routes, booking = world
+    movable = booking(routes["other"])
+    active = booking(routes["other"], status=status)
+
+    with pytest.raises(HTTPException) as exc:
+        _enforce(test_db, tenant_id, routes["target"], [movable, active], auto_move=True)
+
+    assert exc.value.detail["error_code"] == "BOOKING_ALREADY_ACTIVE"
+    assert exc.value.detail["details"] == {"booking_id": active, "booking_status": status.value}
+    assert _links(test_db, active) == [routes["other"]]
+    assert _links(test_db, movable) == [routes["other"]]
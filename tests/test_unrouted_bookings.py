@@ -0,0 +1,99 @@
+"""
+tests/test_unrouted_bookings.py
+--------------------------------
+Shared unrouted-bookings query (booking_crud.get_unrouted_query).
+
+Test coverage:
+1. Only the shift's bookings on no route of the tenant are returned, with
+   the REQUEST filter by default and without it for status=None.
+2. The routed check is a correlated NOT EXISTS — no id list is bound.
+3. GET /routes/unrouted leaves out a REQUEST booking that is already on a route.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.crud.booking import booking_crud
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.route_management import (
+    RouteManagement, RouteManagementBooking, RouteManagementStatusEnum,
+)
+
+DAY = date(2026, 7, 1)
+
+
+@pytest.fixture
+def bookings(test_db, test_tenant):
+    tenant_id = test_tenant.tenant_id
+
+    def add(shift_id=1, day=DAY, status=BookingStatusEnum.REQUEST, routed=False):
+        booking = Booking(
+            tenant_id=tenant_id, employee_id=1, employee_code="E1",
+            shift_id=shift_id, booking_date=day, status=status,
+        )
+        test_db.add(booking)
+        test_db.flush()
+        if routed:
+            route = RouteManagement(
+                tenant_id=tenant_id, shift_id=shift_id, status=RouteManagementStatusEnum.PLANNED,
+            )
+            test_db.add(route)
+            test_db.flush()
+            test_db.add(RouteManagementBooking(route_id=route.route_id, booking_id=booking.booking_id, order_id=1))
+        return booking.booking_id
+
+    ids = {
+        "open": add(),
+        "open_scheduled": add(status=BookingStatusEnum.SCHEDULED),
+        "routed": add(routed=True),
+        "routed_scheduled": add(status=BookingStatusEnum.SCHEDULED, routed=True),
+        "other_shift": add(shift_id=2),
+        "other_day": add(day=date(2026, 6, 30)),
+    }
+    # Long routing history on other days must not matter.
+    for _ in range(20):
+        add(day=date(2026, 6, 1), status=BookingStatusEnum.COMPLETED, routed=True)
+    test_db.commit()
+    return tenant_id, ids
+
+
+def _ids(query):
+    return {b.booking_id for b in query.all()}
+
+
+def test_returns_only_unrouted_bookings_of_the_shift(test_db, bookings):
+    tenant_id, ids = bookings
+
+    requested = booking_crud.get_unrouted_query(test_db, tenant_id=tenant_id, booking_date=DAY, shift_id=1)
+    any_status = booking_crud.get_unrouted_query(
+        test_db, tenant_id=tenant_id, booking_date=DAY, shift_id=1, status=None,
+    )
+
+    assert _ids(requested) == {ids["open"]}
+    assert _ids(any_status) == {ids["open"], ids["open_scheduled"]}
+
+
+def test_routed_check_is_a_correlated_not_exists(test_db, bookings):
+    tenant_id, _ = bookings
+    query = booking_crud.get_unrouted_query(test_db, tenant_id=tenant_id, booking_date=DAY, shift_id=1)
+
+    compiled = query.statement.compile(dialect=test_db.get_bind().dialect)
+
+    assert "NOT (EXISTS" in str(compiled)
+    assert " IN (" not in str(compiled)
+    assert len(compiled.params) == 5   # tenant (twice), date, shift, status — nothing per routed id
+
+
+def test_unrouted_endpoint_skips_routed_requests(client, admin_token, test_db, bookings):
+    tenant_id, ids = bookings
+
+    response = client.get(
+        "/api/v1/routes/unrouted",
+        params={"tenant_id": tenant_id, "shift_id": 1, "booking_date": DAY.isoformat()},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 200
+    returned = {b["booking_id"] for b in response.json()["data"]["bookings"]}
+    assert returned == {ids["open"]}
@@ -0,0 +1,136 @@
+"""
+Unit tests for the coalescing Firebase RTDB location writer.
+
+Covers: app/firebase/location_writer.py
+- last-write-wins coalescing per driver
+- field-level multi-path flattening at the drivers/ root
+- chunking by max_batch
+- re-queue on failure without clobbering newer pings
+- background thread flush and flush-on-stop
+The RTDB sink is a stub callable — no Firebase, no network.
+"""
+import time
+
+import pytest
+
+from app.firebase.location_writer import FirebaseLocationWriter
+
+pytestmark = pytest.mark.unit
+
+
+class StubRTDB:
+    """Records every multi-path update it receives."""
+
+    def __init__(self, fail_times: int = 0):
+        self.calls = []
+        self.fail_times = fail_times
+
+    def __call__(self, updates: dict) -> None:
+        if self.fail_times:
+            self.fail_times -= 1
+            raise ConnectionError("rtdb unavailable")
+        self.calls.append(dict(updates))
+
+    @property
+    def merged(self) -> dict:
+        out = {}
+        for call in self.calls:
+            out.update(call)
+        return out
+
+
+def _payload(lat, lng, **extra):
+    return {"latitude": lat, "longitude": lng, "is_active": True, **extra}
+
+
+class TestCoalescing:
+    def test_latest_ping_per_driver_wins(self):
+        rtdb = StubRTDB()
+        w = FirebaseLocationWriter(update_fn=rtdb)
+        w._ensure_started = lambda: None   # flush manually
+
+        w.submit("T1", 5, 7, _payload(1.0, 1.0))
+        w.submit("T1", 5, 7, _payload(2.0, 2.0))
+        w.submit("T1", 5, 8, _payload(3.0, 3.0))
+        assert w.queue_depth == 2
+
+        assert w.flush() == 2
+        assert len(rtdb.calls) == 1
+        assert rtdb.calls[0]["T1/5/7/latitude"] == 2.0
+        assert rtdb.calls[0]["T1/5/8/longitude"] == 3.0
+        assert w.queue_depth == 0
+
+    def test_paths_are_field_level(self):
+        rtdb = StubRTDB()
+        w = FirebaseLocationWriter(update_fn=rtdb)
+        w._ensure_started = lambda: None
+
+        w.submit("T1", 5, 7, _payload(1.0, 2.0, speed=30))
+        w.flush()
+
+        assert set(rtdb.calls[0]) == {
+            "T1/5/7/latitude", "T1/5/7/longitude", "T1/5/7/is_active", "T1/5/7/speed",
+        }
+
+    def test_empty_flush_makes_no_call(self):
+        rtdb = StubRTDB()
+        w = FirebaseLocationWriter(update_fn=rtdb)
+        assert w.flush() == 0
+        assert rtdb.calls == []
+
+    def test_chunks_by_max_batch(self):
+        rtdb = StubRTDB()
+        w = FirebaseLocationWriter(update_fn=rtdb, max_batch=2)
+        w._ensure_started = lambda: None
+        for d in range(5):
+            w.submit("T1", 1, d, _payload(d, d))
+
+        assert w.flush() == 5
+        assert len(rtdb.calls) == 3
+
+
+class TestFailures:
+    def test_failed_chunk_is_requeued(self):
+        rtdb = StubRTDB(fail_times=1)
+        w = FirebaseLocationWriter(update_fn=rtdb)
+        w._ensure_started = lambda: None
+
+        w.submit("T1", 1, 1, _payload(1.0, 1.0))
+        assert w.flush() == 0
+        assert w.queue_depth == 1
+
+        assert w.flush() == 1
+        assert rtdb.merged["T1/1/1/latitude"] == 1.0
+
+    def test_requeue_does_not_overwrite_newer_ping(self):
+        w = FirebaseLocationWriter(update_fn=StubRTDB())
+        w._ensure_started = lambda: None
+        w.submit("T1", 1, 1, _payload(9.0, 9.0))          # newer ping already queued
+        w._requeue({("T1", "1", "1"): _payload(1.0, 1.0)})  # stale failed chunk
+        assert w._pending[("T1", "1", "1")]["latitude"] == 9.0
+
+
+class TestLifecycle:
+    def test_background_thread_flushes(self):
+        rtdb = StubRTDB()
+        w = FirebaseLocationWriter(update_fn=rtdb, flush_interval=0.02)
+        try:
+            w.submit("T1", 1, 1, _payload(1.0, 1.0))
+            deadline = time.time() + 2
+            while not rtdb.calls and time.time() < deadline:
+                time.sleep(0.01)
+            assert rtdb.merged["T1/1/1/latitude"] == 1.0
+            assert w.stats()["running"] is True
+        finally:
+            w.stop()
+
+    def test_stop_flushes_pending(self):
+        rtdb = StubRTDB()
+        w = FirebaseLocationWriter(update_fn=rtdb, flush_interval=60)
+        w.submit("T1", 1, 1, _payload(1.0, 1.0))
+        w.stop()
+        assert rtdb.merged["T1/1/1/latitude"] == 1.0
+        stats = w.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["flushed_drivers_total"] == 1
+        assert stats["last_flush_seconds"] is not None
@@ -0,0 +1,153 @@
+"""
+Unit tests for the Redis GEO live-map store.
+
+Covers: app/services/fleet_location_service.py
+- record / snapshot round-trip per tenant and per vendor
+- radius search ordering and distance reporting
+- polygon containment (bounding-box prefilter + ray casting)
+- lazy eviction of drivers whose metadata TTL expired
+- remove_driver on duty end
+All tests run against fakeredis — no live Redis, no DB, no HTTP.
+"""
+import fakeredis
+import pytest
+
+from app.services import fleet_location_service as fls
+
+pytestmark = pytest.mark.unit
+
+TENANT = "T1"
+
+# Bangalore landmarks
+MG_ROAD = (12.9756, 77.6050)
+KORAMANGALA = (12.9352, 77.6245)
+WHITEFIELD = (12.9698, 77.7500)
+AIRPORT = (13.1986, 77.7066)
+
+
+@pytest.fixture
+def r():
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+def _ping(r, driver_id, point, vendor_id=1, **extra):
+    assert fls.record_driver_location(
+        tenant_id=TENANT,
+        vendor_id=vendor_id,
+        driver_id=driver_id,
+        latitude=point[0],
+        longitude=point[1],
+        client=r,
+        **extra,
+    )
+
+
+class TestSnapshot:
+    def test_round_trip_includes_metadata(self, r):
+        _ping(r, 7, MG_ROAD, speed=42.5, driver_name="Ravi", driver_code="D7", route_id=99)
+
+        drivers = fls.get_active_drivers(TENANT, client=r)
+
+        assert len(drivers) == 1
+        d = drivers[0]
+        assert d["driver_id"] == 7
+        assert d["vendor_id"] == 1
+        assert d["latitude"] == pytest.approx(MG_ROAD[0])
+        assert d["longitude"] == pytest.approx(MG_ROAD[1])
+        assert d["speed"] == 42.5
+        assert d["driver_name"] == "Ravi"
+        assert d["route_id"] == 99
+
+    def test_vendor_scope(self, r):
+        _ping(r, 1, MG_ROAD, vendor_id=1)
+        _ping(r, 2, KORAMANGALA, vendor_id=2)
+
+        assert {d["driver_id"] for d in fls.get_active_drivers(TENANT, client=r)} == {1, 2}
+        assert [d["driver_id"] for d in fls.get_active_drivers(TENANT, vendor_id=2, client=r)] == [2]
+
+    def test_tenants_are_isolated(self, r):
+        _ping(r, 1, MG_ROAD)
+        assert fls.get_active_drivers("OTHER", client=r) == []
+
+    def test_latest_ping_wins(self, r):
+        _ping(r, 1, MG_ROAD)
+        _ping(r, 1, AIRPORT)
+
+        drivers = fls.get_active_drivers(TENANT, client=r)
+        assert len(drivers) == 1
+        assert drivers[0]["latitude"] == pytest.approx(AIRPORT[0])
+
+
+class TestRadius:
+    def test_nearest_first_with_distance(self, r):
+        _ping(r, 1, KORAMANGALA)
+        _ping(r, 2, MG_ROAD)
+        _ping(r, 3, AIRPORT)
+
+        drivers = fls.get_drivers_within_radius(TENANT, *MG_ROAD, radius_km=10, client=r)
+
+        assert [d["driver_id"] for d in drivers] == [2, 1]
+        assert drivers[0]["distance_km"] == pytest.approx(0.0, abs=0.01)
+        assert 4 < drivers[1]["distance_km"] < 6
+
+    def test_limit(self, r):
+        for i, p in enumerate([MG_ROAD, KORAMANGALA, WHITEFIELD], start=1):
+            _ping(r, i, p)
+        drivers = fls.get_drivers_within_radius(TENANT, *MG_ROAD, radius_km=50, limit=2, client=r)
+        assert len(drivers) == 2
+
+
+class TestPolygon:
+    # Rough box around central Bangalore (excludes Whitefield and the airport)
+    CENTRAL = [(12.90, 77.55), (12.90, 77.65), (13.00, 77.65), (13.00, 77.55)]
+
+    def test_point_in_polygon(self):
+        assert fls.point_in_polygon(*MG_ROAD, self.CENTRAL)
+        assert not fls.point_in_polygon(*AIRPORT, self.CENTRAL)
+
+    def test_drivers_in_polygon(self, r):
+        _ping(r, 1, MG_ROAD)
+        _ping(r, 2, KORAMANGALA)
+        _ping(r, 3, WHITEFIELD)
+        _ping(r, 4, AIRPORT)
+
+        drivers = fls.get_drivers_in_polygon(TENANT, self.CENTRAL, client=r)
+        assert {d["driver_id"] for d in drivers} == {1, 2}
+
+    def test_triangle_excludes_bounding_box_corner(self, r):
+        triangle = [(12.90, 77.55), (12.90, 77.65), (13.00, 77.55)]
+        corner = (12.99, 77.64)   # inside the bbox, outside the triangle
+        _ping(r, 1, corner)
+        assert fls.get_drivers_in_polygon(TENANT, triangle, client=r) == []
+
+    def test_degenerate_polygon(self, r):
+        _ping(r, 1, MG_ROAD)
+        assert fls.get_drivers_in_polygon(TENANT, [MG_ROAD, KORAMANGALA], client=r) == []
+
+
+class TestLifecycle:
+    def test_expired_metadata_is_evicted_on_read(self, r):
+        _ping(r, 1, MG_ROAD)
+        _ping(r, 2, KORAMANGALA)
+        r.delete(fls._meta_key(TENANT, 1))   # simulate TTL expiry
+
+        drivers = fls.get_active_drivers(TENANT, client=r)
+
+        assert [d["driver_id"] for d in drivers] == [2]
+        assert r.zscore(fls._tenant_key(TENANT), "1") is None
+
+    def test_metadata_has_ttl(self, r):
+        _ping(r, 1, MG_ROAD)
+        ttl = r.ttl(fls._meta_key(TENANT, 1))
+        assert 0 < ttl <= fls.LOCATION_TTL_SECONDS
+
+    def test_remove_driver(self, r):
+        _ping(r, 1, MG_ROAD, vendor_id=5)
+        assert fls.remove_driver(TENANT, 5, 1, client=r)
+        assert fls.get_active_drivers(TENANT, client=r) == []
+        assert fls.get_active_drivers(TENANT, vendor_id=5, client=r) == []
+
+    def test_disabled_redis_is_noop(self, monkeypatch):
+        monkeypatch.setattr(fls.settings, "USE_REDIS", False)
+        assert fls.record_driver_location(TENANT, 1, 1, *MG_ROAD) is False
+        assert fls.get_active_drivers(TENANT) == []
@@ -0,0 +1,117 @@
+"""
+Unit tests for common_utils/auth/password_hasher.py
+
+Covers: async hash / verify through the pool, parallel batch hashing,
+        bounded admission, legacy SHA-256 upgrade on login.
+
+No DB or HTTP — the "session" in the rehash tests is a stub.
+"""
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from common_utils.auth import password_hasher as ph
+from common_utils.auth.password_hasher import PasswordHasher, upgrade_legacy_hash
+from common_utils.auth.utils import verify_password
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    h = PasswordHasher(workers=2, max_concurrency=2)
+    yield h
+    h.shutdown()
+
+
+class TestAsyncHashing:
+
+    def test_hash_round_trips(self, hasher):
+        async def scenario():
+            hashed = await hasher.hash("SecurePass@123")
+            return hashed, await hasher.verify("SecurePass@123", hashed), await hasher.verify("nope", hashed)
+
+        hashed, ok, bad = asyncio.run(scenario())
+        assert hashed.startswith("$2")
+        assert ok is True and bad is False
+
+    def test_too_long_raises_422(self, hasher):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(hasher.hash("a" * 73))
+        assert exc.value.status_code == 422
+
+    def test_hash_many_salts_each_row_and_flags_too_long(self, hasher):
+        hashes = asyncio.run(hasher.hash_many(["Welcome@123", "Welcome@123", "b" * 80]))
+
+        assert hashes[2] is None
+        assert hashes[0] != hashes[1]
+        assert all(verify_password("Welcome@123", h) for h in hashes[:2])
+
+    def test_admission_is_bounded(self, hasher):
+        peak = {"now": 0, "max": 0}
+        original = hasher._get_executor
+
+        class CountingExecutor:
+            def __init__(self, inner):
+                self.inner = inner
+
+            def submit(self, fn, *args):
+                peak["now"] += 1
+                peak["max"] = max(peak["max"], peak["now"])
+                future = self.inner.submit(fn, *args)
+                future.add_done_callback(lambda _: peak.__setitem__("now", peak["now"] - 1))
+                return future
+
+        hasher._get_executor = lambda: CountingExecutor(original())
+        try:
+            asyncio.run(hasher.hash_many(["pw"] * 6))
+        finally:
+            hasher._get_executor = original
+        assert peak["max"] <= hasher.max_concurrency
+
+    def test_legacy_verify_skips_the_pool(self, hasher, monkeypatch):
+        monkeypatch.setattr(hasher, "_run", None)   # would fail if called
+        legacy = hashlib.sha256(b"OldPass1").hexdigest()
+        assert asyncio.run(hasher.verify("OldPass1", legacy)) is True
+
+
+class _Session:
+    def __init__(self, fail=False):
+        self.commits = self.rollbacks = 0
+        self.fail = fail
+
+    def commit(self):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class TestLegacyUpgrade:
+
+    def test_sha256_is_rehashed(self):
+        user = SimpleNamespace(password=hashlib.sha256(b"OldPass1").hexdigest())
+        db = _Session()
+
+        assert asyncio.run(upgrade_legacy_hash(db, user, "OldPass1")) is True
+        assert user.password.startswith("$2") and verify_password("OldPass1", user.password)
+        assert db.commits == 1
+
+    def test_bcrypt_is_left_alone(self):
+        user = SimpleNamespace(password=asyncio.run(ph.hash_password_async("NewPass1")))
+        db = _Session()
+
+        assert asyncio.run(upgrade_legacy_hash(db, user, "NewPass1")) is False
+        assert db.commits == 0
+
+    def test_failure_never_raises(self):
+        user = SimpleNamespace(password="plaintext")
+        db = _Session(fail=True)
+
+        assert asyncio.run(upgrade_legacy_hash(db, user, "plaintext")) is False
+        assert db.rollbacks == 1
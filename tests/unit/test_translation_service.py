@@ -0,0 +1,178 @@
+"""
+tests/unit/test_translation_service.py
+---------------------------------------
+Pooled, cached, batched chat translation.
+
+Test coverage:
+1. translate_batch sends a whole transcript upstream in one call, keeps
+   input order and resolves duplicates locally.
+2. Repeated texts are served from the in-process LRU.
+3. Identical concurrent translate_text calls share one upstream call.
+4. A batch whose line structure does not survive falls back to per-text calls.
+5. The admin transcript helper batches per source language and stores the
+   results in translated_texts.
+
+Upstream is a local HTTP stub that mimics the gtx endpoint by upper-casing
+each line.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.config import settings
+from app.services import translation_service
+
+
+class _StubTranslate(BaseHTTPRequestHandler):
+    calls: list = []
+    delay: float = 0.0
+    merge_lines: bool = False
+
+    def _reply(self, text: str) -> None:
+        type(self).calls.append(text)
+        time.sleep(type(self).delay)
+        lines = text.split("\n")
+        if type(self).merge_lines:
+            lines = [" ".join(lines)]
+        segments = [
+            [line.upper() + ("\n" if i < len(lines) - 1 else ""), line]
+            for i, line in enumerate(lines)
+        ]
+        body = json.dumps([segments, None, "en"]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        self._reply(parse_qs(raw)["q"][0])
+
+    def do_GET(self):
+        self._reply(parse_qs(urlparse(self.path).query)["q"][0])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubTranslate)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _StubTranslate.calls = []
+    _StubTranslate.delay = 0.0
+    _StubTranslate.merge_lines = False
+
+    monkeypatch.setattr(translation_service, "_GTRANS_URL", f"http://127.0.0.1:{server.server_port}/")
+    monkeypatch.setattr(settings, "TRANSLATION_ENABLED", True)
+    monkeypatch.setattr(settings, "USE_REDIS", False)
+    translation_service._lru.clear()
+    try:
+        yield _StubTranslate
+    finally:
+        server.shutdown()
+        server.server_close()
+        translation_service._lru.clear()
+
+
+def _run(coro):
+    async def scenario():
+        try:
+            return await coro
+        finally:
+            await translation_service.aclose()
+    return asyncio.run(scenario())
+
+
+def test_batch_is_one_upstream_call(upstream):
+    texts = ["where are you", "on my way", "", "where are you", "reached gate"]
+
+    result = _run(translation_service.translate_batch(texts, "hi", "en"))
+
+    assert result == ["WHERE ARE YOU", "ON MY WAY", "", "WHERE ARE YOU", "REACHED GATE"]
+    assert upstream.calls == ["where are you\non my way\nreached gate"]
+
+
+def test_batch_splits_on_max_chars(upstream, monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_BATCH_MAX_CHARS", 20)
+
+    result = _run(translation_service.translate_batch(["a" * 12, "b" * 12, "c" * 5], "hi", "en"))
+
+    assert result == ["A" * 12, "B" * 12, "C" * 5]
+    assert len(upstream.calls) == 2
+
+
+def test_repeated_texts_hit_the_lru(upstream):
+    async def scenario():
+        first = await translation_service.translate_text("on my way", "hi", "en")
+        again = await translation_service.translate_text("on my way", "hi", "en")
+        batch = await translation_service.translate_batch(["on my way", "stuck in traffic"], "hi", "en")
+        return first, again, batch
+
+    first, again, batch = _run(scenario())
+
+    assert first == again == "ON MY WAY"
+    assert batch == ["ON MY WAY", "STUCK IN TRAFFIC"]
+    assert upstream.calls == ["on my way", "stuck in traffic"]
+
+
+def test_concurrent_identical_texts_share_one_call(upstream):
+    upstream.delay = 0.2
+
+    async def scenario():
+        return await asyncio.gather(*(
+            translation_service.translate_text("please wait", "hi", "en") for _ in range(5)
+        ))
+
+    assert _run(scenario()) == ["PLEASE WAIT"] * 5
+    assert upstream.calls == ["please wait"]
+
+
+def test_line_mismatch_falls_back_to_single_calls(upstream):
+    upstream.merge_lines = True
+
+    result = _run(translation_service.translate_batch(["one", "two"], "hi", "en"))
+
+    # merge_lines only affects multi-line payloads, so the retries succeed.
+    assert result == ["ONE", "TWO"]
+    assert upstream.calls == ["one\ntwo", "one", "two"]
+
+
+def test_disabled_or_same_language_skips_upstream(upstream, monkeypatch):
+    assert _run(translation_service.translate_batch(["hello"], "en", "en")) == ["hello"]
+    monkeypatch.setattr(settings, "TRANSLATION_ENABLED", False)
+    assert _run(translation_service.translate_batch(["hello"], "hi", "en")) == ["hello"]
+    assert upstream.calls == []
+
+
+def test_transcript_batches_per_source_language(upstream):
+    from app.routes.chat_router import _translate_transcript
+
+    messages = [
+        SimpleNamespace(original_text="on my way", original_language="en", translated_texts={}),
+        SimpleNamespace(original_text="pahunch gaya", original_language="hi", translated_texts=None),
+        SimpleNamespace(original_text="two minutes", original_language="en", translated_texts={"fr": "x"}),
+        SimpleNamespace(original_text="done", original_language="en", translated_texts={"ta": "cached"}),
+        SimpleNamespace(original_text="already", original_language="ta", translated_texts={}),
+    ]
+    db = SimpleNamespace(commits=0)
+    db.commit = lambda: setattr(db, "commits", db.commits + 1)
+
+    _run(_translate_transcript(db, messages, "ta"))
+
+    assert sorted(upstream.calls) == ["on my way\ntwo minutes", "pahunch gaya"]
+    assert messages[0].translated_texts == {"ta": "ON MY WAY"}
+    assert messages[1].translated_texts == {"ta": "PAHUNCH GAYA"}
+    assert messages[2].translated_texts == {"fr": "x", "ta": "TWO MINUTES"}
+    assert messages[3].translated_texts == {"ta": "cached"}
+    assert messages[4].translated_texts == {}
+    assert db.commits == 1